@@ -2,6 +2,8 @@
 ASGI config for KardesLastik project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+HTTP istekleri Django'ya, WebSocket bağlantıları Channels consumer'larına
+yönlendirilir.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/3.2/howto/deployment/asgi/
@@ -13,4 +15,18 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'KardesLastik.settings')
 
-application = get_asgi_application()
+# Consumer'lar model import ettiği için Django önce kurulmalı
+django_asgi_app = get_asgi_application()
+
+from channels.routing import ProtocolTypeRouter, URLRouter  # noqa: E402
+from channels.security.websocket import AllowedHostsOriginValidator  # noqa: E402
+
+from backend.interfaces.realtime.middleware import JWTAuthMiddleware  # noqa: E402
+from backend.interfaces.realtime.routing import websocket_urlpatterns  # noqa: E402
+
+application = ProtocolTypeRouter({
+    'http': django_asgi_app,
+    'websocket': AllowedHostsOriginValidator(
+        JWTAuthMiddleware(URLRouter(websocket_urlpatterns))
+    ),
+})
@@ -0,0 +1,72 @@
+"""
+SQLite backend with connection-time pragmas and immediate write transactions.
+
+Django 4.2'nin sqlite3 backend'i bağlantı açılışında PRAGMA çalıştırmayı
+ve BEGIN IMMEDIATE kullanmayı desteklemez (Django 5.1'de init_command ve
+transaction_mode olarak eklendi). Bu backend ikisini OPTIONS üzerinden sağlar:
+
+    'ENGINE': 'KardesLastik.backends.sqlite3',
+    'OPTIONS': {
+        'pragmas': {'journal_mode': 'WAL', 'synchronous': 'NORMAL', 'busy_timeout': 5000},
+        'transaction_mode': 'IMMEDIATE',
+    }
+
+WAL modunda okuyucular yazarı beklemez. IMMEDIATE ile transaction.atomic()
+yazma kilidini en başta alır; kilit bekleme busy_timeout süresince yapılır.
+Varsayılan (DEFERRED) modda okuyup sonra yazan iki transaction kilit
+yükseltirken beklemeden "database is locked" hatası alır.
+"""
+import re
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.sqlite3 import base
+
+_PRAGMA_NAME = re.compile(r'^[a-z_]+$')
+_PRAGMA_VALUE = re.compile(r'^(-?\d+|[A-Za-z_]+)$')
+
+TRANSACTION_MODES = ('DEFERRED', 'IMMEDIATE', 'EXCLUSIVE')
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    sqlite3 DatabaseWrapper - pragmas ve transaction_mode OPTIONS desteği
+    """
+    
+    CUSTOM_OPTIONS = ('pragmas', 'transaction_mode')
+    
+    def __init__(self, settings_dict, *args, **kwargs):
+        super().__init__(settings_dict, *args, **kwargs)
+        options = self.settings_dict.get('OPTIONS', {})
+        
+        self.pragmas = dict(options.get('pragmas') or {})
+        for name, value in self.pragmas.items():
+            if not _PRAGMA_NAME.match(str(name)) or not _PRAGMA_VALUE.match(str(value)):
+                raise ImproperlyConfigured(f'Geçersiz SQLite pragma: {name}={value!r}')
+        
+        mode = (options.get('transaction_mode') or 'DEFERRED').upper()
+        if mode not in TRANSACTION_MODES:
+            raise ImproperlyConfigured(
+                f'Geçersiz transaction_mode: {mode!r} ({", ".join(TRANSACTION_MODES)})'
+            )
+        self.transaction_mode = mode
+    
+    def get_connection_params(self):
+        """Özel seçenekler sqlite3.connect'e iletilmez"""
+        params = super().get_connection_params()
+        for key in self.CUSTOM_OPTIONS:
+            params.pop(key, None)
+        return params
+    
+    def get_new_connection(self, conn_params):
+        """Bağlantı açılırken pragmaları uygula"""
+        conn = super().get_new_connection(conn_params)
+        for name, value in self.pragmas.items():
+            conn.execute(f'PRAGMA {name} = {value}')
+        return conn
+    
+    def _start_transaction_under_autocommit(self):
+        """atomic() bloğunu yapılandırılan kilit modu ile başlat"""
+        if self.transaction_mode == 'DEFERRED':
+            super()._start_transaction_under_autocommit()
+        else:
+            self.cursor().execute(f'BEGIN {self.transaction_mode}')
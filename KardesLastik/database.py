@@ -0,0 +1,184 @@
+"""
+Environment-driven database configuration.
+
+Geliştirmede varsayılan SQLite kullanılır; production'da DB_ENGINE=postgresql
+ile PostgreSQL profili seçilir:
+
+    DB_ENGINE=postgresql
+    DB_NAME, DB_USER, DB_PASSWORD, DB_HOST, DB_PORT
+    DB_CONN_MAX_AGE=60            # kalıcı bağlantı ömrü (sn); 0 = her istekte yeni bağlantı
+    DB_CONN_HEALTH_CHECKS=1       # yeniden kullanmadan önce bağlantıyı doğrula
+    DB_STATEMENT_TIMEOUT_MS=30000 # uzun sorguları sunucu tarafında kes; 0 = kapalı
+    DB_POOL=0                     # Django >= 5.1 + psycopg 3 ile yerleşik bağlantı havuzu
+    DB_POOL_MIN_SIZE=2
+    DB_POOL_MAX_SIZE=10
+    DB_SSLMODE=prefer
+
+Her gunicorn worker'ı kendi bağlantısını CONN_MAX_AGE süresince tutar; böylece
+istek başına TCP + kimlik doğrulama maliyeti ödenmez. Havuz açıldığında
+CONN_MAX_AGE kullanılmaz (Django ikisine birden izin vermez).
+
+SQLite profili varsayılan olarak performans modunda çalışır
+(bkz. KardesLastik/backends/sqlite3):
+
+    DB_SQLITE_PERFORMANCE=1              # 0 = Django'nun varsayılan sqlite3 backend'i
+    DB_SQLITE_BUSY_TIMEOUT_MS=5000       # kilit için bekleme süresi
+    DB_SQLITE_CACHE_SIZE=-20000          # negatif değer KiB cinsindendir (~20 MB)
+    DB_SQLITE_MMAP_SIZE=134217728        # 128 MB bellek eşlemeli okuma
+    DB_SQLITE_TRANSACTION_MODE=IMMEDIATE
+
+Okuma replica'sı (isteğe bağlı, bkz. backend.core.replica):
+
+    DB_REPLICA_NAME / DB_REPLICA_HOST  # biri verilirse 'replica' alias'ı tanımlanır
+    DB_REPLICA_PORT, DB_REPLICA_USER, DB_REPLICA_PASSWORD
+    DB_REPLICA_LAG_WINDOW=5            # yazmadan sonra okumaların primary'de kaldığı süre (sn)
+
+Replica ayarları 'default' profilinden kopyalanır; yalnızca verilen alanlar
+değişir. Liste, rapor ve dışa aktarma okumaları replica'ya, yazmalar ve
+yazma sonrası okumalar primary'ye gider.
+"""
+import copy
+import os
+import warnings
+
+import django
+from django.core.exceptions import ImproperlyConfigured
+
+
+def _env_int(name, default):
+    """Tam sayı ortam değişkeni oku"""
+    value = os.environ.get(name)
+    if value in (None, ''):
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ImproperlyConfigured(f'{name} bir tam sayı olmalıdır: {value!r}')
+
+
+def _env_bool(name, default):
+    """1/0, true/false ortam değişkeni oku"""
+    value = os.environ.get(name)
+    if value in (None, ''):
+        return default
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def pool_supported():
+    """Yerleşik bağlantı havuzu: Django >= 5.1 ve psycopg_pool gerekir"""
+    if django.VERSION < (5, 1):
+        return False
+    try:
+        import psycopg_pool  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def sqlite_config(base_dir):
+    """
+    Geliştirme ve küçük kurulumlar için SQLite profili
+    
+    Performans modunda WAL ile okuyucular yazarı beklemez, synchronous=NORMAL
+    her commit'te fsync yapmaz (WAL'da güvenlidir) ve yazma transaction'ları
+    kilidi BEGIN IMMEDIATE ile en başta alıp busy_timeout kadar bekler.
+    """
+    name = os.environ.get('DB_NAME') or os.path.join(base_dir, 'db.sqlite3')
+    if not _env_bool('DB_SQLITE_PERFORMANCE', True):
+        return {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': name,
+        }
+    
+    return {
+        'ENGINE': 'KardesLastik.backends.sqlite3',
+        'NAME': name,
+        'OPTIONS': {
+            'pragmas': {
+                'journal_mode': 'WAL',
+                'synchronous': 'NORMAL',
+                'busy_timeout': _env_int('DB_SQLITE_BUSY_TIMEOUT_MS', 5000),
+                'cache_size': _env_int('DB_SQLITE_CACHE_SIZE', -20000),
+                'mmap_size': _env_int('DB_SQLITE_MMAP_SIZE', 134217728),
+                'temp_store': 'MEMORY',
+            },
+            'transaction_mode': os.environ.get('DB_SQLITE_TRANSACTION_MODE', 'IMMEDIATE'),
+        },
+    }
+
+
+def postgresql_config():
+    """Production için PostgreSQL profili"""
+    options = {}
+    
+    statement_timeout = _env_int('DB_STATEMENT_TIMEOUT_MS', 30000)
+    if statement_timeout > 0:
+        # Bağlantı açılırken oturum parametresi olarak gönderilir; ek sorgu yok
+        options['options'] = f'-c statement_timeout={statement_timeout}'
+    
+    sslmode = os.environ.get('DB_SSLMODE')
+    if sslmode:
+        options['sslmode'] = sslmode
+    
+    conn_max_age = _env_int('DB_CONN_MAX_AGE', 60)
+    
+    if _env_bool('DB_POOL', False):
+        if pool_supported():
+            options['pool'] = {
+                'min_size': _env_int('DB_POOL_MIN_SIZE', 2),
+                'max_size': _env_int('DB_POOL_MAX_SIZE', 10),
+            }
+            conn_max_age = 0
+        else:
+            warnings.warn(
+                'DB_POOL yok sayıldı: yerleşik havuz Django >= 5.1 ve psycopg[pool] gerektirir; '
+                'kalıcı bağlantılar (DB_CONN_MAX_AGE) kullanılıyor.',
+                RuntimeWarning,
+            )
+    
+    return {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': os.environ.get('DB_NAME', 'kardeslastik_db'),
+        'USER': os.environ.get('DB_USER', 'kardeslastik_user'),
+        'PASSWORD': os.environ.get('DB_PASSWORD', ''),
+        'HOST': os.environ.get('DB_HOST', 'localhost'),
+        'PORT': os.environ.get('DB_PORT', '5432'),
+        'CONN_MAX_AGE': conn_max_age,
+        'CONN_HEALTH_CHECKS': _env_bool('DB_CONN_HEALTH_CHECKS', True),
+        'OPTIONS': options,
+    }
+
+
+def replica_config(default):
+    """
+    'replica' alias'ı için ayarlar; DB_REPLICA_* verilmemişse None
+    
+    Testlerde replica primary'nin aynası sayılır (TEST.MIRROR); ayrı test
+    veritabanı oluşturulmaz.
+    """
+    name = os.environ.get('DB_REPLICA_NAME')
+    host = os.environ.get('DB_REPLICA_HOST')
+    if not name and not host:
+        return None
+    
+    config = copy.deepcopy(default)
+    overrides = {
+        'NAME': name,
+        'HOST': host,
+        'PORT': os.environ.get('DB_REPLICA_PORT'),
+        'USER': os.environ.get('DB_REPLICA_USER'),
+        'PASSWORD': os.environ.get('DB_REPLICA_PASSWORD'),
+    }
+    config.update({key: value for key, value in overrides.items() if value})
+    config['TEST'] = {'MIRROR': 'default'}
+    return config
+
+
+def database_config(base_dir):
+    """DB_ENGINE'e göre 'default' veritabanı ayarlarını döndür"""
+    engine = os.environ.get('DB_ENGINE', 'sqlite').strip().lower()
+    if engine in ('postgresql', 'postgres', 'psql'):
+        return postgresql_config()
+    if engine in ('sqlite', 'sqlite3'):
+        return sqlite_config(base_dir)
+    raise ImproperlyConfigured(f'Desteklenmeyen DB_ENGINE: {engine!r} (sqlite veya postgresql)')
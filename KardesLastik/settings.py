@@ -11,11 +11,14 @@ https://docs.djangoproject.com/en/3.2/ref/settings/
 """
 
 import os
+import tempfile
 from django.utils.translation import gettext_lazy as _
 from django.utils import translation
 from django.db import transaction
 from datetime import timedelta
 
+from KardesLastik.database import database_config, replica_config
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
@@ -35,6 +38,8 @@ ALLOWED_HOSTS = ['*']
 # Application definition
 
 INSTALLED_APPS = [
+    # runserver'ın WebSocket'leri de sunması için staticfiles'tan önce olmalı
+    'daphne',
     'django.contrib.admin',
     'django.contrib.auth',
     'django.contrib.contenttypes',
@@ -87,6 +92,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'backend.interfaces.api.middleware.PrimaryStickinessMiddleware',  # Yazma sonrası okumaları primary'de tut
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'django.middleware.locale.LocaleMiddleware',
@@ -122,18 +128,29 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'KardesLastik.wsgi.application'
+ASGI_APPLICATION = 'KardesLastik.asgi.application'
 
 
 # Database
 # https://docs.djangoproject.com/en/3.2/ref/settings/#databases
+# DB_ENGINE=postgresql ile production profili seçilir (bkz. KardesLastik/database.py)
 
 DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': os.path.join(BASE_DIR, 'db.sqlite3'),
-    }
+    'default': database_config(BASE_DIR),
 }
 
+# Okuma replica'sı: DB_REPLICA_NAME veya DB_REPLICA_HOST verilirse tanımlanır.
+# Liste/rapor/dışa aktarma okumaları replica'ya, yazmalar primary'ye gider.
+_replica = replica_config(DATABASES['default'])
+if _replica:
+    DATABASES['replica'] = _replica
+
+DATABASE_ROUTERS = ['backend.core.replica.PrimaryReplicaRouter']
+
+# Yazmadan sonra aynı istemcinin okumalarının primary'de kaldığı süre (sn);
+# replica'dan okunan cache girdilerinin ömrü de bununla sınırlanır
+DATABASE_REPLICA_LAG_WINDOW = int(os.environ.get('DB_REPLICA_LAG_WINDOW', '5'))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/3.2/ref/settings/#auth-password-validators
@@ -197,6 +214,90 @@ DATA_UPLOAD_MAX_NUMBER_FIELDS = 10240
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Cache
+# CACHE_BACKEND=file (varsayılan) | locmem | redis
+# Gunicorn birden fazla worker ile çalıştığından varsayılan, süreçler arası paylaşılan
+# dosya tabanlı cache'tir; locmem her süreçte ayrı olduğundan sadece tek süreçli
+# geliştirme sunucusu için uygundur. redis, Redis protokolünü konuşan yerel bir
+# sunucuyla da (Valkey, KeyDB vb.) çalışır.
+#
+# Adlandırılmış cache'ler:
+#   default    - sürüm sayaçları ve genel kullanım
+#   responses  - API yanıt cache'i (backend.interfaces.api.caching.cached_view)
+#   aggregates - rapor/dashboard aggregate sonuçları
+#   sessions   - oturumlar (cached_db)
+CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'file')
+CACHE_LOCATION = os.environ.get('CACHE_LOCATION', os.path.join(tempfile.gettempdir(), 'kardeslastik_cache'))
+REDIS_URL = os.environ.get('REDIS_URL', 'redis://127.0.0.1:6379/1')
+
+
+def _cache_config(alias, timeout=300):
+    """Seçili backend için tek bir adlandırılmış cache tanımı"""
+    if CACHE_BACKEND == 'redis':
+        return {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': alias,
+            'TIMEOUT': timeout,
+        }
+    if CACHE_BACKEND == 'locmem':
+        return {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': alias,
+            'TIMEOUT': timeout,
+        }
+    return {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.path.join(CACHE_LOCATION, alias),
+        'TIMEOUT': timeout,
+        'OPTIONS': {'MAX_ENTRIES': 5000},
+    }
+
+
+CACHES = {
+    'default': _cache_config('default'),
+    'responses': _cache_config('responses', timeout=60 * 60 * 24),
+    'aggregates': _cache_config('aggregates', timeout=60 * 60),
+    'sessions': _cache_config('sessions', timeout=60 * 60 * 24 * 14),
+}
+
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+SESSION_CACHE_ALIAS = 'sessions'
+
+# Arka plan işleri (manage.py run_worker)
+# Geliştirmede worker çalıştırmadan işlerin commit sonrası aynı süreçte çalışması için:
+# BACKGROUND_JOBS_EAGER=1
+BACKGROUND_JOBS_EAGER = os.environ.get('BACKGROUND_JOBS_EAGER', '0') == '1'
+# Bu süreden uzun RUNNING kalan işler (çökmüş worker) yeniden alınır
+BACKGROUND_JOBS_STALE_AFTER = timedelta(minutes=10)
+
+# Channels (gerçek zamanlı admin bildirimleri, /ws/ledger/)
+# CHANNEL_LAYER_BACKEND=memory (varsayılan) | redis
+# memory katmanı yalnızca aynı süreç içinde çalışır: HTTP ve WebSocket aynı ASGI
+# sürecinden (runserver/daphne) sunulmalıdır. HTTP gunicorn, WebSocket daphne
+# ile ayrı süreçlerde çalışıyorsa redis kullanılmalıdır.
+CHANNEL_LAYER_BACKEND = os.environ.get('CHANNEL_LAYER_BACKEND', 'memory')
+if CHANNEL_LAYER_BACKEND == 'redis':
+    CHANNEL_LAYERS = {
+        'default': {
+            'BACKEND': 'channels_redis.core.RedisChannelLayer',
+            'CONFIG': {'hosts': [os.environ.get('CHANNEL_REDIS_URL', REDIS_URL)]},
+        },
+    }
+else:
+    CHANNEL_LAYERS = {
+        'default': {
+            'BACKEND': 'channels.layers.InMemoryChannelLayer',
+        },
+    }
+
+# Delta senkronizasyon (/api/sync/)
+# Silinme izleri bu süre saklanır (manage.py prune_tombstones); daha eski
+# token'lar tam yeniden yükleme (reset) ister
+SYNC_TOMBSTONE_RETENTION = timedelta(days=int(os.environ.get('SYNC_TOMBSTONE_RETENTION_DAYS', '30')))
+# Tek yanıtta dönebilecek en fazla değişiklik; aşılırsa reset döner
+SYNC_MAX_CHANGES = 1000
+
 # CORS Settings - React frontend için
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:3000",  # React development server
@@ -1,8 +1,53 @@
 """
 Django admin configuration for backend models.
 """
+from decimal import Decimal, InvalidOperation
+
 from django.contrib import admin
-from backend.core.models import Customer, Debt, GalleryImage, ContactMessage
+from django.db.models import DecimalField, Value
+from django.db.models.functions import Coalesce
+from backend.core.cache import bump_version
+from backend.core.models import (
+    AgingSnapshot,
+    BackgroundJob,
+    Customer,
+    Debt,
+    GalleryImage,
+    ContactMessage,
+    DailyLedgerRollup,
+    LedgerEntry,
+    Payment,
+    PaymentAllocation,
+)
+from backend.infrastructure.repositories import DebtRepository
+
+
+class OutstandingDebtFilter(admin.SimpleListFilter):
+    """
+    Açık borcu verilen tutarın üzerinde olan müşteriler
+    
+    Hazır eşikler dışında URL'de herhangi bir tutar verilebilir
+    (ör. ?borc_ustu=750).
+    """
+    title = 'Açık borç'
+    parameter_name = 'borc_ustu'
+    
+    THRESHOLDS = (0, 500, 1000, 5000, 10000)
+    
+    def lookups(self, request, model_admin):
+        return [
+            (str(threshold), 'Borcu olanlar' if threshold == 0 else f'{threshold} TL üzeri')
+            for threshold in self.THRESHOLDS
+        ]
+    
+    def queryset(self, request, queryset):
+        if self.value() is None:
+            return queryset
+        try:
+            threshold = Decimal(self.value())
+        except InvalidOperation:
+            return queryset
+        return queryset.filter(outstanding_debt_value__gt=threshold)
 
 
 @admin.register(Customer)
@@ -14,13 +59,14 @@ class CustomerAdmin(admin.ModelAdmin):
         'full_name',
         'phone',
         'email',
-        'total_debt',
-        'total_paid',
+        'outstanding_debt_column',
+        'paid_total_column',
         'is_active',
         'created_at',
     ]
     
     list_filter = [
+        OutstandingDebtFilter,
         'is_active',
         'created_at',
     ]
@@ -65,9 +111,31 @@ class CustomerAdmin(admin.ModelAdmin):
     )
     
     def get_queryset(self, request):
-        """Optimize queryset"""
+        """
+        Optimize queryset
+        
+        Bakiyeler denormalize CustomerBalance satırından join ile okunur;
+        liste sayfası satır başına aggregate sorgusu çalıştırmaz ve kolonlar
+        veritabanında sıralanıp filtrelenebilir.
+        """
         qs = super().get_queryset(request)
-        return qs.select_related('created_by')
+        zero = Value(Decimal('0.00'), output_field=DecimalField(max_digits=14, decimal_places=2))
+        return qs.select_related('created_by', 'balance').annotate(
+            outstanding_debt_value=Coalesce('balance__outstanding_debt', zero),
+            paid_total_value=Coalesce('balance__paid_total', zero),
+        )
+    
+    def outstanding_debt_column(self, obj):
+        return obj.outstanding_debt_value
+    
+    outstanding_debt_column.short_description = 'Toplam Borç'
+    outstanding_debt_column.admin_order_field = 'outstanding_debt_value'
+    
+    def paid_total_column(self, obj):
+        return obj.paid_total_value
+    
+    paid_total_column.short_description = 'Toplam Ödenen'
+    paid_total_column.admin_order_field = 'paid_total_value'
 
 
 @admin.register(Debt)
@@ -124,27 +192,203 @@ class DebtAdmin(admin.ModelAdmin):
     
     actions = ['mark_as_paid', 'mark_as_unpaid']
     
+    def get_object(self, request, object_id, from_field=None):
+        """
+        Kayıt/silme isteğinde satırı kilitle
+        
+        changeform_view ve delete_view transaction içinde çalışır; bakiye
+        farkı kilitli satırın durumundan hesaplanır (bkz. DebtRepository).
+        """
+        obj = super().get_object(request, object_id, from_field)
+        if obj is not None and request.method == 'POST':
+            obj = Debt.objects.select_for_update().get(pk=obj.pk)
+        return obj
+    
     def mark_as_paid(self, request, queryset):
-        """Seçili borçları ödendi olarak işaretle"""
-        count = 0
-        for debt in queryset:
-            if not debt.is_paid:
-                debt.mark_as_paid(request.user)
-                count += 1
-        self.message_user(request, f'{count} borç ödendi olarak işaretlendi.')
+        """Seçili borçları tek bir UPDATE ile ödendi olarak işaretle"""
+        result = DebtRepository().bulk_mark_as_paid(
+            debt_ids=list(queryset.values_list('id', flat=True)),
+            user_id=request.user.id,
+        )
+        self.message_user(request, f'{result.updated} borç ödendi olarak işaretlendi.')
     mark_as_paid.short_description = 'Seçili borçları ödendi olarak işaretle'
     
     def mark_as_unpaid(self, request, queryset):
-        """Seçili borçları ödenmedi olarak işaretle"""
-        count = 0
-        for debt in queryset:
-            if debt.is_paid:
-                debt.mark_as_unpaid()
-                count += 1
-        self.message_user(request, f'{count} borç ödenmedi olarak işaretlendi.')
+        """Seçili borçları tek bir UPDATE ile ödenmedi olarak işaretle"""
+        result = DebtRepository().bulk_mark_as_unpaid(
+            debt_ids=list(queryset.values_list('id', flat=True)),
+        )
+        message = f'{result.updated} borç ödenmedi olarak işaretlendi.'
+        if result.skipped_ids:
+            message += f' Ödeme kayıtlarıyla kapatılan {len(result.skipped_ids)} borç atlandı.'
+        self.message_user(request, message)
     mark_as_unpaid.short_description = 'Seçili borçları ödenmedi olarak işaretle'
 
 
+class PaymentAllocationInline(admin.TabularInline):
+    """
+    Ödemenin borçlara dağılımı (salt okunur)
+    """
+    model = PaymentAllocation
+    fields = ['debt', 'amount']
+    readonly_fields = ['debt', 'amount']
+    extra = 0
+    can_delete = False
+    
+    def has_add_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(Payment)
+class PaymentAdmin(admin.ModelAdmin):
+    """
+    Payment admin configuration
+    """
+    list_display = [
+        'customer',
+        'amount',
+        'paid_by',
+        'created_at',
+    ]
+    
+    list_filter = [
+        'created_at',
+    ]
+    
+    search_fields = [
+        'customer__first_name',
+        'customer__last_name',
+        'customer__phone',
+    ]
+    
+    # Ödemeler borçlara dağıtılmış olarak kaydedilir; tutarı değiştirmek veya
+    # silmek dağılımları bozacağı için sadece notlar düzenlenebilir
+    readonly_fields = [
+        'customer',
+        'amount',
+        'paid_by',
+        'created_at',
+    ]
+    
+    inlines = [PaymentAllocationInline]
+    
+    def get_queryset(self, request):
+        """Optimize queryset"""
+        qs = super().get_queryset(request)
+        return qs.select_related('customer', 'paid_by')
+    
+    def has_add_permission(self, request):
+        """Ödemeler API üzerinden (FIFO dağıtımla) oluşturulur"""
+        return False
+    
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(LedgerEntry)
+class LedgerEntryAdmin(admin.ModelAdmin):
+    """
+    Ledger entry admin configuration (read-only)
+    """
+    list_display = [
+        'customer',
+        'kind',
+        'amount',
+        'balance_after',
+        'description',
+        'created_at',
+    ]
+    
+    list_filter = [
+        'kind',
+        'created_at',
+    ]
+    
+    search_fields = [
+        'customer__first_name',
+        'customer__last_name',
+        'customer__phone',
+    ]
+    
+    list_select_related = ['customer']
+    
+    # Ekstre satırları yalnızca eklenir; düzeltmeler yeni satır olarak yazılır
+    def has_add_permission(self, request):
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        return False
+    
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(AgingSnapshot)
+class AgingSnapshotAdmin(admin.ModelAdmin):
+    """
+    Aging snapshot admin configuration (read-only)
+    """
+    list_display = [
+        'as_of',
+        'customer',
+        'bucket_0_30',
+        'bucket_31_60',
+        'bucket_61_90',
+        'bucket_90_plus',
+        'total',
+        'debt_count',
+        'oldest_due_date',
+    ]
+    
+    list_filter = [
+        'as_of',
+    ]
+    
+    search_fields = [
+        'customer__first_name',
+        'customer__last_name',
+        'customer__phone',
+    ]
+    
+    list_select_related = ['customer']
+    
+    # Görüntüler materialize_aging komutu ile yazılır
+    def has_add_permission(self, request):
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(DailyLedgerRollup)
+class DailyLedgerRollupAdmin(admin.ModelAdmin):
+    """
+    Daily ledger rollup admin configuration (read-only)
+    """
+    list_display = [
+        'day',
+        'debt_type',
+        'created_count',
+        'created_amount',
+        'paid_amount',
+        'outstanding_amount',
+        'updated_at',
+    ]
+    
+    list_filter = [
+        'debt_type',
+    ]
+    
+    date_hierarchy = 'day'
+    
+    # Özetler borç yazımlarında ve rebuild_rollups komutu ile yazılır
+    def has_add_permission(self, request):
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
 @admin.register(GalleryImage)
 class GalleryImageAdmin(admin.ModelAdmin):
     """
@@ -154,12 +398,14 @@ class GalleryImageAdmin(admin.ModelAdmin):
         'title',
         'image_preview',
         'is_active',
+        'processing_status',
         'order',
         'created_at',
     ]
     
     list_filter = [
         'is_active',
+        'processing_status',
         'created_at',
     ]
     
@@ -170,6 +416,8 @@ class GalleryImageAdmin(admin.ModelAdmin):
     
     readonly_fields = [
         'image_preview',
+        'processing_status',
+        'processing_error',
         'created_at',
         'updated_at',
     ]
@@ -179,7 +427,7 @@ class GalleryImageAdmin(admin.ModelAdmin):
             'fields': ('title', 'description', 'image', 'image_preview')
         }),
         ('Durum', {
-            'fields': ('is_active', 'order')
+            'fields': ('is_active', 'order', 'processing_status', 'processing_error')
         }),
         ('Sistem Bilgileri', {
             'fields': ('created_by', 'created_at', 'updated_at'),
@@ -246,11 +494,58 @@ class ContactMessageAdmin(admin.ModelAdmin):
     def mark_as_read(self, request, queryset):
         """Seçili mesajları okundu olarak işaretle"""
         count = queryset.filter(is_read=False).update(is_read=True)
+        bump_version(ContactMessage.CACHE_NAMESPACE)
         self.message_user(request, f'{count} mesaj okundu olarak işaretlendi.')
     mark_as_read.short_description = 'Seçili mesajları okundu olarak işaretle'
     
     def mark_as_unread(self, request, queryset):
         """Seçili mesajları okunmadı olarak işaretle"""
         count = queryset.filter(is_read=True).update(is_read=False)
+        bump_version(ContactMessage.CACHE_NAMESPACE)
         self.message_user(request, f'{count} mesaj okunmadı olarak işaretlendi.')
     mark_as_unread.short_description = 'Seçili mesajları okunmadı olarak işaretle'
+
+
+@admin.register(BackgroundJob)
+class BackgroundJobAdmin(admin.ModelAdmin):
+    """
+    Background job admin configuration
+    """
+    list_display = [
+        'task',
+        'status',
+        'attempts',
+        'max_attempts',
+        'run_after',
+        'created_at',
+        'finished_at',
+    ]
+    
+    list_filter = [
+        'status',
+        'task',
+    ]
+    
+    readonly_fields = [
+        'task',
+        'payload',
+        'attempts',
+        'locked_at',
+        'last_error',
+        'created_at',
+        'finished_at',
+    ]
+    
+    actions = ['retry_jobs']
+    
+    def retry_jobs(self, request, queryset):
+        """Başarısız işleri yeniden kuyruğa al"""
+        from django.utils import timezone
+        count = queryset.filter(status=BackgroundJob.Status.FAILED).update(
+            status=BackgroundJob.Status.PENDING,
+            attempts=0,
+            run_after=timezone.now(),
+            finished_at=None,
+        )
+        self.message_user(request, f'{count} iş yeniden kuyruğa alındı.')
+    retry_jobs.short_description = 'Seçili başarısız işleri yeniden dene'
@@ -5,11 +5,13 @@ from backend.application.abstracts.repository_abstract import (
     ICustomerRepository,
     IDebtRepository,
     IGalleryRepository,
+    IReportRepository,
 )
 
 __all__ = [
     'ICustomerRepository',
     'IDebtRepository',
     'IGalleryRepository',
+    'IReportRepository',
 ]
 
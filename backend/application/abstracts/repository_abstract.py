@@ -2,10 +2,19 @@
 Repository Abstract interfaces for the application layer.
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import date, datetime
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from backend.application.dtos.customer_dto import CustomerDTO
 from backend.application.dtos.debt_dto import DebtDTO
 from backend.application.dtos.contact_dto import ContactMessageDTO
+from backend.application.dtos.dashboard_dto import DashboardStatsDTO
+from backend.application.dtos.page_dto import PageDTO
+from backend.application.dtos.sync_dto import SyncDTO
+from backend.application.dtos.balance_dto import DebtBulkUpdateResultDTO
+from backend.application.dtos.payment_dto import PaymentDTO, SettlementResultDTO
+from backend.application.dtos.statement_dto import StatementDTO
+from backend.application.dtos.aging_dto import AgingReportDTO
+from backend.application.dtos.timeseries_dto import TimeseriesDTO
 
 
 class ICustomerRepository(ABC):
@@ -23,16 +32,37 @@ class ICustomerRepository(ABC):
         """ID'ye göre müşteri getir"""
         pass
     
+    @abstractmethod
+    def get_modification_state(self, customer_id: int) -> Optional[Tuple[datetime, ...]]:
+        """Müşteri yanıtını etkileyen updated_at değerleri (yoksa None)"""
+        pass
+    
     @abstractmethod
     def get_by_phone(self, phone: str) -> Optional[CustomerDTO]:
         """Telefona göre müşteri getir"""
         pass
     
+    @abstractmethod
+    def find_by_phone_suffix(self, digits: str, limit: int = 20, is_active: Optional[bool] = None) -> List[CustomerDTO]:
+        """Telefonun son rakamlarına göre müşteri bul"""
+        pass
+    
     @abstractmethod
     def get_all(self, is_active: Optional[bool] = None) -> List[CustomerDTO]:
         """Tüm müşterileri getir"""
         pass
     
+    @abstractmethod
+    def get_page(
+        self,
+        is_active: Optional[bool] = None,
+        search: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> PageDTO:
+        """Müşterileri cursor sayfalama ile getir"""
+        pass
+    
     @abstractmethod
     def update(self, customer_id: int, customer_dto: CustomerDTO) -> Optional[CustomerDTO]:
         """Müşteri bilgilerini güncelle"""
@@ -44,8 +74,13 @@ class ICustomerRepository(ABC):
         pass
     
     @abstractmethod
-    def search(self, query: str) -> List[CustomerDTO]:
-        """Müşteri ara (isim, telefon, email)"""
+    def search(self, query: str, limit: int = 20, is_active: Optional[bool] = None) -> List[CustomerDTO]:
+        """Müşteri ara (isim, telefon, email) - sıralı, en fazla limit sonuç"""
+        pass
+    
+    @abstractmethod
+    def resolve_active_customers(self, customer_ids: Set[int], phones: Set[str]) -> Tuple[Set[int], Dict[str, int]]:
+        """ID ve telefonları toplu çöz: (aktif ID'ler, telefon -> müşteri ID)"""
         pass
 
 
@@ -64,6 +99,11 @@ class IDebtRepository(ABC):
         """ID'ye göre borç getir"""
         pass
     
+    @abstractmethod
+    def get_modification_state(self, debt_id: int) -> Optional[Tuple[datetime, ...]]:
+        """Borç yanıtını etkileyen updated_at değerleri (yoksa None)"""
+        pass
+    
     @abstractmethod
     def get_by_customer_id(self, customer_id: int, is_paid: Optional[bool] = None) -> List[DebtDTO]:
         """Müşteriye ait borçları getir"""
@@ -74,6 +114,47 @@ class IDebtRepository(ABC):
         """Tüm borçları getir"""
         pass
     
+    @abstractmethod
+    def get_page(
+        self,
+        is_paid: Optional[bool] = None,
+        debt_type: Optional[str] = None,
+        customer_id: Optional[int] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> PageDTO:
+        """Borçları cursor sayfalama ile getir"""
+        pass
+    
+    @abstractmethod
+    def get_overdue_page(
+        self,
+        as_of: Optional[date] = None,
+        customer_id: Optional[int] = None,
+        min_days: int = 1,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> PageDTO:
+        """Vadesi en az min_days gün geçmiş ödenmemiş borçları en eski vadeden başlayarak getir"""
+        pass
+    
+    @abstractmethod
+    def iter_export_rows(
+        self,
+        customer_id: Optional[int] = None,
+        debt_type: Optional[str] = None,
+        is_paid: Optional[bool] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+    ) -> Iterator[tuple]:
+        """Dışa aktarma satırlarını (EXPORT_COLUMNS sırasıyla) akış halinde getir"""
+        pass
+    
+    @abstractmethod
+    def bulk_create(self, debt_dtos: List[DebtDTO]) -> int:
+        """Borç kayıtlarını tek transaction içinde toplu oluştur, oluşan kayıt sayısını döndür"""
+        pass
+    
     @abstractmethod
     def update(self, debt_id: int, debt_dto: DebtDTO) -> Optional[DebtDTO]:
         """Borç bilgilerini güncelle"""
@@ -94,12 +175,86 @@ class IDebtRepository(ABC):
         """Borcu ödenmedi olarak işaretle"""
         pass
     
+    @abstractmethod
+    def bulk_mark_as_paid(
+        self,
+        debt_ids: Optional[List[int]] = None,
+        customer_id: Optional[int] = None,
+        debt_type: Optional[str] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        user_id: Optional[int] = None,
+    ) -> DebtBulkUpdateResultDTO:
+        """Filtreye uyan ödenmemiş borçları tek UPDATE ile ödendi yap, güncel bakiyeleri döndür"""
+        pass
+    
+    @abstractmethod
+    def bulk_mark_as_unpaid(
+        self,
+        debt_ids: Optional[List[int]] = None,
+        customer_id: Optional[int] = None,
+        debt_type: Optional[str] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+    ) -> DebtBulkUpdateResultDTO:
+        """Filtreye uyan ödenmiş borçları tek UPDATE ile ödenmedi yap, güncel bakiyeleri döndür"""
+        pass
+    
     @abstractmethod
     def get_customer_total_debt(self, customer_id: int) -> float:
         """Müşterinin toplam borç tutarını getir"""
         pass
 
 
+class IPaymentRepository(ABC):
+    """
+    Payment Repository Abstract Interface
+    """
+    
+    @abstractmethod
+    def get_by_id(self, payment_id: int) -> Optional[PaymentDTO]:
+        """ID ile ödeme getir"""
+        pass
+    
+    @abstractmethod
+    def get_page(self, customer_id: Optional[int] = None, limit: int = 50, cursor: Optional[str] = None) -> PageDTO:
+        """Ödemeleri cursor sayfalama ile getir"""
+        pass
+    
+    @abstractmethod
+    def create(self, payment_dto: PaymentDTO) -> Optional[PaymentDTO]:
+        """Ödemeyi kaydet ve açık borçlara FIFO dağıt (müşteri yoksa None)"""
+        pass
+    
+    @abstractmethod
+    def settle_customer(
+        self,
+        customer_id: int,
+        user_id: Optional[int] = None,
+        notes: Optional[str] = None,
+    ) -> Optional[SettlementResultDTO]:
+        """Müşterinin tüm açık borçlarını kapat ve tek ödeme kaydı yaz"""
+        pass
+
+
+class IStatementRepository(ABC):
+    """
+    Customer Statement Repository Abstract Interface
+    """
+    
+    @abstractmethod
+    def get_statement(
+        self,
+        customer_id: int,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Optional[StatementDTO]:
+        """Müşterinin tarih aralığındaki ekstresini getir (müşteri yoksa None)"""
+        pass
+
+
 class IGalleryRepository(ABC):
     """
     Gallery Repository Abstract Interface
@@ -120,6 +275,11 @@ class IGalleryRepository(ABC):
         """Tüm galeri resimlerini getir"""
         pass
     
+    @abstractmethod
+    def get_page(self, is_active: Optional[bool] = None, limit: int = 50, cursor: Optional[str] = None) -> PageDTO:
+        """Galeri resimlerini cursor sayfalama ile getir"""
+        pass
+    
     @abstractmethod
     def update(self, image_id: int, gallery_dto):
         """Galeri resmi bilgilerini güncelle"""
@@ -151,6 +311,11 @@ class IContactRepository(ABC):
         """Tüm mesajları getir"""
         pass
     
+    @abstractmethod
+    def get_page(self, is_read: Optional[bool] = None, limit: int = 50, cursor: Optional[str] = None) -> PageDTO:
+        """Mesajları cursor sayfalama ile getir"""
+        pass
+    
     @abstractmethod
     def mark_as_read(self, message_id: int) -> bool:
         """Mesajı okundu olarak işaretle"""
@@ -161,3 +326,46 @@ class IContactRepository(ABC):
         """Mesajı sil"""
         pass
 
+
+
+class IReportRepository(ABC):
+    """
+    Report Repository Abstract Interface
+    """
+    
+    @abstractmethod
+    def get_dashboard_stats(self) -> DashboardStatsDTO:
+        """Dashboard istatistiklerini getir"""
+        pass
+    
+    @abstractmethod
+    def get_aging(self, as_of: Optional[date] = None, limit: int = 50, live: bool = False) -> Optional[AgingReportDTO]:
+        """Yaşlandırma raporu: varsa gün sonu görüntüsü, yoksa canlı (görüntüsü olmayan geçmiş gün için None)"""
+        pass
+    
+    @abstractmethod
+    def materialize_aging(self, as_of: Optional[date] = None) -> int:
+        """Günün yaşlandırma görüntüsünü yaz, müşteri satırı sayısını döndür"""
+        pass
+    
+    @abstractmethod
+    def get_timeseries(
+        self,
+        date_from: date,
+        date_to: date,
+        interval: str = 'week',
+        debt_type: Optional[str] = None,
+    ) -> TimeseriesDTO:
+        """Günlük özetlerden dönemlik açılan/ödenen/açık tutar serisi"""
+        pass
+
+
+class ISyncRepository(ABC):
+    """
+    Sync Repository Abstract Interface
+    """
+    
+    @abstractmethod
+    def get_changes(self, token: Optional[str] = None) -> SyncDTO:
+        """Token'dan bu yana eklenen, güncellenen ve silinen kayıtları getir"""
+        pass
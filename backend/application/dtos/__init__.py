@@ -3,13 +3,37 @@ DTOs (Data Transfer Objects) module.
 """
 from backend.application.dtos.customer_dto import CustomerDTO
 from backend.application.dtos.debt_dto import DebtDTO
-from backend.application.dtos.payment_dto import PaymentDTO
+from backend.application.dtos.payment_dto import PaymentAllocationDTO, PaymentDTO, SettlementResultDTO
 from backend.application.dtos.gallery_dto import GalleryImageDTO
+from backend.application.dtos.dashboard_dto import DashboardStatsDTO
+from backend.application.dtos.page_dto import PageDTO
+from backend.application.dtos.ledger_import_dto import LedgerImportErrorDTO, LedgerImportResultDTO
+from backend.application.dtos.sync_dto import SyncDTO
+from backend.application.dtos.balance_dto import CustomerBalanceDTO, DebtBulkUpdateResultDTO
+from backend.application.dtos.statement_dto import StatementDTO, StatementEntryDTO
+from backend.application.dtos.aging_dto import AgingReportDTO, AgingRowDTO, OverdueDebtDTO
+from backend.application.dtos.timeseries_dto import TimeseriesDTO, TimeseriesPointDTO
 
 __all__ = [
     'CustomerDTO',
     'DebtDTO',
     'PaymentDTO',
+    'PaymentAllocationDTO',
+    'SettlementResultDTO',
     'GalleryImageDTO',
+    'DashboardStatsDTO',
+    'PageDTO',
+    'LedgerImportErrorDTO',
+    'LedgerImportResultDTO',
+    'SyncDTO',
+    'CustomerBalanceDTO',
+    'DebtBulkUpdateResultDTO',
+    'StatementDTO',
+    'StatementEntryDTO',
+    'AgingReportDTO',
+    'AgingRowDTO',
+    'OverdueDebtDTO',
+    'TimeseriesDTO',
+    'TimeseriesPointDTO',
 ]
 
@@ -0,0 +1,92 @@
+"""
+Aging DTOs (Data Transfer Objects) for overdue debt reports.
+"""
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from typing import List, Optional
+
+from backend.application.dtos.debt_dto import DebtDTO
+
+
+@dataclass
+class OverdueDebtDTO(DebtDTO):
+    """
+    Vadesi geçmiş borç - gecikme gün sayısı ile
+    """
+    days_overdue: int = 0
+    aging_bucket: str = '0_30'
+    
+    def to_dict(self) -> dict:
+        """DTO'yu dictionary'e çevir"""
+        data = super().to_dict()
+        data['days_overdue'] = self.days_overdue
+        data['aging_bucket'] = self.aging_bucket
+        return data
+
+
+@dataclass
+class AgingRowDTO:
+    """
+    Yaşlandırma satırı (müşteri veya genel toplam)
+    """
+    customer_id: Optional[int] = None
+    customer_name: Optional[str] = None
+    customer_phone: Optional[str] = None
+    bucket_0_30: Decimal = Decimal('0.00')
+    bucket_31_60: Decimal = Decimal('0.00')
+    bucket_61_90: Decimal = Decimal('0.00')
+    bucket_90_plus: Decimal = Decimal('0.00')
+    total: Decimal = Decimal('0.00')
+    debt_count: int = 0
+    oldest_due_date: Optional[date] = None
+    
+    def buckets(self) -> dict:
+        """Dilim anahtarı -> tutar"""
+        return {
+            '0_30': self.bucket_0_30,
+            '31_60': self.bucket_31_60,
+            '61_90': self.bucket_61_90,
+            '90_plus': self.bucket_90_plus,
+        }
+    
+    def to_dict(self) -> dict:
+        """DTO'yu dictionary'e çevir"""
+        return {
+            'customer_id': self.customer_id,
+            'customer_name': self.customer_name,
+            'customer_phone': self.customer_phone,
+            'buckets': self.buckets(),
+            'total': self.total,
+            'debt_count': self.debt_count,
+            'oldest_due_date': self.oldest_due_date.isoformat() if self.oldest_due_date else None,
+        }
+
+
+@dataclass
+class AgingReportDTO:
+    """
+    Vadesi geçmiş borç yaşlandırma raporu
+    
+    source 'snapshot' ise rapor generated_at anındaki gün sonu
+    görüntüsünden, 'live' ise doğrudan borç kayıtlarından okunmuştur.
+    customers en yüksek toplamdan başlayarak sıralanır.
+    """
+    as_of: Optional[date] = None
+    source: str = 'live'
+    generated_at: Optional[datetime] = None
+    summary: AgingRowDTO = field(default_factory=AgingRowDTO)
+    customers: List[AgingRowDTO] = field(default_factory=list)
+    
+    def to_dict(self) -> dict:
+        """DTO'yu dictionary'e çevir"""
+        return {
+            'as_of': self.as_of.isoformat() if self.as_of else None,
+            'source': self.source,
+            'generated_at': self.generated_at.isoformat() if self.generated_at else None,
+            'buckets': self.summary.buckets(),
+            'total': self.summary.total,
+            'debt_count': self.summary.debt_count,
+            'oldest_due_date': self.summary.oldest_due_date.isoformat() if self.summary.oldest_due_date else None,
+            'customers': [row.to_dict() for row in self.customers],
+        }
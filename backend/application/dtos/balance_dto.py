@@ -0,0 +1,47 @@
+"""
+Balance DTOs (Data Transfer Objects) for the application layer.
+"""
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import List
+
+
+@dataclass
+class CustomerBalanceDTO:
+    """
+    Müşteri bakiyesi (denormalize CustomerBalance satırı)
+    """
+    customer_id: int = 0
+    outstanding_debt: Decimal = Decimal('0.00')
+    outstanding_credit: Decimal = Decimal('0.00')
+    paid_total: Decimal = Decimal('0.00')
+    
+    def to_dict(self) -> dict:
+        """DTO'yu dictionary'e çevir"""
+        return {
+            'customer_id': self.customer_id,
+            'outstanding_debt': self.outstanding_debt,
+            'outstanding_credit': self.outstanding_credit,
+            'paid_total': self.paid_total,
+        }
+
+
+@dataclass
+class DebtBulkUpdateResultDTO:
+    """
+    Toplu ödeme durumu güncelleme sonucu
+    
+    skipped_ids, ödeme kayıtlarıyla tamamen kapatıldığı için ödenmedi
+    yapılamayan borçlardır.
+    """
+    updated: int = 0
+    balances: List[CustomerBalanceDTO] = field(default_factory=list)
+    skipped_ids: List[int] = field(default_factory=list)
+    
+    def to_dict(self) -> dict:
+        """DTO'yu dictionary'e çevir"""
+        return {
+            'updated': self.updated,
+            'balances': [balance.to_dict() for balance in self.balances],
+            'skipped_ids': self.skipped_ids,
+        }
@@ -0,0 +1,29 @@
+"""
+Dashboard DTO (Data Transfer Object) for the application layer.
+"""
+from dataclasses import dataclass
+from decimal import Decimal
+
+
+@dataclass
+class DashboardStatsDTO:
+    """
+    Dashboard istatistikleri veri transfer objesi
+    """
+    total_customers: int = 0
+    active_customers: int = 0
+    total_debts: int = 0
+    unpaid_debts: int = 0
+    total_debt_amount: Decimal = Decimal('0.00')
+    total_paid_amount: Decimal = Decimal('0.00')
+    
+    def to_dict(self) -> dict:
+        """DTO'yu dictionary'e çevir"""
+        return {
+            'total_customers': self.total_customers,
+            'active_customers': self.active_customers,
+            'total_debts': self.total_debts,
+            'unpaid_debts': self.unpaid_debts,
+            'total_debt_amount': float(self.total_debt_amount),
+            'total_paid_amount': float(self.total_paid_amount),
+        }
@@ -17,6 +17,7 @@ class DebtDTO:
     customer_name: Optional[str] = None
     debt_type: str = "DEBT"  # DEBT or CREDIT
     amount: Decimal = Decimal('0.00')
+    paid_amount: Decimal = Decimal('0.00')
     description: Optional[str] = None
     is_paid: bool = False
     paid_at: Optional[datetime] = None
@@ -26,6 +27,13 @@ class DebtDTO:
     created_by_id: Optional[int] = None
     due_date: Optional[date] = None
     
+    @property
+    def remaining_amount(self) -> Decimal:
+        """Kalan (ödenmemiş) tutar"""
+        if self.is_paid:
+            return Decimal('0.00')
+        return self.amount - self.paid_amount
+    
     def to_dict(self) -> dict:
         """DTO'yu dictionary'e çevir"""
         return {
@@ -35,6 +43,8 @@ class DebtDTO:
             'debt_type': self.debt_type,
             'debt_type_display': 'Borç' if self.debt_type == 'DEBT' else 'Alacak',
             'amount': float(self.amount),
+            'paid_amount': float(self.paid_amount),
+            'remaining_amount': float(self.remaining_amount),
             'description': self.description,
             'is_paid': self.is_paid,
             'paid_at': self.paid_at.isoformat() if self.paid_at else None,
@@ -1,9 +1,9 @@
 """
 Gallery DTO (Data Transfer Object) for the application layer.
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 
 @dataclass
@@ -15,6 +15,13 @@ class GalleryImageDTO:
     title: str = ""
     description: Optional[str] = None
     image_url: Optional[str] = None
+    srcset: Optional[str] = None  # WebP varyantları ("url 320w, url 640w, ...")
+    sources: List[dict] = field(default_factory=list)  # <picture> kaynakları, AVIF önce
+    placeholder: Optional[str] = None  # bulanık önizleme data URI
+    width: Optional[int] = None
+    height: Optional[int] = None
+    processing_status: str = "READY"  # PENDING, PROCESSING, READY, FAILED
+    processing_error: Optional[str] = None
     is_active: bool = True
     order: int = 0
     created_at: Optional[datetime] = None
@@ -28,6 +35,13 @@ class GalleryImageDTO:
             'title': self.title,
             'description': self.description,
             'image_url': self.image_url,
+            'srcset': self.srcset,
+            'sources': self.sources,
+            'placeholder': self.placeholder,
+            'width': self.width,
+            'height': self.height,
+            'processing_status': self.processing_status,
+            'processing_error': self.processing_error,
             'is_active': self.is_active,
             'order': self.order,
             'created_at': self.created_at.isoformat() if self.created_at else None,
@@ -0,0 +1,47 @@
+"""
+Ledger import DTOs (Data Transfer Objects) for the application layer.
+"""
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass
+class LedgerImportErrorDTO:
+    """
+    İçe aktarılamayan satır
+    """
+    line: int = 0
+    errors: List[str] = field(default_factory=list)
+    
+    def to_dict(self) -> dict:
+        """DTO'yu dictionary'e çevir"""
+        return {
+            'line': self.line,
+            'errors': self.errors,
+        }
+
+
+@dataclass
+class LedgerImportResultDTO:
+    """
+    Defter içe aktarma sonucu
+    """
+    total_rows: int = 0
+    imported: int = 0
+    dry_run: bool = False
+    errors: List[LedgerImportErrorDTO] = field(default_factory=list)
+    
+    @property
+    def failed(self) -> int:
+        """Hatalı satır sayısı"""
+        return len(self.errors)
+    
+    def to_dict(self) -> dict:
+        """DTO'yu dictionary'e çevir"""
+        return {
+            'total_rows': self.total_rows,
+            'imported': self.imported,
+            'failed': self.failed,
+            'dry_run': self.dry_run,
+            'errors': [error.to_dict() for error in self.errors],
+        }
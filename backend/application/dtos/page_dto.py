@@ -0,0 +1,20 @@
+"""
+Page DTO (Data Transfer Object) for cursor-paginated results.
+"""
+from dataclasses import dataclass, field
+from typing import Any, List, Optional
+
+
+@dataclass
+class PageDTO:
+    """
+    Cursor tabanlı sayfalama sonucu
+    """
+    items: List[Any] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    
+    def __len__(self) -> int:
+        return len(self.items)
+    
+    def __iter__(self):
+        return iter(self.items)
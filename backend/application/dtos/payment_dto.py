@@ -1,32 +1,74 @@
 """
 Payment DTO (Data Transfer Object) for the application layer.
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import List, Optional
+
+from backend.application.dtos.balance_dto import CustomerBalanceDTO
+
+
+@dataclass
+class PaymentAllocationDTO:
+    """
+    Ödemenin bir borca uygulanan kısmı
+    """
+    debt_id: int = 0
+    amount: Decimal = Decimal('0.00')
+    
+    def to_dict(self) -> dict:
+        """DTO'yu dictionary'e çevir"""
+        return {
+            'debt_id': self.debt_id,
+            'amount': float(self.amount),
+        }
 
 
 @dataclass
 class PaymentDTO:
     """
     Payment veri transfer objesi - Borç ödeme işlemleri için
+    
+    debt_id verilirse ödeme yalnızca o borca, verilmezse müşterinin açık
+    borçlarına en eskiden başlayarak (FIFO) dağıtılır.
     """
-    debt_id: int = 0
+    id: Optional[int] = None
+    debt_id: Optional[int] = None
     customer_id: int = 0
     amount: Decimal = Decimal('0.00')
     payment_date: Optional[datetime] = None
     notes: Optional[str] = None
     paid_by_id: Optional[int] = None
+    allocations: List[PaymentAllocationDTO] = field(default_factory=list)
     
     def to_dict(self) -> dict:
         """DTO'yu dictionary'e çevir"""
         return {
+            'id': self.id,
             'debt_id': self.debt_id,
             'customer_id': self.customer_id,
             'amount': float(self.amount),
             'payment_date': self.payment_date.isoformat() if self.payment_date else None,
             'notes': self.notes,
             'paid_by_id': self.paid_by_id,
+            'allocations': [allocation.to_dict() for allocation in self.allocations],
         }
 
+
+@dataclass
+class SettlementResultDTO:
+    """
+    Müşteri hesabı kapatma sonucu
+    """
+    payment: PaymentDTO
+    settled_count: int
+    balance: CustomerBalanceDTO
+    
+    def to_dict(self) -> dict:
+        """DTO'yu dictionary'e çevir"""
+        return {
+            'payment': self.payment.to_dict(),
+            'settled_count': self.settled_count,
+            'balance': self.balance.to_dict(),
+        }
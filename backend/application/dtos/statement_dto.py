@@ -0,0 +1,61 @@
+"""
+Statement DTOs (Data Transfer Objects) for customer ledger statements.
+"""
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from typing import List, Optional
+
+
+@dataclass
+class StatementEntryDTO:
+    """
+    Hesap ekstresi satırı
+    """
+    id: int = 0
+    kind: str = ''
+    amount: Decimal = Decimal('0.00')
+    balance_after: Decimal = Decimal('0.00')
+    debt_id: Optional[int] = None
+    payment_id: Optional[int] = None
+    description: str = ''
+    created_at: Optional[datetime] = None
+    
+    def to_dict(self) -> dict:
+        """DTO'yu dictionary'e çevir"""
+        return {
+            'id': self.id,
+            'kind': self.kind,
+            'amount': self.amount,
+            'balance_after': self.balance_after,
+            'debt_id': self.debt_id,
+            'payment_id': self.payment_id,
+            'description': self.description,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+        }
+
+
+@dataclass
+class StatementDTO:
+    """
+    Müşteri hesap ekstresi sayfası
+    
+    opening_balance sayfanın ilk satırından önceki, closing_balance son
+    satırından sonraki bakiyedir. next_cursor doluysa aralıkta devam eden
+    satırlar vardır.
+    """
+    customer_id: int = 0
+    opening_balance: Decimal = Decimal('0.00')
+    closing_balance: Decimal = Decimal('0.00')
+    entries: List[StatementEntryDTO] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    
+    def to_dict(self) -> dict:
+        """DTO'yu dictionary'e çevir"""
+        return {
+            'customer_id': self.customer_id,
+            'opening_balance': self.opening_balance,
+            'closing_balance': self.closing_balance,
+            'entries': [entry.to_dict() for entry in self.entries],
+            'next': self.next_cursor,
+        }
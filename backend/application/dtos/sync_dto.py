@@ -0,0 +1,21 @@
+"""
+Sync DTO (Data Transfer Object) for delta synchronisation.
+"""
+from dataclasses import dataclass, field
+from typing import Any, List
+
+
+@dataclass
+class SyncDTO:
+    """
+    Delta senkronizasyon sonucu
+    
+    reset=True ise istemci yerel kopyasını atıp tam yükleme yapmalıdır;
+    bu durumda değişiklik listeleri boş döner.
+    """
+    token: str
+    reset: bool = False
+    customers: List[Any] = field(default_factory=list)
+    debts: List[Any] = field(default_factory=list)
+    deleted_customer_ids: List[int] = field(default_factory=list)
+    deleted_debt_ids: List[int] = field(default_factory=list)
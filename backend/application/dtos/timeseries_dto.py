@@ -0,0 +1,54 @@
+"""
+Timeseries DTOs (Data Transfer Objects) for ledger charts.
+"""
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+
+@dataclass
+class TimeseriesPointDTO:
+    """
+    Tek dönem (gün, hafta veya ay) değerleri
+    
+    outstanding_amount dönem sonundaki açık tutardır.
+    """
+    period_start: date
+    created_count: int = 0
+    created_amount: Decimal = Decimal('0.00')
+    paid_amount: Decimal = Decimal('0.00')
+    outstanding_amount: Decimal = Decimal('0.00')
+    
+    def to_dict(self) -> dict:
+        """DTO'yu dictionary'e çevir"""
+        return {
+            'period_start': self.period_start.isoformat(),
+            'created_count': self.created_count,
+            'created_amount': self.created_amount,
+            'paid_amount': self.paid_amount,
+            'outstanding_amount': self.outstanding_amount,
+        }
+
+
+@dataclass
+class TimeseriesDTO:
+    """
+    Borç türü başına dönemlik zaman serisi (günlük özetlerden)
+    """
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+    interval: str = 'week'
+    series: Dict[str, List[TimeseriesPointDTO]] = field(default_factory=dict)
+    
+    def to_dict(self) -> dict:
+        """DTO'yu dictionary'e çevir"""
+        return {
+            'date_from': self.date_from.isoformat() if self.date_from else None,
+            'date_to': self.date_to.isoformat() if self.date_to else None,
+            'interval': self.interval,
+            'series': {
+                debt_type: [point.to_dict() for point in points]
+                for debt_type, points in self.series.items()
+            },
+        }
@@ -0,0 +1,48 @@
+"""
+Application layer exceptions.
+"""
+
+
+class InvalidCursorError(ValueError):
+    """Sayfalama cursor'ı çözülemedi veya geçersiz"""
+    pass
+
+
+class LedgerRowError(ValueError):
+    """İçe aktarılan defter satırı geçersiz"""
+    
+    def __init__(self, errors):
+        if isinstance(errors, str):
+            errors = [errors]
+        self.errors = list(errors)
+        super().__init__('; '.join(self.errors))
+
+
+class InvalidSyncTokenError(ValueError):
+    """Senkronizasyon token'ı çözülemedi veya geçersiz"""
+    pass
+
+
+class NothingToSettleError(ValueError):
+    """Müşterinin kapatılacak açık borcu yok"""
+    pass
+
+
+class PaymentAllocationError(ValueError):
+    """Ödeme açık borçlara dağıtılamadı (fazla tutar, kapalı borç vb.)"""
+    pass
+
+
+class DebtHasPaymentsError(ValueError):
+    """İşlem, borca dağıtılmış ödemelerle çelişiyor (silme, tutar düşürme vb.)"""
+    pass
+
+
+__all__ = [
+    'InvalidCursorError',
+    'LedgerRowError',
+    'InvalidSyncTokenError',
+    'NothingToSettleError',
+    'PaymentAllocationError',
+    'DebtHasPaymentsError',
+]
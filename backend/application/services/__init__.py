@@ -0,0 +1,8 @@
+"""
+Application services module.
+"""
+from backend.application.services.ledger_import_service import LedgerImportService
+
+__all__ = [
+    'LedgerImportService',
+]
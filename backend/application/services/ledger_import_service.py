@@ -0,0 +1,224 @@
+"""
+Ledger import service - bulk import of debt rows from CSV or JSON Lines.
+"""
+import csv
+import json
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import Iterable, Iterator, Optional, Tuple
+
+from backend.application.dtos.debt_dto import DebtDTO
+from backend.application.dtos.ledger_import_dto import LedgerImportErrorDTO, LedgerImportResultDTO
+from backend.application.exceptions import LedgerRowError
+
+FORMAT_CSV = 'csv'
+FORMAT_JSONL = 'jsonl'
+SUPPORTED_FORMATS = (FORMAT_CSV, FORMAT_JSONL)
+
+DEFAULT_BATCH_SIZE = 500
+
+_DEBT_TYPES = {
+    'debt': 'DEBT',
+    'borc': 'DEBT',
+    'borç': 'DEBT',
+    'credit': 'CREDIT',
+    'alacak': 'CREDIT',
+}
+_TRUE_VALUES = {'1', 'true', 'yes', 'evet', 'e', 'x'}
+_FALSE_VALUES = {'', '0', 'false', 'no', 'hayir', 'hayır', 'h'}
+
+# satır numarası, satır verisi, okuma hatası
+LedgerRow = Tuple[int, Optional[dict], Optional[str]]
+
+
+def detect_format(filename: str) -> Optional[str]:
+    """Dosya uzantısından biçimi tahmin et"""
+    name = (filename or '').lower()
+    if name.endswith('.csv'):
+        return FORMAT_CSV
+    if name.endswith(('.jsonl', '.ndjson')):
+        return FORMAT_JSONL
+    return None
+
+
+def read_ledger_rows(stream, file_format: str) -> Iterator[LedgerRow]:
+    """
+    Metin akışından satırları tek tek oku (dosya belleğe alınmaz)
+    CSV'de başlık satırı 1. satırdır; veri satırları 2'den başlar.
+    """
+    if file_format == FORMAT_CSV:
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, {k.strip().lower(): v for k, v in row.items() if k}, None
+    elif file_format == FORMAT_JSONL:
+        for line_number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as exc:
+                yield line_number, None, f'Geçersiz JSON: {exc}'
+                continue
+            if not isinstance(row, dict):
+                yield line_number, None, 'Her satır bir JSON nesnesi olmalıdır.'
+                continue
+            yield line_number, {str(k).strip().lower(): v for k, v in row.items()}, None
+    else:
+        raise ValueError(f'Desteklenmeyen biçim: {file_format}')
+
+
+def _text(value) -> str:
+    return '' if value is None else str(value).strip()
+
+
+def _parse_date(value, field_name: str, errors: list):
+    text = _text(value)
+    if not text:
+        return None
+    try:
+        if len(text) == 10:
+            return date.fromisoformat(text)
+        return datetime.fromisoformat(text)
+    except ValueError:
+        errors.append(f'{field_name}: geçersiz tarih "{text}" (YYYY-AA-GG bekleniyor).')
+        return None
+
+
+def parse_ledger_row(row: dict) -> Tuple[DebtDTO, Optional[str]]:
+    """
+    Ham satırı DebtDTO'ya çevir
+    Dönüş: (dto, customer_phone) - müşteri telefonla verildiyse customer_id 0'dır.
+    """
+    errors = []
+    
+    customer_id = 0
+    customer_phone = _text(row.get('customer_phone') or row.get('phone')) or None
+    raw_customer_id = _text(row.get('customer_id'))
+    if raw_customer_id:
+        try:
+            customer_id = int(raw_customer_id)
+        except ValueError:
+            errors.append(f'customer_id: geçersiz değer "{raw_customer_id}".')
+    elif not customer_phone:
+        errors.append('customer_id veya customer_phone gereklidir.')
+    
+    amount = None
+    raw_amount = _text(row.get('amount'))
+    if ',' in raw_amount and '.' not in raw_amount:
+        raw_amount = raw_amount.replace(',', '.')
+    try:
+        amount = Decimal(raw_amount).quantize(Decimal('0.01'))
+        if amount <= 0:
+            errors.append("amount: tutar 0'dan büyük olmalıdır.")
+    except (InvalidOperation, ValueError):
+        errors.append(f'amount: geçersiz tutar "{raw_amount}".')
+    
+    raw_type = _text(row.get('debt_type')).lower() or 'debt'
+    debt_type = _DEBT_TYPES.get(raw_type)
+    if debt_type is None:
+        errors.append(f'debt_type: "{raw_type}" yerine DEBT veya CREDIT olmalıdır.')
+    
+    raw_paid = _text(row.get('is_paid')).lower()
+    is_paid = False
+    if raw_paid in _TRUE_VALUES:
+        is_paid = True
+    elif raw_paid not in _FALSE_VALUES:
+        errors.append(f'is_paid: geçersiz değer "{raw_paid}".')
+    
+    due_date = _parse_date(row.get('due_date'), 'due_date', errors)
+    if isinstance(due_date, datetime):
+        due_date = due_date.date()
+    created_at = _parse_date(row.get('created_at') or row.get('date'), 'created_at', errors)
+    paid_at = _parse_date(row.get('paid_at'), 'paid_at', errors)
+    
+    if errors:
+        raise LedgerRowError(errors)
+    
+    dto = DebtDTO(
+        customer_id=customer_id,
+        debt_type=debt_type,
+        amount=amount,
+        description=_text(row.get('description')) or None,
+        is_paid=is_paid,
+        due_date=due_date,
+        created_at=created_at,
+        paid_at=paid_at if is_paid else None,
+    )
+    return dto, customer_phone
+
+
+class LedgerImportService:
+    """
+    Eski defter kayıtlarını toplu içe aktarır
+    
+    Satırlar akış halinde doğrulanır; her batch için müşteriler tek bir
+    toplu sorgu ile çözülür ve kayıtlar ayrı bir transaction içinde toplu
+    olarak yazılır. Hatalı satırlar atlanır ve raporlanır.
+    """
+    
+    def __init__(self, customer_repository, debt_repository):
+        self.customer_repository = customer_repository
+        self.debt_repository = debt_repository
+    
+    def import_rows(
+        self,
+        rows: Iterable[LedgerRow],
+        created_by_id: Optional[int] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        dry_run: bool = False,
+    ) -> LedgerImportResultDTO:
+        """Satırları batch'ler halinde içe aktar"""
+        result = LedgerImportResultDTO(dry_run=dry_run)
+        batch = []
+        
+        for line, row, read_error in rows:
+            result.total_rows += 1
+            if read_error:
+                result.errors.append(LedgerImportErrorDTO(line=line, errors=[read_error]))
+                continue
+            try:
+                dto, customer_phone = parse_ledger_row(row)
+            except LedgerRowError as exc:
+                result.errors.append(LedgerImportErrorDTO(line=line, errors=exc.errors))
+                continue
+            dto.created_by_id = created_by_id
+            batch.append((line, dto, customer_phone))
+            
+            if len(batch) >= batch_size:
+                self._flush(batch, result, dry_run)
+                batch = []
+        
+        if batch:
+            self._flush(batch, result, dry_run)
+        
+        result.errors.sort(key=lambda error: error.line)
+        return result
+    
+    def _flush(self, batch, result: LedgerImportResultDTO, dry_run: bool):
+        """Batch'in müşterilerini çöz ve geçerli satırları yaz"""
+        customer_ids = {dto.customer_id for _, dto, _ in batch if dto.customer_id}
+        phones = {phone for _, dto, phone in batch if phone and not dto.customer_id}
+        active_ids, phone_ids = self.customer_repository.resolve_active_customers(customer_ids, phones)
+        
+        valid = []
+        for line, dto, phone in batch:
+            if not dto.customer_id:
+                dto.customer_id = phone_ids.get(phone, 0)
+                if not dto.customer_id:
+                    result.errors.append(LedgerImportErrorDTO(
+                        line=line,
+                        errors=[f'customer_phone: "{phone}" numaralı aktif müşteri bulunamadı.'],
+                    ))
+                    continue
+            elif dto.customer_id not in active_ids:
+                result.errors.append(LedgerImportErrorDTO(
+                    line=line,
+                    errors=[f'customer_id: {dto.customer_id} numaralı aktif müşteri bulunamadı.'],
+                ))
+                continue
+            valid.append(dto)
+        
+        if dry_run:
+            result.imported += len(valid)
+        else:
+            result.imported += self.debt_repository.bulk_create(valid)
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class BackendConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'backend'
+    
+    def ready(self):
+        # Signal handler'larını bağla
+        import backend.core.signals  # noqa: F401
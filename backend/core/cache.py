@@ -0,0 +1,92 @@
+"""
+Cache version counters for write-through invalidation.
+
+Cache'lenen her veri, bağlı olduğu ad alanlarının (ör. "customers",
+"debts") sürüm anahtarlarını içerir. Yazma işlemleri commit sonrası
+sürümü değiştirir; eski anahtarlar bir daha okunmaz ve zaman aşımıyla
+düşer. Tek tek anahtar silmeye gerek kalmaz.
+
+Modeller CACHE_NAMESPACE sınıf niteliği ile bir ad alanına bağlanır;
+post_save/post_delete ve toplu yazma sinyalleri sürümü otomatik olarak
+değiştirir (bkz. backend.core.signals.cache).
+"""
+import hashlib
+import uuid
+from typing import Callable, Iterable, Tuple
+
+from django.core.cache import caches
+from django.db import transaction
+
+from backend.core import replica
+
+VERSION_CACHE_ALIAS = 'default'
+VERSION_KEY = 'cache-version:{namespace}'
+
+
+def _version_key(namespace: str) -> str:
+    return VERSION_KEY.format(namespace=namespace)
+
+
+def get_versions(namespaces: Iterable[str]) -> Tuple[str, ...]:
+    """Ad alanlarının güncel sürümleri, tek bir get_many ile (yoksa oluşturulur)"""
+    namespaces = tuple(namespaces)
+    cache = caches[VERSION_CACHE_ALIAS]
+    found = cache.get_many([_version_key(namespace) for namespace in namespaces])
+    
+    versions = []
+    for namespace in namespaces:
+        key = _version_key(namespace)
+        version = found.get(key)
+        if version is None:
+            version = uuid.uuid4().hex
+            # Aynı anda oluşturan başka bir süreç varsa onunki geçerli olur
+            if not cache.add(key, version, timeout=None):
+                version = cache.get(key, version)
+        versions.append(version)
+    return tuple(versions)
+
+
+def get_version(namespace: str) -> str:
+    """Tek bir ad alanının güncel sürümü"""
+    return get_versions([namespace])[0]
+
+
+def bump_version(namespace: str):
+    """
+    Ad alanını commit sonrası geçersiz kıl
+    
+    incr yerine her seferinde yeni bir token yazılır; dosya tabanlı
+    cache'te atomik olmayan incr yüzünden sürüm değişikliği kaybolmaz.
+    """
+    key = _version_key(namespace)
+    transaction.on_commit(
+        lambda: caches[VERSION_CACHE_ALIAS].set(key, uuid.uuid4().hex, timeout=None)
+    )
+
+
+def versioned_key(prefix: str, namespaces: Iterable[str], key: str) -> str:
+    """Ad alanı sürümlerini içeren cache anahtarı"""
+    versions = ':'.join(get_versions(namespaces))
+    digest = hashlib.md5(f'{versions}|{key}'.encode()).hexdigest()
+    return f'{prefix}:{digest}'
+
+
+def cached_value(alias: str, namespaces: Iterable[str], key: str, compute: Callable, timeout=None):
+    """
+    Değeri ad alanı sürümlerine bağlı olarak cache'le
+    
+    timeout verilmezse adlandırılmış cache'in varsayılan TIMEOUT'u kullanılır.
+    Değer replica'dan okunduysa süre replica gecikme penceresiyle sınırlanır.
+    """
+    cache = caches[alias]
+    cache_key = versioned_key(alias, namespaces, key)
+    value = cache.get(cache_key)
+    if value is None:
+        reads_before = replica.replica_reads()
+        value = compute()
+        timeout = replica.lag_bounded_timeout(timeout, reads_before)
+        if timeout is None:
+            cache.set(cache_key, value)
+        else:
+            cache.set(cache_key, value, timeout)
+    return value
@@ -0,0 +1,13 @@
+"""
+Background jobs module.
+Task handlers are registered when this package is imported.
+"""
+from backend.core.jobs.registry import enqueue, register, run_job, run_next_job
+from backend.core.jobs import gallery  # noqa: F401
+
+__all__ = [
+    'enqueue',
+    'register',
+    'run_job',
+    'run_next_job',
+]
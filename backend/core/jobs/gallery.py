@@ -0,0 +1,52 @@
+"""
+Gallery image post-upload processing task.
+"""
+from django.db import transaction
+
+from backend.core.cache import bump_version
+from backend.core.jobs.registry import register
+from backend.core.models import GalleryImage
+
+PROCESS_IMAGE = 'gallery.process_image'
+
+
+def _give_up(payload: dict, error: str):
+    """Tüm denemeler başarısız: resmi FAILED olarak işaretle"""
+    GalleryImage.objects.filter(pk=payload['image_id']).update(
+        processing_status=GalleryImage.ProcessingStatus.FAILED,
+        processing_error=error.strip().splitlines()[-1],
+    )
+    bump_version(GalleryImage.CACHE_NAMESPACE)
+
+
+@register(PROCESS_IMAGE, on_give_up=_give_up)
+def process_gallery_image(payload: dict):
+    """EXIF/metadata temizle, orijinali yeniden kodla ve varyantları üret"""
+    try:
+        gallery_image = GalleryImage.objects.get(pk=payload['image_id'])
+    except GalleryImage.DoesNotExist:
+        # İş çalışmadan önce resim silinmiş
+        return
+    
+    gallery_image.processing_status = GalleryImage.ProcessingStatus.PROCESSING
+    gallery_image.save(update_fields=['processing_status'])
+    
+    replaced_name = None
+    try:
+        replaced_name = gallery_image.strip_metadata()
+        gallery_image.generate_variants(save=False)
+    except Exception as exc:
+        # Satır hâlâ orijinali gösteriyor: yeni yazılan kopya silinir, orijinal kalır
+        if replaced_name:
+            gallery_image.delete_replaced_file(gallery_image.image.name)
+        # Yeniden denenecek; son hata resim üzerinde görünsün
+        GalleryImage.objects.filter(pk=gallery_image.pk).update(processing_error=str(exc))
+        bump_version(GalleryImage.CACHE_NAMESPACE)
+        raise
+    
+    gallery_image.processing_status = GalleryImage.ProcessingStatus.READY
+    gallery_image.processing_error = ''
+    gallery_image.save(update_fields=['image', 'variants', 'processing_status', 'processing_error'])
+    if replaced_name:
+        # Eski dosya ancak yeni ad veritabanına yazıldıktan sonra silinir
+        transaction.on_commit(lambda: gallery_image.delete_replaced_file(replaced_name))
@@ -0,0 +1,90 @@
+"""
+Background task registry, enqueueing and execution.
+"""
+import logging
+import traceback
+from typing import Callable, Dict, NamedTuple, Optional
+
+from django.conf import settings
+from django.db import transaction
+
+from backend.core.models import BackgroundJob
+
+logger = logging.getLogger(__name__)
+
+
+class Task(NamedTuple):
+    handler: Callable[[dict], None]
+    on_give_up: Optional[Callable[[dict, str], None]]
+
+
+_TASKS: Dict[str, Task] = {}
+
+
+def register(name: str, on_give_up: Optional[Callable[[dict, str], None]] = None):
+    """
+    Görev kaydı dekoratörü
+    
+    on_give_up(payload, error): tüm denemeler başarısız olunca çağrılır.
+    """
+    def decorator(handler):
+        _TASKS[name] = Task(handler, on_give_up)
+        return handler
+    return decorator
+
+
+def enqueue(task: str, payload: dict, max_attempts: int = 3) -> BackgroundJob:
+    """
+    İşi kuyruğa ekle
+    
+    Kayıt çağıranın transaction'ı içinde yazılır; worker işi ancak commit
+    sonrası görür. BACKGROUND_JOBS_EAGER açıksa (geliştirme) iş commit
+    sonrası aynı süreçte çalıştırılır.
+    """
+    if task not in _TASKS:
+        raise ValueError(f'Kayıtlı olmayan görev: {task}')
+    
+    job = BackgroundJob.objects.create(task=task, payload=payload, max_attempts=max_attempts)
+    
+    if getattr(settings, 'BACKGROUND_JOBS_EAGER', False):
+        transaction.on_commit(lambda: run_next_job())
+    
+    return job
+
+
+def run_job(job: BackgroundJob) -> bool:
+    """Alınmış (RUNNING) bir işi çalıştır; başarılıysa True"""
+    task = _TASKS.get(job.task)
+    try:
+        if task is None:
+            raise LookupError(f'Kayıtlı olmayan görev: {job.task}')
+        task.handler(job.payload)
+    except Exception:
+        error = traceback.format_exc()
+        logger.warning('Arka plan işi başarısız: %s (deneme %s/%s)', job, job.attempts, job.max_attempts)
+        if job.mark_failed(error):
+            _give_up(job, error)
+        return False
+    
+    job.mark_done()
+    return True
+
+
+def _give_up(job: BackgroundJob, error: str):
+    """Kalıcı olarak başarısız olan işin on_give_up kancasını çağır"""
+    task = _TASKS.get(job.task)
+    if task is not None and task.on_give_up is not None:
+        task.on_give_up(job.payload, error)
+
+
+def run_next_job() -> Optional[BackgroundJob]:
+    """Sıradaki işi al ve çalıştır; iş yoksa None"""
+    stale_after = settings.BACKGROUND_JOBS_STALE_AFTER
+    for job in BackgroundJob.fail_stale(stale_after):
+        logger.warning('Arka plan işi takılı kaldı, deneme hakkı bitti: %s', job)
+        _give_up(job, job.last_error)
+    
+    job = BackgroundJob.claim_next(stale_after=stale_after)
+    if job is not None:
+        run_job(job)
+    return job
@@ -0,0 +1,141 @@
+"""
+Aging snapshot model - nightly materialized overdue debt buckets.
+"""
+from decimal import Decimal
+from django.db import models, transaction
+from django.db.models import Count, DecimalField, F, Min, Q, Sum
+from django.db.models.functions import Coalesce
+from django.utils.translation import gettext_lazy as _
+
+from backend.core.models.debt import Debt
+from backend.core.utils.aging import BUCKET_KEYS, bucket_date_ranges
+
+MATERIALIZE_BATCH_SIZE = 500
+
+
+class AgingSnapshot(models.Model):
+    """
+    Vadesi geçmiş borç yaşlandırma özeti (gün sonu görüntüsü)
+    
+    Her as_of günü için müşteri başına bir satır ve customer'ı boş olan bir
+    genel toplam satırı yazılır. Yaşlandırma raporu bu tablodan index
+    üzerinde tek bir okuma ile servis edilir; canlı hesaplama gerekmez.
+    Satırlar yazıldıkları andaki durumu gösterir (bkz. materialize_aging).
+    """
+    
+    class Meta:
+        verbose_name = _('Yaşlandırma Görüntüsü')
+        verbose_name_plural = _('Yaşlandırma Görüntüleri')
+        ordering = ['-as_of', '-total']
+        indexes = [
+            models.Index(fields=['as_of', '-total']),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=['as_of', 'customer'], name='unique_aging_snapshot_customer'),
+        ]
+    
+    as_of = models.DateField(_('Tarih'))
+    
+    customer = models.ForeignKey(
+        'Customer',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='aging_snapshots',
+        verbose_name=_('Müşteri'),
+        help_text=_('Boş ise genel toplam satırıdır')
+    )
+    
+    bucket_0_30 = models.DecimalField(_('0-30 gün'), max_digits=14, decimal_places=2, default=Decimal('0.00'))
+    bucket_31_60 = models.DecimalField(_('31-60 gün'), max_digits=14, decimal_places=2, default=Decimal('0.00'))
+    bucket_61_90 = models.DecimalField(_('61-90 gün'), max_digits=14, decimal_places=2, default=Decimal('0.00'))
+    bucket_90_plus = models.DecimalField(_('90+ gün'), max_digits=14, decimal_places=2, default=Decimal('0.00'))
+    
+    total = models.DecimalField(
+        _('Toplam'),
+        max_digits=14,
+        decimal_places=2,
+        default=Decimal('0.00'),
+        help_text=_('Vadesi geçmiş kalan tutar')
+    )
+    
+    debt_count = models.PositiveIntegerField(_('Borç Sayısı'), default=0)
+    
+    oldest_due_date = models.DateField(_('En Eski Vade'), blank=True, null=True)
+    
+    created_at = models.DateTimeField(
+        _('Oluşturulma Tarihi'),
+        auto_now_add=True
+    )
+    
+    def __str__(self):
+        owner = self.customer_id or _('Toplam')
+        return f"{self.as_of} - {owner}: {self.total} TL"
+    
+    @staticmethod
+    def overdue_filter(as_of, prefix=''):
+        """Vadesi as_of'tan önce olan ödenmemiş borçlar"""
+        return Q(**{
+            f'{prefix}is_paid': False,
+            f'{prefix}debt_type': 'DEBT',
+            f'{prefix}due_date__lt': as_of,
+        })
+    
+    @staticmethod
+    def bucket_expressions(as_of, prefix=''):
+        """
+        Yaşlandırma dilimleri için aggregate ifadeleri (overdue_filter ile birlikte)
+        
+        Her dilim, kalan tutarın due_date aralığına göre koşullu toplamıdır;
+        tüm dilimler tek bir gruplu sorguda hesaplanır.
+        """
+        due_date = f'{prefix}due_date'
+        remaining = F(f'{prefix}amount') - F(f'{prefix}paid_amount')
+        output = DecimalField(max_digits=14, decimal_places=2)
+        zero = Decimal('0.00')
+        
+        expressions = {}
+        for key, (earliest, latest) in bucket_date_ranges(as_of).items():
+            condition = Q(**{f'{due_date}__lte': latest})
+            if earliest is not None:
+                condition &= Q(**{f'{due_date}__gte': earliest})
+            expressions[f'bucket_{key}'] = Coalesce(Sum(remaining, filter=condition), zero, output_field=output)
+        expressions['total'] = Coalesce(Sum(remaining), zero, output_field=output)
+        expressions['debt_count'] = Count(f'{prefix}id')
+        expressions['oldest_due_date'] = Min(due_date)
+        return expressions
+    
+    @classmethod
+    def customer_totals(cls, as_of, *fields):
+        """
+        Müşteri başına yaşlandırma toplamları (tek gruplu sorgu)
+        
+        fields, gruplamaya eklenecek ek müşteri alanlarıdır (ör. 'customer__phone').
+        """
+        return (
+            Debt.objects.filter(cls.overdue_filter(as_of))
+            .order_by()
+            .values('customer_id', *fields)
+            .annotate(**cls.bucket_expressions(as_of))
+        )
+    
+    @classmethod
+    def materialize(cls, as_of):
+        """
+        as_of gününün görüntüsünü yeniden yaz; yazılan müşteri satırı sayısını döndür
+        
+        Aynı gün için tekrar çalıştırılabilir; önceki satırlar silinir.
+        """
+        snapshots = [cls(as_of=as_of, **row) for row in cls.customer_totals(as_of)]
+        
+        # Genel toplam satırı müşteri satırlarından türetilir; ek sorgu yok
+        summary = cls(as_of=as_of, customer=None)
+        for field in [f'bucket_{key}' for key in BUCKET_KEYS] + ['total']:
+            setattr(summary, field, sum((getattr(s, field) for s in snapshots), Decimal('0.00')))
+        summary.debt_count = sum(s.debt_count for s in snapshots)
+        summary.oldest_due_date = min((s.oldest_due_date for s in snapshots), default=None)
+        
+        with transaction.atomic():
+            cls.objects.filter(as_of=as_of).delete()
+            cls.objects.bulk_create([summary] + snapshots, batch_size=MATERIALIZE_BATCH_SIZE)
+        return len(snapshots)
@@ -0,0 +1,190 @@
+"""
+Customer balance model - denormalized running totals per customer.
+"""
+from decimal import Decimal
+from django.db import models, transaction
+from django.db.models import F, Max, Q, Sum
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+
+class CustomerBalance(models.Model):
+    """
+    Müşteri bakiye modeli
+    
+    Borç kayıtları her yazıldığında aynı transaction içinde artımlı olarak
+    güncellenir; bakiye okumak tek bir primary key erişimidir.
+    """
+    
+    class Meta:
+        verbose_name = _('Müşteri Bakiyesi')
+        verbose_name_plural = _('Müşteri Bakiyeleri')
+        indexes = [
+            models.Index(fields=['updated_at']),
+        ]
+    
+    customer = models.OneToOneField(
+        'Customer',
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='balance',
+        verbose_name=_('Müşteri')
+    )
+    
+    outstanding_debt = models.DecimalField(
+        _('Açık Borç'),
+        max_digits=14,
+        decimal_places=2,
+        default=Decimal('0.00'),
+        help_text=_('Ödenmemiş borç kayıtlarının toplamı')
+    )
+    
+    outstanding_credit = models.DecimalField(
+        _('Açık Alacak'),
+        max_digits=14,
+        decimal_places=2,
+        default=Decimal('0.00'),
+        help_text=_('Ödenmemiş alacak kayıtlarının toplamı')
+    )
+    
+    paid_total = models.DecimalField(
+        _('Ödenen Toplam'),
+        max_digits=14,
+        decimal_places=2,
+        default=Decimal('0.00'),
+        help_text=_('Ödenmiş kayıtların toplamı')
+    )
+    
+    last_activity_at = models.DateTimeField(
+        _('Son Hareket'),
+        blank=True,
+        null=True,
+        help_text=_('Son borç/alacak hareketinin zamanı')
+    )
+    
+    updated_at = models.DateTimeField(
+        _('Güncellenme Tarihi'),
+        default=timezone.now
+    )
+    
+    def __str__(self):
+        return f"{self.customer_id} - {self.outstanding_debt} TL"
+    
+    @staticmethod
+    def contribution(debt_type, amount, paid_amount, is_paid):
+        """
+        Tek bir borç kaydının bakiyeye katkısı
+        (outstanding_debt, outstanding_credit, paid_total)
+        
+        Kısmi ödenmiş kayıtta kalan tutar açık, ödenen kısım ödenmiş sayılır.
+        """
+        zero = Decimal('0.00')
+        amount = amount or zero
+        paid_amount = paid_amount or zero
+        if is_paid:
+            return zero, zero, amount
+        remaining = amount - paid_amount
+        if debt_type == 'CREDIT':
+            return zero, remaining, paid_amount
+        return remaining, zero, paid_amount
+    
+    @staticmethod
+    def total_expressions(prefix=''):
+        """
+        Borç satırlarından bakiye alanlarını hesaplayan aggregate ifadeleri
+        
+        prefix, ilişki üzerinden toplamak için kullanılır (ör. 'debts__').
+        Ödenmiş kayıtlarda paid_amount tutarın tamamına eşittir.
+        """
+        remaining = F(f'{prefix}amount') - F(f'{prefix}paid_amount')
+        return {
+            'outstanding_debt': Sum(
+                remaining, filter=Q(**{f'{prefix}is_paid': False, f'{prefix}debt_type': 'DEBT'})
+            ),
+            'outstanding_credit': Sum(
+                remaining, filter=Q(**{f'{prefix}is_paid': False, f'{prefix}debt_type': 'CREDIT'})
+            ),
+            'paid_total': Sum(f'{prefix}paid_amount'),
+            'last_activity_at': Max(f'{prefix}updated_at'),
+        }
+    
+    @classmethod
+    def apply_delta(cls, customer_id, delta_debt, delta_credit, delta_paid, at=None, create_missing=True):
+        """Bakiyeyi tek bir UPDATE ile artımlı olarak güncelle"""
+        now = at or timezone.now()
+        updated = cls.objects.filter(customer_id=customer_id).update(
+            outstanding_debt=F('outstanding_debt') + delta_debt,
+            outstanding_credit=F('outstanding_credit') + delta_credit,
+            paid_total=F('paid_total') + delta_paid,
+            last_activity_at=now,
+            updated_at=now,
+        )
+        if not updated and create_missing:
+            # Bakiye satırı henüz yok: borç kayıtlarından hesapla
+            cls.recompute(customer_id)
+    
+    @classmethod
+    def compute_totals(cls, debts_queryset):
+        """Borç kayıtlarından bakiye alanlarını hesaplayan aggregate ifadeleri"""
+        return debts_queryset.aggregate(**cls.total_expressions())
+    
+    @classmethod
+    def recompute_many(cls, customer_ids):
+        """Birden çok müşterinin bakiyesini tek bir gruplu sorgu ile yeniden hesapla"""
+        from backend.core.models.customer import Customer
+        from backend.core.models.debt import Debt
+        
+        customer_ids = set(customer_ids)
+        if not customer_ids:
+            return
+        
+        totals = {
+            row['customer_id']: row
+            for row in Debt.objects.filter(customer_id__in=customer_ids)
+            .order_by()
+            .values('customer_id')
+            .annotate(**cls.total_expressions())
+        }
+        
+        now = timezone.now()
+        with transaction.atomic():
+            existing = set(
+                cls.objects.select_for_update()
+                .filter(customer_id__in=customer_ids)
+                .values_list('customer_id', flat=True)
+            )
+            missing = set(
+                Customer.objects.filter(id__in=customer_ids - existing).values_list('id', flat=True)
+            )
+            balances = []
+            for customer_id in existing | missing:
+                row = totals.get(customer_id, {})
+                balances.append(cls(
+                    customer_id=customer_id,
+                    outstanding_debt=row.get('outstanding_debt') or Decimal('0.00'),
+                    outstanding_credit=row.get('outstanding_credit') or Decimal('0.00'),
+                    paid_total=row.get('paid_total') or Decimal('0.00'),
+                    last_activity_at=row.get('last_activity_at'),
+                    updated_at=now,
+                ))
+            cls.objects.bulk_create([b for b in balances if b.customer_id in missing])
+            cls.objects.bulk_update(
+                [b for b in balances if b.customer_id in existing],
+                ['outstanding_debt', 'outstanding_credit', 'paid_total', 'last_activity_at', 'updated_at'],
+            )
+    
+    @classmethod
+    def recompute(cls, customer_id):
+        """Müşterinin bakiyesini borç kayıtlarından yeniden hesapla"""
+        from backend.core.models.debt import Debt
+        
+        totals = cls.compute_totals(Debt.objects.filter(customer_id=customer_id))
+        with transaction.atomic():
+            balance, _ = cls.objects.select_for_update().get_or_create(customer_id=customer_id)
+            balance.outstanding_debt = totals['outstanding_debt'] or Decimal('0.00')
+            balance.outstanding_credit = totals['outstanding_credit'] or Decimal('0.00')
+            balance.paid_total = totals['paid_total'] or Decimal('0.00')
+            balance.last_activity_at = totals['last_activity_at']
+            balance.updated_at = timezone.now()
+            balance.save()
+        return balance
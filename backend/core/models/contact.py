@@ -10,6 +10,9 @@ class ContactMessage(models.Model):
     İletişim mesajı modeli
     """
     
+    # Yanıt cache'i sürüm ad alanı (bkz. backend.core.cache)
+    CACHE_NAMESPACE = 'contact'
+    
     class Meta:
         verbose_name = _('İletişim Mesajı')
         verbose_name_plural = _('İletişim Mesajları')
@@ -3,14 +3,20 @@ Customer model for the veresiye defteri application.
 """
 from django.db import models
 from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
 
+from backend.core.utils.phone import normalize_phone, reversed_digits
+
 
 class Customer(models.Model):
     """
     Müşteri modeli - Veresiye defteri için müşteri bilgileri
     """
     
+    # Yanıt cache'i sürüm ad alanı (bkz. backend.core.cache)
+    CACHE_NAMESPACE = 'customers'
+    
     class Meta:
         verbose_name = _('Müşteri')
         verbose_name_plural = _('Müşteriler')
@@ -18,6 +24,7 @@ class Customer(models.Model):
         indexes = [
             models.Index(fields=['phone']),
             models.Index(fields=['-created_at']),
+            models.Index(fields=['updated_at']),
         ]
     
     # Temel Bilgiler
@@ -40,6 +47,26 @@ class Customer(models.Model):
         help_text=_('Müşteri telefon numarası')
     )
     
+    phone_e164 = models.CharField(
+        _('Telefon (E.164)'),
+        max_length=16,
+        unique=True,
+        blank=True,
+        null=True,
+        editable=False,
+        help_text=_('Normalize edilmiş telefon numarası (+905321234567)')
+    )
+    
+    phone_reversed = models.CharField(
+        _('Telefon (ters)'),
+        max_length=16,
+        db_index=True,
+        blank=True,
+        null=True,
+        editable=False,
+        help_text=_('Son rakamlarla arama için ters çevrilmiş telefon rakamları')
+    )
+    
     email = models.EmailField(
         _('E-posta'),
         blank=True,
@@ -91,31 +118,95 @@ class Customer(models.Model):
     def __str__(self):
         return f"{self.first_name} {self.last_name} ({self.phone})"
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Yüklenen telefonu sakla (normalize kolonlar yalnızca değişince yazılır)"""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_phone = instance.__dict__.get('phone')
+        return instance
+    
+    def phone_changed(self) -> bool:
+        """Yeni kayıt mı veya telefon yüklendiğinden beri değişti mi"""
+        return self._state.adding or self.phone != getattr(self, '_loaded_phone', None)
+    
+    @classmethod
+    def phone_owner(cls, phone: str, exclude_pk=None):
+        """
+        Numarayı (yazım biçiminden bağımsız) kullanan müşterinin id'si, yoksa None
+        """
+        e164 = normalize_phone(phone)
+        lookup = models.Q(phone=phone)
+        if e164:
+            lookup |= models.Q(phone_e164=e164)
+        queryset = cls.objects.filter(lookup)
+        if exclude_pk is not None:
+            queryset = queryset.exclude(pk=exclude_pk)
+        return queryset.values_list('id', flat=True).first()
+    
+    def clean(self):
+        """Telefon, farklı yazılmış olsa da başka bir müşteriye ait olamaz"""
+        super().clean()
+        if self.phone and self.phone_changed() and self.phone_owner(self.phone, exclude_pk=self.pk):
+            raise ValidationError({'phone': _('Bu telefon numarası zaten kullanılıyor.')})
+    
+    def save(self, *args, **kwargs):
+        """
+        Normalize telefon kolonlarını telefon değiştiğinde doldur
+        
+        Telefon değişmediyse mevcut değerler korunur: backfill_phones'un
+        yinelenen eski kayıtlarda boş bıraktığı phone_e164 yeniden
+        hesaplanıp unique kısıtına takılmaz.
+        """
+        if self.phone_changed():
+            self.phone_e164 = normalize_phone(self.phone)
+            self.phone_reversed = reversed_digits(self.phone_e164 or self.phone)
+            
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None and 'phone' in update_fields:
+                kwargs['update_fields'] = set(update_fields) | {'phone_e164', 'phone_reversed'}
+        
+        super().save(*args, **kwargs)
+        self._loaded_phone = self.phone
+    
     @property
     def full_name(self):
         """Tam ad"""
         return f"{self.first_name} {self.last_name}"
     
+    def _get_balance(self):
+        """Denormalize bakiye kaydı (yoksa None)"""
+        from backend.core.models.balance import CustomerBalance
+        try:
+            return self.balance
+        except CustomerBalance.DoesNotExist:
+            return None
+    
     @property
     def total_debt(self):
         """Toplam borç tutarı"""
-        from django.db.models import Sum
+        balance = self._get_balance()
+        if balance is not None:
+            return balance.outstanding_debt
+        
+        from django.db.models import F, Sum
         result = self.debts.filter(
             is_paid=False,
             debt_type='DEBT'
         ).aggregate(
-            total=Sum('amount')
+            total=Sum(F('amount') - F('paid_amount'))
         )
         return result['total'] or 0
     
     @property
     def total_paid(self):
         """Toplam ödenen tutar"""
+        balance = self._get_balance()
+        if balance is not None:
+            return balance.paid_total
+        
         from django.db.models import Sum
-        result = self.debts.filter(
-            is_paid=True
-        ).aggregate(
-            total=Sum('amount')
+        result = self.debts.aggregate(
+            total=Sum('paid_amount')
         )
         return result['total'] or 0
 
@@ -1,9 +1,10 @@
 """
 Debt model for the veresiye defteri application.
 """
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth.models import User
 from django.utils.translation import gettext_lazy as _
+from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator
 from decimal import Decimal
 
@@ -17,6 +18,9 @@ class Debt(models.Model):
         DEBT = 'DEBT', _('Borç')
         CREDIT = 'CREDIT', _('Alacak')
     
+    # Yanıt cache'i sürüm ad alanı (bkz. backend.core.cache)
+    CACHE_NAMESPACE = 'debts'
+    
     class Meta:
         verbose_name = _('Borç/Alacak')
         verbose_name_plural = _('Borçlar/Alacaklar')
@@ -25,6 +29,9 @@ class Debt(models.Model):
             models.Index(fields=['customer', '-created_at']),
             models.Index(fields=['is_paid']),
             models.Index(fields=['debt_type']),
+            models.Index(fields=['updated_at']),
+            # Vadesi geçmiş borç sorguları: is_paid=False AND due_date < bugün
+            models.Index(fields=['is_paid', 'due_date']),
         ]
     
     # İlişkiler
@@ -66,6 +73,14 @@ class Debt(models.Model):
         help_text=_('Borç ödendi mi?')
     )
     
+    paid_amount = models.DecimalField(
+        _('Ödenen Tutar'),
+        max_digits=12,
+        decimal_places=2,
+        default=Decimal('0.00'),
+        help_text=_('Kısmi ödemelerle kapatılan tutar (ödendiyse tutarın tamamı)')
+    )
+    
     paid_at = models.DateTimeField(
         _('Ödeme Tarihi'),
         blank=True,
@@ -113,6 +128,69 @@ class Debt(models.Model):
         status = _('Ödendi') if self.is_paid else _('Ödenmedi')
         return f"{self.customer.full_name} - {self.amount} TL ({status})"
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Yüklenen kaydın bakiye durumunu sakla (artımlı bakiye güncellemesi için)"""
+        instance = super().from_db(db, field_names, values)
+        instance._balance_state = instance.balance_state()
+        return instance
+    
+    def balance_state(self):
+        """Bakiyeyi etkileyen alanların anlık görüntüsü"""
+        return (self.customer_id, self.debt_type, self.amount, self.paid_amount, self.is_paid)
+    
+    @property
+    def remaining_amount(self):
+        """Kalan (ödenmemiş) tutar"""
+        if self.is_paid:
+            return Decimal('0.00')
+        return self.amount - self.paid_amount
+    
+    def allocated_amount(self) -> Decimal:
+        """Ödeme kayıtlarından bu borca dağıtılan toplam"""
+        if self.pk is None:
+            return Decimal('0.00')
+        return self.allocations.aggregate(total=models.Sum('amount'))['total'] or Decimal('0.00')
+    
+    def minimum_amount(self, is_paid=None) -> Decimal:
+        """
+        Tutarın inebileceği en düşük değer
+        
+        Dağıtılmış ödemeler her zaman karşılanmalıdır. Ödenmemiş kalacak
+        kayıtta ödenen kısım da tutarı aşamaz.
+        """
+        is_paid = self.is_paid if is_paid is None else is_paid
+        allocated = self.allocated_amount()
+        if is_paid or self.is_paid:
+            return allocated
+        return max(allocated, self.paid_amount)
+    
+    def clean(self):
+        """Tutar, ödenmiş kısmın altına indirilemez"""
+        super().clean()
+        if self.pk is None or self.amount is None:
+            return
+        minimum = self.minimum_amount()
+        if self.amount < minimum:
+            raise ValidationError({
+                'amount': _('Tutar ödenen tutarın (%(minimum)s TL) altında olamaz.') % {'minimum': minimum},
+            })
+    
+    def save(self, *args, **kwargs):
+        """Kayıt ve bakiye güncellemesi aynı transaction içinde yapılır"""
+        # Ödenmiş kayıtta ödenen tutar her zaman tutarın tamamıdır
+        if self.is_paid:
+            self.paid_amount = self.amount
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None and {'is_paid', 'amount'} & set(update_fields):
+                kwargs['update_fields'] = set(update_fields) | {'paid_amount'}
+        
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+        # post_save handler'ları (bakiye, ekstre, özet) önceki durumu okuduktan
+        # sonra tek yerde ilerletilir; handler'lar durumu değiştirmez
+        self._balance_state = self.balance_state()
+    
     def mark_as_paid(self, user=None):
         """Borcu ödendi olarak işaretle"""
         from django.utils import timezone
@@ -123,8 +201,14 @@ class Debt(models.Model):
         self.save()
     
     def mark_as_unpaid(self):
-        """Borcu ödenmedi olarak işaretle"""
+        """
+        Borcu ödenmedi olarak işaretle
+        
+        Ödeme kayıtlarıyla dağıtılmış kısım ödenmiş kalır; yalnızca elle
+        işaretlenen kısım geri alınır.
+        """
         self.is_paid = False
+        self.paid_amount = self.allocated_amount()
         self.paid_at = None
         self.paid_by = None
         self.save()
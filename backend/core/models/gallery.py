@@ -1,16 +1,33 @@
 """
 Gallery model for image gallery.
 """
+import logging
+import posixpath
+
+from django.core.files.base import ContentFile
 from django.db import models
 from django.contrib.auth.models import User
 from django.utils.translation import gettext_lazy as _
 
+from backend.core.utils.images import FORMAT_PREFERENCE, generate_variants, reencode_original, variant_file_names
+
+logger = logging.getLogger(__name__)
+
 
 class GalleryImage(models.Model):
     """
     Galeri resmi modeli
     """
     
+    class ProcessingStatus(models.TextChoices):
+        PENDING = 'PENDING', _('Bekliyor')
+        PROCESSING = 'PROCESSING', _('İşleniyor')
+        READY = 'READY', _('Hazır')
+        FAILED = 'FAILED', _('Başarısız')
+    
+    # Yanıt cache'i sürüm ad alanı (bkz. backend.core.cache)
+    CACHE_NAMESPACE = 'gallery'
+    
     class Meta:
         verbose_name = _('Galeri Resmi')
         verbose_name_plural = _('Galeri Resimleri')
@@ -40,6 +57,28 @@ class GalleryImage(models.Model):
         help_text=_('Galeri resmi')
     )
     
+    # Duyarlı (responsive) varyantlar - bkz. backend.core.utils.images
+    variants = models.JSONField(
+        _('Varyantlar'),
+        default=dict,
+        blank=True,
+        help_text=_('Yeniden boyutlandırılmış WebP/AVIF kopyalar ve bulanık önizleme')
+    )
+    
+    # Yükleme sonrası işleme (arka plan işi) - bkz. backend.core.jobs.gallery
+    processing_status = models.CharField(
+        _('İşleme Durumu'),
+        max_length=10,
+        choices=ProcessingStatus.choices,
+        default=ProcessingStatus.PENDING
+    )
+    
+    processing_error = models.TextField(
+        _('İşleme Hatası'),
+        blank=True,
+        default=''
+    )
+    
     # Durum
     is_active = models.BooleanField(
         _('Aktif'),
@@ -77,10 +116,97 @@ class GalleryImage(models.Model):
     def __str__(self):
         return f"{self.title}"
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Resim değişikliğini post_save'de tespit etmek için
+        instance._loaded_image_name = instance.__dict__.get('image')
+        return instance
+    
+    def image_changed(self) -> bool:
+        """Yüklendikten sonra resim dosyası değişti mi?"""
+        return getattr(self, '_loaded_image_name', None) != self.image.name
+    
     @property
     def image_url(self):
         """Resim URL'i"""
         if self.image:
             return self.image.url
         return None
-
+    
+    @property
+    def placeholder(self):
+        """Bulanık önizleme (data URI)"""
+        return (self.variants or {}).get('placeholder')
+    
+    def variant_sources(self):
+        """
+        <picture> için kaynaklar, tercih sırasıyla (AVIF önce)
+        [{"type": "image/avif", "srcset": "/media/...320w.avif 320w, ..."}]
+        """
+        storage = self.image.storage
+        formats = (self.variants or {}).get('formats', {})
+        sources = []
+        for name in FORMAT_PREFERENCE:
+            entry = formats.get(name)
+            if not entry:
+                continue
+            srcset = ', '.join(
+                f"{storage.url(item['name'])} {item['width']}w" for item in entry['files']
+            )
+            sources.append({'type': entry['mime'], 'srcset': srcset})
+        return sources
+    
+    def strip_metadata(self):
+        """
+        Orijinali EXIF/metadata olmadan yeniden kodla ve eskisinin yerine koy
+        
+        Kayıt kaydedilmez; yerine geçilen eski dosyanın adı döner (değişmediyse
+        None). Eski dosya, satır yeni adla kaydedildikten sonra silinmelidir
+        (bkz. delete_replaced_file); arada bir hata olursa satır hâlâ eski
+        dosyayı gösterir.
+        """
+        self.image.open('rb')
+        try:
+            result = reencode_original(self.image)
+        finally:
+            self.image.close()
+        if result is None:
+            return None
+        
+        content, extension = result
+        old_name = self.image.name
+        stem = posixpath.splitext(posixpath.basename(old_name))[0]
+        self.image.save(f'{stem}.{extension}', ContentFile(content), save=False)
+        return old_name if self.image.name != old_name else None
+    
+    def delete_replaced_file(self, name):
+        """strip_metadata'nın yerine geçtiği dosyayı storage'dan sil"""
+        try:
+            self.image.storage.delete(name)
+        except OSError:
+            logger.warning('Eski resim dosyası silinemedi: %s', name)
+    
+    def generate_variants(self, save=True):
+        """Varyantları (yeniden) üret; eski varyant dosyaları silinir"""
+        self.delete_variants(save=False)
+        self.image.open('rb')
+        try:
+            self.variants = generate_variants(self.image, self.image.storage, self.image.name)
+        finally:
+            self.image.close()
+        if save:
+            self.save(update_fields=['variants'])
+        return self.variants
+    
+    def delete_variants(self, save=True):
+        """Varyant dosyalarını storage'dan sil"""
+        storage = self.image.storage
+        for name in variant_file_names(self.variants):
+            try:
+                storage.delete(name)
+            except OSError:
+                logger.warning('Varyant dosyası silinemedi: %s', name)
+        self.variants = {}
+        if save:
+            self.save(update_fields=['variants'])
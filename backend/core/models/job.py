@@ -0,0 +1,173 @@
+"""
+Database-backed background job model.
+"""
+from datetime import timedelta
+
+from django.db import models, transaction
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+RETRY_BASE_DELAY = timedelta(seconds=30)
+
+
+class BackgroundJob(models.Model):
+    """
+    Arka plan işi
+    
+    İşler istekle aynı transaction içinde yazılır (commit edilmeyen iş
+    worker'a görünmez) ve `manage.py run_worker` tarafından çalıştırılır.
+    Harici bir broker gerekmez.
+    """
+    
+    class Status(models.TextChoices):
+        PENDING = 'PENDING', _('Bekliyor')
+        RUNNING = 'RUNNING', _('Çalışıyor')
+        DONE = 'DONE', _('Tamamlandı')
+        FAILED = 'FAILED', _('Başarısız')
+    
+    class Meta:
+        verbose_name = _('Arka Plan İşi')
+        verbose_name_plural = _('Arka Plan İşleri')
+        ordering = ['run_after', 'id']
+        indexes = [
+            models.Index(fields=['status', 'run_after']),
+        ]
+    
+    task = models.CharField(
+        _('Görev'),
+        max_length=100,
+        help_text=_('Kayıtlı görev adı (ör. gallery.process_image)')
+    )
+    
+    payload = models.JSONField(
+        _('Parametreler'),
+        default=dict,
+        blank=True
+    )
+    
+    status = models.CharField(
+        _('Durum'),
+        max_length=10,
+        choices=Status.choices,
+        default=Status.PENDING
+    )
+    
+    attempts = models.PositiveSmallIntegerField(
+        _('Deneme Sayısı'),
+        default=0
+    )
+    
+    max_attempts = models.PositiveSmallIntegerField(
+        _('En Fazla Deneme'),
+        default=3
+    )
+    
+    run_after = models.DateTimeField(
+        _('Çalışma Zamanı'),
+        default=timezone.now,
+        help_text=_('İş bu zamandan önce alınmaz (yeniden deneme gecikmesi)')
+    )
+    
+    locked_at = models.DateTimeField(
+        _('Alınma Zamanı'),
+        blank=True,
+        null=True
+    )
+    
+    last_error = models.TextField(
+        _('Son Hata'),
+        blank=True,
+        default=''
+    )
+    
+    created_at = models.DateTimeField(
+        _('Oluşturulma Tarihi'),
+        auto_now_add=True
+    )
+    
+    finished_at = models.DateTimeField(
+        _('Bitiş Tarihi'),
+        blank=True,
+        null=True
+    )
+    
+    def __str__(self):
+        return f"{self.task} #{self.pk} ({self.get_status_display()})"
+    
+    @classmethod
+    def claim_next(cls, stale_after: timedelta):
+        """
+        Sıradaki işi al ve RUNNING olarak işaretle
+        
+        Koşullu UPDATE ile alınır; aynı işi iki worker alamaz. stale_after'dan
+        uzun süredir RUNNING kalan (çökmüş worker'a ait) işler deneme hakkı
+        kaldıysa yeniden alınır; hakkı bitenler için bkz. fail_stale.
+        """
+        now = timezone.now()
+        available = models.Q(status=cls.Status.PENDING, run_after__lte=now) | models.Q(
+            cls._stale(now, stale_after), attempts__lt=models.F('max_attempts')
+        )
+        
+        while True:
+            with transaction.atomic():
+                candidate = cls.objects.filter(available).order_by('run_after', 'id').values(
+                    'id', 'status', 'locked_at'
+                ).first()
+                if candidate is None:
+                    return None
+                claimed = cls.objects.filter(
+                    id=candidate['id'],
+                    status=candidate['status'],
+                    locked_at=candidate['locked_at'],
+                ).update(status=cls.Status.RUNNING, locked_at=now, attempts=models.F('attempts') + 1)
+            if claimed:
+                return cls.objects.get(id=candidate['id'])
+    
+    @classmethod
+    def fail_stale(cls, stale_after: timedelta) -> list:
+        """
+        Deneme hakkı bitmiş, takılı kalmış işleri FAILED olarak işaretle
+        
+        Worker'ı öldüren bir iş (ör. bellek yetersizliği) her seferinde
+        takılı kalır; bu işler yeniden alınmaz. Bu çağrının FAILED yaptığı
+        işler döner.
+        """
+        now = timezone.now()
+        error = 'İş tamamlanmadan worker durdu (zaman aşımı).'
+        failed = []
+        for job in cls.objects.filter(cls._stale(now, stale_after), attempts__gte=models.F('max_attempts')):
+            updated = cls.objects.filter(id=job.id, status=job.status, locked_at=job.locked_at).update(
+                status=cls.Status.FAILED, locked_at=None, last_error=error, finished_at=now
+            )
+            if updated:
+                job.status, job.locked_at, job.last_error, job.finished_at = cls.Status.FAILED, None, error, now
+                failed.append(job)
+        return failed
+    
+    @classmethod
+    def _stale(cls, now, stale_after: timedelta) -> models.Q:
+        """stale_after'dan uzun süredir RUNNING kalan işler"""
+        return models.Q(status=cls.Status.RUNNING, locked_at__lt=now - stale_after)
+    
+    def mark_done(self):
+        """İşi tamamlandı olarak kaydet"""
+        self.status = self.Status.DONE
+        self.finished_at = timezone.now()
+        self.last_error = ''
+        self.save(update_fields=['status', 'finished_at', 'last_error'])
+    
+    def mark_failed(self, error: str) -> bool:
+        """
+        Hatayı kaydet; deneme hakkı varsa üstel gecikmeyle yeniden kuyruğa al
+        Dönüş: iş kalıcı olarak başarısız olduysa True
+        """
+        self.last_error = error
+        self.locked_at = None
+        if self.attempts < self.max_attempts:
+            self.status = self.Status.PENDING
+            self.run_after = timezone.now() + RETRY_BASE_DELAY * (2 ** (self.attempts - 1))
+        else:
+            self.status = self.Status.FAILED
+            self.finished_at = timezone.now()
+        self.save(update_fields=['status', 'run_after', 'locked_at', 'last_error', 'finished_at'])
+        return self.status == self.Status.FAILED
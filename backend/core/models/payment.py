@@ -0,0 +1,131 @@
+"""
+Payment model for the veresiye defteri application.
+"""
+from django.db import models
+from django.db.models import OuterRef, Subquery, Sum
+from django.contrib.auth.models import User
+from django.utils.translation import gettext_lazy as _
+from django.core.validators import MinValueValidator
+from decimal import Decimal
+
+
+class Payment(models.Model):
+    """
+    Ödeme modeli - Müşteriden alınan tahsilat kayıtları
+    """
+    
+    # Yanıt cache'i sürüm ad alanı (bkz. backend.core.cache)
+    CACHE_NAMESPACE = 'payments'
+    
+    class Meta:
+        verbose_name = _('Ödeme')
+        verbose_name_plural = _('Ödemeler')
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['customer', 'created_at']),
+        ]
+    
+    customer = models.ForeignKey(
+        'Customer',
+        on_delete=models.CASCADE,
+        related_name='payments',
+        verbose_name=_('Müşteri')
+    )
+    
+    amount = models.DecimalField(
+        _('Tutar'),
+        max_digits=14,
+        decimal_places=2,
+        validators=[MinValueValidator(Decimal('0.01'))],
+        help_text=_('Tahsil edilen tutar')
+    )
+    
+    notes = models.TextField(
+        _('Notlar'),
+        blank=True,
+        null=True,
+        help_text=_('Ödeme hakkında ek notlar')
+    )
+    
+    paid_by = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='recorded_payments',
+        verbose_name=_('Kaydeden')
+    )
+    
+    created_at = models.DateTimeField(
+        _('Ödeme Tarihi'),
+        auto_now_add=True
+    )
+    
+    def __str__(self):
+        return f"{self.customer_id} - {self.amount} TL"
+
+
+class PaymentAllocation(models.Model):
+    """
+    Ödeme dağılımı - Bir ödemenin hangi borca ne kadar uygulandığı
+    
+    Ödemeler açık borçlara en eskiden başlayarak (FIFO) dağıtılır; kayıtlar
+    ödeme geçmişini korur, borç tutarları değiştirilmez.
+    """
+    
+    class Meta:
+        verbose_name = _('Ödeme Dağılımı')
+        verbose_name_plural = _('Ödeme Dağılımları')
+        indexes = [
+            models.Index(fields=['debt']),
+        ]
+    
+    payment = models.ForeignKey(
+        Payment,
+        on_delete=models.CASCADE,
+        related_name='allocations',
+        verbose_name=_('Ödeme')
+    )
+    
+    # Tahsil edilmiş para sessizce kaybolmasın: dağıtımı olan borç silinemez.
+    # RESTRICT, müşteri silinirken (ödemeler de cascade silinir) silmeye izin verir
+    debt = models.ForeignKey(
+        'Debt',
+        on_delete=models.RESTRICT,
+        related_name='allocations',
+        verbose_name=_('Borç')
+    )
+    
+    amount = models.DecimalField(
+        _('Tutar'),
+        max_digits=12,
+        decimal_places=2,
+        validators=[MinValueValidator(Decimal('0.01'))],
+        help_text=_('Bu borca uygulanan tutar')
+    )
+    
+    def __str__(self):
+        return f"{self.payment_id} -> {self.debt_id}: {self.amount} TL"
+    
+    @classmethod
+    def total_subquery(cls, debt_ref='pk'):
+        """Borca dağıtılan toplam (Subquery ifadesi; dağıtım yoksa NULL)"""
+        return Subquery(
+            cls.objects.filter(debt_id=OuterRef(debt_ref))
+            .order_by()
+            .values('debt_id')
+            .annotate(total=Sum('amount'))
+            .values('total'),
+            output_field=models.DecimalField(max_digits=12, decimal_places=2),
+        )
+    
+    @classmethod
+    def totals(cls, debt_ids) -> dict:
+        """debt_id -> dağıtılan toplam (tek gruplu sorgu)"""
+        return dict(
+            cls.objects.filter(debt_id__in=debt_ids)
+            .order_by()
+            .values('debt_id')
+            .annotate(total=Sum('amount'))
+            .values_list('debt_id', 'total')
+        )
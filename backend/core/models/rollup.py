@@ -0,0 +1,168 @@
+"""
+Daily ledger rollup model - per-day created/paid/outstanding totals by debt type.
+"""
+from datetime import date, timedelta
+from decimal import Decimal
+from django.db import models, transaction
+from django.db.models import Case, F, Q, When
+from django.utils.translation import gettext_lazy as _
+
+from backend.core.models.debt import Debt
+from backend.core.models.payment import PaymentAllocation
+from backend.core.utils.rollup import Flows, load_flows, with_outstanding, without_zeros
+
+REBUILD_BATCH_SIZE = 500
+
+
+class DailyLedgerRollup(models.Model):
+    """
+    Günlük defter özeti
+    
+    Her (gün, borç türü) için o gün açılan ve ödenen tutarlar ile gün sonu
+    açık tutar tutulur. Borç yazımlarında artımlı güncellenir
+    (bkz. backend.core.signals.rollup). Yıllık bir grafik, borç tablosu
+    taranmadan birkaç yüz satır okunarak çizilir.
+    Satırlar yalnızca hareket olan günler için vardır.
+    """
+    
+    class Meta:
+        verbose_name = _('Günlük Defter Özeti')
+        verbose_name_plural = _('Günlük Defter Özetleri')
+        ordering = ['debt_type', 'day']
+        constraints = [
+            # (debt_type, day) index'i aralık okumalarını da servis eder
+            models.UniqueConstraint(fields=['debt_type', 'day'], name='unique_daily_rollup_type_day'),
+        ]
+    
+    day = models.DateField(_('Gün'))
+    
+    debt_type = models.CharField(
+        _('Tür'),
+        max_length=10,
+        choices=Debt.DebtType.choices
+    )
+    
+    created_count = models.IntegerField(_('Açılan Kayıt'), default=0)
+    
+    created_amount = models.DecimalField(
+        _('Açılan Tutar'),
+        max_digits=14,
+        decimal_places=2,
+        default=Decimal('0.00')
+    )
+    
+    paid_amount = models.DecimalField(
+        _('Ödenen Tutar'),
+        max_digits=14,
+        decimal_places=2,
+        default=Decimal('0.00')
+    )
+    
+    outstanding_amount = models.DecimalField(
+        _('Açık Tutar'),
+        max_digits=14,
+        decimal_places=2,
+        default=Decimal('0.00'),
+        help_text=_('Gün sonundaki açık tutar')
+    )
+    
+    updated_at = models.DateTimeField(
+        _('Güncellenme Tarihi'),
+        auto_now=True
+    )
+    
+    def __str__(self):
+        return f"{self.day} {self.debt_type}: +{self.created_amount} / -{self.paid_amount}"
+    
+    @classmethod
+    def outstanding_before(cls, debt_type: str, day: date) -> Decimal:
+        """Verilen günden önceki son satırın açık tutarı"""
+        value = (
+            cls.objects.filter(debt_type=debt_type, day__lt=day)
+            .order_by('-day')
+            .values_list('outstanding_amount', flat=True)
+            .first()
+        )
+        return value if value is not None else Decimal('0.00')
+    
+    @classmethod
+    def apply(cls, flows: Flows):
+        """
+        Akışları ekle (artımlı güncelleme)
+        
+        Her (gün, tür) için tek bir UPDATE çalışır: günün akışları artar ve
+        o günden sonraki tüm satırların açık tutarı kayar. Bugüne yazılan
+        akışta bu yalnızca tek satırdır.
+        """
+        flows = without_zeros(flows)
+        if not flows:
+            return
+        
+        with transaction.atomic():
+            keys = sorted(flows)
+            for day, debt_type in keys:
+                cls._ensure_row(day, debt_type)
+            for day, debt_type in keys:
+                count, created, paid = flows[(day, debt_type)]
+                cls.objects.filter(debt_type=debt_type, day__gte=day).update(
+                    created_count=Case(When(day=day, then=F('created_count') + count), default=F('created_count')),
+                    created_amount=Case(When(day=day, then=F('created_amount') + created), default=F('created_amount')),
+                    paid_amount=Case(When(day=day, then=F('paid_amount') + paid), default=F('paid_amount')),
+                    outstanding_amount=F('outstanding_amount') + (created - paid),
+                )
+            
+            # Akışları sıfırlanan günler (ör. aynı gün açılıp silinen kayıt) silinir
+            touched = Q()
+            for day, debt_type in keys:
+                touched |= Q(debt_type=debt_type, day=day)
+            cls.objects.filter(touched, created_count=0, created_amount=0, paid_amount=0).delete()
+    
+    @classmethod
+    def _ensure_row(cls, day: date, debt_type: str):
+        """Günün satırı yoksa önceki günün açık tutarıyla oluştur"""
+        if cls.objects.filter(debt_type=debt_type, day=day).exists():
+            return
+        # Önceki satır kilitlenir; eşzamanlı bir aralık kaydırması beklenir
+        previous = (
+            cls.objects.select_for_update()
+            .filter(debt_type=debt_type, day__lt=day)
+            .order_by('-day')
+            .values_list('outstanding_amount', flat=True)
+            .first()
+        )
+        cls.objects.get_or_create(
+            debt_type=debt_type,
+            day=day,
+            defaults={'outstanding_amount': previous if previous is not None else Decimal('0.00')},
+        )
+    
+    @classmethod
+    def rebuild(cls, date_from: date, date_to: date) -> int:
+        """
+        Tarih aralığındaki satırları borç ve ödeme kayıtlarından yeniden yaz
+        
+        Açılış tutarı aralıktan önceki son satırdan alınır; aralık sonrası
+        satırların açık tutarı yeni kapanışa göre kaydırılır. Yazılan satır
+        sayısını döndürür.
+        """
+        with transaction.atomic():
+            flows = load_flows(Debt, PaymentAllocation, date_from, date_to)
+            debt_types = Debt.DebtType.values
+            opening = {debt_type: cls.outstanding_before(debt_type, date_from) for debt_type in debt_types}
+            next_day = date_to + timedelta(days=1)
+            old_closing = {debt_type: cls.outstanding_before(debt_type, next_day) for debt_type in debt_types}
+            
+            cls.objects.filter(day__gte=date_from, day__lte=date_to).delete()
+            rows = [cls(**row) for row in with_outstanding(flows, opening)]
+            cls.objects.bulk_create(rows, batch_size=REBUILD_BATCH_SIZE)
+            
+            closing = dict(opening)
+            for row in rows:
+                closing[row.debt_type] = row.outstanding_amount
+            for debt_type in debt_types:
+                shift = closing[debt_type] - old_closing[debt_type]
+                if shift:
+                    cls.objects.filter(debt_type=debt_type, day__gt=date_to).update(
+                        outstanding_amount=F('outstanding_amount') + shift
+                    )
+        return len(rows)
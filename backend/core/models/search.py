@@ -0,0 +1,90 @@
+"""
+Customer search index model.
+"""
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from backend.core.utils.text import MAX_TERM_LENGTH, digits_only, fold_turkish, tokenize
+
+
+class CustomerSearchTerm(models.Model):
+    """
+    Müşteri arama terimi
+    
+    Her müşteri için katlanmış ad/soyad kelimeleri, telefon rakamları ve
+    e-posta parçaları ayrı satırlarda tutulur. Önek araması (term, customer)
+    index'i üzerinde bir aralık taramasıdır; dört kolonda icontains taraması
+    yapılmaz.
+    """
+    
+    class Kind(models.TextChoices):
+        NAME = 'NAME', _('Ad')
+        PHONE = 'PHONE', _('Telefon')
+        EMAIL = 'EMAIL', _('E-posta')
+    
+    class Meta:
+        verbose_name = _('Müşteri Arama Terimi')
+        verbose_name_plural = _('Müşteri Arama Terimleri')
+        constraints = [
+            models.UniqueConstraint(fields=['term', 'customer'], name='customer_search_term_unique'),
+        ]
+        indexes = [
+            # PostgreSQL'de LIKE 'önek%' araması için (bkz. prefix_q); opclass
+            # diğer veritabanlarında yok sayılır
+            models.Index(fields=['term'], name='customer_search_term_prefix', opclasses=['varchar_pattern_ops']),
+        ]
+    
+    customer = models.ForeignKey(
+        'Customer',
+        on_delete=models.CASCADE,
+        related_name='search_terms',
+        verbose_name=_('Müşteri')
+    )
+    
+    term = models.CharField(
+        _('Terim'),
+        max_length=MAX_TERM_LENGTH
+    )
+    
+    kind = models.CharField(
+        _('Tür'),
+        max_length=5,
+        choices=Kind.choices
+    )
+    
+    def __str__(self):
+        return f"{self.term} ({self.customer_id})"
+    
+    @classmethod
+    def terms_for(cls, first_name, last_name, phone, email):
+        """Müşteri alanlarından (term, kind) çiftleri üret"""
+        terms = {}
+        
+        for token in tokenize(f"{first_name or ''} {last_name or ''}"):
+            terms.setdefault(token, cls.Kind.NAME)
+        
+        phone_digits = digits_only(phone)
+        if phone_digits:
+            terms.setdefault(phone_digits[:MAX_TERM_LENGTH], cls.Kind.PHONE)
+            # 0532... ve 532... yazımları aynı müşteriyi bulsun
+            if phone_digits.startswith('0'):
+                terms.setdefault(phone_digits[1:MAX_TERM_LENGTH + 1], cls.Kind.PHONE)
+        
+        if email:
+            folded_email = fold_turkish(email).strip()
+            terms.setdefault(folded_email[:MAX_TERM_LENGTH], cls.Kind.EMAIL)
+            for token in tokenize(folded_email.replace('@', ' ')):
+                terms.setdefault(token, cls.Kind.EMAIL)
+        
+        return [(term, kind) for term, kind in terms.items() if term]
+    
+    @classmethod
+    def rebuild_for(cls, customer):
+        """Tek müşterinin arama terimlerini yeniden yaz"""
+        cls.objects.filter(customer_id=customer.pk).delete()
+        cls.objects.bulk_create([
+            cls(customer_id=customer.pk, term=term, kind=kind)
+            for term, kind in cls.terms_for(
+                customer.first_name, customer.last_name, customer.phone, customer.email
+            )
+        ])
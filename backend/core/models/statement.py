@@ -0,0 +1,258 @@
+"""
+Ledger entry model - append-only customer statement with running balance.
+"""
+from decimal import Decimal
+from django.db import models, transaction
+from django.db.models import Case, F, When
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from backend.core.utils.statement import load_history, with_running_balance
+
+REBUILD_BATCH_SIZE = 500
+
+
+class LedgerEntry(models.Model):
+    """
+    Hesap ekstresi satırı
+    
+    Her borç/alacak kaydı, ödeme ve düzeltme, müşterinin ekstresine bir satır
+    olarak eklenir ve satırlar güncellenmez. balance_after, satır yazılırken
+    bir önceki satırın bakiyesi üzerine eklenir; ekstre okumak (customer,
+    created_at, id) index'i üzerinde tek bir aralık taramasıdır. Artı bakiye
+    müşterinin borçlu olduğunu gösterir.
+    """
+    
+    class Kind(models.TextChoices):
+        DEBT = 'DEBT', _('Borç')
+        CREDIT = 'CREDIT', _('Alacak')
+        PAYMENT = 'PAYMENT', _('Ödeme')
+        ADJUSTMENT = 'ADJUSTMENT', _('Düzeltme')
+    
+    class Meta:
+        verbose_name = _('Ekstre Satırı')
+        verbose_name_plural = _('Ekstre Satırları')
+        ordering = ['customer', 'created_at', 'id']
+        indexes = [
+            models.Index(fields=['customer', 'created_at', 'id']),
+        ]
+    
+    customer = models.ForeignKey(
+        'Customer',
+        on_delete=models.CASCADE,
+        related_name='ledger_entries',
+        verbose_name=_('Müşteri')
+    )
+    
+    kind = models.CharField(
+        _('Tür'),
+        max_length=10,
+        choices=Kind.choices,
+        help_text=_('Hareket türü')
+    )
+    
+    amount = models.DecimalField(
+        _('Tutar'),
+        max_digits=14,
+        decimal_places=2,
+        help_text=_('Bakiyeye etkisi (borç artı, ödeme/alacak eksi)')
+    )
+    
+    balance_after = models.DecimalField(
+        _('Bakiye'),
+        max_digits=14,
+        decimal_places=2,
+        help_text=_('Bu hareketten sonraki bakiye')
+    )
+    
+    debt = models.ForeignKey(
+        'Debt',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='ledger_entries',
+        verbose_name=_('Borç')
+    )
+    
+    payment = models.ForeignKey(
+        'Payment',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='ledger_entries',
+        verbose_name=_('Ödeme')
+    )
+    
+    description = models.CharField(
+        _('Açıklama'),
+        max_length=255,
+        blank=True,
+        default=''
+    )
+    
+    created_at = models.DateTimeField(
+        _('Tarih'),
+        default=timezone.now
+    )
+    
+    def __str__(self):
+        return f"{self.customer_id} - {self.get_kind_display()} {self.amount} TL"
+    
+    @classmethod
+    def last_balance(cls, customer_id, before=None, through=None):
+        """Müşterinin son (veya verilen tarihten önceki / tarihe kadarki son) bakiyesi"""
+        queryset = cls.objects.filter(customer_id=customer_id)
+        if before is not None:
+            queryset = queryset.filter(created_at__lt=before)
+        if through is not None:
+            queryset = queryset.filter(created_at__lte=through)
+        balance = queryset.order_by('-created_at', '-id').values_list('balance_after', flat=True).first()
+        return balance if balance is not None else Decimal('0.00')
+    
+    @classmethod
+    def append(cls, customer_id, kind, amount, debt_id=None, payment_id=None, description=''):
+        """Müşterinin ekstresine tek satır ekle"""
+        cls.append_many([{
+            'customer_id': customer_id,
+            'kind': kind,
+            'amount': amount,
+            'debt_id': debt_id,
+            'payment_id': payment_id,
+            'description': description,
+        }])
+    
+    @classmethod
+    def append_many(cls, entries):
+        """
+        Ekstreye satır ekle ve bakiyeyi önceki satırın üzerine yürüt
+        
+        Aynı müşteriye eşzamanlı eklemeler CustomerBalance satırı kilitlenerek
+        sıraya sokulur; böylece her satır bir öncekinin bakiyesini görür.
+        Tutarı sıfır olan satırlar yazılmaz.
+        """
+        from backend.core.models.balance import CustomerBalance
+        
+        entries = [entry for entry in entries if entry['amount']]
+        if not entries:
+            return []
+        
+        customer_ids = sorted({entry['customer_id'] for entry in entries})
+        with transaction.atomic():
+            list(
+                CustomerBalance.objects.select_for_update()
+                .filter(customer_id__in=customer_ids)
+                .order_by('customer_id')
+                .values_list('customer_id', flat=True)
+            )
+            balances = {customer_id: cls.last_balance(customer_id) for customer_id in customer_ids}
+            
+            now = timezone.now()
+            rows = []
+            for entry in entries:
+                balance = balances[entry['customer_id']] + entry['amount']
+                balances[entry['customer_id']] = balance
+                rows.append(cls(
+                    customer_id=entry['customer_id'],
+                    kind=entry['kind'],
+                    amount=entry['amount'],
+                    balance_after=balance,
+                    debt_id=entry.get('debt_id'),
+                    payment_id=entry.get('payment_id'),
+                    description=(entry.get('description') or '')[:255],
+                    created_at=now,
+                ))
+            return cls.objects.bulk_create(rows)
+    
+    @classmethod
+    def insert_many(cls, entries):
+        """
+        Geçmiş tarihli satırları ekstrenin ortasına ekle
+        
+        entries append_many ile aynıdır, ek olarak 'created_at' taşır. Her
+        satırın bakiyesi o ana kadarki (dahil) son satırın üzerine yürütülür;
+        sonraki mevcut satırların balance_after değeri müşteri başına tek bir
+        UPDATE ile eklenen tutarlar kadar kaydırılır. Mevcut satırlar
+        silinmez ve yeniden yazılmaz.
+        """
+        from backend.core.models.balance import CustomerBalance
+        
+        entries = sorted(
+            (entry for entry in entries if entry['amount']),
+            key=lambda entry: (entry['customer_id'], entry['created_at']),
+        )
+        if not entries:
+            return []
+        
+        by_customer = {}
+        for entry in entries:
+            by_customer.setdefault(entry['customer_id'], []).append(entry)
+        
+        with transaction.atomic():
+            list(
+                CustomerBalance.objects.select_for_update()
+                .filter(customer_id__in=sorted(by_customer))
+                .order_by('customer_id')
+                .values_list('customer_id', flat=True)
+            )
+            
+            rows = []
+            for customer_id, customer_entries in by_customer.items():
+                # Kaydırmadan önce: her anın mevcut bakiyesi okunur
+                moments = sorted({entry['created_at'] for entry in customer_entries})
+                bases = {moment: cls.last_balance(customer_id, through=moment) for moment in moments}
+                
+                inserted = Decimal('0.00')
+                shifts = []
+                for moment in moments:
+                    for entry in customer_entries:
+                        if entry['created_at'] != moment:
+                            continue
+                        inserted += entry['amount']
+                        rows.append(cls(
+                            customer_id=customer_id,
+                            kind=entry['kind'],
+                            amount=entry['amount'],
+                            balance_after=bases[moment] + inserted,
+                            debt_id=entry.get('debt_id'),
+                            payment_id=entry.get('payment_id'),
+                            description=(entry.get('description') or '')[:255],
+                            created_at=moment,
+                        ))
+                    shifts.append((moment, inserted))
+                
+                # Sonraki satır, kendisinden önceki tüm eklemelerin toplamı kadar kayar
+                cls.objects.filter(customer_id=customer_id, created_at__gt=moments[0]).update(
+                    balance_after=Case(
+                        *[
+                            When(created_at__gt=moment, then=F('balance_after') + total)
+                            for moment, total in reversed(shifts)
+                        ],
+                        default=F('balance_after'),
+                    )
+                )
+            
+            return cls.objects.bulk_create(rows, batch_size=REBUILD_BATCH_SIZE)
+    
+    @classmethod
+    def rebuild(cls, customer_ids):
+        """
+        Müşterilerin ekstresini mevcut borç ve ödeme kayıtlarından yeniden yaz
+        
+        Silinmiş kayıtların geçmişi yeniden oluşturulamaz; son bakiye her
+        zaman açık borç - açık alacak değerine eşit olur.
+        """
+        from backend.core.models.debt import Debt
+        from backend.core.models.payment import Payment, PaymentAllocation
+        
+        customer_ids = set(customer_ids)
+        if not customer_ids:
+            return 0
+        
+        with transaction.atomic():
+            cls.objects.filter(customer_id__in=customer_ids).delete()
+            events = load_history(Debt, Payment, PaymentAllocation, customer_ids)
+            created = cls.objects.bulk_create(
+                [cls(**event) for event in with_running_balance(events)],
+                batch_size=REBUILD_BATCH_SIZE,
+            )
+        return len(created)
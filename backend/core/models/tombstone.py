@@ -0,0 +1,41 @@
+"""
+Deletion tombstone model for delta sync.
+"""
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+
+class DeletionTombstone(models.Model):
+    """
+    Silinen kayıt izi
+    
+    Borçlar ve müşteriler veritabanından tamamen silindiğinde, istemcilerin
+    /api/sync/ ile yerel kopyalarından da silebilmesi için bir iz bırakılır.
+    Eski izler `manage.py prune_tombstones` ile temizlenir.
+    """
+    
+    class Meta:
+        verbose_name = _('Silinme İzi')
+        verbose_name_plural = _('Silinme İzleri')
+        indexes = [
+            models.Index(fields=['deleted_at']),
+        ]
+    
+    model = models.CharField(
+        _('Model'),
+        max_length=50,
+        help_text=_('Model etiketi (ör. backend.debt)')
+    )
+    
+    object_id = models.BigIntegerField(
+        _('Kayıt ID')
+    )
+    
+    deleted_at = models.DateTimeField(
+        _('Silinme Tarihi'),
+        default=timezone.now
+    )
+    
+    def __str__(self):
+        return f"{self.model} #{self.object_id}"
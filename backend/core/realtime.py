@@ -0,0 +1,54 @@
+"""
+Real-time change notifications over the Channels layer.
+
+Yazma işlemleri commit olduktan sonra bağlı admin oturumlarına küçük bir
+olay ("hangi kayıt değişti") gönderilir; istemciler değişen kayıtları
+/api/sync/ ile çeker. Olaylar kayıt içeriği taşımaz.
+"""
+import logging
+from typing import Iterable
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+# Admin oturumlarının katıldığı grup (backend.interfaces.realtime.consumers)
+LEDGER_GROUP = 'admin-ledger'
+
+# Toplu içe aktarmalarda olay boyutunu sınırlar; aşılırsa id listeleri
+# boş gönderilir ve truncated=True olur (istemci yine /api/sync/ çağırır)
+MAX_EVENT_IDS = 500
+
+
+def publish_change(entity: str, action: str, ids: Iterable[int], customer_ids: Iterable[int] = ()):
+    """
+    Değişiklik olayını transaction commit olduktan sonra yayınla
+    
+    entity: 'customer' | 'debt' | 'contactmessage'
+    action: 'created' | 'updated' | 'deleted' | 'bulk'
+    """
+    ids = sorted(set(ids))
+    customer_ids = sorted(set(customer_ids))
+    truncated = len(ids) > MAX_EVENT_IDS or len(customer_ids) > MAX_EVENT_IDS
+    event = {
+        'type': 'change',
+        'entity': entity,
+        'action': action,
+        'ids': [] if truncated else ids,
+        'customer_ids': [] if truncated else customer_ids,
+        'truncated': truncated,
+    }
+    transaction.on_commit(lambda: _send(event))
+
+
+def _send(event: dict):
+    """Olayı gruba gönder; bildirim hatası yazma işlemini bozmamalı"""
+    layer = get_channel_layer()
+    if layer is None:
+        return
+    try:
+        async_to_sync(layer.group_send)(LEDGER_GROUP, {'type': 'ledger.change', 'event': event})
+    except Exception:
+        logger.exception('Gerçek zamanlı bildirim gönderilemedi: %s', event)
@@ -0,0 +1,127 @@
+"""
+Primary/replica database routing with a read-only hint and sticky primary.
+
+Yazmalar ve sıradan okumalar her zaman 'default' (primary) veritabanına
+gider. Liste, rapor ve dışa aktarma gibi ağır okumalar read_only() ile
+işaretlenir ve yapılandırılmışsa 'replica' alias'ına yönlenir:
+
+    @read_only()
+    def get_page(self, ...):
+        ...
+
+Replica, primary'nin gerisinde kalabilir. Bu yüzden okuma şu durumlarda
+yine primary'ye gider:
+- aynı istekte daha önce bir yazma yapılmışsa,
+- istemci son DATABASE_REPLICA_LAG_WINDOW saniye içinde yazma yapmışsa
+  (bkz. PrimaryStickinessMiddleware),
+- bir transaction.atomic() bloğunun içindeyse.
+"""
+import contextvars
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+REPLICA_DB_ALIAS = 'replica'
+
+_read_only = contextvars.ContextVar('db_read_only', default=False)
+_primary_pinned = contextvars.ContextVar('db_primary_pinned', default=False)
+_wrote = contextvars.ContextVar('db_wrote', default=False)
+_replica_reads = contextvars.ContextVar('db_replica_reads', default=0)
+
+
+def replica_configured() -> bool:
+    return REPLICA_DB_ALIAS in connections.databases
+
+
+def lag_window() -> int:
+    """Replica gecikmesi için üst sınır (sn); yapışkan primary süresi"""
+    return getattr(settings, 'DATABASE_REPLICA_LAG_WINDOW', 5)
+
+
+def replica_alias() -> str:
+    """Ağır okumaların şu anda gideceği alias ('replica' veya 'default')"""
+    if not replica_configured() or _primary_pinned.get():
+        return DEFAULT_DB_ALIAS
+    if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+        return DEFAULT_DB_ALIAS
+    _replica_reads.set(_replica_reads.get() + 1)
+    return REPLICA_DB_ALIAS
+
+
+@contextmanager
+def read_only():
+    """Bloktaki okumalar replica'ya gidebilir (dekoratör olarak da kullanılır)"""
+    token = _read_only.set(True)
+    try:
+        yield
+    finally:
+        _read_only.reset(token)
+
+
+@contextmanager
+def request_scope(pinned=False):
+    """
+    İstek başına yönlendirme durumunu sıfırla
+    
+    pinned=True ise istek boyunca tüm okumalar primary'ye gider. Blok içinde
+    yazma yapıldıysa wrote() True döner.
+    """
+    tokens = (
+        (_primary_pinned, _primary_pinned.set(pinned)),
+        (_wrote, _wrote.set(False)),
+        (_replica_reads, _replica_reads.set(0)),
+    )
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
+
+
+def wrote() -> bool:
+    """Geçerli istek/bağlamda bir yazma yapıldı mı?"""
+    return _wrote.get()
+
+
+def replica_reads() -> int:
+    """Geçerli istek/bağlamda replica'ya yönlenen okuma sayısı"""
+    return _replica_reads.get()
+
+
+def lag_bounded_timeout(timeout, replica_reads_before: int):
+    """
+    Replica'dan okunmuş bir sonucun cache süresi
+    
+    Gecikmeli bir replica'dan okunan değer, yeni sürüm anahtarı altında
+    eski veri olarak saklanabilir; bu yüzden süre gecikme penceresiyle
+    sınırlanır. Replica kullanılmadıysa timeout değişmez.
+    """
+    if replica_reads() <= replica_reads_before:
+        return timeout
+    window = lag_window()
+    return window if timeout is None else min(timeout, window)
+
+
+class PrimaryReplicaRouter:
+    """
+    Database router - yazmalar primary'ye, read_only() okumalar replica'ya
+    """
+    
+    def db_for_read(self, model, **hints):
+        if _read_only.get():
+            return replica_alias()
+        return None
+    
+    def db_for_write(self, model, **hints):
+        # Bu bağlamdaki sonraki okumalar yazılanı görmeli
+        _wrote.set(True)
+        _primary_pinned.set(True)
+        return DEFAULT_DB_ALIAS
+    
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replica, primary'nin kopyasıdır; iki alias arası ilişkiler geçerlidir
+        aliases = {DEFAULT_DB_ALIAS, REPLICA_DB_ALIAS}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
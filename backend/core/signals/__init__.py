@@ -0,0 +1,17 @@
+"""
+Core signal handlers module.
+Handlers are connected when this package is imported from BackendConfig.ready().
+"""
+from backend.core.signals.ledger import debts_bulk_changed
+from backend.core.signals import balance  # noqa: F401
+from backend.core.signals import cache  # noqa: F401
+from backend.core.signals import gallery  # noqa: F401
+from backend.core.signals import realtime  # noqa: F401
+from backend.core.signals import rollup  # noqa: F401
+from backend.core.signals import search  # noqa: F401
+from backend.core.signals import statement  # noqa: F401
+from backend.core.signals import tombstone  # noqa: F401
+
+__all__ = [
+    'debts_bulk_changed',
+]
@@ -0,0 +1,71 @@
+"""
+Signal handlers keeping CustomerBalance in step with Debt writes.
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from backend.core.models import Customer, CustomerBalance, Debt
+from backend.core.signals.ledger import debts_bulk_changed
+
+
+def _apply_state(state, sign, at=None, create_missing=True):
+    """Bir borç durumunun bakiye katkısını ekle (sign=1) veya çıkar (sign=-1)"""
+    customer_id, debt_type, amount, paid_amount, is_paid = state
+    delta_debt, delta_credit, delta_paid = CustomerBalance.contribution(debt_type, amount, paid_amount, is_paid)
+    if not (delta_debt or delta_credit or delta_paid):
+        return
+    CustomerBalance.apply_delta(
+        customer_id,
+        sign * delta_debt,
+        sign * delta_credit,
+        sign * delta_paid,
+        at=at,
+        create_missing=create_missing,
+    )
+
+
+@receiver(post_save, sender=Customer)
+def create_customer_balance(sender, instance, created, raw=False, **kwargs):
+    """Yeni müşteri için boş bakiye satırı oluştur"""
+    if created and not raw:
+        CustomerBalance.objects.get_or_create(customer=instance)
+
+
+@receiver(post_save, sender=Debt)
+def update_balance_on_debt_save(sender, instance, created, raw=False, **kwargs):
+    """Borç kaydı oluşturulduğunda/güncellendiğinde bakiyeyi artımlı güncelle"""
+    if raw:
+        return
+    
+    old_state = getattr(instance, '_balance_state', None)
+    new_state = instance.balance_state()
+    
+    if created:
+        _apply_state(new_state, 1, at=instance.updated_at)
+    elif old_state is None:
+        # Önceki durum bilinmiyor (DB'den yüklenmemiş örnek): tam hesapla
+        CustomerBalance.recompute(instance.customer_id)
+    elif old_state != new_state:
+        _apply_state(old_state, -1, at=instance.updated_at)
+        _apply_state(new_state, 1, at=instance.updated_at)
+
+
+@receiver(post_delete, sender=Debt)
+def update_balance_on_debt_delete(sender, instance, origin=None, **kwargs):
+    """Silinen borç kaydının katkısını bakiyeden düş"""
+    # Müşteri silinirken (cascade) bakiye satırı da silinir; güncellenecek bir şey yok
+    origin_model = getattr(origin, 'model', type(origin))
+    if origin_model is Customer:
+        return
+    
+    state = getattr(instance, '_balance_state', None) or instance.balance_state()
+    _apply_state(state, -1, create_missing=False)
+
+
+@receiver(debts_bulk_changed)
+def recompute_balances_on_bulk_change(sender, customer_ids, balances_updated=False, **kwargs):
+    """Toplu borç yazımlarından sonra etkilenen bakiyeleri bir kez yeniden hesapla"""
+    # Gönderen bakiyeleri zaten artımlı güncellediyse yeniden tarama yapılmaz
+    if balances_updated:
+        return
+    CustomerBalance.recompute_many(customer_ids)
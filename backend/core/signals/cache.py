@@ -0,0 +1,29 @@
+"""
+Signal handlers bumping cache namespace versions on writes.
+"""
+from django.apps import apps
+from django.db.models.signals import post_delete, post_save
+
+from backend.core.cache import bump_version
+from backend.core.models import Debt
+from backend.core.signals.ledger import debts_bulk_changed
+
+
+def bump_model_namespace(sender, raw=False, **kwargs):
+    """CACHE_NAMESPACE tanımlı bir modele yazıldı: ad alanı sürümünü değiştir"""
+    if raw:
+        return
+    bump_version(sender.CACHE_NAMESPACE)
+
+
+def bump_debts_on_bulk_change(sender, **kwargs):
+    """bulk_create / QuerySet.update ile yapılan toplu borç yazmaları"""
+    bump_version(Debt.CACHE_NAMESPACE)
+
+
+for model in apps.get_app_config('backend').get_models():
+    if getattr(model, 'CACHE_NAMESPACE', None):
+        post_save.connect(bump_model_namespace, sender=model, dispatch_uid=f'cache-bump-save-{model._meta.label}')
+        post_delete.connect(bump_model_namespace, sender=model, dispatch_uid=f'cache-bump-delete-{model._meta.label}')
+
+debts_bulk_changed.connect(bump_debts_on_bulk_change, dispatch_uid='cache-bump-debts-bulk')
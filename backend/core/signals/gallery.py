@@ -0,0 +1,41 @@
+"""
+Signal handlers for gallery image processing and variant files.
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from backend.core.jobs import enqueue
+from backend.core.jobs.gallery import PROCESS_IMAGE
+from backend.core.models import GalleryImage
+
+
+@receiver(post_save, sender=GalleryImage)
+def enqueue_gallery_processing(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    """
+    Yeni veya değişen resim için işleme işini kuyruğa ekle
+    
+    İstek orijinal kaydedilir kaydedilmez döner; yeniden boyutlandırma ve
+    yeniden kodlama worker'da yapılır. update_fields ile yapılan kayıtlar
+    (worker'ın kendi yazmaları dahil) iş oluşturmaz.
+    """
+    if raw or update_fields is not None:
+        return
+    if not created and not instance.image_changed():
+        return
+    
+    if not created:
+        instance.processing_status = GalleryImage.ProcessingStatus.PENDING
+        instance.processing_error = ''
+        GalleryImage.objects.filter(pk=instance.pk).update(
+            processing_status=instance.processing_status,
+            processing_error='',
+        )
+    instance._loaded_image_name = instance.image.name
+    enqueue(PROCESS_IMAGE, {'image_id': instance.pk})
+
+
+@receiver(post_delete, sender=GalleryImage)
+def delete_gallery_variants(sender, instance, **kwargs):
+    """Resim silindiğinde türetilmiş varyant dosyalarını da sil"""
+    instance.delete_variants(save=False)
+
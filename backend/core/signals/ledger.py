@@ -0,0 +1,17 @@
+"""
+Custom signals for ledger writes that bypass Model.save().
+
+bulk_create / QuerySet.update gibi toplu işlemler post_save/post_delete
+göndermez. Bu yolları kullanan kod, işlem bittikten sonra (aynı transaction
+içinde) debts_bulk_changed sinyalini gönderir; türetilmiş veriler
+(bakiyeler vb.) bu sinyali dinleyerek toplu olarak yeniden hesaplanır.
+"""
+from django.dispatch import Signal
+
+# kwargs: customer_ids (set[int]), debt_ids (list[int]),
+#         balances_updated (bool, opsiyonel) - gönderen CustomerBalance'ı
+#         apply_delta ile zaten güncellediyse True; bakiyeler yeniden taranmaz
+#         previous_states (dict, opsiyonel) - debt_id -> yazım öncesi
+#         Debt.balance_state(); listede olmayan borçlar yeni sayılır. Verilirse
+#         günlük özetler artımlı, verilmezse yeniden hesaplanarak güncellenir
+debts_bulk_changed = Signal()
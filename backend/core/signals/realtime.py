@@ -0,0 +1,42 @@
+"""
+Signal handlers publishing real-time change events to admin sessions.
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from backend.core.models import ContactMessage, Customer, Debt
+from backend.core.realtime import publish_change
+from backend.core.signals.ledger import debts_bulk_changed
+
+
+def _customer_ids(instance):
+    """Borç değişikliği müşterinin bakiyesini de değiştirir"""
+    customer_id = getattr(instance, 'customer_id', None)
+    return [customer_id] if customer_id else []
+
+
+@receiver(post_save, sender=Customer)
+@receiver(post_save, sender=Debt)
+@receiver(post_save, sender=ContactMessage)
+def publish_saved(sender, instance, created, **kwargs):
+    """Kayıt eklendi/güncellendi olayı"""
+    publish_change(
+        sender._meta.model_name,
+        'created' if created else 'updated',
+        [instance.pk],
+        _customer_ids(instance),
+    )
+
+
+@receiver(post_delete, sender=Customer)
+@receiver(post_delete, sender=Debt)
+@receiver(post_delete, sender=ContactMessage)
+def publish_deleted(sender, instance, **kwargs):
+    """Kayıt silindi olayı"""
+    publish_change(sender._meta.model_name, 'deleted', [instance.pk], _customer_ids(instance))
+
+
+@receiver(debts_bulk_changed)
+def publish_bulk_debts(sender, customer_ids, debt_ids=None, **kwargs):
+    """Toplu borç yazımı tek bir olay olarak yayınlanır"""
+    publish_change(Debt._meta.model_name, 'bulk', debt_ids or [], customer_ids)
@@ -0,0 +1,108 @@
+"""
+Signal handlers keeping DailyLedgerRollup in step with Debt writes.
+
+Önceki durum Debt._balance_state'ten okunur; Debt.save tüm post_save
+handler'ları çalıştıktan sonra ilerletir (bağlanma sırası önemsizdir).
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from backend.core.models import DailyLedgerRollup, Debt
+from backend.core.signals.ledger import debts_bulk_changed
+from backend.core.utils.rollup import debt_deltas, local_day, paid_day, without_zeros
+
+# Bundan fazla (gün, tür) anahtarı etkileyen toplu yazımda (ör. geçmiş tarihli
+# içe aktarma) satır satır kaydırma yerine aralık yeniden hesaplanır
+MAX_INCREMENTAL_KEYS = 50
+
+
+def _rebuild_from(day):
+    """Verilen günden bugüne kadar özetleri yeniden hesapla"""
+    DailyLedgerRollup.rebuild(day, max(day, timezone.localdate()))
+
+
+@receiver(post_save, sender=Debt)
+def update_rollup_on_debt_save(sender, instance, created, raw=False, **kwargs):
+    """Borç kaydı oluşturulduğunda/güncellendiğinde günlük özeti artımlı güncelle"""
+    if raw:
+        return
+    
+    created_day = local_day(instance.created_at)
+    old_state = None if created else getattr(instance, '_balance_state', None)
+    new_state = instance.balance_state()
+    
+    if not created and old_state is None:
+        # Önceki durum bilinmiyor (DB'den yüklenmemiş örnek): yeniden hesapla
+        _rebuild_from(created_day)
+        return
+    
+    if old_state == new_state:
+        return
+    
+    flows = {}
+    debt_deltas(
+        flows,
+        old_state,
+        new_state,
+        created_day,
+        paid_day(instance.created_at, instance.paid_at, instance.updated_at),
+        timezone.localdate(),
+    )
+    DailyLedgerRollup.apply(flows)
+
+
+@receiver(post_delete, sender=Debt)
+def update_rollup_on_debt_delete(sender, instance, **kwargs):
+    """Silinen borç kaydının açılış ve ödeme tutarlarını özetten düş"""
+    state = getattr(instance, '_balance_state', None) or instance.balance_state()
+    flows = {}
+    debt_deltas(
+        flows,
+        state,
+        None,
+        local_day(instance.created_at),
+        paid_day(instance.created_at, instance.paid_at, instance.updated_at),
+        timezone.localdate(),
+    )
+    DailyLedgerRollup.apply(flows)
+
+
+@receiver(debts_bulk_changed)
+def update_rollup_on_bulk_change(sender, debt_ids=None, previous_states=None, **kwargs):
+    """Toplu borç yazımlarından sonra günlük özeti güncelle"""
+    if not debt_ids:
+        return
+    
+    rows = list(
+        Debt.objects.filter(id__in=debt_ids).values_list(
+            'id', 'customer_id', 'debt_type', 'amount', 'paid_amount', 'is_paid',
+            'created_at', 'paid_at', 'updated_at',
+        )
+    )
+    if not rows:
+        return
+    
+    first_day = min(local_day(row[6]) for row in rows)
+    if previous_states is None:
+        # Gönderen önceki durumları vermediyse etkilenen aralık yeniden hesaplanır
+        _rebuild_from(first_day)
+        return
+    
+    today = timezone.localdate()
+    flows = {}
+    for debt_id, customer_id, debt_type, amount, paid_amount, is_paid, created_at, paid_at, updated_at in rows:
+        debt_deltas(
+            flows,
+            previous_states.get(debt_id),
+            (customer_id, debt_type, amount, paid_amount, is_paid),
+            local_day(created_at),
+            paid_day(created_at, paid_at, updated_at),
+            today,
+        )
+    
+    flows = without_zeros(flows)
+    if len(flows) > MAX_INCREMENTAL_KEYS:
+        _rebuild_from(first_day)
+    else:
+        DailyLedgerRollup.apply(flows)
@@ -0,0 +1,19 @@
+"""
+Signal handlers keeping the customer search index up to date.
+"""
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from backend.core.models import Customer, CustomerSearchTerm
+
+SEARCH_FIELDS = {'first_name', 'last_name', 'phone', 'email'}
+
+
+@receiver(post_save, sender=Customer)
+def update_customer_search_terms(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    """Müşteri kaydedildiğinde arama terimlerini yeniden yaz"""
+    if raw:
+        return
+    if update_fields is not None and not SEARCH_FIELDS.intersection(update_fields):
+        return
+    CustomerSearchTerm.rebuild_for(instance)
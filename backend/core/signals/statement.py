@@ -0,0 +1,99 @@
+"""
+Signal handlers appending customer statement (ledger) entries on Debt writes.
+
+Önceki durum Debt._balance_state'ten okunur; Debt.save tüm post_save
+handler'ları çalıştıktan sonra ilerletir (bağlanma sırası önemsizdir).
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from backend.core.models import Customer, Debt, LedgerEntry
+from backend.core.utils.statement import net_amount, signed
+
+
+@receiver(post_save, sender=Debt)
+def append_statement_on_debt_save(sender, instance, created, raw=False, **kwargs):
+    """Borç kaydı oluşturulduğunda/güncellendiğinde ekstreye hareket ekle"""
+    if raw:
+        return
+    
+    old_state = getattr(instance, '_balance_state', None)
+    new_state = instance.balance_state()
+    customer_id, debt_type, amount, paid_amount, is_paid = new_state
+    
+    if created:
+        entries = [{
+            'customer_id': customer_id,
+            'kind': debt_type,
+            'amount': signed(debt_type, amount),
+            'debt_id': instance.pk,
+            'description': instance.description or '',
+        }]
+        paid = net_amount(debt_type, amount, paid_amount, is_paid) - signed(debt_type, amount)
+        if paid:
+            entries.append({
+                'customer_id': customer_id,
+                'kind': LedgerEntry.Kind.PAYMENT,
+                'amount': paid,
+                'debt_id': instance.pk,
+            })
+        LedgerEntry.append_many(entries)
+        return
+    
+    if old_state is None:
+        # Önceki durum bilinmiyor (DB'den yüklenmemiş örnek): ekstreyi yeniden yaz
+        LedgerEntry.rebuild([customer_id])
+        return
+    
+    if old_state == new_state:
+        return
+    
+    old_customer_id = old_state[0]
+    old_net = net_amount(*old_state[1:])
+    new_net = net_amount(*new_state[1:])
+    
+    if old_customer_id != customer_id:
+        LedgerEntry.append_many([
+            {
+                'customer_id': old_customer_id,
+                'kind': LedgerEntry.Kind.ADJUSTMENT,
+                'amount': -old_net,
+                'debt_id': instance.pk,
+                'description': 'Kayıt başka müşteriye taşındı',
+            },
+            {
+                'customer_id': customer_id,
+                'kind': LedgerEntry.Kind.ADJUSTMENT,
+                'amount': new_net,
+                'debt_id': instance.pk,
+                'description': 'Kayıt başka müşteriden taşındı',
+            },
+        ])
+        return
+    
+    is_payment = paid_amount > old_state[3] and debt_type == old_state[1] and amount == old_state[2]
+    LedgerEntry.append(
+        customer_id,
+        LedgerEntry.Kind.PAYMENT if is_payment else LedgerEntry.Kind.ADJUSTMENT,
+        new_net - old_net,
+        debt_id=instance.pk,
+        description='' if is_payment else 'Kayıt güncellendi',
+    )
+
+
+@receiver(post_delete, sender=Debt)
+def append_statement_on_debt_delete(sender, instance, origin=None, **kwargs):
+    """Silinen borç kaydının açık tutarını ekstreden ters kayıtla düş"""
+    # Müşteri silinirken (cascade) ekstre satırları da silinir
+    origin_model = getattr(origin, 'model', type(origin))
+    if origin_model is Customer:
+        return
+    
+    state = getattr(instance, '_balance_state', None) or instance.balance_state()
+    customer_id = state[0]
+    LedgerEntry.append(
+        customer_id,
+        LedgerEntry.Kind.ADJUSTMENT,
+        -net_amount(*state[1:]),
+        description=f'Kayıt silindi (#{instance.pk})',
+    )
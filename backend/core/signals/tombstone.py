@@ -0,0 +1,14 @@
+"""
+Signal handlers recording deletion tombstones for delta sync.
+"""
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from backend.core.models import Customer, Debt, DeletionTombstone
+
+
+@receiver(post_delete, sender=Customer)
+@receiver(post_delete, sender=Debt)
+def record_deletion_tombstone(sender, instance, **kwargs):
+    """Silinen müşteri/borç için iz bırak (müşteri silinince borçları da ayrı ayrı gelir)"""
+    DeletionTombstone.objects.create(model=sender._meta.label_lower, object_id=instance.pk)
@@ -0,0 +1,48 @@
+"""
+Aging buckets for overdue debts.
+
+Vadesi geçmiş (due_date < bugün) ve ödenmemiş borçlar, vadeden bu yana
+geçen gün sayısına göre dilimlere ayrılır. Dilimler due_date aralıklarına
+çevrilir; böylece gruplama tek bir koşullu SUM sorgusu ile yapılır ve
+(is_paid, due_date) index'i kullanılır.
+"""
+from datetime import date, timedelta
+from typing import Dict, Optional, Tuple
+
+# (anahtar, en az gün, en çok gün); son dilimin üst sınırı yoktur
+AGING_BUCKETS = (
+    ('0_30', 0, 30),
+    ('31_60', 31, 60),
+    ('61_90', 61, 90),
+    ('90_plus', 91, None),
+)
+
+BUCKET_KEYS = tuple(key for key, _, _ in AGING_BUCKETS)
+
+
+def days_overdue(due_date: date, as_of: date) -> int:
+    """Vadeden bu yana geçen gün sayısı"""
+    return (as_of - due_date).days
+
+
+def bucket_for(days: int) -> str:
+    """Gecikme gün sayısının dilim anahtarı"""
+    for key, low, high in AGING_BUCKETS:
+        if days >= low and (high is None or days <= high):
+            return key
+    return BUCKET_KEYS[0]
+
+
+def bucket_date_ranges(as_of: date) -> Dict[str, Tuple[Optional[date], date]]:
+    """
+    Her dilim için due_date aralığı (dahil): {anahtar: (en erken, en geç)}
+    
+    En erken None ise alt sınır yoktur (90+ dilimi).
+    """
+    return {
+        key: (
+            as_of - timedelta(days=high) if high is not None else None,
+            as_of - timedelta(days=low),
+        )
+        for key, low, high in AGING_BUCKETS
+    }
@@ -0,0 +1,121 @@
+"""
+Responsive image variant helpers (Pillow).
+"""
+import base64
+import io
+import posixpath
+
+from django.core.files.base import ContentFile
+from PIL import Image, ImageFilter, ImageOps, features
+
+VARIANT_WIDTHS = (320, 640, 1280)
+PLACEHOLDER_WIDTH = 16
+
+# (format adı, uzantı, MIME türü, Pillow kayıt seçenekleri)
+_FORMATS = (
+    ('avif', 'avif', 'image/avif', {'quality': 50}),
+    ('webp', 'webp', 'image/webp', {'quality': 80, 'method': 4}),
+)
+
+FORMAT_PREFERENCE = tuple(fmt[0] for fmt in _FORMATS)
+
+
+def available_formats():
+    """Bu Pillow kurulumunun yazabildiği varyant biçimleri (tercih sırasıyla)"""
+    return [fmt for fmt in _FORMATS if features.check(fmt[0])]
+
+
+def _prepare(image: Image.Image) -> Image.Image:
+    """EXIF yönünü uygula ve kaydedilebilir renk moduna çevir"""
+    image = ImageOps.exif_transpose(image)
+    if image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA' if 'transparency' in image.info or image.mode in ('LA', 'PA') else 'RGB')
+    return image
+
+
+def _encode(image: Image.Image, pillow_format: str, options: dict) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, format=pillow_format.upper(), **options)
+    return buffer.getvalue()
+
+
+def reencode_original(source):
+    """
+    Orijinali EXIF/metadata olmadan yeniden kodla (yön bilgisi piksellere uygulanır)
+    Dönüş: (bytes, uzantı) veya desteklenmeyen biçimlerde (ör. animasyonlu GIF) None
+    """
+    with Image.open(source) as original:
+        pillow_format = original.format
+        if pillow_format not in ('JPEG', 'PNG', 'WEBP') or getattr(original, 'is_animated', False):
+            return None
+        image = _prepare(original)
+        image.load()
+    
+    if pillow_format == 'JPEG':
+        return _encode(image.convert('RGB'), 'jpeg', {'quality': 85, 'optimize': True, 'progressive': True}), 'jpg'
+    if pillow_format == 'PNG':
+        return _encode(image, 'png', {'optimize': True}), 'png'
+    return _encode(image, 'webp', {'quality': 85}), 'webp'
+
+
+def target_widths(original_width: int):
+    """Büyütme yapılmaz; orijinalden küçük genişlikler + gerekirse orijinal genişlik"""
+    widths = [width for width in VARIANT_WIDTHS if width < original_width]
+    if len(widths) < len(VARIANT_WIDTHS):
+        widths.append(original_width)
+    return widths
+
+
+def build_placeholder(image: Image.Image) -> str:
+    """Bulanık, birkaç yüz baytlık data URI (LQIP)"""
+    thumb = image.copy()
+    thumb.thumbnail((PLACEHOLDER_WIDTH, PLACEHOLDER_WIDTH * 4))
+    thumb = thumb.convert('RGB').filter(ImageFilter.GaussianBlur(1))
+    data = _encode(thumb, 'webp', {'quality': 30})
+    return 'data:image/webp;base64,' + base64.b64encode(data).decode('ascii')
+
+
+def generate_variants(source, storage, base_name: str) -> dict:
+    """
+    Kaynak resimden yeniden boyutlandırılmış varyantlar üret ve storage'a yaz
+    
+    Dönüş (GalleryImage.variants):
+        {"width": 2000, "height": 1500, "placeholder": "data:...",
+         "formats": {"webp": {"mime": "image/webp", "files": [{"width": 320, "name": "..."}]}}}
+    """
+    with Image.open(source) as original:
+        image = _prepare(original)
+        image.load()
+    
+    width, height = image.size
+    stem = posixpath.splitext(posixpath.basename(base_name))[0]
+    directory = posixpath.join(posixpath.dirname(base_name), 'variants')
+    
+    result = {
+        'width': width,
+        'height': height,
+        'placeholder': build_placeholder(image),
+        'formats': {},
+    }
+    
+    for target in target_widths(width):
+        resized = image if target == width else image.resize(
+            (target, max(1, round(height * target / width))),
+            Image.LANCZOS,
+        )
+        for name, extension, mime, options in available_formats():
+            file_name = storage.save(
+                posixpath.join(directory, f'{stem}_{target}w.{extension}'),
+                ContentFile(_encode(resized, name, options)),
+            )
+            entry = result['formats'].setdefault(name, {'mime': mime, 'files': []})
+            entry['files'].append({'width': target, 'name': file_name})
+    
+    return result
+
+
+def variant_file_names(variants: dict):
+    """Varyant sözlüğündeki tüm dosya adları"""
+    for entry in (variants or {}).get('formats', {}).values():
+        for item in entry.get('files', []):
+            yield item['name']
@@ -0,0 +1,47 @@
+"""
+Phone number normalization helpers.
+"""
+from typing import Optional
+
+from backend.core.utils.text import digits_only
+
+DEFAULT_COUNTRY_CODE = '90'
+
+
+def normalize_phone(raw: str, country_code: str = DEFAULT_COUNTRY_CODE) -> Optional[str]:
+    """
+    Telefon numarasını E.164 biçimine çevir
+    "0532 123 45 67" / "532-123-4567" / "+90 532 123 45 67" -> "+905321234567"
+    Tanınmayan biçimlerde None döner.
+    """
+    raw = (raw or '').strip()
+    digits = digits_only(raw)
+    if not digits:
+        return None
+    
+    if raw.startswith('+'):
+        e164 = digits
+    elif digits.startswith('00'):
+        e164 = digits[2:]
+    elif len(digits) == 11 and digits.startswith('0'):
+        e164 = country_code + digits[1:]
+    elif len(digits) == 10 and not digits.startswith('0'):
+        e164 = country_code + digits
+    elif len(digits) == 12 and digits.startswith(country_code):
+        e164 = digits
+    else:
+        return None
+    
+    # E.164: en fazla 15 rakam
+    if not 8 <= len(e164) <= 15:
+        return None
+    return f'+{e164}'
+
+
+def reversed_digits(phone: Optional[str]) -> Optional[str]:
+    """
+    Numaranın rakamlarını ters çevir
+    Son N rakam araması, ters çevrilmiş kolonda önek (index) aramasına dönüşür.
+    """
+    digits = digits_only(phone)
+    return digits[::-1] if digits else None
@@ -0,0 +1,193 @@
+"""
+Helpers for daily ledger rollups (DailyLedgerRollup).
+
+Günlük özet satırları borç türü (DEBT/CREDIT) başına şu değerleri tutar:
+- created: o gün kaydı açılan tutar ve kayıt sayısı (kayıt tarihine göre),
+- paid: o gün ödenen tutar (ödenmedi işaretleme eksi yazılır),
+- outstanding: gün sonu açık tutar = o güne kadarki created - paid toplamı.
+
+Satırlar yalnızca hareket olan günler için yazılır; aradaki günlerde
+outstanding bir önceki satırdan taşınır.
+
+Yeniden hesaplamada ödemeler, dağılımların ödeme tarihine yazılır.
+Ödenen tutarın dağılımla açıklanmayan kısmı (mark_paid vb.) borcun ödeme
+tarihine yazılır (bkz. backend.core.utils.statement.history_events).
+"""
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from django.db.models import Count, DecimalField, F, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce, Greatest, TruncDate
+from django.utils import timezone
+
+ZERO = Decimal('0.00')
+
+DAY = 'day'
+WEEK = 'week'
+MONTH = 'month'
+INTERVALS = (DAY, WEEK, MONTH)
+
+# (gün, borç türü) -> [kayıt sayısı, açılan tutar, ödenen tutar]
+Flows = Dict[Tuple[date, str], List]
+
+
+def local_day(value: datetime) -> date:
+    """Aware datetime'ın aktif saat dilimindeki günü"""
+    return timezone.localtime(value).date()
+
+
+def day_bounds(date_from: date, date_to: date) -> Tuple[datetime, datetime]:
+    """[date_from 00:00, date_to + 1 gün 00:00) aralığı (aware)"""
+    return (
+        timezone.make_aware(datetime.combine(date_from, time.min)),
+        timezone.make_aware(datetime.combine(date_to + timedelta(days=1), time.min)),
+    )
+
+
+def paid_day(created_at: datetime, paid_at: Optional[datetime], updated_at: Optional[datetime]) -> date:
+    """Ödenen kısmın yazıldığı gün: ödeme tarihi (yoksa son güncelleme), kayıttan önce olamaz"""
+    paid_on = paid_at or updated_at or created_at
+    return local_day(max(paid_on, created_at))
+
+
+def paid_value(state) -> Decimal:
+    """Debt.balance_state() görüntüsündeki ödenen tutar"""
+    _, _, amount, paid_amount, is_paid = state
+    return amount if is_paid else (paid_amount or ZERO)
+
+
+def add_flow(flows: Flows, day: date, debt_type: str, count=0, created=ZERO, paid=ZERO):
+    """Akışı (gün, tür) anahtarına ekle"""
+    row = flows.setdefault((day, debt_type), [0, ZERO, ZERO])
+    row[0] += count
+    row[1] += created
+    row[2] += paid
+
+
+def debt_deltas(flows: Flows, old_state, new_state, created_day: date, paid_on: date, today: date):
+    """
+    Tek bir borç yazımının özet değişikliklerini flows'a ekle
+    
+    old_state None ise kayıt yenidir; new_state None ise silinmiştir.
+    Yeni kayıtta ve silmede ödenen kısım paid_on gününe yazılır. Güncellemede
+    tutar ve tür düzeltmesi kayıt gününe, ödeme değişikliği bugüne yazılır.
+    """
+    if old_state is not None:
+        add_flow(flows, created_day, old_state[1], -1, -old_state[2])
+        add_flow(flows, paid_on if new_state is None else today, old_state[1], paid=-paid_value(old_state))
+    if new_state is not None:
+        add_flow(flows, created_day, new_state[1], 1, new_state[2])
+        add_flow(flows, paid_on if old_state is None else today, new_state[1], paid=paid_value(new_state))
+
+
+def without_zeros(flows: Flows) -> Flows:
+    """Etkisi olmayan anahtarları at"""
+    return {key: row for key, row in flows.items() if any(row)}
+
+
+def load_flows(debt_model, allocation_model, date_from: date, date_to: date) -> Flows:
+    """
+    Tarih aralığındaki günlük akışları borç ve ödeme kayıtlarından hesapla
+    
+    Model sınıfları parametre olarak alınır; migration'larda tarihsel
+    modellerle de kullanılabilir.
+    """
+    start, end = day_bounds(date_from, date_to)
+    tzinfo = timezone.get_current_timezone()
+    money = DecimalField(max_digits=14, decimal_places=2)
+    flows: Flows = {}
+    
+    created = (
+        debt_model.objects.filter(created_at__gte=start, created_at__lt=end)
+        .annotate(day=TruncDate('created_at', tzinfo=tzinfo))
+        .order_by()
+        .values('day', 'debt_type')
+        .annotate(count=Count('id'), total=Sum('amount'))
+    )
+    for row in created:
+        add_flow(flows, row['day'], row['debt_type'], row['count'], row['total'])
+    
+    allocated = (
+        allocation_model.objects.filter(payment__created_at__gte=start, payment__created_at__lt=end)
+        .annotate(day=TruncDate('payment__created_at', tzinfo=tzinfo))
+        .order_by()
+        .values('day', 'debt__debt_type')
+        .annotate(total=Sum('amount'))
+    )
+    for row in allocated:
+        add_flow(flows, row['day'], row['debt__debt_type'], paid=row['total'])
+    
+    # Dağılımla açıklanmayan ödenen kısım borcun ödeme tarihine yazılır
+    allocation_total = (
+        allocation_model.objects.filter(debt_id=OuterRef('pk'))
+        .order_by()
+        .values('debt_id')
+        .annotate(total=Sum('amount'))
+        .values('total')
+    )
+    unallocated = (
+        debt_model.objects.annotate(
+            paid_on=Greatest(Coalesce('paid_at', 'updated_at'), 'created_at'),
+            unallocated=F('paid_amount') - Coalesce(Subquery(allocation_total, output_field=money), ZERO, output_field=money),
+        )
+        .filter(paid_on__gte=start, paid_on__lt=end)
+        .exclude(unallocated=ZERO)
+        .annotate(day=TruncDate('paid_on', tzinfo=tzinfo))
+        .order_by()
+        .values('day', 'debt_type')
+        .annotate(total=Sum('unallocated'))
+    )
+    for row in unallocated:
+        add_flow(flows, row['day'], row['debt_type'], paid=row['total'])
+    
+    return without_zeros(flows)
+
+
+def first_day(debt_model) -> Optional[date]:
+    """İlk borç kaydının günü; ödemeler kayıttan önce olamaz"""
+    first = debt_model.objects.order_by('created_at').values_list('created_at', flat=True).first()
+    return local_day(first) if first is not None else None
+
+
+def with_outstanding(flows: Flows, opening: Dict[str, Decimal]) -> Iterator[dict]:
+    """Tür ve gün sırasıyla özet satırları; outstanding opening üzerine yürür"""
+    balances = dict(opening)
+    for (day, debt_type), (count, created, paid) in sorted(flows.items(), key=lambda item: (item[0][1], item[0][0])):
+        balance = balances.get(debt_type, ZERO) + created - paid
+        balances[debt_type] = balance
+        yield {
+            'day': day,
+            'debt_type': debt_type,
+            'created_count': count,
+            'created_amount': created,
+            'paid_amount': paid,
+            'outstanding_amount': balance,
+        }
+
+
+def period_start(day: date, interval: str) -> date:
+    """Günün ait olduğu dönemin ilk günü (hafta Pazartesi başlar)"""
+    if interval == WEEK:
+        return day - timedelta(days=day.weekday())
+    if interval == MONTH:
+        return day.replace(day=1)
+    return day
+
+
+def iter_periods(date_from: date, date_to: date, interval: str) -> Iterator[date]:
+    """Aralığa düşen dönemlerin başlangıç günleri"""
+    current = period_start(date_from, interval)
+    while current <= date_to:
+        yield current
+        if interval == MONTH:
+            current = (current.replace(day=28) + timedelta(days=4)).replace(day=1)
+        elif interval == WEEK:
+            current += timedelta(days=7)
+        else:
+            current += timedelta(days=1)
+
+
+def period_count(date_from: date, date_to: date, interval: str) -> int:
+    """Aralıktaki dönem sayısı"""
+    return sum(1 for _ in iter_periods(date_from, date_to, interval))
@@ -0,0 +1,134 @@
+"""
+Helpers for building customer statement (ledger) entries.
+
+Hesap ekstresinde bakiye, müşterinin borçlu olduğu net tutardır:
+açık borç (DEBT) artı, açık alacak (CREDIT) eksi yönde sayılır; ödenen
+kısımlar bakiyeden düşer. Son satırın bakiyesi her zaman
+outstanding_debt - outstanding_credit değerine eşittir.
+"""
+from decimal import Decimal
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from django.db.models import Sum
+
+ZERO = Decimal('0.00')
+
+DEBT = 'DEBT'
+CREDIT = 'CREDIT'
+PAYMENT = 'PAYMENT'
+ADJUSTMENT = 'ADJUSTMENT'
+
+# Aynı anda gerçekleşen hareketlerde sıra: kayıt, sonra ödeme
+_KIND_ORDER = {DEBT: 0, CREDIT: 0, PAYMENT: 1, ADJUSTMENT: 2}
+
+# rebuild için okunan kolonlar
+DEBT_COLUMNS = (
+    'id', 'customer_id', 'debt_type', 'amount', 'paid_amount',
+    'created_at', 'paid_at', 'updated_at', 'description',
+)
+PAYMENT_COLUMNS = ('id', 'customer_id', 'created_at', 'notes')
+
+
+def signed(debt_type: str, value: Decimal) -> Decimal:
+    """Borç artı, alacak eksi yönde"""
+    return -value if debt_type == CREDIT else value
+
+
+def net_amount(debt_type: str, amount: Decimal, paid_amount: Decimal, is_paid: bool) -> Decimal:
+    """Tek bir borç kaydının bakiyeye net katkısı"""
+    if is_paid:
+        return ZERO
+    return signed(debt_type, (amount or ZERO) - (paid_amount or ZERO))
+
+
+def history_events(
+    debt_rows: Iterable[tuple],
+    payment_rows: Iterable[tuple],
+    allocated: Dict[int, Decimal],
+) -> List[dict]:
+    """
+    Mevcut kayıtlardan kronolojik ekstre hareketleri üret
+    
+    debt_rows DEBT_COLUMNS sırasıyla tuple'dır; payment_rows PAYMENT_COLUMNS
+    sırasına ek olarak ödemenin mevcut borçlara dağıtılan toplamını taşır
+    (silinmiş borçlara düşen kısım ekstreye girmez). allocated, borç başına
+    dağılım toplamıdır; ödenen tutarın dağılımla açıklanmayan kısmı
+    (mark_paid vb.) ödeme tarihinde ayrı bir hareket olarak eklenir.
+    """
+    events = []
+    for debt_id, customer_id, debt_type, amount, paid_amount, created_at, paid_at, updated_at, description in debt_rows:
+        events.append({
+            'customer_id': customer_id,
+            'kind': debt_type,
+            'amount': signed(debt_type, amount),
+            'debt_id': debt_id,
+            'payment_id': None,
+            'description': (description or '')[:255],
+            'created_at': created_at,
+        })
+        unallocated = (paid_amount or ZERO) - allocated.get(debt_id, ZERO)
+        if unallocated:
+            events.append({
+                'customer_id': customer_id,
+                'kind': PAYMENT if unallocated > ZERO else ADJUSTMENT,
+                'amount': -signed(debt_type, unallocated),
+                'debt_id': debt_id,
+                'payment_id': None,
+                'description': '',
+                'created_at': max(paid_at or updated_at, created_at),
+            })
+    
+    for payment_id, customer_id, created_at, notes, amount in payment_rows:
+        if not amount:
+            continue
+        events.append({
+            'customer_id': customer_id,
+            'kind': PAYMENT,
+            'amount': -amount,
+            'debt_id': None,
+            'payment_id': payment_id,
+            'description': (notes or '')[:255],
+            'created_at': created_at,
+        })
+    
+    events.sort(key=lambda e: (e['customer_id'], e['created_at'], _KIND_ORDER[e['kind']]))
+    return events
+
+
+def load_history(debt_model, payment_model, allocation_model, customer_ids) -> List[dict]:
+    """
+    Verilen müşterilerin kronolojik hareketlerini veritabanından oku
+    
+    Model sınıfları parametre olarak alınır; migration'larda tarihsel
+    modellerle de kullanılabilir.
+    """
+    debt_rows = debt_model.objects.filter(customer_id__in=customer_ids).values_list(*DEBT_COLUMNS)
+    allocations = allocation_model.objects.filter(debt__customer_id__in=customer_ids).order_by()
+    allocated = dict(
+        allocations.values('debt_id').annotate(total=Sum('amount')).values_list('debt_id', 'total')
+    )
+    payment_totals = dict(
+        allocations.values('payment_id').annotate(total=Sum('amount')).values_list('payment_id', 'total')
+    )
+    payment_rows = [
+        row + (payment_totals.get(row[0], ZERO),)
+        for row in payment_model.objects.filter(customer_id__in=customer_ids).values_list(*PAYMENT_COLUMNS)
+    ]
+    return history_events(debt_rows, payment_rows, allocated)
+
+
+def with_running_balance(events: Iterable[dict]) -> Iterator[dict]:
+    """Müşteri bazında sıralı hareketlere balance_after ekle"""
+    balances: Dict[int, Decimal] = {}
+    for event in events:
+        balance = balances.get(event['customer_id'], ZERO) + event['amount']
+        balances[event['customer_id']] = balance
+        yield dict(event, balance_after=balance)
+
+
+def group_deltas(rows: Iterable[Tuple[int, Decimal]]) -> Dict[int, Decimal]:
+    """(customer_id, delta) çiftlerini müşteri bazında topla, sıfırları at"""
+    totals: Dict[int, Decimal] = {}
+    for customer_id, delta in rows:
+        totals[customer_id] = totals.get(customer_id, ZERO) + delta
+    return {customer_id: total for customer_id, total in totals.items() if total}
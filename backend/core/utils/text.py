@@ -0,0 +1,75 @@
+"""
+Text normalization helpers for search.
+"""
+import re
+import unicodedata
+from typing import List, Optional
+
+from django.db import connection
+from django.db.models import Q
+
+# Türkçe büyük harfler: İ -> i, I -> ı (str.lower() İ'yi "i̇" yapar)
+_TURKISH_UPPER = str.maketrans({'İ': 'i', 'I': 'ı'})
+
+# Aramada Türkçe karakterler ASCII karşılıklarıyla eşleşir (ı=i, ş=s, ...)
+_ASCII_FOLD = str.maketrans('ıçğöşüâîû', 'icgosuaiu')
+
+_TOKEN_RE = re.compile(r'[^a-z0-9@._+\-]+')
+_PHONE_QUERY_RE = re.compile(r'^[\d\s()+\-./]+$')
+
+MAX_TERM_LENGTH = 64
+
+
+def fold_turkish(text: str) -> str:
+    """
+    Türkçe kurallarına göre küçük harfe çevir ve aksanları kaldır
+    "İsmail IŞIK" -> "ismail isik"
+    """
+    if not text:
+        return ''
+    text = text.translate(_TURKISH_UPPER).lower().translate(_ASCII_FOLD)
+    text = unicodedata.normalize('NFKD', text)
+    return ''.join(ch for ch in text if not unicodedata.combining(ch))
+
+
+def digits_only(text: str) -> str:
+    """Metindeki rakamları döndür"""
+    return ''.join(ch for ch in (text or '') if ch.isdigit())
+
+
+def is_phone_query(text: str) -> bool:
+    """Sorgu sadece telefon numarası karakterlerinden mi oluşuyor?"""
+    return bool(text) and bool(_PHONE_QUERY_RE.match(text.strip())) and bool(digits_only(text))
+
+
+def tokenize(text: str) -> List[str]:
+    """Metni katlanmış arama terimlerine böl"""
+    tokens = []
+    for raw in _TOKEN_RE.split(fold_turkish(text)):
+        token = raw.strip('._+-')[:MAX_TERM_LENGTH]
+        if token and token not in tokens:
+            tokens.append(token)
+    return tokens
+
+
+def prefix_upper_bound(prefix: str) -> str:
+    """
+    Önek aralığının (hariç) üst sınırı: son karakter bir artırılır
+    "ab" -> "ac"; [önek, üst sınır) ikili karşılaştırmada tam önek aralığıdır.
+    """
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def prefix_q(field: str, prefix: str, vendor: Optional[str] = None) -> Q:
+    """
+    field önek araması, index ile servis edilen biçimde
+    
+    SQLite metni ikili karşılaştırır ama LIKE büyük/küçük harf duyarsız
+    olduğundan index kullanmaz: aralık taraması yapılır. PostgreSQL'de yerel
+    collation (ör. tr_TR/en_US) noktalama işaretlerini yok sayıp aralığı
+    bozabilir; orada LIKE 'önek%' varchar_pattern_ops index'i ile servis edilir.
+    """
+    vendor = vendor or connection.vendor
+    if vendor == 'postgresql':
+        return Q(**{f'{field}__startswith': prefix})
+    return Q(**{f'{field}__gte': prefix, f'{field}__lt': prefix_upper_bound(prefix)})
@@ -0,0 +1,97 @@
+"""
+Keyset (cursor) pagination helpers for Django querysets.
+
+OFFSET tabanlı sayfalamanın aksine her sayfa, bir önceki sayfanın son
+satırının sıralama anahtarından başlayan bir index aralık taraması ile okunur;
+tablo büyüdükçe yanıt süresi sabit kalır.
+"""
+import base64
+import json
+from datetime import date, datetime
+from typing import Callable, Optional, Sequence
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+
+from backend.application.dtos.page_dto import PageDTO
+from backend.application.exceptions import InvalidCursorError
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def _encode_cursor(values: list) -> str:
+    """Sıralama anahtarını URL-safe token'a çevir"""
+    serializable = [
+        v.isoformat() if isinstance(v, (datetime, date)) else v
+        for v in values
+    ]
+    raw = json.dumps(serializable, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def _decode_cursor(cursor: str, size: int) -> list:
+    """Token'ı sıralama anahtarına geri çevir"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise InvalidCursorError('Geçersiz cursor.')
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursorError('Geçersiz cursor.')
+    return values
+
+
+def _after_cursor_q(ordering: Sequence[str], values: list) -> Q:
+    """
+    Cursor'dan sonraki satırları seçen koşul
+    (a, b, c) > (x, y, z) -> a > x OR (a = x AND b > y) OR (a = x AND b = y AND c > z)
+    """
+    condition = Q()
+    for i, field_spec in enumerate(ordering):
+        field = field_spec.lstrip('-')
+        lookup = 'lt' if field_spec.startswith('-') else 'gt'
+        branch = Q(**{f'{field}__{lookup}': values[i]})
+        for prev_spec, prev_value in zip(ordering[:i], values[:i]):
+            branch &= Q(**{prev_spec.lstrip('-'): prev_value})
+        condition |= branch
+    return condition
+
+
+def keyset_paginate(
+    queryset,
+    ordering: Sequence[str],
+    to_dto: Callable,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+) -> PageDTO:
+    """
+    Queryset'i keyset sayfalama ile böl
+    
+    ordering benzersiz bir alanla (genelde 'id') bitmelidir; aksi halde
+    eşit anahtarlı satırlar sayfa sınırında atlanabilir.
+    """
+    limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+    queryset = queryset.order_by(*ordering)
+    
+    if cursor:
+        values = _decode_cursor(cursor, len(ordering))
+        try:
+            queryset = queryset.filter(_after_cursor_q(ordering, values))
+        except (ValidationError, ValueError, TypeError):
+            # Cursor içindeki değerler alan tiplerine dönüştürülemedi
+            raise InvalidCursorError('Geçersiz cursor.')
+    
+    # Bir fazla satır okuyarak sonraki sayfanın varlığını anla
+    rows = list(queryset[:limit + 1])
+    has_next = len(rows) > limit
+    rows = rows[:limit]
+    
+    next_cursor = None
+    if has_next:
+        last = rows[-1]
+        next_cursor = _encode_cursor([
+            getattr(last, spec.lstrip('-')) for spec in ordering
+        ])
+    
+    return PageDTO(items=[to_dto(row) for row in rows], next_cursor=next_cursor)
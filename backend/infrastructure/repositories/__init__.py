@@ -3,13 +3,21 @@ Repository implementations module.
 """
 from backend.infrastructure.repositories.customer_repository import CustomerRepository
 from backend.infrastructure.repositories.debt_repository import DebtRepository
+from backend.infrastructure.repositories.payment_repository import PaymentRepository
 from backend.infrastructure.repositories.gallery_repository import GalleryRepository
 from backend.infrastructure.repositories.contact_repository import ContactRepository
+from backend.infrastructure.repositories.report_repository import ReportRepository
+from backend.infrastructure.repositories.sync_repository import SyncRepository
+from backend.infrastructure.repositories.statement_repository import StatementRepository
 
 __all__ = [
     'CustomerRepository',
     'DebtRepository',
+    'PaymentRepository',
     'GalleryRepository',
     'ContactRepository',
+    'ReportRepository',
+    'SyncRepository',
+    'StatementRepository',
 ]
 
@@ -3,8 +3,11 @@ Contact Message Repository Implementation using Django ORM.
 """
 from typing import List, Optional
 from backend.core.models import ContactMessage
+from backend.core.replica import read_only
 from backend.application.abstracts.repository_abstract import IContactRepository
 from backend.application.dtos.contact_dto import ContactMessageDTO
+from backend.application.dtos.page_dto import PageDTO
+from backend.infrastructure.pagination import DEFAULT_PAGE_SIZE, keyset_paginate
 
 
 class ContactRepository(IContactRepository):
@@ -12,6 +15,9 @@ class ContactRepository(IContactRepository):
     Contact Message Repository Implementation
     """
     
+    # -created_at index'i ile servis edilir
+    PAGE_ORDERING = ('-created_at', 'id')
+    
     def _model_to_dto(self, contact_message: ContactMessage) -> ContactMessageDTO:
         """Model'i DTO'ya çevir"""
         return ContactMessageDTO(
@@ -43,6 +49,7 @@ class ContactRepository(IContactRepository):
         except ContactMessage.DoesNotExist:
             return None
     
+    @read_only()
     def get_all(self, is_read: Optional[bool] = None) -> List[ContactMessageDTO]:
         """Tüm mesajları getir"""
         queryset = ContactMessage.objects.all()
@@ -54,6 +61,21 @@ class ContactRepository(IContactRepository):
         
         return [self._model_to_dto(msg) for msg in queryset]
     
+    @read_only()
+    def get_page(
+        self,
+        is_read: Optional[bool] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+    ) -> PageDTO:
+        """Mesajları cursor sayfalama ile getir"""
+        queryset = ContactMessage.objects.all()
+        
+        if is_read is not None:
+            queryset = queryset.filter(is_read=is_read)
+        
+        return keyset_paginate(queryset, self.PAGE_ORDERING, self._model_to_dto, limit, cursor)
+    
     def mark_as_read(self, message_id: int) -> bool:
         """Mesajı okundu olarak işaretle"""
         try:
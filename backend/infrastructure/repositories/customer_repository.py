@@ -1,12 +1,20 @@
 """
 Customer Repository Implementation using Django ORM.
 """
-from typing import List, Optional
-from django.db.models import Q, Sum
+import operator
+from datetime import datetime
+from functools import reduce
+from typing import Dict, List, Optional, Set, Tuple
+from django.db.models import Case, F, IntegerField, Max, Q, Sum, Value, When
 from django.db import models
-from backend.core.models import Customer
+from backend.core.models import Customer, CustomerSearchTerm
+from backend.core.utils.phone import normalize_phone
+from backend.core.utils.text import digits_only, is_phone_query, prefix_q, tokenize
+from backend.core.replica import read_only
 from backend.application.abstracts.repository_abstract import ICustomerRepository
 from backend.application.dtos.customer_dto import CustomerDTO
+from backend.application.dtos.page_dto import PageDTO
+from backend.infrastructure.pagination import DEFAULT_PAGE_SIZE, keyset_paginate
 from decimal import Decimal
 
 
@@ -15,6 +23,22 @@ class CustomerRepository(ICustomerRepository):
     Customer Repository Implementation
     """
     
+    # (-created_at, id) sıralaması mevcut -created_at index'i ile servis edilir
+    PAGE_ORDERING = ('-created_at', 'id')
+    
+    SEARCH_LIMIT = 20
+    MAX_SEARCH_TOKENS = 5
+    PHONE_SUFFIX_MIN_DIGITS = 4
+    
+    def _balance_queryset(self):
+        """
+        Bakiye kaydı ile birlikte yüklenen queryset
+        
+        Bakiyeler CustomerBalance tablosunda artımlı tutulur; N müşteri ve
+        bakiyeleri tek bir JOIN sorgusu ile gelir.
+        """
+        return Customer.objects.select_related('balance')
+    
     def _model_to_dto(self, customer: Customer) -> CustomerDTO:
         """Model'i DTO'ya çevir"""
         total_debt = Decimal(str(customer.total_debt))
@@ -53,28 +77,112 @@ class CustomerRepository(ICustomerRepository):
     def get_by_id(self, customer_id: int) -> Optional[CustomerDTO]:
         """ID'ye göre müşteri getir"""
         try:
-            customer = Customer.objects.get(id=customer_id)
+            customer = self._balance_queryset().get(id=customer_id)
             return self._model_to_dto(customer)
         except Customer.DoesNotExist:
             return None
     
+    def get_modification_state(self, customer_id: int) -> Optional[Tuple[datetime, ...]]:
+        """
+        Müşteri ve bakiye satırının updated_at değerleri
+        Koşullu GET için tek, DTO oluşturmayan bir sorgudur.
+        """
+        return Customer.objects.filter(id=customer_id).values_list(
+            'updated_at', 'balance__updated_at'
+        ).first()
+    
     def get_by_phone(self, phone: str) -> Optional[CustomerDTO]:
-        """Telefona göre müşteri getir"""
-        try:
-            customer = Customer.objects.get(phone=phone)
-            return self._model_to_dto(customer)
-        except Customer.DoesNotExist:
-            return None
+        """Telefona göre müşteri getir (yazım biçiminden bağımsız, E.164 index'i ile)"""
+        queryset = self._balance_queryset()
+        e164 = normalize_phone(phone)
+        
+        customer = None
+        if e164:
+            customer = queryset.filter(phone_e164=e164).first()
+        if customer is None:
+            # Normalize edilemeyen/yinelenen eski kayıtlar için birebir eşleşme
+            customer = queryset.filter(phone=phone).first()
+        
+        return self._model_to_dto(customer) if customer else None
+    
+    def find_by_phone_suffix(
+        self,
+        digits: str,
+        limit: int = SEARCH_LIMIT,
+        is_active: Optional[bool] = None,
+    ) -> List[CustomerDTO]:
+        """
+        Telefonun son rakamlarına göre müşteri bul ("son 4/7 hane")
+        
+        Ters çevrilmiş rakam kolonunda önek araması yapılır; index seek'tir.
+        """
+        digits = digits_only(digits)
+        if len(digits) < self.PHONE_SUFFIX_MIN_DIGITS:
+            return []
+        
+        key = digits[::-1]
+        queryset = self._balance_queryset().filter(prefix_q('phone_reversed', key))
+        if is_active is not None:
+            queryset = queryset.filter(is_active=is_active)
+        
+        return [self._model_to_dto(customer) for customer in queryset.order_by('phone_reversed')[:limit]]
     
+    def resolve_active_customers(self, customer_ids: Set[int], phones: Set[str]) -> Tuple[Set[int], Dict[str, int]]:
+        """
+        İçe aktarma batch'i için müşterileri toplu çöz
+        
+        ID'ler ve normalize edilmiş telefonlar birer in_bulk sorgusu ile
+        getirilir; satır başına sorgu yapılmaz.
+        """
+        active = Customer.objects.filter(is_active=True)
+        
+        active_ids = set()
+        if customer_ids:
+            active_ids = set(active.in_bulk(list(customer_ids)))
+        
+        phone_ids = {}
+        if phones:
+            e164_by_phone = {phone: normalize_phone(phone) for phone in phones}
+            by_e164 = active.in_bulk(
+                [e164 for e164 in e164_by_phone.values() if e164],
+                field_name='phone_e164',
+            )
+            for phone, e164 in e164_by_phone.items():
+                if e164 in by_e164:
+                    phone_ids[phone] = by_e164[e164].id
+        
+        return active_ids, phone_ids
+    
+    @read_only()
     def get_all(self, is_active: Optional[bool] = None) -> List[CustomerDTO]:
         """Tüm müşterileri getir"""
-        queryset = Customer.objects.all()
+        queryset = self._balance_queryset()
         
         if is_active is not None:
             queryset = queryset.filter(is_active=is_active)
         
         return [self._model_to_dto(customer) for customer in queryset]
     
+    @read_only()
+    def get_page(
+        self,
+        is_active: Optional[bool] = None,
+        search: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+    ) -> PageDTO:
+        """Müşterileri cursor sayfalama ile getir"""
+        if search:
+            # Arama sonuçları sıralı (rank) döner; cursor yoktur
+            return PageDTO(items=self.search(search, limit=limit, is_active=is_active))
+        
+        queryset = self._balance_queryset()
+        
+        if is_active is not None:
+            queryset = queryset.filter(is_active=is_active)
+        
+        return keyset_paginate(queryset, self.PAGE_ORDERING, self._model_to_dto, limit, cursor)
+    
     def update(self, customer_id: int, customer_dto: CustomerDTO) -> Optional[CustomerDTO]:
         """Müşteri bilgilerini güncelle"""
         try:
@@ -101,13 +209,63 @@ class CustomerRepository(ICustomerRepository):
         except Customer.DoesNotExist:
             return False
     
-    def search(self, query: str) -> List[CustomerDTO]:
-        """Müşteri ara (isim, telefon, email)"""
-        queryset = Customer.objects.filter(
-            Q(first_name__icontains=query) |
-            Q(last_name__icontains=query) |
-            Q(phone__icontains=query) |
-            Q(email__icontains=query)
+    def _search_tokens(self, query: str) -> List[str]:
+        """Sorguyu index terimleriyle aynı şekilde katla"""
+        if is_phone_query(query):
+            # "0532 123 45 67" tek bir rakam dizisi olarak aranır
+            return [digits_only(query)]
+        return tokenize(query)[:self.MAX_SEARCH_TOKENS]
+    
+    @read_only()
+    def search(
+        self,
+        query: str,
+        limit: int = SEARCH_LIMIT,
+        is_active: Optional[bool] = None,
+    ) -> List[CustomerDTO]:
+        """
+        Müşteri ara (isim, telefon, email)
+        
+        Her sorgu kelimesi arama index'inde önek olarak aranır ve tüm
+        kelimeleri eşleşen müşteriler döner. Tam kelime eşleşmeleri önce gelir.
+        """
+        tokens = self._search_tokens(query)
+        if not tokens:
+            return []
+        
+        suffix_matches = []
+        if is_phone_query(query):
+            # Tezgahta genelde numaranın son haneleri söylenir: önce sondan eşleşenler
+            suffix_matches = self.find_by_phone_suffix(tokens[0], limit=limit, is_active=is_active)
+            if len(suffix_matches) >= limit:
+                return suffix_matches
+        
+        # Her kelime için index ile servis edilen önek koşulu (bkz. prefix_q)
+        token_qs = [prefix_q('term', token) for token in tokens]
+        token_matches = {
+            f'match_{i}': Max(Case(When(token_q, then=Value(1)), default=Value(0), output_field=IntegerField()))
+            for i, token_q in enumerate(token_qs)
+        }
+        
+        terms = CustomerSearchTerm.objects.filter(reduce(operator.or_, token_qs))
+        if is_active is not None:
+            terms = terms.filter(customer__is_active=is_active)
+        
+        ranked_ids = list(
+            terms.values('customer_id')
+            .annotate(
+                exact=Sum(Case(When(term__in=tokens, then=Value(1)), default=Value(0), output_field=IntegerField())),
+                **token_matches
+            )
+            .annotate(matched=reduce(operator.add, [F(name) for name in token_matches]))
+            .filter(matched=len(tokens))
+            .order_by('-exact', '-customer_id')
+            .values_list('customer_id', flat=True)[:limit]
         )
-        return [self._model_to_dto(customer) for customer in queryset]
-
+        
+        seen = {dto.id for dto in suffix_matches}
+        ranked_ids = [pk for pk in ranked_ids if pk not in seen][:limit - len(suffix_matches)]
+        customers = self._balance_queryset().in_bulk(ranked_ids)
+        return suffix_matches + [
+            self._model_to_dto(customers[pk]) for pk in ranked_ids if pk in customers
+        ]
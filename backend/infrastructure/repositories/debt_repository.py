@@ -1,13 +1,45 @@
 """
 Debt Repository Implementation using Django ORM.
 """
-from typing import List, Optional
+from datetime import date, datetime, time, timedelta
+from typing import Iterator, List, Optional, Tuple
+from django.db import transaction
+from django.db.models.deletion import RestrictedError
 from django.utils import timezone
-from django.db.models import Sum, Q
+from django.db.models import F, Sum, Q
+from django.db.models.functions import Coalesce
 from decimal import Decimal
-from backend.core.models import Debt
+from backend.core.models import CustomerBalance, Debt, LedgerEntry, PaymentAllocation
+from backend.core.signals import debts_bulk_changed
+from backend.core.utils.aging import bucket_for, days_overdue
+from backend.core.utils.statement import group_deltas, net_amount, signed
+from backend.core.replica import read_only, replica_alias
 from backend.application.abstracts.repository_abstract import IDebtRepository
+from backend.application.dtos.aging_dto import OverdueDebtDTO
+from backend.application.dtos.balance_dto import CustomerBalanceDTO, DebtBulkUpdateResultDTO
 from backend.application.dtos.debt_dto import DebtDTO
+from backend.application.dtos.page_dto import PageDTO
+from backend.application.exceptions import DebtHasPaymentsError
+from backend.infrastructure.pagination import DEFAULT_PAGE_SIZE, keyset_paginate
+
+BULK_BATCH_SIZE = 500
+EXPORT_CHUNK_SIZE = 2000
+
+# Dışa aktarmada satırlar DTO'ya çevrilmeden tuple olarak akar
+EXPORT_COLUMNS = (
+    'id',
+    'created_at',
+    'customer_id',
+    'customer__first_name',
+    'customer__last_name',
+    'customer__phone',
+    'debt_type',
+    'amount',
+    'is_paid',
+    'paid_at',
+    'due_date',
+    'description',
+)
 
 
 class DebtRepository(IDebtRepository):
@@ -15,6 +47,12 @@ class DebtRepository(IDebtRepository):
     Debt Repository Implementation
     """
     
+    # (customer, -created_at) ve -created_at index'leri ile servis edilir
+    PAGE_ORDERING = ('-created_at', 'id')
+    
+    # (is_paid, due_date) index'i ile servis edilir: en eski vade önce
+    OVERDUE_ORDERING = ('due_date', 'id')
+    
     def _model_to_dto(self, debt: Debt) -> DebtDTO:
         """Model'i DTO'ya çevir"""
         return DebtDTO(
@@ -23,6 +61,7 @@ class DebtRepository(IDebtRepository):
             customer_name=debt.customer.full_name if debt.customer else None,
             debt_type=debt.debt_type,
             amount=debt.amount,
+            paid_amount=debt.paid_amount,
             description=debt.description,
             is_paid=debt.is_paid,
             paid_at=debt.paid_at,
@@ -62,6 +101,16 @@ class DebtRepository(IDebtRepository):
         except Debt.DoesNotExist:
             return None
     
+    def get_modification_state(self, debt_id: int) -> Optional[Tuple[datetime, ...]]:
+        """
+        Borç ve müşterisinin updated_at değerleri (yanıtta müşteri adı yer alır)
+        Koşullu GET için tek, DTO oluşturmayan bir sorgudur.
+        """
+        return Debt.objects.filter(id=debt_id).values_list(
+            'updated_at', 'customer__updated_at'
+        ).first()
+    
+    @read_only()
     def get_by_customer_id(self, customer_id: int, is_paid: Optional[bool] = None) -> List[DebtDTO]:
         """Müşteriye ait borçları getir"""
         queryset = Debt.objects.select_related('customer').filter(customer_id=customer_id)
@@ -73,6 +122,7 @@ class DebtRepository(IDebtRepository):
         
         return [self._model_to_dto(debt) for debt in queryset]
     
+    @read_only()
     def get_all(self, is_paid: Optional[bool] = None, debt_type: Optional[str] = None) -> List[DebtDTO]:
         """Tüm borçları getir"""
         queryset = Debt.objects.select_related('customer').all()
@@ -87,63 +137,463 @@ class DebtRepository(IDebtRepository):
         
         return [self._model_to_dto(debt) for debt in queryset]
     
-    def update(self, debt_id: int, debt_dto: DebtDTO) -> Optional[DebtDTO]:
-        """Borç bilgilerini güncelle"""
-        try:
-            debt = Debt.objects.get(id=debt_id)
-            debt.debt_type = debt_dto.debt_type
-            debt.amount = debt_dto.amount
-            debt.description = debt_dto.description
-            debt.due_date = debt_dto.due_date
+    @read_only()
+    def get_page(
+        self,
+        is_paid: Optional[bool] = None,
+        debt_type: Optional[str] = None,
+        customer_id: Optional[int] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+    ) -> PageDTO:
+        """Borçları cursor sayfalama ile getir"""
+        queryset = Debt.objects.select_related('customer')
+        
+        if customer_id is not None:
+            queryset = queryset.filter(customer_id=customer_id)
+        
+        if is_paid is not None:
+            queryset = queryset.filter(is_paid=is_paid)
+        
+        if debt_type:
+            queryset = queryset.filter(debt_type=debt_type)
+        
+        return keyset_paginate(queryset, self.PAGE_ORDERING, self._model_to_dto, limit, cursor)
+    
+    @read_only()
+    def get_overdue_page(
+        self,
+        as_of: Optional[date] = None,
+        customer_id: Optional[int] = None,
+        min_days: int = 1,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+    ) -> PageDTO:
+        """
+        Vadesi geçmiş ödenmemiş borçları cursor sayfalama ile getir
+        
+        as_of verilmezse bugün kullanılır; vadesi as_of - min_days gününe
+        kadar olan (dahil) borçlar döner.
+        """
+        as_of = as_of or timezone.localdate()
+        queryset = Debt.objects.select_related('customer').filter(
+            is_paid=False,
+            debt_type=Debt.DebtType.DEBT,
+            due_date__lte=as_of - timedelta(days=min_days),
+        )
+        
+        if customer_id is not None:
+            queryset = queryset.filter(customer_id=customer_id)
+        
+        return keyset_paginate(
+            queryset,
+            self.OVERDUE_ORDERING,
+            lambda debt: self._overdue_dto(debt, as_of),
+            limit,
+            cursor,
+        )
+    
+    def _overdue_dto(self, debt: Debt, as_of: date) -> OverdueDebtDTO:
+        """Model'i gecikme bilgisiyle DTO'ya çevir"""
+        days = days_overdue(debt.due_date, as_of)
+        return OverdueDebtDTO(
+            **vars(self._model_to_dto(debt)),
+            days_overdue=days,
+            aging_bucket=bucket_for(days),
+        )
+    
+    def iter_export_rows(
+        self,
+        customer_id: Optional[int] = None,
+        debt_type: Optional[str] = None,
+        is_paid: Optional[bool] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        chunk_size: int = EXPORT_CHUNK_SIZE,
+    ) -> Iterator[tuple]:
+        """
+        Dışa aktarma satırlarını akış halinde getir
+        
+        iterator() ile satırlar chunk_size'lık parçalar halinde çekilir
+        (PostgreSQL'de server-side cursor); bellek kullanımı defter
+        boyutundan bağımsızdır.
+        """
+        queryset = self._filtered_queryset(
+            customer_id=customer_id,
+            debt_type=debt_type,
+            is_paid=is_paid,
+            date_from=date_from,
+            date_to=date_to,
+        ).order_by('created_at', 'id')
+        
+        # Akış tüketilirken read_only() bağlamı kapanmış olur; alias burada sabitlenir
+        queryset = queryset.using(replica_alias())
+        return queryset.values_list(*EXPORT_COLUMNS).iterator(chunk_size=chunk_size)
+    
+    def _filtered_queryset(
+        self,
+        debt_ids: Optional[List[int]] = None,
+        customer_id: Optional[int] = None,
+        debt_type: Optional[str] = None,
+        is_paid: Optional[bool] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+    ):
+        """Dışa aktarma ve toplu güncellemelerde ortak filtreler"""
+        queryset = Debt.objects.all()
+        
+        if debt_ids is not None:
+            queryset = queryset.filter(id__in=debt_ids)
+        
+        if customer_id is not None:
+            queryset = queryset.filter(customer_id=customer_id)
+        
+        if debt_type:
+            queryset = queryset.filter(debt_type=debt_type)
+        
+        if is_paid is not None:
+            queryset = queryset.filter(is_paid=is_paid)
+        
+        # __date yerine aralık karşılaştırması: created_at index'i kullanılabilir
+        if date_from is not None:
+            queryset = queryset.filter(created_at__gte=self._aware(date_from))
+        
+        if date_to is not None:
+            queryset = queryset.filter(created_at__lt=self._aware(date_to + timedelta(days=1)))
+        
+        return queryset
+    
+    def bulk_create(self, debt_dtos: List[DebtDTO]) -> int:
+        """
+        Borç kayıtlarını toplu oluştur
+        
+        bulk_create post_save göndermediği için bakiyeler, aynı transaction
+        içinde gönderilen debts_bulk_changed sinyali ile yeniden hesaplanır.
+        """
+        if not debt_dtos:
+            return 0
+        
+        now = timezone.now()
+        debts = []
+        historical = []
+        for dto in debt_dtos:
+            debt = Debt(
+                customer_id=dto.customer_id,
+                debt_type=dto.debt_type,
+                amount=dto.amount,
+                description=dto.description,
+                is_paid=dto.is_paid,
+                paid_amount=dto.amount if dto.is_paid else Decimal('0.00'),
+                paid_at=self._aware(dto.paid_at) or (now if dto.is_paid else None),
+                paid_by_id=dto.paid_by_id,
+                due_date=dto.due_date,
+                created_by_id=dto.created_by_id,
+            )
+            debts.append((debt, self._aware(dto.created_at)))
+        
+        with transaction.atomic():
+            created = Debt.objects.bulk_create([debt for debt, _ in debts], batch_size=BULK_BATCH_SIZE)
             
-            # Ödeme durumu değiştiyse
-            if debt_dto.is_paid and not debt.is_paid:
-                debt.mark_as_paid()
-            elif not debt_dto.is_paid and debt.is_paid:
-                debt.mark_as_unpaid()
+            # created_at auto_now_add olduğu için geçmiş tarihler ayrıca yazılır
+            for debt, created_at in debts:
+                if created_at is not None:
+                    debt.created_at = created_at
+                    historical.append(debt)
+            if historical:
+                Debt.objects.bulk_update(historical, ['created_at'], batch_size=BULK_BATCH_SIZE)
             
-            debt.save()
+            customer_ids = {debt.customer_id for debt in created}
+            if historical:
+                # Geçmiş tarihli kayıtlar ekstrenin ortasına eklenir; sonraki satırlar kaydırılır
+                LedgerEntry.insert_many(self._opening_entries(created, dated=True))
+            else:
+                LedgerEntry.append_many(self._opening_entries(created))
+            
+            debts_bulk_changed.send(
+                sender=Debt,
+                customer_ids=customer_ids,
+                debt_ids=[debt.pk for debt in created],
+                previous_states={},
+            )
+        
+        return len(created)
+    
+    @staticmethod
+    def _opening_entries(debts, dated=False) -> List[dict]:
+        """
+        Yeni borç kayıtları için ekstre hareketleri (ödenmişse ödeme satırıyla)
+        
+        dated=True ise satırlar kayıt ve ödeme tarihlerini taşır (bkz.
+        LedgerEntry.insert_many); tarihler rebuild ile aynı kurala uyar.
+        """
+        entries = []
+        for debt in debts:
+            gross = signed(debt.debt_type, debt.amount)
+            entry = {
+                'customer_id': debt.customer_id,
+                'kind': debt.debt_type,
+                'amount': gross,
+                'debt_id': debt.pk,
+                'description': debt.description or '',
+            }
+            if dated:
+                entry['created_at'] = debt.created_at
+            entries.append(entry)
+            paid = net_amount(debt.debt_type, debt.amount, debt.paid_amount, debt.is_paid) - gross
+            if paid:
+                entry = {
+                    'customer_id': debt.customer_id,
+                    'kind': LedgerEntry.Kind.PAYMENT,
+                    'amount': paid,
+                    'debt_id': debt.pk,
+                }
+                if dated:
+                    entry['created_at'] = max(debt.paid_at or debt.created_at, debt.created_at)
+                entries.append(entry)
+        return entries
+    
+    @staticmethod
+    def _aware(value):
+        """Tarih/naive datetime değerini aktif saat dilimine göre aware yap"""
+        if value is None:
+            return None
+        if not isinstance(value, datetime):
+            value = datetime.combine(value, time.min)
+        if timezone.is_naive(value):
+            value = timezone.make_aware(value)
+        return value
+    
+    def update(self, debt_id: int, debt_dto: DebtDTO) -> Optional[DebtDTO]:
+        """
+        Borç bilgilerini güncelle
+        
+        Tutar ödenmiş kısmın altına indirilirse DebtHasPaymentsError fırlatılır.
+        """
+        try:
+            with transaction.atomic():
+                debt = self._get_for_update(debt_id)
+                minimum = debt.minimum_amount(is_paid=debt_dto.is_paid)
+                if debt_dto.amount < minimum:
+                    raise DebtHasPaymentsError(f'Tutar ödenen tutarın ({minimum} TL) altında olamaz.')
+                if not debt_dto.is_paid and debt.is_paid:
+                    self._check_unpayable(debt)
+                
+                debt.debt_type = debt_dto.debt_type
+                debt.amount = debt_dto.amount
+                debt.description = debt_dto.description
+                debt.due_date = debt_dto.due_date
+                
+                # Ödeme durumu değiştiyse
+                if debt_dto.is_paid and not debt.is_paid:
+                    debt.mark_as_paid()
+                elif not debt_dto.is_paid and debt.is_paid:
+                    debt.mark_as_unpaid()
+                
+                debt.save()
             return self._model_to_dto(debt)
         except Debt.DoesNotExist:
             return None
     
     def delete(self, debt_id: int) -> bool:
-        """Borç kaydını sil"""
+        """
+        Borç kaydını sil
+        
+        Ödeme dağıtılmış kayıtlar silinemez (DebtHasPaymentsError); tahsil
+        edilen tutar ödeme geçmişinde kalmalıdır.
+        """
         try:
-            debt = Debt.objects.get(id=debt_id)
-            debt.delete()
+            with transaction.atomic():
+                self._get_for_update(debt_id).delete()
             return True
         except Debt.DoesNotExist:
             return False
+        except RestrictedError:
+            raise DebtHasPaymentsError('Ödeme dağıtılmış borç kaydı silinemez.')
     
     def mark_as_paid(self, debt_id: int, user_id: Optional[int] = None) -> bool:
         """Borcu ödendi olarak işaretle"""
         try:
             from django.contrib.auth.models import User
-            debt = Debt.objects.get(id=debt_id)
             user = User.objects.get(id=user_id) if user_id else None
-            debt.mark_as_paid(user)
+            with transaction.atomic():
+                self._get_for_update(debt_id).mark_as_paid(user)
             return True
         except (Debt.DoesNotExist, User.DoesNotExist):
             return False
     
     def mark_as_unpaid(self, debt_id: int) -> bool:
-        """Borcu ödenmedi olarak işaretle"""
+        """
+        Borcu ödenmedi olarak işaretle
+        
+        Ödemelerle dağıtılmış kısım ödenmiş kalır; ödemelerle tamamen
+        kapanmış borç için DebtHasPaymentsError fırlatılır.
+        """
         try:
-            debt = Debt.objects.get(id=debt_id)
-            debt.mark_as_unpaid()
+            with transaction.atomic():
+                debt = self._get_for_update(debt_id)
+                self._check_unpayable(debt)
+                debt.mark_as_unpaid()
             return True
         except Debt.DoesNotExist:
             return False
     
-    def get_customer_total_debt(self, customer_id: int) -> float:
-        """Müşterinin toplam borç tutarını getir"""
-        result = Debt.objects.filter(
+    @staticmethod
+    def _get_for_update(debt_id: int) -> Debt:
+        """
+        Borcu satır kilidiyle yükle (çağıran transaction içinde olmalı)
+        
+        Bakiye, ekstre ve günlük özet handler'ları farkı yüklenen durumdan
+        hesaplar; kilit olmadan aynı borcu eşzamanlı yazan iki istek aynı
+        farkı iki kez uygular.
+        """
+        return Debt.objects.select_for_update().get(id=debt_id)
+    
+    @staticmethod
+    def _check_unpayable(debt: Debt):
+        """Ödemelerle tamamen kapanmış borç ödenmedi yapılamaz"""
+        if debt.allocated_amount() >= debt.amount:
+            raise DebtHasPaymentsError('Borç ödeme kayıtlarıyla kapatılmış; ödenmedi olarak işaretlenemez.')
+    
+    def bulk_mark_as_paid(
+        self,
+        debt_ids: Optional[List[int]] = None,
+        customer_id: Optional[int] = None,
+        debt_type: Optional[str] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        user_id: Optional[int] = None,
+    ) -> DebtBulkUpdateResultDTO:
+        """Filtreye uyan ödenmemiş borçları tek bir UPDATE ile ödendi yap"""
+        queryset = self._filtered_queryset(
+            debt_ids=debt_ids,
             customer_id=customer_id,
+            debt_type=debt_type,
             is_paid=False,
-            debt_type='DEBT'
-        ).aggregate(
-            total=Sum('amount')
+            date_from=date_from,
+            date_to=date_to,
         )
-        return float(result['total'] or 0)
-
+        now = timezone.now()
+        return self._bulk_set_paid(
+            queryset,
+            is_paid=True,
+            paid_amount=F('amount'),
+            paid_at=now,
+            paid_by_id=user_id,
+            updated_at=now,
+        )
+    
+    def bulk_mark_as_unpaid(
+        self,
+        debt_ids: Optional[List[int]] = None,
+        customer_id: Optional[int] = None,
+        debt_type: Optional[str] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+    ) -> DebtBulkUpdateResultDTO:
+        """
+        Filtreye uyan ödenmiş borçları tek bir UPDATE ile ödenmedi yap
+        
+        Ödeme kayıtlarıyla dağıtılan kısım ödenmiş kalır; ödemelerle tamamen
+        kapanmış borçlar atlanır ve skipped_ids içinde döner.
+        """
+        queryset = self._filtered_queryset(
+            debt_ids=debt_ids,
+            customer_id=customer_id,
+            debt_type=debt_type,
+            is_paid=True,
+            date_from=date_from,
+            date_to=date_to,
+        )
+        return self._bulk_set_paid(
+            queryset,
+            is_paid=False,
+            paid_amount=Coalesce(PaymentAllocation.total_subquery(), Decimal('0.00')),
+            paid_at=None,
+            paid_by_id=None,
+            updated_at=timezone.now(),
+        )
+    
+    def _bulk_set_paid(self, queryset, **values) -> DebtBulkUpdateResultDTO:
+        """
+        Ödeme durumunu tek bir UPDATE ile yaz
+        
+        Etkilenecek satırlar önce kilitlenir (select_for_update), böylece
+        UPDATE tam olarak bu satırlara uygulanır. QuerySet.update post_save
+        göndermediği için bakiyeler debts_bulk_changed ile yeniden hesaplanır.
+        """
+        with transaction.atomic():
+            rows = list(queryset.select_for_update().values_list(
+                'id', 'customer_id', 'debt_type', 'amount', 'paid_amount', 'is_paid'
+            ))
+            is_paid = values['is_paid']
+            skipped_ids = []
+            allocated = {}
+            if not is_paid and rows:
+                # Ödemelerle tamamen kapanmış borçlar ödenmedi yapılamaz
+                allocated = PaymentAllocation.totals([row[0] for row in rows])
+                skipped = {row[0] for row in rows if allocated.get(row[0], Decimal('0.00')) >= row[3]}
+                rows = [row for row in rows if row[0] not in skipped]
+                skipped_ids = sorted(skipped)
+            if not rows:
+                return DebtBulkUpdateResultDTO(skipped_ids=skipped_ids)
+            
+            debt_ids = [row[0] for row in rows]
+            customer_ids = {row[1] for row in rows}
+            updated = Debt.objects.filter(id__in=debt_ids).update(**values)
+            
+            debts_bulk_changed.send(
+                sender=Debt,
+                customer_ids=customer_ids,
+                debt_ids=debt_ids,
+                previous_states={row[0]: row[1:] for row in rows},
+            )
+            
+            # Ekstreye müşteri başına tek bir toplu hareket yazılır
+            deltas = group_deltas(
+                (
+                    customer_id,
+                    net_amount(
+                        debt_type,
+                        amount,
+                        amount if is_paid else allocated.get(debt_id, Decimal('0.00')),
+                        is_paid,
+                    )
+                    - net_amount(debt_type, amount, paid_amount, was_paid),
+                )
+                for debt_id, customer_id, debt_type, amount, paid_amount, was_paid in rows
+            )
+            LedgerEntry.append_many([
+                {
+                    'customer_id': customer_id,
+                    'kind': LedgerEntry.Kind.PAYMENT if is_paid else LedgerEntry.Kind.ADJUSTMENT,
+                    'amount': delta,
+                    'description': 'Toplu ödendi işaretleme' if is_paid else 'Toplu ödenmedi işaretleme',
+                }
+                for customer_id, delta in sorted(deltas.items())
+            ])
+            
+            balances = CustomerBalance.objects.filter(customer_id__in=customer_ids).order_by('customer_id')
+            return DebtBulkUpdateResultDTO(
+                updated=updated,
+                balances=[
+                    CustomerBalanceDTO(
+                        customer_id=balance.customer_id,
+                        outstanding_debt=balance.outstanding_debt,
+                        outstanding_credit=balance.outstanding_credit,
+                        paid_total=balance.paid_total,
+                    )
+                    for balance in balances
+                ],
+                skipped_ids=skipped_ids,
+            )
+    
+    def get_customer_total_debt(self, customer_id: int) -> float:
+        """Müşterinin toplam borç tutarını getir (denormalize bakiyeden)"""
+        from backend.core.models import CustomerBalance
+        
+        balance = CustomerBalance.objects.filter(customer_id=customer_id).values_list(
+            'outstanding_debt', flat=True
+        ).first()
+        if balance is None:
+            balance = CustomerBalance.recompute(customer_id).outstanding_debt
+        return float(balance)
@@ -2,9 +2,13 @@
 Gallery Repository Implementation using Django ORM.
 """
 from typing import List, Optional
+from django.db import transaction
 from backend.core.models import GalleryImage
+from backend.core.replica import read_only
 from backend.application.abstracts.repository_abstract import IGalleryRepository
 from backend.application.dtos.gallery_dto import GalleryImageDTO
+from backend.application.dtos.page_dto import PageDTO
+from backend.infrastructure.pagination import DEFAULT_PAGE_SIZE, keyset_paginate
 
 
 class GalleryRepository(IGalleryRepository):
@@ -12,13 +16,25 @@ class GalleryRepository(IGalleryRepository):
     Gallery Repository Implementation
     """
     
+    # Gösterim sırası korunur; id benzersiz bitiş anahtarıdır
+    PAGE_ORDERING = ('order', '-created_at', 'id')
+    
     def _model_to_dto(self, gallery_image: GalleryImage) -> GalleryImageDTO:
         """Model'i DTO'ya çevir"""
+        sources = gallery_image.variant_sources()
+        variants = gallery_image.variants or {}
         return GalleryImageDTO(
             id=gallery_image.id,
             title=gallery_image.title,
             description=gallery_image.description,
             image_url=gallery_image.image_url,
+            srcset=next((source['srcset'] for source in sources if source['type'] == 'image/webp'), None),
+            sources=sources,
+            placeholder=gallery_image.placeholder,
+            width=variants.get('width'),
+            height=variants.get('height'),
+            processing_status=gallery_image.processing_status,
+            processing_error=gallery_image.processing_error or None,
             is_active=gallery_image.is_active,
             order=gallery_image.order,
             created_at=gallery_image.created_at,
@@ -28,14 +44,17 @@ class GalleryRepository(IGalleryRepository):
     
     def create(self, gallery_dto, image_file) -> GalleryImageDTO:
         """Yeni galeri resmi oluştur"""
-        gallery_image = GalleryImage.objects.create(
-            title=gallery_dto.title,
-            description=gallery_dto.description,
-            image=image_file,
-            is_active=gallery_dto.is_active,
-            order=gallery_dto.order,
-            created_by_id=gallery_dto.created_by_id,
-        )
+        # Resim ve işleme işi birlikte commit edilir (bkz. core.signals.gallery);
+        # varyantlar ve EXIF temizliği worker'da yapılır
+        with transaction.atomic():
+            gallery_image = GalleryImage.objects.create(
+                title=gallery_dto.title,
+                description=gallery_dto.description,
+                image=image_file,
+                is_active=gallery_dto.is_active,
+                order=gallery_dto.order,
+                created_by_id=gallery_dto.created_by_id,
+            )
         return self._model_to_dto(gallery_image)
     
     def get_by_id(self, image_id: int) -> Optional[GalleryImageDTO]:
@@ -46,6 +65,7 @@ class GalleryRepository(IGalleryRepository):
         except GalleryImage.DoesNotExist:
             return None
     
+    @read_only()
     def get_all(self, is_active: Optional[bool] = None) -> List[GalleryImageDTO]:
         """Tüm galeri resimlerini getir"""
         queryset = GalleryImage.objects.all()
@@ -57,6 +77,21 @@ class GalleryRepository(IGalleryRepository):
         
         return [self._model_to_dto(img) for img in queryset]
     
+    @read_only()
+    def get_page(
+        self,
+        is_active: Optional[bool] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+    ) -> PageDTO:
+        """Galeri resimlerini cursor sayfalama ile getir"""
+        queryset = GalleryImage.objects.all()
+        
+        if is_active is not None:
+            queryset = queryset.filter(is_active=is_active)
+        
+        return keyset_paginate(queryset, self.PAGE_ORDERING, self._model_to_dto, limit, cursor)
+    
     def update(self, image_id: int, gallery_dto: GalleryImageDTO) -> Optional[GalleryImageDTO]:
         """Galeri resmi bilgilerini güncelle"""
         try:
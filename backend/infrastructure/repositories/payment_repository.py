@@ -0,0 +1,257 @@
+"""
+Payment Repository Implementation using Django ORM.
+"""
+from decimal import Decimal
+from typing import List, Optional
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from backend.core.models import Customer, CustomerBalance, Debt, LedgerEntry, Payment, PaymentAllocation
+from backend.core.signals import debts_bulk_changed
+from backend.core.replica import read_only
+from backend.application.abstracts.repository_abstract import IPaymentRepository
+from backend.application.dtos.balance_dto import CustomerBalanceDTO
+from backend.application.dtos.page_dto import PageDTO
+from backend.application.dtos.payment_dto import PaymentAllocationDTO, PaymentDTO, SettlementResultDTO
+from backend.application.exceptions import NothingToSettleError, PaymentAllocationError
+from backend.infrastructure.pagination import DEFAULT_PAGE_SIZE, keyset_paginate
+
+ZERO = Decimal('0.00')
+
+
+class PaymentRepository(IPaymentRepository):
+    """
+    Payment Repository Implementation
+    
+    Ödemeler bakiyeyi CustomerBalance.apply_delta ile artımlı günceller;
+    borç kayıtları yeniden taranmaz.
+    """
+    
+    # (customer, created_at) index'i ile servis edilir
+    PAGE_ORDERING = ('-created_at', 'id')
+    
+    def _model_to_dto(self, payment: Payment) -> PaymentDTO:
+        """Model'i DTO'ya çevir (allocations önceden yüklenmiş olmalı)"""
+        return PaymentDTO(
+            id=payment.id,
+            customer_id=payment.customer_id,
+            amount=payment.amount,
+            payment_date=payment.created_at,
+            notes=payment.notes,
+            paid_by_id=payment.paid_by_id,
+            allocations=[
+                PaymentAllocationDTO(debt_id=allocation.debt_id, amount=allocation.amount)
+                for allocation in payment.allocations.all()
+            ],
+        )
+    
+    def get_by_id(self, payment_id: int) -> Optional[PaymentDTO]:
+        """ID ile ödeme getir"""
+        payment = Payment.objects.prefetch_related('allocations').filter(id=payment_id).first()
+        return self._model_to_dto(payment) if payment else None
+    
+    @read_only()
+    def get_page(
+        self,
+        customer_id: Optional[int] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+    ) -> PageDTO:
+        """Ödemeleri cursor sayfalama ile getir (en yeni önce)"""
+        queryset = Payment.objects.prefetch_related('allocations')
+        
+        if customer_id is not None:
+            queryset = queryset.filter(customer_id=customer_id)
+        
+        return keyset_paginate(queryset, self.PAGE_ORDERING, self._model_to_dto, limit, cursor)
+    
+    def create(self, payment_dto: PaymentDTO) -> Optional[PaymentDTO]:
+        """
+        Ödeme kaydet ve açık borçlara dağıt
+        
+        debt_id verilmişse ödeme yalnızca o borca uygulanır; verilmemişse
+        müşterinin açık borçlarına en eskiden başlayarak (FIFO) dağıtılır.
+        Tamamen kapanan borçlar ödendi olarak işaretlenir. Ödeme açık borç
+        toplamını aşarsa PaymentAllocationError fırlatılır. Müşteri yoksa
+        None döner.
+        """
+        amount = payment_dto.amount
+        if amount <= ZERO:
+            raise PaymentAllocationError('Ödeme tutarı 0\'dan büyük olmalıdır.')
+        
+        with transaction.atomic():
+            if not self._lock_customer(payment_dto.customer_id):
+                return None
+            
+            open_debts = (
+                Debt.objects.select_for_update()
+                .filter(customer_id=payment_dto.customer_id, is_paid=False, debt_type=Debt.DebtType.DEBT)
+                .order_by('created_at', 'id')
+            )
+            if payment_dto.debt_id is not None:
+                open_debts = open_debts.filter(id=payment_dto.debt_id)
+            
+            # Sadece ödemeyi karşılayacak kadar borç okunur
+            allocations = []
+            left = amount
+            for debt in open_debts.iterator(chunk_size=100):
+                applied = min(debt.amount - debt.paid_amount, left)
+                if applied > ZERO:
+                    allocations.append((debt, applied))
+                    left -= applied
+                if left == ZERO:
+                    break
+            
+            if left > ZERO:
+                if payment_dto.debt_id is not None and not allocations:
+                    raise PaymentAllocationError('Borç kaydı bulunamadı veya zaten ödenmiş.')
+                raise PaymentAllocationError(
+                    f'Ödeme tutarı açık borç toplamını {left} TL aşıyor.'
+                )
+            
+            payment = self._record_payment(
+                payment_dto.customer_id,
+                amount,
+                allocations,
+                notes=payment_dto.notes,
+                user_id=payment_dto.paid_by_id,
+            )
+        
+        return self._model_to_dto(payment)
+    
+    def settle_customer(
+        self,
+        customer_id: int,
+        user_id: Optional[int] = None,
+        notes: Optional[str] = None,
+    ) -> Optional[SettlementResultDTO]:
+        """
+        Müşterinin tüm açık borçlarını tek seferde kapat
+        
+        Müşteri satırı kilitlenerek aynı müşteri için eşzamanlı kapatmalar
+        sıraya sokulur; ikinci istek açık borç bulamaz. Açık borçlar tek bir
+        UPDATE ile ödendi yapılır ve kalan tutarların toplamı için tek bir
+        ödeme kaydı yazılır. Müşteri yoksa None döner.
+        """
+        with transaction.atomic():
+            if not self._lock_customer(customer_id):
+                return None
+            
+            rows = list(
+                Debt.objects.select_for_update()
+                .filter(customer_id=customer_id, is_paid=False, debt_type=Debt.DebtType.DEBT)
+                .values_list('id', 'amount', 'paid_amount')
+            )
+            if not rows:
+                raise NothingToSettleError('Müşterinin açık borcu bulunmuyor.')
+            
+            debt_ids = [debt_id for debt_id, _, _ in rows]
+            remaining = [(debt_id, amount - paid_amount) for debt_id, amount, paid_amount in rows]
+            total = sum((value for _, value in remaining), ZERO)
+            now = timezone.now()
+            
+            Debt.objects.filter(id__in=debt_ids).update(
+                is_paid=True,
+                paid_amount=F('amount'),
+                paid_at=now,
+                paid_by_id=user_id,
+                updated_at=now,
+            )
+            payment = Payment.objects.create(
+                customer_id=customer_id,
+                amount=total,
+                notes=notes,
+                paid_by_id=user_id,
+            )
+            PaymentAllocation.objects.bulk_create([
+                PaymentAllocation(payment=payment, debt_id=debt_id, amount=value)
+                for debt_id, value in remaining
+                if value > ZERO
+            ])
+            
+            CustomerBalance.apply_delta(customer_id, -total, ZERO, total, at=now)
+            LedgerEntry.append(
+                customer_id,
+                LedgerEntry.Kind.PAYMENT,
+                -total,
+                payment_id=payment.id,
+                description=notes or 'Hesap kapatıldı',
+            )
+            debts_bulk_changed.send(
+                sender=Debt,
+                customer_ids={customer_id},
+                debt_ids=debt_ids,
+                balances_updated=True,
+                previous_states={
+                    debt_id: (customer_id, Debt.DebtType.DEBT, amount, paid_amount, False)
+                    for debt_id, amount, paid_amount in rows
+                },
+            )
+            
+            balance = CustomerBalance.objects.get(customer_id=customer_id)
+            return SettlementResultDTO(
+                payment=self._model_to_dto(payment),
+                settled_count=len(debt_ids),
+                balance=CustomerBalanceDTO(
+                    customer_id=customer_id,
+                    outstanding_debt=balance.outstanding_debt,
+                    outstanding_credit=balance.outstanding_credit,
+                    paid_total=balance.paid_total,
+                ),
+            )
+    
+    @staticmethod
+    def _lock_customer(customer_id: int) -> bool:
+        """Müşteri satırını kilitle; aynı müşteriye ödemeler sıraya girer"""
+        return Customer.objects.select_for_update().filter(id=customer_id).values_list('id', flat=True).exists()
+    
+    def _record_payment(
+        self,
+        customer_id: int,
+        amount: Decimal,
+        allocations: List[tuple],
+        notes: Optional[str] = None,
+        user_id: Optional[int] = None,
+    ) -> Payment:
+        """Ödeme, dağılım ve borç güncellemelerini yaz; bakiye ve ekstreyi artımlı güncelle"""
+        now = timezone.now()
+        payment = Payment.objects.create(
+            customer_id=customer_id,
+            amount=amount,
+            notes=notes,
+            paid_by_id=user_id,
+        )
+        PaymentAllocation.objects.bulk_create([
+            PaymentAllocation(payment=payment, debt=debt, amount=applied)
+            for debt, applied in allocations
+        ])
+        
+        debts = []
+        for debt, applied in allocations:
+            debt.paid_amount += applied
+            if debt.paid_amount >= debt.amount:
+                debt.is_paid = True
+                debt.paid_at = now
+                debt.paid_by_id = user_id
+            debt.updated_at = now
+            debts.append(debt)
+        Debt.objects.bulk_update(debts, ['paid_amount', 'is_paid', 'paid_at', 'paid_by', 'updated_at'])
+        
+        CustomerBalance.apply_delta(customer_id, -amount, ZERO, amount, at=now)
+        LedgerEntry.append(
+            customer_id,
+            LedgerEntry.Kind.PAYMENT,
+            -amount,
+            payment_id=payment.id,
+            description=notes or '',
+        )
+        debts_bulk_changed.send(
+            sender=Debt,
+            customer_ids={customer_id},
+            debt_ids=[debt.pk for debt in debts],
+            balances_updated=True,
+            previous_states={debt.pk: debt._balance_state for debt in debts},
+        )
+        return payment
@@ -0,0 +1,231 @@
+"""
+Report Repository Implementation using Django ORM.
+"""
+from datetime import date
+from decimal import Decimal
+from typing import Optional
+from django.db.models import Count, F, Q, Sum
+from django.utils import timezone
+from backend.core.cache import cached_value
+from backend.core.models import AgingSnapshot, Customer, DailyLedgerRollup, Debt
+from backend.core.replica import read_only
+from backend.core.utils.aging import BUCKET_KEYS
+from backend.core.utils.rollup import WEEK, iter_periods, period_start
+from backend.application.abstracts.repository_abstract import IReportRepository
+from backend.application.dtos.aging_dto import AgingReportDTO, AgingRowDTO
+from backend.application.dtos.dashboard_dto import DashboardStatsDTO
+from backend.application.dtos.timeseries_dto import TimeseriesDTO, TimeseriesPointDTO
+from backend.infrastructure.pagination import DEFAULT_PAGE_SIZE
+
+# Canlı yaşlandırma sorgusunda müşteri bilgisi gruplamaya eklenir; ek sorgu yok
+AGING_CUSTOMER_FIELDS = ('customer__first_name', 'customer__last_name', 'customer__phone')
+BUCKET_FIELDS = tuple(f'bucket_{key}' for key in BUCKET_KEYS)
+
+
+class ReportRepository(IReportRepository):
+    """
+    Report Repository Implementation
+    """
+    
+    AGGREGATE_CACHE_ALIAS = 'aggregates'
+    
+    def get_dashboard_stats(self) -> DashboardStatsDTO:
+        """
+        Dashboard istatistiklerini getir
+        
+        Sonuç, müşteri ve borç yazmalarında geçersiz olan sürümlü bir
+        anahtarla 'aggregates' cache'inde tutulur.
+        """
+        return cached_value(
+            self.AGGREGATE_CACHE_ALIAS,
+            (Customer.CACHE_NAMESPACE, Debt.CACHE_NAMESPACE),
+            'dashboard-stats',
+            self._compute_dashboard_stats,
+        )
+    
+    @read_only()
+    def _compute_dashboard_stats(self) -> DashboardStatsDTO:
+        """
+        Customer -> Debt LEFT JOIN üzerinde tek bir koşullu aggregate sorgusu
+        çalışır. Her borç satırı join sonucunda tam bir kez yer aldığı için
+        borç toplamları doğrudur; müşteri sayıları ise DISTINCT ile sayılır.
+        """
+        result = Customer.objects.aggregate(
+            total_customers=Count('id', distinct=True),
+            active_customers=Count('id', distinct=True, filter=Q(is_active=True)),
+            total_debts=Count('debts'),
+            unpaid_debts=Count('debts', filter=Q(debts__is_paid=False)),
+            total_debt_amount=Sum(
+                F('debts__amount') - F('debts__paid_amount'),
+                filter=Q(debts__is_paid=False, debts__debt_type='DEBT')
+            ),
+            total_paid_amount=Sum('debts__paid_amount'),
+        )
+        
+        return DashboardStatsDTO(
+            total_customers=result['total_customers'],
+            active_customers=result['active_customers'],
+            total_debts=result['total_debts'],
+            unpaid_debts=result['unpaid_debts'],
+            total_debt_amount=result['total_debt_amount'] or Decimal('0.00'),
+            total_paid_amount=result['total_paid_amount'] or Decimal('0.00'),
+        )
+    
+    @read_only()
+    def get_aging(
+        self,
+        as_of: Optional[date] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        live: bool = False,
+    ) -> Optional[AgingReportDTO]:
+        """
+        Vadesi geçmiş borç yaşlandırma raporu
+        
+        Bugünün raporu her zaman borç kayıtlarından tek bir gruplu sorgu ile
+        hesaplanır; gece yazılan görüntü gün içindeki ödemeleri göstermez.
+        Geçmiş günler görüntüden (materialize_aging) index üzerinden okunur;
+        görüntüsü olmayan geçmiş gün için None döner. live=True geçmiş gün
+        için anlamsızdır ve yalnızca bugünü zorlar.
+        """
+        today = timezone.localdate()
+        as_of = as_of or today
+        
+        if as_of == today:
+            return self._live_aging(as_of, limit)
+        if live:
+            return None
+        return self._aging_from_snapshot(as_of, limit)
+    
+    def materialize_aging(self, as_of: Optional[date] = None) -> int:
+        """Günün yaşlandırma görüntüsünü yaz, müşteri satırı sayısını döndür"""
+        return AgingSnapshot.materialize(as_of or timezone.localdate())
+    
+    @read_only()
+    def get_timeseries(
+        self,
+        date_from: date,
+        date_to: date,
+        interval: str = WEEK,
+        debt_type: Optional[str] = None,
+    ) -> TimeseriesDTO:
+        """
+        Günlük özetlerden dönemlik açılan/ödenen/açık tutar serisi
+        
+        Aralıktaki özet satırları (debt_type, day) index'i üzerinden tek
+        sorguda okunur; hareketsiz günlerin satırı yoktur. Dönemler Python'da
+        toplanır ve hareketsiz dönemlerde açık tutar bir öncekinden taşınır.
+        İlk dönemin başlangıcı date_from'dan önce olabilir (hafta/ay başı);
+        yalnızca aralıktaki günler sayılır.
+        """
+        debt_types = [debt_type] if debt_type else Debt.DebtType.values
+        rows = (
+            DailyLedgerRollup.objects.filter(day__gte=date_from, day__lte=date_to, debt_type__in=debt_types)
+            .order_by('debt_type', 'day')
+            .values_list('debt_type', 'day', 'created_count', 'created_amount', 'paid_amount', 'outstanding_amount')
+        )
+        
+        periods = list(iter_periods(date_from, date_to, interval))
+        series = {}
+        for current_type in debt_types:
+            opening = DailyLedgerRollup.outstanding_before(current_type, date_from)
+            series[current_type] = {
+                start: TimeseriesPointDTO(period_start=start, outstanding_amount=opening)
+                for start in periods
+            }
+        
+        touched = set()
+        for row_type, day, created_count, created_amount, paid_amount, outstanding_amount in rows:
+            start = period_start(day, interval)
+            point = series[row_type][start]
+            point.created_count += created_count
+            point.created_amount += created_amount
+            point.paid_amount += paid_amount
+            point.outstanding_amount = outstanding_amount
+            touched.add((row_type, start))
+        
+        # Satırı olmayan dönemler önceki dönemin kapanışını taşır
+        for current_type, points in series.items():
+            previous = None
+            for start in periods:
+                point = points[start]
+                if previous is not None and (current_type, start) not in touched:
+                    point.outstanding_amount = previous.outstanding_amount
+                previous = point
+        
+        return TimeseriesDTO(
+            date_from=date_from,
+            date_to=date_to,
+            interval=interval,
+            series={current_type: list(points.values()) for current_type, points in series.items()},
+        )
+    
+    def _aging_from_snapshot(self, as_of: date, limit: int) -> Optional[AgingReportDTO]:
+        """
+        Görüntüden oku: genel toplam satırı en büyük toplama sahip olduğundan
+        (as_of, -total) index'i üzerinde ilk limit + 1 satırın içindedir.
+        """
+        rows = list(
+            AgingSnapshot.objects.filter(as_of=as_of)
+            .select_related('customer')
+            .order_by('-total', 'customer_id')[:limit + 1]
+        )
+        summary = next((row for row in rows if row.customer_id is None), None)
+        if summary is None:
+            return None
+        
+        return AgingReportDTO(
+            as_of=as_of,
+            source='snapshot',
+            generated_at=summary.created_at,
+            summary=self._snapshot_to_dto(summary),
+            customers=[self._snapshot_to_dto(row) for row in rows if row.customer_id is not None][:limit],
+        )
+    
+    def _live_aging(self, as_of: date, limit: int) -> AgingReportDTO:
+        """Borç kayıtlarından tek bir gruplu sorgu ile hesapla"""
+        rows = [
+            AgingRowDTO(
+                customer_id=row['customer_id'],
+                customer_name=f"{row['customer__first_name']} {row['customer__last_name']}",
+                customer_phone=row['customer__phone'],
+                total=row['total'],
+                debt_count=row['debt_count'],
+                oldest_due_date=row['oldest_due_date'],
+                **{field: row[field] for field in BUCKET_FIELDS},
+            )
+            for row in AgingSnapshot.customer_totals(as_of, *AGING_CUSTOMER_FIELDS)
+        ]
+        rows.sort(key=lambda row: (-row.total, row.customer_id))
+        
+        # Genel toplam tüm müşteri satırlarından türetilir
+        summary = AgingRowDTO(
+            total=sum((row.total for row in rows), Decimal('0.00')),
+            debt_count=sum(row.debt_count for row in rows),
+            oldest_due_date=min((row.oldest_due_date for row in rows), default=None),
+            **{
+                field: sum((getattr(row, field) for row in rows), Decimal('0.00'))
+                for field in BUCKET_FIELDS
+            },
+        )
+        
+        return AgingReportDTO(
+            as_of=as_of,
+            source='live',
+            generated_at=timezone.now(),
+            summary=summary,
+            customers=rows[:limit],
+        )
+    
+    @staticmethod
+    def _snapshot_to_dto(snapshot: AgingSnapshot) -> AgingRowDTO:
+        """Görüntü satırını DTO'ya çevir"""
+        customer = snapshot.customer
+        return AgingRowDTO(
+            customer_id=snapshot.customer_id,
+            customer_name=customer.full_name if customer else None,
+            customer_phone=customer.phone if customer else None,
+            total=snapshot.total,
+            debt_count=snapshot.debt_count,
+            oldest_due_date=snapshot.oldest_due_date,
+            **{field: getattr(snapshot, field) for field in BUCKET_FIELDS},
+        )
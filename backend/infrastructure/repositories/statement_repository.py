@@ -0,0 +1,87 @@
+"""
+Customer Statement Repository Implementation using Django ORM.
+"""
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Optional
+
+from django.utils import timezone
+
+from backend.core.models import Customer, LedgerEntry
+from backend.core.replica import read_only
+from backend.application.abstracts.repository_abstract import IStatementRepository
+from backend.application.dtos.statement_dto import StatementDTO, StatementEntryDTO
+from backend.infrastructure.pagination import DEFAULT_PAGE_SIZE, keyset_paginate
+
+
+class StatementRepository(IStatementRepository):
+    """
+    Customer Statement Repository Implementation
+    
+    Satırlar bakiyeleriyle birlikte saklandığı için ekstre, (customer,
+    created_at, id) index'i üzerinde tek bir aralık taraması ile okunur;
+    önceki satırlar toplanmaz.
+    """
+    
+    PAGE_ORDERING = ('created_at', 'id')
+    
+    def _model_to_dto(self, entry: LedgerEntry) -> StatementEntryDTO:
+        """Model'i DTO'ya çevir"""
+        return StatementEntryDTO(
+            id=entry.id,
+            kind=entry.kind,
+            amount=entry.amount,
+            balance_after=entry.balance_after,
+            debt_id=entry.debt_id,
+            payment_id=entry.payment_id,
+            description=entry.description,
+            created_at=entry.created_at,
+        )
+    
+    @staticmethod
+    def _start_of_day(value: date) -> datetime:
+        """Günün başlangıcını aktif saat diliminde aware datetime olarak döndür"""
+        return timezone.make_aware(datetime.combine(value, time.min))
+    
+    @read_only()
+    def get_statement(
+        self,
+        customer_id: int,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+    ) -> Optional[StatementDTO]:
+        """
+        Müşterinin tarih aralığındaki ekstresini getir (tarihler dahil)
+        
+        Açılış bakiyesi sayfanın ilk satırından türetilir; aralıkta satır
+        yoksa aralık başlangıcından önceki son satırın bakiyesi kullanılır.
+        """
+        if not Customer.objects.filter(id=customer_id).exists():
+            return None
+        
+        start = self._start_of_day(date_from) if date_from else None
+        queryset = LedgerEntry.objects.filter(customer_id=customer_id)
+        if start is not None:
+            queryset = queryset.filter(created_at__gte=start)
+        if date_to:
+            queryset = queryset.filter(created_at__lt=self._start_of_day(date_to + timedelta(days=1)))
+        
+        page = keyset_paginate(queryset, self.PAGE_ORDERING, self._model_to_dto, limit, cursor)
+        
+        if page.items:
+            first, last = page.items[0], page.items[-1]
+            opening = first.balance_after - first.amount
+            closing = last.balance_after
+        else:
+            # Aralıkta hareket yok: bakiye aralık başındaki değerde sabittir
+            opening = closing = LedgerEntry.last_balance(customer_id, before=start) if start else Decimal('0.00')
+        
+        return StatementDTO(
+            customer_id=customer_id,
+            opening_balance=opening,
+            closing_balance=closing,
+            entries=page.items,
+            next_cursor=page.next_cursor,
+        )
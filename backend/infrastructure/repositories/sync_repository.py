@@ -0,0 +1,110 @@
+"""
+Sync Repository Implementation using Django ORM.
+"""
+import base64
+import json
+from datetime import datetime, timedelta
+from typing import Optional
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from backend.core.models import Customer, Debt, DeletionTombstone
+from backend.application.abstracts.repository_abstract import ISyncRepository
+from backend.application.dtos.sync_dto import SyncDTO
+from backend.application.exceptions import InvalidSyncTokenError
+from backend.infrastructure.repositories.customer_repository import CustomerRepository
+from backend.infrastructure.repositories.debt_repository import DebtRepository
+
+# Yeni token "şimdi"den bu kadar geride başlar: token üretildiği anda henüz
+# commit olmamış (daha eski updated_at ile yazılan) transaction'lar bir sonraki
+# senkronizasyonda yeniden görülür. İstemciler kayıtları id ile upsert ettiği
+# için tekrar gelen satırlar zararsızdır.
+SYNC_OVERLAP = timedelta(seconds=30)
+
+
+def _encode_token(moment: datetime) -> str:
+    """Zaman damgasını URL-safe token'a çevir"""
+    raw = json.dumps({'t': moment.isoformat()}, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def _decode_token(token: str) -> datetime:
+    """Token'ı zaman damgasına geri çevir"""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        moment = datetime.fromisoformat(payload['t'])
+    except (ValueError, TypeError, KeyError):
+        raise InvalidSyncTokenError('Geçersiz senkronizasyon token\'ı.')
+    if timezone.is_naive(moment):
+        raise InvalidSyncTokenError('Geçersiz senkronizasyon token\'ı.')
+    return moment
+
+
+class SyncRepository(ISyncRepository):
+    """
+    Sync Repository Implementation
+    
+    Değişen kayıtlar updated_at index'leri üzerinden, silinenler
+    DeletionTombstone tablosundan okunur.
+    """
+    
+    def __init__(self):
+        self.customer_repository = CustomerRepository()
+        self.debt_repository = DebtRepository()
+    
+    def get_changes(self, token: Optional[str] = None) -> SyncDTO:
+        """
+        Token'dan bu yana eklenen, güncellenen ve silinen kayıtları getir
+        
+        Token verilmezse yalnızca yeni bir token döner; istemci bunu tam
+        yüklemeden önce alır. Token saklama süresinden eskiyse ya da değişiklik
+        sayısı SYNC_MAX_CHANGES'i aşarsa reset=True döner.
+        """
+        now = timezone.now()
+        new_token = _encode_token(now - SYNC_OVERLAP)
+        
+        if not token:
+            return SyncDTO(token=new_token)
+        
+        since = _decode_token(token)
+        if since < now - settings.SYNC_TOMBSTONE_RETENTION:
+            return SyncDTO(token=new_token, reset=True)
+        
+        limit = settings.SYNC_MAX_CHANGES
+        
+        # Bakiye değişimi (borç yazımı) müşteri satırını da değiştirir
+        customers = list(
+            self.customer_repository._balance_queryset()
+            .filter(Q(updated_at__gte=since) | Q(balance__updated_at__gte=since))
+            .order_by('id')[:limit + 1]
+        )
+        debts = list(
+            Debt.objects.select_related('customer')
+            .filter(updated_at__gte=since)
+            .order_by('id')[:limit + 1]
+        )
+        if len(customers) + len(debts) > limit:
+            return SyncDTO(token=new_token, reset=True)
+        
+        deleted_customer_ids = []
+        deleted_debt_ids = []
+        tombstones = DeletionTombstone.objects.filter(
+            deleted_at__gte=since,
+            model__in=(Customer._meta.label_lower, Debt._meta.label_lower),
+        ).values_list('model', 'object_id')
+        for model, object_id in tombstones:
+            if model == Customer._meta.label_lower:
+                deleted_customer_ids.append(object_id)
+            else:
+                deleted_debt_ids.append(object_id)
+        
+        return SyncDTO(
+            token=new_token,
+            customers=[self.customer_repository._model_to_dto(c) for c in customers],
+            debts=[self.debt_repository._model_to_dto(d) for d in debts],
+            deleted_customer_ids=sorted(set(deleted_customer_ids)),
+            deleted_debt_ids=sorted(set(deleted_debt_ids)),
+        )
@@ -0,0 +1,129 @@
+"""
+Per-view response caching and HTTP conditional request helpers.
+"""
+import functools
+import hashlib
+
+from django.core.cache import caches
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework.renderers import JSONRenderer
+
+from backend.core import replica
+from backend.core.cache import versioned_key
+
+RESPONSE_CACHE_ALIAS = 'responses'
+
+
+def _etag_matches(request, etag: str) -> bool:
+    header = request.META.get('HTTP_IF_NONE_MATCH')
+    if not header:
+        return False
+    if header.strip() == '*':
+        return True
+    candidates = {value.strip().removeprefix('W/') for value in header.split(',')}
+    return etag in candidates
+
+
+def _request_key(view, request, args, kwargs, per_user: bool) -> str:
+    """View, eylem, URL argümanları, kullanıcı ve sıralı query parametreleri"""
+    params = sorted(
+        (key, value) for key, values in request.query_params.lists() for value in values
+    )
+    user = 'public'
+    if per_user:
+        user = request.user.pk if request.user.is_authenticated else 'anon'
+    return repr((type(view).__name__, view.action, args, sorted(kwargs.items()), user, params))
+
+
+def cached_view(*namespaces, per_user=True, timeout=None, cache_control=None):
+    """
+    ViewSet metotları için yanıt cache dekoratörü
+    
+    Anahtar; view/eylem, URL argümanları, kullanıcı (per_user), query
+    parametreleri ve verilen ad alanlarının sürüm sayaçlarından oluşur.
+    Bu ad alanlarındaki bir modele yazıldığında sürüm değişir ve eski
+    yanıtlar bir daha okunmaz. Sadece 200 yanıtlar cache'lenir; eşleşen
+    If-None-Match'e veritabanına gitmeden 304 döner.
+    
+    Kullanıcıya göre değişmeyen herkese açık yanıtlar için per_user=False.
+    """
+    if cache_control is None:
+        # Herkese açık: tarayıcı saklar ama her seferinde ETag ile doğrular
+        cache_control = 'private, no-cache' if per_user else 'public, no-cache'
+    
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, request, *args, **kwargs):
+            cache = caches[RESPONSE_CACHE_ALIAS]
+            cache_key = versioned_key(
+                'response',
+                namespaces,
+                _request_key(self, request, args, kwargs, per_user),
+            )
+            entry = cache.get(cache_key)
+            
+            if entry is None:
+                reads_before = replica.replica_reads()
+                response = method(self, request, *args, **kwargs)
+                if response.status_code != 200 or not hasattr(response, 'data'):
+                    return response
+                body = JSONRenderer().render(response.data)
+                entry = (f'"{hashlib.md5(body).hexdigest()}"', body)
+                # Replica'dan okunan yanıt gecikme penceresinden uzun saklanmaz
+                entry_timeout = replica.lag_bounded_timeout(timeout, reads_before)
+                if entry_timeout is None:
+                    cache.set(cache_key, entry)
+                else:
+                    cache.set(cache_key, entry, entry_timeout)
+            
+            etag, body = entry
+            if _etag_matches(request, etag):
+                response = HttpResponseNotModified()
+            else:
+                response = HttpResponse(body, content_type='application/json')
+            response['ETag'] = etag
+            response['Cache-Control'] = cache_control
+            if per_user:
+                response['Vary'] = 'Authorization'
+            return response
+        return wrapper
+    return decorator
+
+
+def conditional_view(state_func):
+    """
+    Detay eylemleri için ETag / Last-Modified dekoratörü
+    
+    state_func(view, pk) -> updated_at değerlerinden oluşan tuple (kayıt
+    yoksa None). Bu tek ucuz sorgudan zayıf bir ETag ve Last-Modified
+    üretilir; If-None-Match / If-Modified-Since eşleşirse yanıt, DTO veya
+    serializer çalışmadan 304 olur. cached_view'ın üstünde kullanılır.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, request, pk=None, *args, **kwargs):
+            state = state_func(self, pk)
+            if state is None:
+                return method(self, request, pk, *args, **kwargs)
+            
+            timestamps = [value for value in state if value is not None]
+            etag = 'W/"%s"' % hashlib.md5(
+                '|'.join(value.isoformat() if value else '-' for value in state).encode()
+            ).hexdigest()
+            last_modified = int(max(timestamps).timestamp()) if timestamps else None
+            
+            response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+            if response is None:
+                response = method(self, request, pk, *args, **kwargs)
+                if response.status_code != 200:
+                    return response
+            
+            response['ETag'] = etag
+            if last_modified is not None:
+                response['Last-Modified'] = http_date(last_modified)
+            response['Cache-Control'] = 'private, no-cache'
+            return response
+        return wrapper
+    return decorator
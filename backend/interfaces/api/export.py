@@ -0,0 +1,128 @@
+"""
+Ledger export helpers - streaming CSV and XLSX responses.
+"""
+import csv
+import tempfile
+
+from django.http import FileResponse, StreamingHttpResponse
+from django.utils import timezone
+
+EXPORT_HEADERS = (
+    'ID',
+    'Tarih',
+    'Müşteri ID',
+    'Ad',
+    'Soyad',
+    'Telefon',
+    'Tür',
+    'Tutar',
+    'Ödendi',
+    'Ödeme Tarihi',
+    'Vade Tarihi',
+    'Açıklama',
+)
+
+_DEBT_TYPE_LABELS = {'DEBT': 'Borç', 'CREDIT': 'Alacak'}
+
+# EXPORT_COLUMNS içindeki konumlar
+_CREATED_AT, _DEBT_TYPE, _AMOUNT, _IS_PAID, _PAID_AT, _DUE_DATE = 1, 6, 7, 8, 9, 10
+
+# Bu karakterlerle başlayan hücreyi tablo programları formül olarak çalıştırır
+_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+def _local(value):
+    """Aware datetime'ı yerel saate çevirip saat dilimi bilgisini at"""
+    if value is None:
+        return None
+    return timezone.localtime(value).replace(tzinfo=None)
+
+
+def _csv_safe(value):
+    """Müşteri girdisi metin hücresini formül olarak yorumlanmayacak hale getir"""
+    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+class _Echo:
+    """csv.writer için yazılanı aynen döndüren sahte buffer"""
+    
+    def write(self, value):
+        return value
+
+
+def _csv_lines(rows):
+    writer = csv.writer(_Echo())
+    # BOM: Excel'in Türkçe karakterleri doğru açması için; başlık sorgu bitmeden gönderilir
+    yield '\ufeff' + writer.writerow(EXPORT_HEADERS)
+    for row in rows:
+        row = list(row)
+        created_at, paid_at = _local(row[_CREATED_AT]), _local(row[_PAID_AT])
+        row[_CREATED_AT] = created_at.strftime('%Y-%m-%d %H:%M:%S')
+        row[_PAID_AT] = paid_at.strftime('%Y-%m-%d %H:%M:%S') if paid_at else ''
+        row[_DEBT_TYPE] = _DEBT_TYPE_LABELS.get(row[_DEBT_TYPE], row[_DEBT_TYPE])
+        row[_IS_PAID] = 'Evet' if row[_IS_PAID] else 'Hayır'
+        row[_DUE_DATE] = row[_DUE_DATE].isoformat() if row[_DUE_DATE] else ''
+        yield writer.writerow([_csv_safe(value) for value in row])
+
+
+def csv_response(rows, filename: str) -> StreamingHttpResponse:
+    """Satırları CSV olarak akış halinde gönder"""
+    response = StreamingHttpResponse(_csv_lines(rows), content_type='text/csv; charset=utf-8')
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
+def xlsx_response(rows, filename: str) -> FileResponse:
+    """
+    Satırları XLSX olarak gönder
+    
+    XLSX bir zip arşivi olduğu için bayt bayt akıtılamaz; xlsxwriter
+    constant_memory modunda satırları diske yazar, dosya bittikten sonra
+    parça parça gönderilir. Bellek kullanımı yine satır sayısından bağımsızdır.
+    Metinler her zaman metin hücresi olarak yazılır; "=" ile başlayan bir
+    müşteri adı formül olmaz.
+    """
+    import xlsxwriter
+    
+    handle = tempfile.TemporaryFile()
+    workbook = xlsxwriter.Workbook(handle, {
+        'constant_memory': True,
+        'strings_to_formulas': False,
+        'strings_to_urls': False,
+    })
+    sheet = workbook.add_worksheet('Defter')
+    bold = workbook.add_format({'bold': True})
+    money = workbook.add_format({'num_format': '#,##0.00'})
+    datetime_format = workbook.add_format({'num_format': 'yyyy-mm-dd hh:mm'})
+    date_format = workbook.add_format({'num_format': 'yyyy-mm-dd'})
+    
+    sheet.write_row(0, 0, EXPORT_HEADERS, bold)
+    for index, row in enumerate(rows, start=1):
+        for column, value in enumerate(row):
+            if column in (_CREATED_AT, _PAID_AT):
+                if value is not None:
+                    sheet.write_datetime(index, column, _local(value), datetime_format)
+            elif column == _DUE_DATE:
+                if value is not None:
+                    sheet.write_datetime(index, column, value, date_format)
+            elif column == _AMOUNT:
+                sheet.write_number(index, column, float(value), money)
+            elif column == _DEBT_TYPE:
+                sheet.write_string(index, column, _DEBT_TYPE_LABELS.get(value, value))
+            elif column == _IS_PAID:
+                sheet.write_string(index, column, 'Evet' if value else 'Hayır')
+            elif isinstance(value, str):
+                sheet.write_string(index, column, value)
+            elif value is not None:
+                sheet.write_number(index, column, value)
+    workbook.close()
+    
+    handle.seek(0)
+    return FileResponse(
+        handle,
+        as_attachment=True,
+        filename=filename,
+        content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    )
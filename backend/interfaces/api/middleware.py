@@ -0,0 +1,41 @@
+"""
+HTTP middleware for primary/replica read routing.
+"""
+import time
+
+from backend.core import replica
+
+STICKY_COOKIE = 'db_primary_until'
+
+
+class PrimaryStickinessMiddleware:
+    """
+    Yazma yapan istemcinin okumalarını kısa süre primary'de tut
+    
+    Bir istekte yazma yapılırsa yanıta, DATABASE_REPLICA_LAG_WINDOW saniye
+    geçerli bir çerez eklenir. Çerez süresince aynı istemcinin read_only()
+    okumaları da primary'ye gider; böylece istemci kendi yazdığını
+    gecikmeli replica'da kaybolmuş görmez.
+    """
+    
+    def __init__(self, get_response):
+        self.get_response = get_response
+    
+    def __call__(self, request):
+        try:
+            pinned = float(request.COOKIES.get(STICKY_COOKIE, 0)) > time.time()
+        except ValueError:
+            pinned = False
+        
+        with replica.request_scope(pinned=pinned):
+            response = self.get_response(request)
+            if replica.wrote() and replica.replica_configured():
+                window = replica.lag_window()
+                response.set_cookie(
+                    STICKY_COOKIE,
+                    f'{time.time() + window:.3f}',
+                    max_age=window,
+                    httponly=True,
+                    samesite='Lax',
+                )
+        return response
@@ -0,0 +1,48 @@
+"""
+Cursor pagination helpers for API list endpoints.
+"""
+from rest_framework import status
+from rest_framework.response import Response
+
+from backend.application.exceptions import InvalidCursorError
+from backend.infrastructure.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+
+
+def paginated_response(request, fetch_page, serializer_class):
+    """
+    limit/cursor query parametrelerini okuyup sayfalı yanıt döndür
+    
+    fetch_page(limit, cursor) -> PageDTO
+    Yanıt: {"results": [...], "next": "<cursor>" | null}
+    """
+    cursor = request.query_params.get('cursor') or None
+    limit = request.query_params.get('limit', DEFAULT_PAGE_SIZE)
+    
+    try:
+        limit = int(limit)
+    except (TypeError, ValueError):
+        return Response(
+            {'limit': ['Geçerli bir sayı giriniz.']},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    if limit < 1 or limit > MAX_PAGE_SIZE:
+        return Response(
+            {'limit': [f'1 ile {MAX_PAGE_SIZE} arasında olmalıdır.']},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    try:
+        page = fetch_page(limit, cursor)
+    except InvalidCursorError as exc:
+        return Response(
+            {'cursor': [str(exc)]},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    serializer = serializer_class([item.to_dict() for item in page], many=True)
+    
+    return Response({
+        'results': serializer.data,
+        'next': page.next_cursor,
+    })
@@ -8,17 +8,39 @@ from backend.interfaces.api.serializers.customer_serializer import (
 from backend.interfaces.api.serializers.debt_serializer import (
     DebtSerializer,
     DebtListSerializer,
+    OverdueDebtSerializer,
 )
 from backend.interfaces.api.serializers.gallery_serializer import (
     GalleryImageSerializer,
+    GalleryImageAdminSerializer,
     GalleryImageListSerializer,
 )
+from backend.interfaces.api.serializers.dashboard_serializer import (
+    DashboardStatsSerializer,
+)
+from backend.interfaces.api.serializers.sync_serializer import (
+    SyncSerializer,
+)
+from backend.interfaces.api.serializers.statement_serializer import (
+    StatementSerializer,
+)
+from backend.interfaces.api.serializers.report_serializer import (
+    AgingReportSerializer,
+    TimeseriesSerializer,
+)
 
 __all__ = [
     'CustomerSerializer',
     'CustomerListSerializer',
     'DebtSerializer',
     'DebtListSerializer',
+    'OverdueDebtSerializer',
     'GalleryImageSerializer',
+    'GalleryImageAdminSerializer',
     'GalleryImageListSerializer',
+    'DashboardStatsSerializer',
+    'SyncSerializer',
+    'StatementSerializer',
+    'AgingReportSerializer',
+    'TimeseriesSerializer',
 ]
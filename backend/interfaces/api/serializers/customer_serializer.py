@@ -37,10 +37,25 @@ class CustomerSerializer(serializers.Serializer):
     created_by_id = serializers.IntegerField(read_only=True, required=False)
     
     def validate_phone(self, value):
-        """Telefon numarası validasyonu"""
+        """
+        Telefon numarası validasyonu
+        
+        Numara, yazım biçimi farklı olsa da başka bir müşteriye ait olamaz.
+        Güncellemede context['customer'] (mevcut müşteri DTO'su) verilir;
+        telefonu değişmeyen kayıt kontrol edilmez.
+        """
+        from backend.core.models import Customer
+        
         if not value or len(value.strip()) < 10:
             raise serializers.ValidationError("Telefon numarası en az 10 karakter olmalıdır.")
-        return value.strip()
+        value = value.strip()
+        
+        customer = self.context.get('customer')
+        if customer is not None and value == customer.phone:
+            return value
+        if Customer.phone_owner(value, exclude_pk=customer.id if customer is not None else None):
+            raise serializers.ValidationError("Bu telefon numarası zaten kullanılıyor.")
+        return value
     
     def validate_email(self, value):
         """E-posta validasyonu"""
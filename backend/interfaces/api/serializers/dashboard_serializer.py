@@ -0,0 +1,24 @@
+"""
+Dashboard Serializers for API endpoints.
+"""
+from rest_framework import serializers
+
+
+class DashboardStatsSerializer(serializers.Serializer):
+    """
+    Dashboard statistics serializer (read-only)
+    """
+    total_customers = serializers.IntegerField(read_only=True)
+    active_customers = serializers.IntegerField(read_only=True)
+    total_debts = serializers.IntegerField(read_only=True)
+    unpaid_debts = serializers.IntegerField(read_only=True)
+    total_debt_amount = serializers.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        read_only=True
+    )
+    total_paid_amount = serializers.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        read_only=True
+    )
@@ -31,6 +31,8 @@ class DebtSerializer(serializers.Serializer):
     is_paid = serializers.BooleanField(default=False, required=False)
     
     # Read-only fields
+    paid_amount = serializers.DecimalField(max_digits=12, decimal_places=2, read_only=True)
+    remaining_amount = serializers.DecimalField(max_digits=12, decimal_places=2, read_only=True)
     paid_at = serializers.DateTimeField(read_only=True, required=False)
     paid_by_id = serializers.IntegerField(read_only=True, required=False)
     created_at = serializers.DateTimeField(read_only=True)
@@ -68,9 +70,69 @@ class DebtListSerializer(serializers.Serializer):
         decimal_places=2,
         read_only=True
     )
+    paid_amount = serializers.DecimalField(max_digits=12, decimal_places=2, read_only=True)
+    remaining_amount = serializers.DecimalField(max_digits=12, decimal_places=2, read_only=True)
     description = serializers.CharField(read_only=True)
     is_paid = serializers.BooleanField(read_only=True)
     due_date = serializers.DateField(read_only=True, allow_null=True)
     created_at = serializers.DateTimeField(read_only=True)
     paid_at = serializers.DateTimeField(read_only=True, allow_null=True)
 
+
+class OverdueDebtSerializer(DebtListSerializer):
+    """
+    Overdue debt serializer (read-only)
+    """
+    days_overdue = serializers.IntegerField(read_only=True)
+    aging_bucket = serializers.CharField(read_only=True)
+
+
+
+class DebtBulkStatusSerializer(serializers.Serializer):
+    """
+    Toplu ödendi/ödenmedi işaretleme isteği
+    
+    ids ve/veya filtre alanları verilir; en az biri zorunludur
+    (yanlışlıkla tüm defterin işaretlenmesini önler).
+    """
+    MAX_IDS = 5000
+    
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        required=False,
+        allow_empty=False,
+        max_length=MAX_IDS
+    )
+    customer_id = serializers.IntegerField(required=False, min_value=1)
+    debt_type = serializers.ChoiceField(choices=['DEBT', 'CREDIT'], required=False)
+    date_from = serializers.DateField(required=False)
+    date_to = serializers.DateField(required=False)
+    
+    def validate(self, attrs):
+        """En az bir seçim kriteri zorunlu"""
+        if not any(key in attrs for key in ('ids', 'customer_id', 'date_from', 'date_to')):
+            raise serializers.ValidationError(
+                "ids, customer_id, date_from veya date_to alanlarından en az biri gereklidir."
+            )
+        if attrs.get('date_from') and attrs.get('date_to') and attrs['date_from'] > attrs['date_to']:
+            raise serializers.ValidationError({'date_to': "date_from'dan önce olamaz."})
+        return attrs
+
+
+class CustomerBalanceSerializer(serializers.Serializer):
+    """
+    Customer balance serializer (read-only)
+    """
+    customer_id = serializers.IntegerField(read_only=True)
+    outstanding_debt = serializers.DecimalField(max_digits=14, decimal_places=2, read_only=True)
+    outstanding_credit = serializers.DecimalField(max_digits=14, decimal_places=2, read_only=True)
+    paid_total = serializers.DecimalField(max_digits=14, decimal_places=2, read_only=True)
+
+
+class DebtBulkUpdateResultSerializer(serializers.Serializer):
+    """
+    Toplu işaretleme sonucu (read-only)
+    """
+    updated = serializers.IntegerField(read_only=True)
+    balances = CustomerBalanceSerializer(many=True, read_only=True)
+    skipped_ids = serializers.ListField(child=serializers.IntegerField(), read_only=True)
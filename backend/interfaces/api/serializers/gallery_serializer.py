@@ -17,6 +17,12 @@ class GalleryImageSerializer(serializers.Serializer):
     
     # Read-only fields
     image_url = serializers.CharField(read_only=True, required=False)
+    srcset = serializers.CharField(read_only=True, required=False, allow_null=True)
+    sources = serializers.ListField(child=serializers.DictField(), read_only=True, required=False)
+    placeholder = serializers.CharField(read_only=True, required=False, allow_null=True)
+    width = serializers.IntegerField(read_only=True, required=False, allow_null=True)
+    height = serializers.IntegerField(read_only=True, required=False, allow_null=True)
+    processing_status = serializers.CharField(read_only=True, required=False)
     created_at = serializers.DateTimeField(read_only=True)
     updated_at = serializers.DateTimeField(read_only=True)
     created_by_id = serializers.IntegerField(read_only=True, required=False)
@@ -34,6 +40,15 @@ class GalleryImageSerializer(serializers.Serializer):
         return value
 
 
+class GalleryImageAdminSerializer(GalleryImageSerializer):
+    """
+    Gallery Image serializer for admin responses
+    
+    İşleme hatası iç hata metni içerir; herkese açık yanıtlarda yer almaz.
+    """
+    processing_error = serializers.CharField(read_only=True, required=False, allow_null=True)
+
+
 class GalleryImageListSerializer(serializers.Serializer):
     """
     Gallery Image serializer for list operations (optimized)
@@ -42,6 +57,12 @@ class GalleryImageListSerializer(serializers.Serializer):
     title = serializers.CharField(read_only=True)
     description = serializers.CharField(read_only=True)
     image_url = serializers.CharField(read_only=True)
+    srcset = serializers.CharField(read_only=True, allow_null=True)
+    sources = serializers.ListField(child=serializers.DictField(), read_only=True)
+    placeholder = serializers.CharField(read_only=True, allow_null=True)
+    width = serializers.IntegerField(read_only=True, allow_null=True)
+    height = serializers.IntegerField(read_only=True, allow_null=True)
+    processing_status = serializers.CharField(read_only=True)
     is_active = serializers.BooleanField(read_only=True)
     order = serializers.IntegerField(read_only=True)
     created_at = serializers.DateTimeField(read_only=True)
@@ -0,0 +1,62 @@
+"""
+Payment Serializers for API endpoints.
+"""
+from rest_framework import serializers
+from decimal import Decimal
+
+from backend.interfaces.api.serializers.debt_serializer import CustomerBalanceSerializer
+
+
+class PaymentAllocationSerializer(serializers.Serializer):
+    """
+    Payment allocation serializer (read-only)
+    """
+    debt_id = serializers.IntegerField(read_only=True)
+    amount = serializers.DecimalField(max_digits=12, decimal_places=2, read_only=True)
+
+
+class PaymentSerializer(serializers.Serializer):
+    """
+    Payment serializer for create operations
+    
+    debt_id verilirse ödeme yalnızca o borca uygulanır; verilmezse açık
+    borçlara en eskiden başlayarak dağıtılır.
+    """
+    id = serializers.IntegerField(read_only=True)
+    customer_id = serializers.IntegerField(required=True)
+    debt_id = serializers.IntegerField(required=False, allow_null=True)
+    amount = serializers.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        required=True,
+        min_value=Decimal('0.01')
+    )
+    notes = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+    
+    # Read-only fields
+    payment_date = serializers.DateTimeField(read_only=True)
+    paid_by_id = serializers.IntegerField(read_only=True, allow_null=True)
+    allocations = PaymentAllocationSerializer(many=True, read_only=True)
+    
+    def validate_customer_id(self, value):
+        """Müşteri ID validasyonu"""
+        from backend.core.models import Customer
+        if not Customer.objects.filter(id=value, is_active=True).exists():
+            raise serializers.ValidationError("Aktif bir müşteri bulunamadı.")
+        return value
+
+
+class SettleCustomerSerializer(serializers.Serializer):
+    """
+    Müşteri hesabı kapatma isteği
+    """
+    notes = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+
+
+class SettlementResultSerializer(serializers.Serializer):
+    """
+    Hesap kapatma sonucu (read-only)
+    """
+    payment = PaymentSerializer(read_only=True)
+    settled_count = serializers.IntegerField(read_only=True)
+    balance = CustomerBalanceSerializer(read_only=True)
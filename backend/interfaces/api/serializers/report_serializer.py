@@ -0,0 +1,63 @@
+"""
+Report Serializers for API endpoints.
+"""
+from rest_framework import serializers
+
+
+def aging_buckets_field():
+    """Dilim anahtarı ("0_30", "31_60", "61_90", "90_plus") -> tutar"""
+    return serializers.DictField(
+        child=serializers.DecimalField(max_digits=14, decimal_places=2),
+        read_only=True
+    )
+
+
+class AgingRowSerializer(serializers.Serializer):
+    """
+    Customer aging row serializer (read-only)
+    """
+    customer_id = serializers.IntegerField(read_only=True)
+    customer_name = serializers.CharField(read_only=True)
+    customer_phone = serializers.CharField(read_only=True)
+    buckets = aging_buckets_field()
+    total = serializers.DecimalField(max_digits=14, decimal_places=2, read_only=True)
+    debt_count = serializers.IntegerField(read_only=True)
+    oldest_due_date = serializers.DateField(read_only=True, allow_null=True)
+
+
+class AgingReportSerializer(serializers.Serializer):
+    """
+    Aging report serializer (read-only)
+    """
+    as_of = serializers.DateField(read_only=True)
+    source = serializers.CharField(read_only=True)
+    generated_at = serializers.DateTimeField(read_only=True)
+    buckets = aging_buckets_field()
+    total = serializers.DecimalField(max_digits=14, decimal_places=2, read_only=True)
+    debt_count = serializers.IntegerField(read_only=True)
+    oldest_due_date = serializers.DateField(read_only=True, allow_null=True)
+    customers = AgingRowSerializer(many=True, read_only=True)
+
+
+class TimeseriesPointSerializer(serializers.Serializer):
+    """
+    Timeseries period serializer (read-only)
+    """
+    period_start = serializers.DateField(read_only=True)
+    created_count = serializers.IntegerField(read_only=True)
+    created_amount = serializers.DecimalField(max_digits=14, decimal_places=2, read_only=True)
+    paid_amount = serializers.DecimalField(max_digits=14, decimal_places=2, read_only=True)
+    outstanding_amount = serializers.DecimalField(max_digits=14, decimal_places=2, read_only=True)
+
+
+class TimeseriesSerializer(serializers.Serializer):
+    """
+    Ledger timeseries serializer (read-only)
+    """
+    date_from = serializers.DateField(read_only=True)
+    date_to = serializers.DateField(read_only=True)
+    interval = serializers.CharField(read_only=True)
+    series = serializers.DictField(
+        child=serializers.ListField(child=TimeseriesPointSerializer()),
+        read_only=True
+    )
@@ -0,0 +1,31 @@
+"""
+Customer Statement Serializers for API endpoints.
+"""
+from rest_framework import serializers
+
+from backend.core.models import LedgerEntry
+
+
+class StatementEntrySerializer(serializers.Serializer):
+    """
+    Statement entry serializer (read-only)
+    """
+    id = serializers.IntegerField(read_only=True)
+    kind = serializers.ChoiceField(choices=LedgerEntry.Kind.choices, read_only=True)
+    amount = serializers.DecimalField(max_digits=14, decimal_places=2, read_only=True)
+    balance_after = serializers.DecimalField(max_digits=14, decimal_places=2, read_only=True)
+    debt_id = serializers.IntegerField(read_only=True, allow_null=True)
+    payment_id = serializers.IntegerField(read_only=True, allow_null=True)
+    description = serializers.CharField(read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
+
+
+class StatementSerializer(serializers.Serializer):
+    """
+    Customer statement serializer (read-only)
+    """
+    customer_id = serializers.IntegerField(read_only=True)
+    opening_balance = serializers.DecimalField(max_digits=14, decimal_places=2, read_only=True)
+    closing_balance = serializers.DecimalField(max_digits=14, decimal_places=2, read_only=True)
+    entries = StatementEntrySerializer(many=True, read_only=True)
+    next = serializers.CharField(read_only=True, allow_null=True)
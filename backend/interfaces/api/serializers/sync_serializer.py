@@ -0,0 +1,19 @@
+"""
+Sync Serializers for API endpoints.
+"""
+from rest_framework import serializers
+
+from backend.interfaces.api.serializers.customer_serializer import CustomerListSerializer
+from backend.interfaces.api.serializers.debt_serializer import DebtListSerializer
+
+
+class SyncSerializer(serializers.Serializer):
+    """
+    Delta sync serializer (read-only)
+    """
+    token = serializers.CharField(read_only=True)
+    reset = serializers.BooleanField(read_only=True)
+    customers = CustomerListSerializer(many=True, read_only=True)
+    debts = DebtListSerializer(many=True, read_only=True)
+    deleted_customer_ids = serializers.ListField(child=serializers.IntegerField(), read_only=True)
+    deleted_debt_ids = serializers.ListField(child=serializers.IntegerField(), read_only=True)
@@ -6,8 +6,12 @@ from rest_framework.routers import DefaultRouter
 
 from backend.interfaces.api.views.customer_viewset import CustomerViewSet
 from backend.interfaces.api.views.debt_viewset import DebtViewSet
+from backend.interfaces.api.views.payment_viewset import PaymentViewSet
 from backend.interfaces.api.views.gallery_viewset import GalleryViewSet
 from backend.interfaces.api.views.contact_viewset import ContactViewSet
+from backend.interfaces.api.views.dashboard_viewset import DashboardViewSet
+from backend.interfaces.api.views.report_viewset import ReportViewSet
+from backend.interfaces.api.views.sync_viewset import SyncViewSet
 from backend.interfaces.api.views.auth_view import login_view
 
 # API router for automatic URL generation
@@ -16,8 +20,12 @@ router = DefaultRouter()
 # Register ViewSets
 router.register(r'customers', CustomerViewSet, basename='customer')
 router.register(r'debts', DebtViewSet, basename='debt')
+router.register(r'payments', PaymentViewSet, basename='payment')
 router.register(r'gallery', GalleryViewSet, basename='gallery')
 router.register(r'contact', ContactViewSet, basename='contact')
+router.register(r'dashboard', DashboardViewSet, basename='dashboard')
+router.register(r'reports', ReportViewSet, basename='report')
+router.register(r'sync', SyncViewSet, basename='sync')
 
 # API URL patterns
 urlpatterns = [
@@ -4,11 +4,15 @@ API Views module.
 from backend.interfaces.api.views.customer_viewset import CustomerViewSet
 from backend.interfaces.api.views.debt_viewset import DebtViewSet
 from backend.interfaces.api.views.gallery_viewset import GalleryViewSet
+from backend.interfaces.api.views.dashboard_viewset import DashboardViewSet
+from backend.interfaces.api.views.report_viewset import ReportViewSet
 from backend.interfaces.api.views.auth_view import login_view
 
 __all__ = [
     'CustomerViewSet',
     'DebtViewSet',
     'GalleryViewSet',
+    'DashboardViewSet',
+    'ReportViewSet',
     'login_view',
 ]
@@ -11,6 +11,9 @@ from backend.interfaces.api.serializers.contact_serializer import (
     ContactMessageListSerializer,
 )
 from backend.infrastructure.repositories import ContactRepository
+from backend.interfaces.api.pagination import paginated_response
+from backend.interfaces.api.caching import cached_view
+from backend.core.models import ContactMessage
 from backend.application.dtos.contact_dto import ContactMessageDTO
 
 
@@ -60,10 +63,11 @@ class ContactViewSet(viewsets.ViewSet):
             status=status.HTTP_201_CREATED
         )
     
+    @cached_view(ContactMessage.CACHE_NAMESPACE)
     def list(self, request):
         """
-        GET /api/contact/
-        İletişim mesajları listesi (admin only)
+        GET /api/contact/?limit=50&cursor=...
+        İletişim mesajları listesi (admin only, cursor sayfalama)
         """
         repository = ContactRepository()
         
@@ -75,16 +79,17 @@ class ContactViewSet(viewsets.ViewSet):
         if is_read is not None:
             is_read_filter = is_read.lower() == 'true'
         
-        messages = repository.get_all(is_read=is_read_filter)
-        
-        # Serialize
-        serializer = ContactMessageListSerializer([msg.to_dict() for msg in messages], many=True)
-        
-        return Response({
-            'count': len(messages),
-            'results': serializer.data
-        })
+        return paginated_response(
+            request,
+            lambda limit, cursor: repository.get_page(
+                is_read=is_read_filter,
+                limit=limit,
+                cursor=cursor,
+            ),
+            ContactMessageListSerializer,
+        )
     
+    @cached_view(ContactMessage.CACHE_NAMESPACE)
     def retrieve(self, request, pk=None):
         """
         GET /api/contact/{id}/
@@ -1,6 +1,8 @@
 """
 Customer ViewSet for API endpoints.
 """
+from datetime import date
+
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -11,8 +13,18 @@ from backend.interfaces.api.serializers.customer_serializer import (
     CustomerSerializer,
     CustomerListSerializer,
 )
-from backend.infrastructure.repositories import CustomerRepository
+from backend.interfaces.api.serializers.payment_serializer import (
+    SettleCustomerSerializer,
+    SettlementResultSerializer,
+)
+from backend.interfaces.api.serializers.statement_serializer import StatementSerializer
+from backend.infrastructure.repositories import CustomerRepository, PaymentRepository, StatementRepository
+from backend.infrastructure.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from backend.interfaces.api.pagination import paginated_response
+from backend.interfaces.api.caching import cached_view, conditional_view
+from backend.core.models import Customer, Debt, Payment
 from backend.application.dtos.customer_dto import CustomerDTO
+from backend.application.exceptions import InvalidCursorError, NothingToSettleError
 
 
 class CustomerViewSet(viewsets.ViewSet):
@@ -28,10 +40,11 @@ class CustomerViewSet(viewsets.ViewSet):
             return CustomerListSerializer
         return CustomerSerializer
     
+    @cached_view(Customer.CACHE_NAMESPACE, Debt.CACHE_NAMESPACE)
     def list(self, request):
         """
-        GET /api/customers/
-        Müşteri listesi
+        GET /api/customers/?limit=50&cursor=...
+        Müşteri listesi (cursor sayfalama)
         """
         repository = CustomerRepository()
         
@@ -40,22 +53,23 @@ class CustomerViewSet(viewsets.ViewSet):
         search = request.query_params.get('search', None)
         
         # Filtreleme
-        if search:
-            customers = repository.search(search)
-        else:
-            is_active_filter = None
-            if is_active is not None:
-                is_active_filter = is_active.lower() == 'true'
-            customers = repository.get_all(is_active=is_active_filter)
-        
-        # Serialize
-        serializer = CustomerListSerializer([c.to_dict() for c in customers], many=True)
-        
-        return Response({
-            'count': len(customers),
-            'results': serializer.data
-        })
+        is_active_filter = None
+        if is_active is not None:
+            is_active_filter = is_active.lower() == 'true'
+        
+        return paginated_response(
+            request,
+            lambda limit, cursor: repository.get_page(
+                is_active=is_active_filter,
+                search=search,
+                limit=limit,
+                cursor=cursor,
+            ),
+            CustomerListSerializer,
+        )
     
+    @conditional_view(lambda view, pk: CustomerRepository().get_modification_state(int(pk)))
+    @cached_view(Customer.CACHE_NAMESPACE, Debt.CACHE_NAMESPACE)
     def retrieve(self, request, pk=None):
         """
         GET /api/customers/{id}/
@@ -96,14 +110,6 @@ class CustomerViewSet(viewsets.ViewSet):
         # Repository ile kaydet
         repository = CustomerRepository()
         
-        # Telefon kontrolü
-        existing = repository.get_by_phone(customer_dto.phone)
-        if existing:
-            return Response(
-                {'phone': ['Bu telefon numarası zaten kullanılıyor.']},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
         customer = repository.create(customer_dto)
         
         # Response
@@ -127,7 +133,8 @@ class CustomerViewSet(viewsets.ViewSet):
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        serializer = CustomerSerializer(data=request.data)
+        # Telefon tekilliği serializer'da, mevcut müşteri hariç kontrol edilir
+        serializer = CustomerSerializer(data=request.data, context={'customer': customer})
         serializer.is_valid(raise_exception=True)
         
         # DTO oluştur
@@ -142,15 +149,6 @@ class CustomerViewSet(viewsets.ViewSet):
             notes=serializer.validated_data.get('notes'),
         )
         
-        # Telefon kontrolü (farklı bir müşteriye aitse)
-        if customer_dto.phone != customer.phone:
-            existing = repository.get_by_phone(customer_dto.phone)
-            if existing and existing.id != customer.id:
-                return Response(
-                    {'phone': ['Bu telefon numarası zaten kullanılıyor.']},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-        
         # Güncelle
         updated_customer = repository.update(int(pk), customer_dto)
         
@@ -179,7 +177,12 @@ class CustomerViewSet(viewsets.ViewSet):
             )
         
         # Mevcut verilerle merge
-        serializer = CustomerSerializer(customer.to_dict(), data=request.data, partial=True)
+        serializer = CustomerSerializer(
+            customer.to_dict(),
+            data=request.data,
+            partial=True,
+            context={'customer': customer},
+        )
         serializer.is_valid(raise_exception=True)
         
         # DTO oluştur (sadece güncellenen alanlar)
@@ -194,15 +197,6 @@ class CustomerViewSet(viewsets.ViewSet):
             notes=serializer.validated_data.get('notes', customer.notes),
         )
         
-        # Telefon kontrolü
-        if customer_dto.phone != customer.phone:
-            existing = repository.get_by_phone(customer_dto.phone)
-            if existing and existing.id != customer.id:
-                return Response(
-                    {'phone': ['Bu telefon numarası zaten kullanılıyor.']},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-        
         # Güncelle
         updated_customer = repository.update(int(pk), customer_dto)
         
@@ -233,12 +227,14 @@ class CustomerViewSet(viewsets.ViewSet):
         return Response(status=status.HTTP_204_NO_CONTENT)
     
     @action(detail=True, methods=['get'])
+    @cached_view(Customer.CACHE_NAMESPACE, Debt.CACHE_NAMESPACE)
     def debts(self, request, pk=None):
         """
-        GET /api/customers/{id}/debts/
-        Müşterinin borçlarını getir
+        GET /api/customers/{id}/debts/?limit=50&cursor=...
+        Müşterinin borçlarını getir (cursor sayfalama)
         """
         from backend.infrastructure.repositories import DebtRepository
+        from backend.interfaces.api.serializers.debt_serializer import DebtListSerializer
         
         repository = DebtRepository()
         is_paid = request.query_params.get('is_paid', None)
@@ -247,13 +243,100 @@ class CustomerViewSet(viewsets.ViewSet):
         if is_paid is not None:
             is_paid_filter = is_paid.lower() == 'true'
         
-        debts = repository.get_by_customer_id(int(pk), is_paid=is_paid_filter)
+        return paginated_response(
+            request,
+            lambda limit, cursor: repository.get_page(
+                customer_id=int(pk),
+                is_paid=is_paid_filter,
+                limit=limit,
+                cursor=cursor,
+            ),
+            DebtListSerializer,
+        )
+    
+    @action(detail=True, methods=['get'])
+    @cached_view(Customer.CACHE_NAMESPACE, Debt.CACHE_NAMESPACE, Payment.CACHE_NAMESPACE)
+    def statement(self, request, pk=None):
+        """
+        GET /api/customers/{id}/statement/?date_from=2024-01-01&date_to=2024-12-31&limit=50&cursor=...
+        Müşterinin hesap ekstresi: kronolojik hareketler ve yürüyen bakiye
         
-        from backend.interfaces.api.serializers.debt_serializer import DebtListSerializer
-        serializer = DebtListSerializer([d.to_dict() for d in debts], many=True)
+        Tarihler dahildir; sonraki sayfa için yanıttaki next değeri cursor
+        olarak gönderilir.
+        """
+        filters = {}
+        errors = {}
+        
+        for param in ('date_from', 'date_to'):
+            value = request.query_params.get(param)
+            if value:
+                try:
+                    filters[param] = date.fromisoformat(value)
+                except ValueError:
+                    errors[param] = ['Tarih YYYY-AA-GG biçiminde olmalıdır.']
+        
+        if filters.get('date_from') and filters.get('date_to') and filters['date_from'] > filters['date_to']:
+            errors['date_to'] = ["date_from'dan önce olamaz."]
+        
+        try:
+            limit = int(request.query_params.get('limit', DEFAULT_PAGE_SIZE))
+            if limit < 1 or limit > MAX_PAGE_SIZE:
+                errors['limit'] = [f'1 ile {MAX_PAGE_SIZE} arasında olmalıdır.']
+        except (TypeError, ValueError):
+            errors['limit'] = ['Geçerli bir sayı giriniz.']
+        
+        if errors:
+            return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+        
+        try:
+            result = StatementRepository().get_statement(
+                int(pk),
+                limit=limit,
+                cursor=request.query_params.get('cursor') or None,
+                **filters
+            )
+        except InvalidCursorError as exc:
+            return Response(
+                {'cursor': [str(exc)]},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
-        return Response({
-            'count': len(debts),
-            'results': serializer.data
-        })
-
+        if result is None:
+            return Response(
+                {'detail': 'Müşteri bulunamadı.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        
+        return Response(StatementSerializer(result.to_dict()).data)
+    
+    @action(detail=True, methods=['post'])
+    def settle(self, request, pk=None):
+        """
+        POST /api/customers/{id}/settle/
+        Müşterinin tüm açık borçlarını tek ödeme kaydıyla kapat
+        """
+        serializer = SettleCustomerSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        
+        try:
+            result = PaymentRepository().settle_customer(
+                int(pk),
+                user_id=request.user.id if request.user.is_authenticated else None,
+                notes=serializer.validated_data.get('notes') or None,
+            )
+        except NothingToSettleError as exc:
+            return Response(
+                {'detail': str(exc)},
+                status=status.HTTP_409_CONFLICT
+            )
+        
+        if result is None:
+            return Response(
+                {'detail': 'Müşteri bulunamadı.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        
+        return Response(
+            SettlementResultSerializer(result.to_dict()).data,
+            status=status.HTTP_201_CREATED
+        )
@@ -0,0 +1,30 @@
+"""
+Dashboard ViewSet for API endpoints.
+"""
+from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.permissions import IsAdminUser
+
+from backend.interfaces.api.serializers.dashboard_serializer import DashboardStatsSerializer
+from backend.infrastructure.repositories import ReportRepository
+
+
+class DashboardViewSet(viewsets.ViewSet):
+    """
+    Dashboard ViewSet
+    Admin paneli özet istatistikleri
+    """
+    permission_classes = [IsAdminUser]
+    
+    @action(detail=False, methods=['get'])
+    def stats(self, request):
+        """
+        GET /api/dashboard/stats/
+        Müşteri ve borç özet istatistikleri
+        """
+        repository = ReportRepository()
+        stats = repository.get_dashboard_stats()
+        
+        serializer = DashboardStatsSerializer(stats.to_dict())
+        return Response(serializer.data)
@@ -5,14 +5,30 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAdminUser
+from datetime import date
 from decimal import Decimal
+import io
 
 from backend.interfaces.api.serializers.debt_serializer import (
     DebtSerializer,
     DebtListSerializer,
+    DebtBulkStatusSerializer,
+    DebtBulkUpdateResultSerializer,
+    OverdueDebtSerializer,
 )
-from backend.infrastructure.repositories import DebtRepository
+from backend.infrastructure.repositories import CustomerRepository, DebtRepository
+from backend.interfaces.api.pagination import paginated_response
+from backend.interfaces.api.export import csv_response, xlsx_response
+from backend.interfaces.api.caching import cached_view, conditional_view
+from backend.core.models import Customer, Debt
 from backend.application.dtos.debt_dto import DebtDTO
+from backend.application.exceptions import DebtHasPaymentsError
+from backend.application.services.ledger_import_service import (
+    LedgerImportService,
+    SUPPORTED_FORMATS,
+    detect_format,
+    read_ledger_rows,
+)
 
 
 class DebtViewSet(viewsets.ViewSet):
@@ -28,10 +44,11 @@ class DebtViewSet(viewsets.ViewSet):
             return DebtListSerializer
         return DebtSerializer
     
+    @cached_view(Debt.CACHE_NAMESPACE, Customer.CACHE_NAMESPACE)
     def list(self, request):
         """
-        GET /api/debts/
-        Borç listesi
+        GET /api/debts/?limit=50&cursor=...
+        Borç listesi (cursor sayfalama)
         """
         repository = DebtRepository()
         
@@ -45,19 +62,60 @@ class DebtViewSet(viewsets.ViewSet):
         if is_paid is not None:
             is_paid_filter = is_paid.lower() == 'true'
         
+        customer_id_filter = int(customer_id) if customer_id else None
+        
+        return paginated_response(
+            request,
+            lambda limit, cursor: repository.get_page(
+                is_paid=is_paid_filter,
+                debt_type=debt_type,
+                customer_id=customer_id_filter,
+                limit=limit,
+                cursor=cursor,
+            ),
+            DebtListSerializer,
+        )
+    
+    @action(detail=False, methods=['get'])
+    def overdue(self, request):
+        """
+        GET /api/debts/overdue/?customer_id=1&min_days=30&limit=50&cursor=...
+        Vadesi geçmiş ödenmemiş borçlar (en eski vade önce)
+        
+        min_days: vadeden bu yana en az geçen gün (varsayılan 1).
+        Yanıt güne bağlı olduğundan (days_overdue) önbelleğe alınmaz.
+        """
+        filters = {}
+        errors = {}
+        
+        customer_id = request.query_params.get('customer_id')
         if customer_id:
-            debts = repository.get_by_customer_id(int(customer_id), is_paid=is_paid_filter)
-        else:
-            debts = repository.get_all(is_paid=is_paid_filter, debt_type=debt_type)
+            try:
+                filters['customer_id'] = int(customer_id)
+            except ValueError:
+                errors['customer_id'] = ['Geçerli bir sayı giriniz.']
         
-        # Serialize
-        serializer = DebtListSerializer([d.to_dict() for d in debts], many=True)
+        min_days = request.query_params.get('min_days')
+        if min_days:
+            try:
+                filters['min_days'] = int(min_days)
+                if filters['min_days'] < 1:
+                    errors['min_days'] = ['En az 1 olmalıdır.']
+            except ValueError:
+                errors['min_days'] = ['Geçerli bir sayı giriniz.']
         
-        return Response({
-            'count': len(debts),
-            'results': serializer.data
-        })
+        if errors:
+            return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+        
+        repository = DebtRepository()
+        return paginated_response(
+            request,
+            lambda limit, cursor: repository.get_overdue_page(limit=limit, cursor=cursor, **filters),
+            OverdueDebtSerializer,
+        )
     
+    @conditional_view(lambda view, pk: DebtRepository().get_modification_state(int(pk)))
+    @cached_view(Debt.CACHE_NAMESPACE, Customer.CACHE_NAMESPACE)
     def retrieve(self, request, pk=None):
         """
         GET /api/debts/{id}/
@@ -134,7 +192,13 @@ class DebtViewSet(viewsets.ViewSet):
         )
         
         # Güncelle
-        updated_debt = repository.update(int(pk), debt_dto)
+        try:
+            updated_debt = repository.update(int(pk), debt_dto)
+        except DebtHasPaymentsError as exc:
+            return Response(
+                {'amount': [str(exc)]},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
         if not updated_debt:
             return Response(
@@ -176,7 +240,13 @@ class DebtViewSet(viewsets.ViewSet):
         )
         
         # Güncelle
-        updated_debt = repository.update(int(pk), debt_dto)
+        try:
+            updated_debt = repository.update(int(pk), debt_dto)
+        except DebtHasPaymentsError as exc:
+            return Response(
+                {'amount': [str(exc)]},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
         if not updated_debt:
             return Response(
@@ -194,7 +264,13 @@ class DebtViewSet(viewsets.ViewSet):
         Borç kaydını sil
         """
         repository = DebtRepository()
-        success = repository.delete(int(pk))
+        try:
+            success = repository.delete(int(pk))
+        except DebtHasPaymentsError as exc:
+            return Response(
+                {'detail': str(exc)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
         if not success:
             return Response(
@@ -232,7 +308,13 @@ class DebtViewSet(viewsets.ViewSet):
         Borcu ödenmedi olarak işaretle
         """
         repository = DebtRepository()
-        success = repository.mark_as_unpaid(int(pk))
+        try:
+            success = repository.mark_as_unpaid(int(pk))
+        except DebtHasPaymentsError as exc:
+            return Response(
+                {'detail': str(exc)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
         if not success:
             return Response(
@@ -245,4 +327,132 @@ class DebtViewSet(viewsets.ViewSet):
         serializer = DebtSerializer(debt.to_dict())
         
         return Response(serializer.data)
-
+    
+    @action(detail=False, methods=['post'])
+    def bulk_mark_paid(self, request):
+        """
+        POST /api/debts/bulk_mark_paid/
+        {"ids": [1, 2, 3]} veya {"customer_id": 5, "date_to": "2024-12-31"}
+        Seçilen ödenmemiş borçları tek bir UPDATE ile ödendi olarak işaretle
+        """
+        serializer = DebtBulkStatusSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        filters = dict(serializer.validated_data)
+        
+        result = DebtRepository().bulk_mark_as_paid(
+            debt_ids=filters.pop('ids', None),
+            user_id=request.user.id if request.user.is_authenticated else None,
+            **filters,
+        )
+        return Response(DebtBulkUpdateResultSerializer(result.to_dict()).data)
+    
+    @action(detail=False, methods=['post'])
+    def bulk_mark_unpaid(self, request):
+        """
+        POST /api/debts/bulk_mark_unpaid/
+        Seçilen ödenmiş borçları tek bir UPDATE ile ödenmedi olarak işaretle
+        """
+        serializer = DebtBulkStatusSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        filters = dict(serializer.validated_data)
+        
+        result = DebtRepository().bulk_mark_as_unpaid(
+            debt_ids=filters.pop('ids', None),
+            **filters,
+        )
+        return Response(DebtBulkUpdateResultSerializer(result.to_dict()).data)
+    
+    @action(detail=False, methods=['post'], url_path='import')
+    def import_ledger(self, request):
+        """
+        POST /api/debts/import/
+        Eski defter kayıtlarını CSV veya JSON Lines dosyasından toplu içe aktar
+        
+        multipart alanları: file, file_type (csv/jsonl, opsiyonel), dry_run
+        Hatalı satırlar atlanır ve satır numarasıyla raporlanır.
+        """
+        upload = request.FILES.get('file')
+        if upload is None:
+            return Response(
+                {'detail': 'Dosya gereklidir (file alanı).'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        file_type = (request.data.get('file_type') or detect_format(upload.name) or '').lower()
+        if file_type not in SUPPORTED_FORMATS:
+            return Response(
+                {'detail': 'Desteklenmeyen dosya türü. csv veya jsonl kullanın.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        dry_run = str(request.data.get('dry_run', '')).lower() == 'true'
+        
+        # Yükleme parça parça okunur; dosya belleğe tamamen alınmaz
+        stream = io.TextIOWrapper(upload.file, encoding='utf-8-sig', newline='')
+        service = LedgerImportService(CustomerRepository(), DebtRepository())
+        try:
+            result = service.import_rows(
+                read_ledger_rows(stream, file_type),
+                created_by_id=request.user.id if request.user.is_authenticated else None,
+                dry_run=dry_run,
+            )
+        except UnicodeDecodeError:
+            return Response(
+                {'detail': 'Dosya UTF-8 olarak okunamadı.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        finally:
+            stream.detach()
+        
+        return Response(result.to_dict())
+    
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        """
+        GET /api/debts/export/?file_type=csv&customer_id=1&date_from=2024-01-01&date_to=2024-12-31
+        Borç defterini CSV (akış halinde) veya XLSX olarak indir
+        
+        Filtreler: customer_id, debt_type, is_paid, date_from, date_to (kayıt tarihi, dahil)
+        """
+        file_type = request.query_params.get('file_type', 'csv').lower()
+        if file_type not in ('csv', 'xlsx'):
+            return Response(
+                {'file_type': ['csv veya xlsx olmalıdır.']},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        is_paid = request.query_params.get('is_paid', None)
+        is_paid_filter = None
+        if is_paid is not None:
+            is_paid_filter = is_paid.lower() == 'true'
+        
+        filters = {
+            'debt_type': request.query_params.get('debt_type') or None,
+            'is_paid': is_paid_filter,
+        }
+        errors = {}
+        
+        customer_id = request.query_params.get('customer_id')
+        if customer_id:
+            try:
+                filters['customer_id'] = int(customer_id)
+            except ValueError:
+                errors['customer_id'] = ['Geçerli bir sayı giriniz.']
+        
+        for param in ('date_from', 'date_to'):
+            value = request.query_params.get(param)
+            if value:
+                try:
+                    filters[param] = date.fromisoformat(value)
+                except ValueError:
+                    errors[param] = ['Tarih YYYY-AA-GG biçiminde olmalıdır.']
+        
+        if errors:
+            return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+        
+        rows = DebtRepository().iter_export_rows(**filters)
+        filename = f'defter-{date.today().isoformat()}.{file_type}'
+        
+        if file_type == 'xlsx':
+            return xlsx_response(rows, filename)
+        return csv_response(rows, filename)
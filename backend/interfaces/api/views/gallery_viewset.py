@@ -8,9 +8,13 @@ from rest_framework.permissions import IsAdminUser, AllowAny
 
 from backend.interfaces.api.serializers.gallery_serializer import (
     GalleryImageSerializer,
+    GalleryImageAdminSerializer,
     GalleryImageListSerializer,
 )
 from backend.infrastructure.repositories import GalleryRepository
+from backend.interfaces.api.pagination import paginated_response
+from backend.interfaces.api.caching import cached_view
+from backend.core.models import GalleryImage
 from backend.application.dtos.gallery_dto import GalleryImageDTO
 
 
@@ -32,10 +36,11 @@ class GalleryViewSet(viewsets.ViewSet):
             return GalleryImageListSerializer
         return GalleryImageSerializer
     
+    @cached_view(GalleryImage.CACHE_NAMESPACE, per_user=False)
     def list(self, request):
         """
-        GET /api/gallery/
-        Galeri resmi listesi
+        GET /api/gallery/?limit=50&cursor=...
+        Galeri resmi listesi (cursor sayfalama, cache'li + ETag)
         """
         repository = GalleryRepository()
         
@@ -47,20 +52,21 @@ class GalleryViewSet(viewsets.ViewSet):
         if is_active is not None:
             is_active_filter = is_active.lower() == 'true'
         
-        images = repository.get_all(is_active=is_active_filter)
-        
-        # Serialize
-        serializer = GalleryImageListSerializer([img.to_dict() for img in images], many=True)
-        
-        return Response({
-            'count': len(images),
-            'results': serializer.data
-        })
+        return paginated_response(
+            request,
+            lambda limit, cursor: repository.get_page(
+                is_active=is_active_filter,
+                limit=limit,
+                cursor=cursor,
+            ),
+            GalleryImageListSerializer,
+        )
     
+    @cached_view(GalleryImage.CACHE_NAMESPACE, per_user=False)
     def retrieve(self, request, pk=None):
         """
         GET /api/gallery/{id}/
-        Tek galeri resmi detayı
+        Tek galeri resmi detayı (cache'li + ETag)
         """
         repository = GalleryRepository()
         image = repository.get_by_id(int(pk))
@@ -71,6 +77,7 @@ class GalleryViewSet(viewsets.ViewSet):
                 status=status.HTTP_404_NOT_FOUND
             )
         
+        # Herkese açık (ve paylaşılan cache'e yazılan) yanıtta işleme hatası yok
         serializer = GalleryImageSerializer(image.to_dict())
         return Response(serializer.data)
     
@@ -104,7 +111,7 @@ class GalleryViewSet(viewsets.ViewSet):
         image = repository.create(gallery_dto, image_file)
         
         # Response
-        response_serializer = GalleryImageSerializer(image.to_dict())
+        response_serializer = GalleryImageAdminSerializer(image.to_dict())
         return Response(
             response_serializer.data,
             status=status.HTTP_201_CREATED
@@ -146,7 +153,7 @@ class GalleryViewSet(viewsets.ViewSet):
             )
         
         # Response
-        response_serializer = GalleryImageSerializer(updated_image.to_dict())
+        response_serializer = GalleryImageAdminSerializer(updated_image.to_dict())
         return Response(response_serializer.data)
     
     def partial_update(self, request, pk=None):
@@ -186,7 +193,7 @@ class GalleryViewSet(viewsets.ViewSet):
             )
         
         # Response
-        response_serializer = GalleryImageSerializer(updated_image.to_dict())
+        response_serializer = GalleryImageAdminSerializer(updated_image.to_dict())
         return Response(response_serializer.data)
     
     def destroy(self, request, pk=None):
@@ -0,0 +1,102 @@
+"""
+Payment ViewSet for API endpoints.
+"""
+from rest_framework import viewsets, status
+from rest_framework.response import Response
+from rest_framework.permissions import IsAdminUser
+
+from backend.interfaces.api.serializers.payment_serializer import PaymentSerializer
+from backend.infrastructure.repositories import PaymentRepository
+from backend.interfaces.api.pagination import paginated_response
+from backend.interfaces.api.caching import cached_view
+from backend.core.models import Payment
+from backend.application.dtos.payment_dto import PaymentDTO
+from backend.application.exceptions import PaymentAllocationError
+
+
+class PaymentViewSet(viewsets.ViewSet):
+    """
+    Payment ViewSet
+    Kısmi/tam ödeme kayıtları (oluşturma ve listeleme)
+    """
+    permission_classes = [IsAdminUser]
+    
+    @cached_view(Payment.CACHE_NAMESPACE)
+    def list(self, request):
+        """
+        GET /api/payments/?customer_id=1&limit=50&cursor=...
+        Ödeme listesi (en yeni önce, cursor sayfalama)
+        """
+        repository = PaymentRepository()
+        
+        customer_id = request.query_params.get('customer_id')
+        customer_id_filter = None
+        if customer_id:
+            try:
+                customer_id_filter = int(customer_id)
+            except ValueError:
+                return Response(
+                    {'customer_id': ['Geçerli bir sayı giriniz.']},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+        
+        return paginated_response(
+            request,
+            lambda limit, cursor: repository.get_page(
+                customer_id=customer_id_filter,
+                limit=limit,
+                cursor=cursor,
+            ),
+            PaymentSerializer,
+        )
+    
+    @cached_view(Payment.CACHE_NAMESPACE)
+    def retrieve(self, request, pk=None):
+        """
+        GET /api/payments/{id}/
+        Tek ödeme ve borçlara dağılımı
+        """
+        payment = PaymentRepository().get_by_id(int(pk))
+        
+        if not payment:
+            return Response(
+                {'detail': 'Ödeme bulunamadı.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        
+        return Response(PaymentSerializer(payment.to_dict()).data)
+    
+    def create(self, request):
+        """
+        POST /api/payments/
+        Ödeme kaydet; tutar açık borçlara en eskiden başlayarak dağıtılır
+        """
+        serializer = PaymentSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        
+        payment_dto = PaymentDTO(
+            customer_id=serializer.validated_data['customer_id'],
+            debt_id=serializer.validated_data.get('debt_id'),
+            amount=serializer.validated_data['amount'],
+            notes=serializer.validated_data.get('notes') or None,
+            paid_by_id=request.user.id if request.user.is_authenticated else None,
+        )
+        
+        try:
+            payment = PaymentRepository().create(payment_dto)
+        except PaymentAllocationError as exc:
+            return Response(
+                {'amount': [str(exc)]},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        if payment is None:
+            return Response(
+                {'customer_id': ['Müşteri bulunamadı.']},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        return Response(
+            PaymentSerializer(payment.to_dict()).data,
+            status=status.HTTP_201_CREATED
+        )
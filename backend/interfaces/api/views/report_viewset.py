@@ -0,0 +1,117 @@
+"""
+Report ViewSet for API endpoints.
+"""
+from datetime import date, timedelta
+
+from django.utils import timezone
+from rest_framework import viewsets, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.permissions import IsAdminUser
+
+from backend.core.models import Debt
+from backend.core.utils.rollup import INTERVALS, WEEK, period_count
+from backend.interfaces.api.serializers.report_serializer import AgingReportSerializer, TimeseriesSerializer
+from backend.infrastructure.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from backend.infrastructure.repositories import ReportRepository
+
+
+class ReportViewSet(viewsets.ViewSet):
+    """
+    Report ViewSet
+    Admin paneli raporları
+    """
+    permission_classes = [IsAdminUser]
+    
+    # Varsayılan zaman serisi aralığı (gün) ve tek yanıttaki en çok dönem
+    TIMESERIES_DEFAULT_DAYS = 365
+    MAX_TIMESERIES_PERIODS = 1000
+    
+    @action(detail=False, methods=['get'])
+    def aging(self, request):
+        """
+        GET /api/reports/aging/?date=2024-12-31&live=false&limit=50
+        Vadesi geçmiş borçların 0-30 / 31-60 / 61-90 / 90+ gün dilimlerine dağılımı
+        
+        Bugünün raporu borç kayıtlarından canlı hesaplanır. date geçmiş bir
+        gün ise o günün görüntüsü (materialize_aging) döner; source ve
+        generated_at alanları verinin ne zamana ait olduğunu gösterir.
+        customers en yüksek toplamdan başlar.
+        """
+        errors = {}
+        as_of = None
+        
+        value = request.query_params.get('date')
+        if value:
+            try:
+                as_of = date.fromisoformat(value)
+            except ValueError:
+                errors['date'] = ['Tarih YYYY-AA-GG biçiminde olmalıdır.']
+        
+        try:
+            limit = int(request.query_params.get('limit', DEFAULT_PAGE_SIZE))
+            if limit < 1 or limit > MAX_PAGE_SIZE:
+                errors['limit'] = [f'1 ile {MAX_PAGE_SIZE} arasında olmalıdır.']
+        except (TypeError, ValueError):
+            errors['limit'] = ['Geçerli bir sayı giriniz.']
+        
+        if errors:
+            return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+        
+        live = request.query_params.get('live', '').lower() == 'true'
+        report = ReportRepository().get_aging(as_of=as_of, limit=limit, live=live)
+        
+        if report is None:
+            return Response(
+                {'detail': 'Bu tarih için yaşlandırma görüntüsü bulunamadı.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        
+        return Response(AgingReportSerializer(report.to_dict()).data)
+    
+    @action(detail=False, methods=['get'])
+    def timeseries(self, request):
+        """
+        GET /api/reports/timeseries/?date_from=2024-01-01&date_to=2024-12-31&interval=week&debt_type=DEBT
+        Dönemlik açılan, ödenen ve dönem sonu açık tutarlar (borç türü başına)
+        
+        Günlük defter özetlerinden okunur; bir yıllık grafik en çok birkaç
+        yüz özet satırı okur. Varsayılan aralık son 365 gün, dönem haftadır.
+        """
+        errors = {}
+        dates = {}
+        
+        for param in ('date_from', 'date_to'):
+            value = request.query_params.get(param)
+            if value:
+                try:
+                    dates[param] = date.fromisoformat(value)
+                except ValueError:
+                    errors[param] = ['Tarih YYYY-AA-GG biçiminde olmalıdır.']
+        
+        interval = request.query_params.get('interval', WEEK)
+        if interval not in INTERVALS:
+            errors['interval'] = [f'Geçerli değerler: {", ".join(INTERVALS)}.']
+        
+        debt_type = request.query_params.get('debt_type') or None
+        if debt_type is not None and debt_type not in Debt.DebtType.values:
+            errors['debt_type'] = [f'Geçerli değerler: {", ".join(Debt.DebtType.values)}.']
+        
+        if errors:
+            return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+        
+        date_to = dates.get('date_to') or timezone.localdate()
+        date_from = dates.get('date_from') or date_to - timedelta(days=self.TIMESERIES_DEFAULT_DAYS - 1)
+        if date_from > date_to:
+            return Response(
+                {'date_from': ['Başlangıç tarihi bitiş tarihinden sonra olamaz.']},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if period_count(date_from, date_to, interval) > self.MAX_TIMESERIES_PERIODS:
+            return Response(
+                {'interval': [f'En çok {self.MAX_TIMESERIES_PERIODS} dönem istenebilir; daha uzun bir dönem seçiniz.']},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        series = ReportRepository().get_timeseries(date_from, date_to, interval=interval, debt_type=debt_type)
+        return Response(TimeseriesSerializer(series.to_dict()).data)
@@ -0,0 +1,44 @@
+"""
+Sync ViewSet for API endpoints.
+"""
+from rest_framework import viewsets, status
+from rest_framework.response import Response
+from rest_framework.permissions import IsAdminUser
+
+from backend.interfaces.api.serializers.sync_serializer import SyncSerializer
+from backend.infrastructure.repositories import SyncRepository
+from backend.application.exceptions import InvalidSyncTokenError
+
+
+class SyncViewSet(viewsets.ViewSet):
+    """
+    Sync ViewSet
+    Müşteri ve borç kayıtları için delta senkronizasyon
+    """
+    permission_classes = [IsAdminUser]
+    
+    def list(self, request):
+        """
+        GET /api/sync/?since=<token>
+        Token'dan bu yana eklenen/güncellenen kayıtlar ve silinen id'ler.
+        since verilmezse yalnızca yeni token döner.
+        """
+        repository = SyncRepository()
+        
+        try:
+            changes = repository.get_changes(request.query_params.get('since') or None)
+        except InvalidSyncTokenError as exc:
+            return Response(
+                {'since': [str(exc)]},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        serializer = SyncSerializer({
+            'token': changes.token,
+            'reset': changes.reset,
+            'customers': [customer.to_dict() for customer in changes.customers],
+            'debts': [debt.to_dict() for debt in changes.debts],
+            'deleted_customer_ids': changes.deleted_customer_ids,
+            'deleted_debt_ids': changes.deleted_debt_ids,
+        })
+        return Response(serializer.data)
@@ -0,0 +1,3 @@
+"""
+Real-time (WebSocket) interface module.
+"""
@@ -0,0 +1,40 @@
+"""
+WebSocket consumers for admin real-time updates.
+"""
+from channels.generic.websocket import AsyncJsonWebsocketConsumer
+
+from backend.core.realtime import LEDGER_GROUP
+
+# Uygulamaya özel kapanış kodu: kimlik doğrulanamadı veya yetki yok
+CLOSE_UNAUTHORIZED = 4401
+
+
+class LedgerConsumer(AsyncJsonWebsocketConsumer):
+    """
+    WS /ws/ledger/?token=<access>
+    
+    Müşteri, borç ve iletişim mesajı değişikliklerini bağlı admin
+    oturumlarına iletir. Olaylar yalnızca değişen id'leri taşır; istemci
+    kayıtları /api/sync/ ile çeker.
+    """
+    
+    async def connect(self):
+        user = self.scope.get('user')
+        if user is None or not user.is_active or not user.is_staff:
+            await self.close(code=CLOSE_UNAUTHORIZED)
+            return
+        
+        await self.channel_layer.group_add(LEDGER_GROUP, self.channel_name)
+        await self.accept()
+    
+    async def disconnect(self, code):
+        await self.channel_layer.group_discard(LEDGER_GROUP, self.channel_name)
+    
+    async def receive_json(self, content, **kwargs):
+        """İstemci mesajları yalnızca bağlantı kontrolü içindir"""
+        if content.get('type') == 'ping':
+            await self.send_json({'type': 'pong'})
+    
+    async def ledger_change(self, message):
+        """backend.core.realtime.publish_change tarafından gönderilen olay"""
+        await self.send_json(message['event'])
@@ -0,0 +1,39 @@
+"""
+JWT authentication middleware for WebSocket connections.
+
+Tarayıcılar WebSocket el sıkışmasında Authorization başlığı gönderemediği
+için erişim token'ı query string'den okunur: /ws/ledger/?token=<access>
+"""
+from urllib.parse import parse_qs
+
+from channels.db import database_sync_to_async
+from channels.middleware import BaseMiddleware
+from django.contrib.auth.models import AnonymousUser
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+
+
+@database_sync_to_async
+def _get_user(raw_token):
+    """SimpleJWT ile token'ı doğrula ve kullanıcıyı getir"""
+    authentication = JWTAuthentication()
+    try:
+        validated_token = authentication.get_validated_token(raw_token)
+        return authentication.get_user(validated_token)
+    except (InvalidToken, AuthenticationFailed):
+        return AnonymousUser()
+
+
+class JWTAuthMiddleware(BaseMiddleware):
+    """
+    scope['user'] alanını ?token= parametresindeki SimpleJWT erişim
+    token'ından doldurur; token yoksa veya geçersizse AnonymousUser olur.
+    """
+    
+    async def __call__(self, scope, receive, send):
+        query = parse_qs(scope.get('query_string', b'').decode())
+        raw_token = (query.get('token') or [None])[0]
+        
+        scope = dict(scope)
+        scope['user'] = await _get_user(raw_token.encode()) if raw_token else AnonymousUser()
+        return await super().__call__(scope, receive, send)
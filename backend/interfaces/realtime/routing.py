@@ -0,0 +1,10 @@
+"""
+WebSocket URL patterns for the backend application.
+"""
+from django.urls import path
+
+from backend.interfaces.realtime.consumers import LedgerConsumer
+
+websocket_urlpatterns = [
+    path('ws/ledger/', LedgerConsumer.as_asgi()),
+]
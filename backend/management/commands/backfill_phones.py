@@ -0,0 +1,87 @@
+"""
+Fill the normalized phone columns (phone_e164, phone_reversed) for every customer.
+
+Kullanım:
+    python manage.py backfill_phones
+    python manage.py backfill_phones --dry-run
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from backend.core.cache import bump_version
+from backend.core.models import Customer
+from backend.core.utils.phone import normalize_phone, reversed_digits
+
+
+class Command(BaseCommand):
+    help = 'Müşteri telefonlarını E.164 biçiminde normalize eder ve son rakam index\'ini doldurur.'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Değişiklik yapmadan sadece raporla.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Toplu yazma boyutu (varsayılan 1000).',
+        )
+    
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        batch_size = options['batch_size']
+        
+        owners = {}
+        changed = []
+        invalid = []
+        duplicates = []
+        
+        customers = Customer.objects.order_by('created_at', 'id').only(
+            'id', 'phone', 'phone_e164', 'phone_reversed'
+        )
+        for customer in customers.iterator(chunk_size=batch_size):
+            e164 = normalize_phone(customer.phone)
+            if e164 is None:
+                invalid.append(customer)
+            elif e164 in owners:
+                duplicates.append((customer, owners[e164]))
+                e164 = None
+            else:
+                owners[e164] = customer.id
+            
+            reversed_phone = reversed_digits(e164 or customer.phone)
+            if customer.phone_e164 != e164 or customer.phone_reversed != reversed_phone:
+                customer.phone_e164 = e164
+                customer.phone_reversed = reversed_phone
+                changed.append(customer)
+        
+        for customer in invalid:
+            self.stdout.write(self.style.WARNING(
+                f'Tanınmayan telefon biçimi: müşteri #{customer.id} "{customer.phone}"'
+            ))
+        for customer, owner_id in duplicates:
+            self.stdout.write(self.style.WARNING(
+                f'Yinelenen telefon: müşteri #{customer.id} "{customer.phone}" '
+                f'müşteri #{owner_id} ile aynı numara'
+            ))
+        
+        if not dry_run and changed:
+            with transaction.atomic():
+                # Önce eski değerleri temizle; aksi halde yer değiştiren numaralar
+                # unique kısıtına takılır
+                for start in range(0, len(changed), batch_size):
+                    chunk_ids = [c.id for c in changed[start:start + batch_size]]
+                    Customer.objects.filter(id__in=chunk_ids).update(phone_e164=None)
+                Customer.objects.bulk_update(
+                    changed,
+                    ['phone_e164', 'phone_reversed'],
+                    batch_size=batch_size,
+                )
+                bump_version(Customer.CACHE_NAMESPACE)
+        
+        action = 'güncellenecek' if dry_run else 'güncellendi'
+        self.stdout.write(self.style.SUCCESS(
+            f'{len(changed)} müşteri {action}; {len(invalid)} tanınmayan, {len(duplicates)} yinelenen numara.'
+        ))
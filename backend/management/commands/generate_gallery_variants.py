@@ -0,0 +1,52 @@
+"""
+Generate responsive WebP/AVIF variants for existing gallery images.
+
+Kullanım:
+    python manage.py generate_gallery_variants          # varyantı olmayanlar
+    python manage.py generate_gallery_variants --force  # hepsini yeniden üret
+    python manage.py generate_gallery_variants --ids 3 7
+"""
+from django.core.management.base import BaseCommand
+
+from backend.core.models import GalleryImage
+
+
+class Command(BaseCommand):
+    help = 'Galeri resimleri için yeniden boyutlandırılmış varyantları ve önizlemeleri üretir.'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Varyantı olan resimleri de yeniden üret.',
+        )
+        parser.add_argument(
+            '--ids',
+            nargs='+',
+            type=int,
+            help='Sadece verilen ID\'lerdeki resimler.',
+        )
+    
+    def handle(self, *args, **options):
+        queryset = GalleryImage.objects.order_by('id')
+        if options['ids']:
+            queryset = queryset.filter(id__in=options['ids'])
+        if not options['force']:
+            queryset = queryset.filter(variants={})
+        
+        generated = 0
+        failed = 0
+        for gallery_image in queryset.iterator(chunk_size=100):
+            try:
+                gallery_image.generate_variants()
+            except (OSError, ValueError) as exc:
+                failed += 1
+                self.stderr.write(f'#{gallery_image.pk} ({gallery_image.image.name}): {exc}')
+                continue
+            generated += 1
+        
+        message = f'{generated} resim için varyant üretildi, {failed} hata.'
+        if failed:
+            self.stdout.write(self.style.WARNING(message))
+        else:
+            self.stdout.write(self.style.SUCCESS(message))
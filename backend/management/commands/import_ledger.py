@@ -0,0 +1,89 @@
+"""
+Import legacy ledger rows (debts/credits) from a CSV or JSON Lines file.
+
+Kullanım:
+    python manage.py import_ledger defter.csv
+    python manage.py import_ledger defter.jsonl --dry-run
+    python manage.py import_ledger defter.txt --file-type csv --user admin
+"""
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from backend.application.services.ledger_import_service import (
+    DEFAULT_BATCH_SIZE,
+    LedgerImportService,
+    SUPPORTED_FORMATS,
+    detect_format,
+    read_ledger_rows,
+)
+from backend.infrastructure.repositories import CustomerRepository, DebtRepository
+
+MAX_REPORTED_ERRORS = 50
+
+
+class Command(BaseCommand):
+    help = 'Borç/alacak kayıtlarını CSV veya JSON Lines dosyasından toplu içe aktarır.'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='İçe aktarılacak dosya.')
+        parser.add_argument(
+            '--file-type',
+            choices=SUPPORTED_FORMATS,
+            help='Dosya biçimi (varsayılan: uzantıdan tahmin edilir).',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f'Batch başına satır sayısı (varsayılan {DEFAULT_BATCH_SIZE}).',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Sadece doğrula; veritabanına yazma.',
+        )
+        parser.add_argument(
+            '--user',
+            help='Kayıtları oluşturan kullanıcı adı.',
+        )
+    
+    def handle(self, *args, **options):
+        path = options['path']
+        file_type = options['file_type'] or detect_format(path)
+        if file_type is None:
+            raise CommandError('Dosya biçimi tahmin edilemedi; --file-type kullanın.')
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size en az 1 olmalıdır.')
+        
+        created_by_id = None
+        if options['user']:
+            try:
+                created_by_id = User.objects.get(username=options['user']).id
+            except User.DoesNotExist:
+                raise CommandError(f'Kullanıcı bulunamadı: {options["user"]}')
+        
+        service = LedgerImportService(CustomerRepository(), DebtRepository())
+        try:
+            with open(path, encoding='utf-8-sig', newline='') as stream:
+                result = service.import_rows(
+                    read_ledger_rows(stream, file_type),
+                    created_by_id=created_by_id,
+                    batch_size=options['batch_size'],
+                    dry_run=options['dry_run'],
+                )
+        except OSError as exc:
+            raise CommandError(f'Dosya okunamadı: {exc}')
+        except UnicodeDecodeError:
+            raise CommandError('Dosya UTF-8 olarak okunamadı.')
+        
+        for error in result.errors[:MAX_REPORTED_ERRORS]:
+            self.stderr.write(f'Satır {error.line}: {"; ".join(error.errors)}')
+        if result.failed > MAX_REPORTED_ERRORS:
+            self.stderr.write(f'... ve {result.failed - MAX_REPORTED_ERRORS} hata daha.')
+        
+        verb = 'doğrulandı' if result.dry_run else 'içe aktarıldı'
+        message = f'{result.total_rows} satırdan {result.imported} kayıt {verb}, {result.failed} satır hatalı.'
+        if result.failed:
+            self.stdout.write(self.style.WARNING(message))
+        else:
+            self.stdout.write(self.style.SUCCESS(message))
@@ -0,0 +1,42 @@
+"""
+Materialize the daily overdue debt aging snapshot.
+
+Kullanım:
+    python manage.py materialize_aging              # bugünün görüntüsünü yaz (tekrar çalıştırılabilir)
+    python manage.py materialize_aging --keep 60    # 60 günden eski görüntüleri sil
+
+Gece çalıştırılması önerilir (ör. cron: 5 0 * * *). /api/reports/aging/
+bugünün raporunu canlı hesaplar; geçmiş günleri (?date=) bu görüntülerden okur.
+"""
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from backend.core.models import AgingSnapshot
+from backend.infrastructure.repositories import ReportRepository
+
+
+class Command(BaseCommand):
+    help = 'Vadesi geçmiş borçların günlük yaşlandırma görüntüsünü yazar.'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--keep',
+            type=int,
+            default=90,
+            help='Bu günden eski görüntüleri sil (varsayılan 90).',
+        )
+    
+    def handle(self, *args, **options):
+        keep = options['keep']
+        if keep < 1:
+            raise CommandError('--keep en az 1 olmalıdır.')
+        
+        as_of = timezone.localdate()
+        customers = ReportRepository().materialize_aging(as_of)
+        
+        pruned, _ = AgingSnapshot.objects.filter(as_of__lt=as_of - timedelta(days=keep)).delete()
+        self.stdout.write(self.style.SUCCESS(
+            f'{as_of} yaşlandırma görüntüsü yazıldı ({customers} müşteri); {pruned} eski satır silindi.'
+        ))
@@ -0,0 +1,39 @@
+"""
+Delete deletion tombstones older than the sync retention window.
+
+Kullanım:
+    python manage.py prune_tombstones            # SYNC_TOMBSTONE_RETENTION'dan eski izleri sil
+    python manage.py prune_tombstones --days 60  # 60 günden eski izleri sil
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from backend.core.models import DeletionTombstone
+
+
+class Command(BaseCommand):
+    help = 'Saklama süresini aşan silinme izlerini (delta sync) temizler.'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=None,
+            help='Bu günden eski izleri sil (varsayılan SYNC_TOMBSTONE_RETENTION).',
+        )
+    
+    def handle(self, *args, **options):
+        days = options['days']
+        if days is not None and days < 1:
+            raise CommandError('--days en az 1 olmalıdır.')
+        
+        # SyncRepository yalnızca SYNC_TOMBSTONE_RETENTION'dan eski token'lara reset
+        # döndürür; daha kısa --days ile bu aralıktaki token'lar silinmeleri kaçırabilir
+        retention = timedelta(days=days) if days is not None else settings.SYNC_TOMBSTONE_RETENTION
+        cutoff = timezone.now() - retention
+        
+        deleted, _ = DeletionTombstone.objects.filter(deleted_at__lt=cutoff).delete()
+        self.stdout.write(self.style.SUCCESS(f'{deleted} silinme izi temizlendi.'))
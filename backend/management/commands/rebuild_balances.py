@@ -0,0 +1,101 @@
+"""
+Recompute and verify every CustomerBalance row from the Debt ledger.
+
+Kullanım:
+    python manage.py rebuild_balances          # farkları düzelt
+    python manage.py rebuild_balances --check  # sadece doğrula, düzeltme yapma
+"""
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from backend.core.cache import bump_version
+from backend.core.models import Customer, CustomerBalance, Debt
+
+ZERO = Decimal('0.00')
+FIELDS = ('outstanding_debt', 'outstanding_credit', 'paid_total')
+
+
+class Command(BaseCommand):
+    help = 'Müşteri bakiyelerini borç kayıtlarından yeniden hesaplar ve doğrular.'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Sadece doğrula; farklı bakiye varsa hata koduyla çık.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Toplu yazma boyutu (varsayılan 1000).',
+        )
+    
+    def handle(self, *args, **options):
+        check_only = options['check']
+        batch_size = options['batch_size']
+        
+        # Tüm bakiyeler tek bir gruplu aggregate sorgusu ile hesaplanır
+        expected = {
+            row['customer_id']: row
+            for row in Debt.objects.order_by().values('customer_id').annotate(
+                **CustomerBalance.total_expressions()
+            )
+        }
+        stored = {
+            balance.customer_id: balance
+            for balance in CustomerBalance.objects.all().iterator(chunk_size=batch_size)
+        }
+        
+        now = timezone.now()
+        to_create = []
+        to_update = []
+        checked = 0
+        
+        for customer_id in Customer.objects.values_list('id', flat=True).iterator(chunk_size=batch_size):
+            checked += 1
+            row = expected.get(customer_id, {})
+            values = {field: row.get(field) or ZERO for field in FIELDS}
+            balance = stored.get(customer_id)
+            
+            if balance is None:
+                to_create.append(CustomerBalance(
+                    customer_id=customer_id,
+                    last_activity_at=row.get('last_activity_at'),
+                    updated_at=now,
+                    **values
+                ))
+                continue
+            
+            if any(getattr(balance, field) != value for field, value in values.items()):
+                for field, value in values.items():
+                    setattr(balance, field, value)
+                balance.last_activity_at = row.get('last_activity_at')
+                balance.updated_at = now
+                to_update.append(balance)
+        
+        mismatches = len(to_create) + len(to_update)
+        self.stdout.write(
+            f'{checked} müşteri kontrol edildi: {len(to_create)} eksik, {len(to_update)} hatalı bakiye.'
+        )
+        
+        if check_only:
+            if mismatches:
+                raise CommandError(f'{mismatches} bakiye borç kayıtlarıyla uyuşmuyor.')
+            self.stdout.write(self.style.SUCCESS('Tüm bakiyeler doğru.'))
+            return
+        
+        with transaction.atomic():
+            CustomerBalance.objects.bulk_create(to_create, batch_size=batch_size)
+            CustomerBalance.objects.bulk_update(
+                to_update,
+                list(FIELDS) + ['last_activity_at', 'updated_at'],
+                batch_size=batch_size,
+            )
+            # Bakiyeler müşteri yanıtlarında yer alır
+            bump_version(Customer.CACHE_NAMESPACE)
+        
+        self.stdout.write(self.style.SUCCESS(f'{mismatches} bakiye düzeltildi.'))
@@ -0,0 +1,95 @@
+"""
+Verify and rebuild customer statements (LedgerEntry) from debts and payments.
+
+Kullanım:
+    python manage.py rebuild_ledger                # son bakiyesi tutmayan ekstreleri yeniden yaz
+    python manage.py rebuild_ledger --check        # sadece doğrula, düzeltme yapma
+    python manage.py rebuild_ledger --customer 42  # tek müşterinin ekstresini yeniden yaz
+    python manage.py rebuild_ledger --all          # tüm ekstreleri yeniden yaz
+
+Yeniden yazılan ekstrelerde silinmiş kayıtların düzeltme satırları kaybolur;
+bu yüzden varsayılan olarak yalnızca tutarsız ekstreler yeniden yazılır.
+"""
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import OuterRef, Subquery
+
+from backend.core.cache import bump_version
+from backend.core.models import Customer, CustomerBalance, Debt, LedgerEntry
+
+ZERO = Decimal('0.00')
+
+
+class Command(BaseCommand):
+    help = 'Müşteri ekstrelerini borç ve ödeme kayıtlarına göre doğrular ve yeniden yazar.'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Sadece doğrula; tutarsız ekstre varsa hata koduyla çık.',
+        )
+        parser.add_argument(
+            '--customer',
+            type=int,
+            help='Sadece bu müşterinin ekstresini yeniden yaz.',
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Tutarlı olanlar dahil tüm ekstreleri yeniden yaz.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=200,
+            help='Tek seferde yeniden yazılan müşteri sayısı (varsayılan 200).',
+        )
+    
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        
+        if options['customer'] is not None:
+            if not Customer.objects.filter(id=options['customer']).exists():
+                raise CommandError(f'Müşteri bulunamadı: {options["customer"]}')
+            targets = [options['customer']]
+        elif options['all']:
+            targets = list(Customer.objects.order_by('id').values_list('id', flat=True))
+        else:
+            targets = self._mismatched()
+            self.stdout.write(f'{len(targets)} tutarsız ekstre bulundu.')
+            if options['check']:
+                if targets:
+                    raise CommandError(f'{len(targets)} ekstrenin son bakiyesi borç kayıtlarıyla uyuşmuyor.')
+                self.stdout.write(self.style.SUCCESS('Tüm ekstreler doğru.'))
+                return
+        
+        written = 0
+        for start in range(0, len(targets), batch_size):
+            written += LedgerEntry.rebuild(targets[start:start + batch_size])
+        
+        if targets:
+            # Ekstre yanıtları borç ad alanı ile önbelleklenir
+            bump_version(Debt.CACHE_NAMESPACE)
+        self.stdout.write(self.style.SUCCESS(
+            f'{len(targets)} müşterinin ekstresi yeniden yazıldı ({written} satır).'
+        ))
+    
+    def _mismatched(self):
+        """Son ekstre bakiyesi açık borç - açık alacak değerine eşit olmayan müşteriler"""
+        # Beklenen değerler tek bir gruplu aggregate sorgusu ile hesaplanır
+        expected = {}
+        for row in Debt.objects.order_by().values('customer_id').annotate(**CustomerBalance.total_expressions()):
+            expected[row['customer_id']] = (row['outstanding_debt'] or ZERO) - (row['outstanding_credit'] or ZERO)
+        
+        last_balance = LedgerEntry.objects.filter(customer_id=OuterRef('pk')).order_by('-created_at', '-id')
+        stored = Customer.objects.annotate(
+            ledger_balance=Subquery(last_balance.values('balance_after')[:1])
+        ).values_list('id', 'ledger_balance')
+        
+        return [
+            customer_id
+            for customer_id, balance in stored.iterator(chunk_size=1000)
+            if (balance or ZERO) != expected.get(customer_id, ZERO)
+        ]
@@ -0,0 +1,61 @@
+"""
+Rebuild daily ledger rollups (DailyLedgerRollup) from debts and payments.
+
+Kullanım:
+    python manage.py rebuild_rollups                                      # ilk kayıttan bugüne
+    python manage.py rebuild_rollups --from 2026-01-01                    # 1 Ocak'tan bugüne
+    python manage.py rebuild_rollups --from 2026-01-01 --to 2026-03-31    # sadece ilk çeyrek
+
+Özetler borç yazımlarında artımlı güncellenir; bu komut geçmiş tarihli
+düzeltmelerden veya elle yapılan veri değişikliklerinden sonra aralığı
+kayıtlardan yeniden türetir. Aralık boyunca satırlar kilitlendiği için
+uzun aralıklar sakin saatlerde çalıştırılmalıdır.
+"""
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from backend.core.models import DailyLedgerRollup, Debt
+from backend.core.utils.rollup import first_day
+
+
+def _parse_date(value: str) -> date:
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise CommandError(f'Tarih YYYY-AA-GG biçiminde olmalıdır: {value}')
+
+
+class Command(BaseCommand):
+    help = 'Günlük defter özetlerini borç ve ödeme kayıtlarından yeniden hesaplar.'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--from',
+            dest='date_from',
+            help='Başlangıç günü (YYYY-AA-GG, varsayılan ilk kayıt günü).',
+        )
+        parser.add_argument(
+            '--to',
+            dest='date_to',
+            help='Bitiş günü (YYYY-AA-GG, varsayılan bugün).',
+        )
+    
+    def handle(self, *args, **options):
+        date_to = _parse_date(options['date_to']) if options['date_to'] else timezone.localdate()
+        if options['date_from']:
+            date_from = _parse_date(options['date_from'])
+        else:
+            date_from = first_day(Debt)
+            if date_from is None:
+                self.stdout.write('Borç kaydı yok; yeniden hesaplanacak özet bulunmuyor.')
+                return
+        
+        if date_from > date_to:
+            raise CommandError('--from, --to tarihinden sonra olamaz.')
+        
+        written = DailyLedgerRollup.rebuild(date_from, date_to)
+        self.stdout.write(self.style.SUCCESS(
+            f'{date_from} - {date_to} aralığında {written} günlük özet satırı yazıldı.'
+        ))
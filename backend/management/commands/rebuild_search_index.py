@@ -0,0 +1,46 @@
+"""
+Rebuild the customer search index from scratch.
+
+Kullanım:
+    python manage.py rebuild_search_index
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from backend.core.models import Customer, CustomerSearchTerm
+
+
+class Command(BaseCommand):
+    help = 'Müşteri arama index\'ini tüm müşteriler için yeniden oluşturur.'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Toplu yazma boyutu (varsayılan 1000).',
+        )
+    
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        customers = Customer.objects.only('id', 'first_name', 'last_name', 'phone', 'email')
+        
+        total_terms = 0
+        with transaction.atomic():
+            CustomerSearchTerm.objects.all().delete()
+            batch = []
+            for customer in customers.iterator(chunk_size=batch_size):
+                batch.extend(
+                    CustomerSearchTerm(customer_id=customer.id, term=term, kind=kind)
+                    for term, kind in CustomerSearchTerm.terms_for(
+                        customer.first_name, customer.last_name, customer.phone, customer.email
+                    )
+                )
+                if len(batch) >= batch_size:
+                    CustomerSearchTerm.objects.bulk_create(batch)
+                    total_terms += len(batch)
+                    batch = []
+            CustomerSearchTerm.objects.bulk_create(batch)
+            total_terms += len(batch)
+        
+        self.stdout.write(self.style.SUCCESS(f'{total_terms} arama terimi oluşturuldu.'))
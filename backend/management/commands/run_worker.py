@@ -0,0 +1,64 @@
+"""
+Run the database-backed background job worker.
+
+Kullanım:
+    python manage.py run_worker            # sürekli çalış (systemd/supervisor altında)
+    python manage.py run_worker --once     # kuyruğu boşalt ve çık (cron)
+"""
+import signal
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from backend.core.jobs import run_next_job
+
+
+class Command(BaseCommand):
+    help = 'Arka plan işlerini (resim işleme vb.) kuyruktan alıp çalıştırır.'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Bekleyen işleri çalıştır ve çık.',
+        )
+        parser.add_argument(
+            '--sleep',
+            type=float,
+            default=2.0,
+            help='Kuyruk boşken bekleme süresi, saniye (varsayılan 2).',
+        )
+        parser.add_argument(
+            '--max-jobs',
+            type=int,
+            default=0,
+            help='Bu kadar iş çalıştırdıktan sonra çık (0: sınırsız).',
+        )
+    
+    def handle(self, *args, **options):
+        self._stopping = False
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+        
+        processed = 0
+        while not self._stopping:
+            close_old_connections()
+            job = run_next_job()
+            
+            if job is None:
+                if options['once']:
+                    break
+                time.sleep(options['sleep'])
+                continue
+            
+            processed += 1
+            self.stdout.write(f'{job.task} #{job.pk}: {job.get_status_display()}')
+            if options['max_jobs'] and processed >= options['max_jobs']:
+                break
+        
+        self.stdout.write(self.style.SUCCESS(f'{processed} iş çalıştırıldı.'))
+    
+    def _stop(self, signum, frame):
+        """Çalışan iş bitince dur"""
+        self._stopping = True
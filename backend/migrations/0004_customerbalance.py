@@ -0,0 +1,65 @@
+# Generated by Django 4.2.15 on 2026-10-18 07:14
+
+from decimal import Decimal
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+def backfill_balances(apps, schema_editor):
+    """Mevcut müşteriler için bakiyeleri tek bir gruplu sorgu ile hesapla"""
+    from django.db.models import Max, Q, Sum
+
+    Customer = apps.get_model('backend', 'Customer')
+    Debt = apps.get_model('backend', 'Debt')
+    CustomerBalance = apps.get_model('backend', 'CustomerBalance')
+
+    totals = {
+        row['customer_id']: row
+        for row in Debt.objects.values('customer_id').annotate(
+            outstanding_debt=Sum('amount', filter=Q(is_paid=False, debt_type='DEBT')),
+            outstanding_credit=Sum('amount', filter=Q(is_paid=False, debt_type='CREDIT')),
+            paid_total=Sum('amount', filter=Q(is_paid=True)),
+            last_activity_at=Max('updated_at'),
+        )
+    }
+
+    now = django.utils.timezone.now()
+    balances = []
+    for customer_id in Customer.objects.values_list('id', flat=True).iterator():
+        row = totals.get(customer_id, {})
+        balances.append(CustomerBalance(
+            customer_id=customer_id,
+            outstanding_debt=row.get('outstanding_debt') or Decimal('0.00'),
+            outstanding_credit=row.get('outstanding_credit') or Decimal('0.00'),
+            paid_total=row.get('paid_total') or Decimal('0.00'),
+            last_activity_at=row.get('last_activity_at'),
+            updated_at=now,
+        ))
+    CustomerBalance.objects.bulk_create(balances, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0003_contactmessage'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CustomerBalance',
+            fields=[
+                ('customer', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='balance', serialize=False, to='backend.customer', verbose_name='Müşteri')),
+                ('outstanding_debt', models.DecimalField(decimal_places=2, default=Decimal('0.00'), help_text='Ödenmemiş borç kayıtlarının toplamı', max_digits=14, verbose_name='Açık Borç')),
+                ('outstanding_credit', models.DecimalField(decimal_places=2, default=Decimal('0.00'), help_text='Ödenmemiş alacak kayıtlarının toplamı', max_digits=14, verbose_name='Açık Alacak')),
+                ('paid_total', models.DecimalField(decimal_places=2, default=Decimal('0.00'), help_text='Ödenmiş kayıtların toplamı', max_digits=14, verbose_name='Ödenen Toplam')),
+                ('last_activity_at', models.DateTimeField(blank=True, help_text='Son borç/alacak hareketinin zamanı', null=True, verbose_name='Son Hareket')),
+                ('updated_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Güncellenme Tarihi')),
+            ],
+            options={
+                'verbose_name': 'Müşteri Bakiyesi',
+                'verbose_name_plural': 'Müşteri Bakiyeleri',
+            },
+        ),
+        migrations.RunPython(backfill_balances, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,98 @@
+# Generated by Django 4.2.15 on 2026-10-18 07:15
+
+import re
+import unicodedata
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+# Arama terimi kuralları bu migration yazıldığı andaki haliyle kopyalanmıştır
+# (backend.core.utils.text, CustomerSearchTerm.terms_for); uygulama kodu
+# sonradan değişse de migration aynı sonucu üretir.
+_TURKISH_UPPER = str.maketrans({'İ': 'i', 'I': 'ı'})
+_ASCII_FOLD = str.maketrans('ıçğöşüâîû', 'icgosuaiu')
+_TOKEN_RE = re.compile(r'[^a-z0-9@._+\-]+')
+MAX_TERM_LENGTH = 64
+
+
+def _fold_turkish(text):
+    if not text:
+        return ''
+    text = text.translate(_TURKISH_UPPER).lower().translate(_ASCII_FOLD)
+    text = unicodedata.normalize('NFKD', text)
+    return ''.join(ch for ch in text if not unicodedata.combining(ch))
+
+
+def _digits_only(text):
+    return ''.join(ch for ch in (text or '') if ch.isdigit())
+
+
+def _tokenize(text):
+    tokens = []
+    for raw in _TOKEN_RE.split(_fold_turkish(text)):
+        token = raw.strip('._+-')[:MAX_TERM_LENGTH]
+        if token and token not in tokens:
+            tokens.append(token)
+    return tokens
+
+
+def _terms_for(first_name, last_name, phone, email):
+    terms = {}
+    for token in _tokenize(f"{first_name or ''} {last_name or ''}"):
+        terms.setdefault(token, 'NAME')
+    phone_digits = _digits_only(phone)
+    if phone_digits:
+        terms.setdefault(phone_digits[:MAX_TERM_LENGTH], 'PHONE')
+        if phone_digits.startswith('0'):
+            terms.setdefault(phone_digits[1:MAX_TERM_LENGTH + 1], 'PHONE')
+    if email:
+        folded_email = _fold_turkish(email).strip()
+        terms.setdefault(folded_email[:MAX_TERM_LENGTH], 'EMAIL')
+        for token in _tokenize(folded_email.replace('@', ' ')):
+            terms.setdefault(token, 'EMAIL')
+    return [(term, kind) for term, kind in terms.items() if term]
+
+
+def build_search_index(apps, schema_editor):
+    """Mevcut müşteriler için arama terimlerini oluştur"""
+    Customer = apps.get_model('backend', 'Customer')
+    CustomerSearchTerm = apps.get_model('backend', 'CustomerSearchTerm')
+
+    batch = []
+    customers = Customer.objects.only('id', 'first_name', 'last_name', 'phone', 'email')
+    for customer in customers.iterator():
+        batch.extend(
+            CustomerSearchTerm(customer_id=customer.id, term=term, kind=kind)
+            for term, kind in _terms_for(
+                customer.first_name, customer.last_name, customer.phone, customer.email
+            )
+        )
+    CustomerSearchTerm.objects.bulk_create(batch, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0004_customerbalance'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CustomerSearchTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=64, verbose_name='Terim')),
+                ('kind', models.CharField(choices=[('NAME', 'Ad'), ('PHONE', 'Telefon'), ('EMAIL', 'E-posta')], max_length=5, verbose_name='Tür')),
+                ('customer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_terms', to='backend.customer', verbose_name='Müşteri')),
+            ],
+            options={
+                'verbose_name': 'Müşteri Arama Terimi',
+                'verbose_name_plural': 'Müşteri Arama Terimleri',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='customersearchterm',
+            constraint=models.UniqueConstraint(fields=('term', 'customer'), name='customer_search_term_unique'),
+        ),
+        migrations.RunPython(build_search_index, migrations.RunPython.noop),
+    ]
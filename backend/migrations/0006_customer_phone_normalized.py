@@ -0,0 +1,80 @@
+# Generated by Django 4.2.15 on 2026-10-18 07:16
+
+from django.db import migrations, models
+
+# Normalizasyon kuralları bu migration yazıldığı andaki haliyle kopyalanmıştır
+# (backend.core.utils.phone); uygulama kodu sonradan değişse de migration
+# aynı sonucu üretir.
+DEFAULT_COUNTRY_CODE = '90'
+
+
+def _digits_only(text):
+    return ''.join(ch for ch in (text or '') if ch.isdigit())
+
+
+def _normalize_phone(raw, country_code=DEFAULT_COUNTRY_CODE):
+    raw = (raw or '').strip()
+    digits = _digits_only(raw)
+    if not digits:
+        return None
+    if raw.startswith('+'):
+        e164 = digits
+    elif digits.startswith('00'):
+        e164 = digits[2:]
+    elif len(digits) == 11 and digits.startswith('0'):
+        e164 = country_code + digits[1:]
+    elif len(digits) == 10 and not digits.startswith('0'):
+        e164 = country_code + digits
+    elif len(digits) == 12 and digits.startswith(country_code):
+        e164 = digits
+    else:
+        return None
+    if not 8 <= len(e164) <= 15:
+        return None
+    return f'+{e164}'
+
+
+def _reversed_digits(phone):
+    digits = _digits_only(phone)
+    return digits[::-1] if digits else None
+
+
+def backfill_normalized_phones(apps, schema_editor):
+    """Mevcut müşterilerin normalize telefon kolonlarını doldur"""
+    Customer = apps.get_model('backend', 'Customer')
+
+    seen = set()
+    batch = []
+    # Aynı numaraya normalize olan kayıtlarda en eski müşteri numarayı alır;
+    # diğerleri boş kalır ve backfill_phones komutu ile raporlanır.
+    for customer in Customer.objects.order_by('created_at', 'id').only('id', 'phone').iterator():
+        e164 = _normalize_phone(customer.phone)
+        if e164 in seen:
+            e164 = None
+        elif e164:
+            seen.add(e164)
+        customer.phone_e164 = e164
+        customer.phone_reversed = _reversed_digits(e164 or customer.phone)
+        batch.append(customer)
+    Customer.objects.bulk_update(batch, ['phone_e164', 'phone_reversed'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0005_customersearchterm'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customer',
+            name='phone_e164',
+            field=models.CharField(blank=True, editable=False, help_text='Normalize edilmiş telefon numarası (+905321234567)', max_length=16, null=True, unique=True, verbose_name='Telefon (E.164)'),
+        ),
+        migrations.AddField(
+            model_name='customer',
+            name='phone_reversed',
+            field=models.CharField(blank=True, db_index=True, editable=False, help_text='Son rakamlarla arama için ters çevrilmiş telefon rakamları', max_length=16, null=True, verbose_name='Telefon (ters)'),
+        ),
+        migrations.RunPython(backfill_normalized_phones, migrations.RunPython.noop),
+    ]
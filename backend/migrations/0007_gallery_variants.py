@@ -0,0 +1,18 @@
+# Generated by Django 4.2.15 on 2026-10-18 07:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0006_customer_phone_normalized'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='galleryimage',
+            name='variants',
+            field=models.JSONField(blank=True, default=dict, help_text='Yeniden boyutlandırılmış WebP/AVIF kopyalar ve bulanık önizleme', verbose_name='Varyantlar'),
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 4.2.15 on 2026-10-18 07:23
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0007_gallery_variants'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='galleryimage',
+            name='processing_error',
+            field=models.TextField(blank=True, default='', verbose_name='İşleme Hatası'),
+        ),
+        # Mevcut resimler READY kabul edilir (varyantlar generate_gallery_variants ile);
+        # yeni kayıtlar PENDING başlar
+        migrations.AddField(
+            model_name='galleryimage',
+            name='processing_status',
+            field=models.CharField(choices=[('PENDING', 'Bekliyor'), ('PROCESSING', 'İşleniyor'), ('READY', 'Hazır'), ('FAILED', 'Başarısız')], default='READY', max_length=10, verbose_name='İşleme Durumu'),
+        ),
+        migrations.AlterField(
+            model_name='galleryimage',
+            name='processing_status',
+            field=models.CharField(choices=[('PENDING', 'Bekliyor'), ('PROCESSING', 'İşleniyor'), ('READY', 'Hazır'), ('FAILED', 'Başarısız')], default='PENDING', max_length=10, verbose_name='İşleme Durumu'),
+        ),
+        migrations.CreateModel(
+            name='BackgroundJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('task', models.CharField(help_text='Kayıtlı görev adı (ör. gallery.process_image)', max_length=100, verbose_name='Görev')),
+                ('payload', models.JSONField(blank=True, default=dict, verbose_name='Parametreler')),
+                ('status', models.CharField(choices=[('PENDING', 'Bekliyor'), ('RUNNING', 'Çalışıyor'), ('DONE', 'Tamamlandı'), ('FAILED', 'Başarısız')], default='PENDING', max_length=10, verbose_name='Durum')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='Deneme Sayısı')),
+                ('max_attempts', models.PositiveSmallIntegerField(default=3, verbose_name='En Fazla Deneme')),
+                ('run_after', models.DateTimeField(default=django.utils.timezone.now, help_text='İş bu zamandan önce alınmaz (yeniden deneme gecikmesi)', verbose_name='Çalışma Zamanı')),
+                ('locked_at', models.DateTimeField(blank=True, null=True, verbose_name='Alınma Zamanı')),
+                ('last_error', models.TextField(blank=True, default='', verbose_name='Son Hata')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Oluşturulma Tarihi')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='Bitiş Tarihi')),
+            ],
+            options={
+                'verbose_name': 'Arka Plan İşi',
+                'verbose_name_plural': 'Arka Plan İşleri',
+                'ordering': ['run_after', 'id'],
+                'indexes': [models.Index(fields=['status', 'run_after'], name='backend_bac_status_a39212_idx')],
+            },
+        ),
+    ]
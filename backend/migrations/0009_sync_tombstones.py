@@ -0,0 +1,43 @@
+# Generated by Django 4.2.15 on 2026-10-18 07:28
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0008_background_jobs'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DeletionTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model', models.CharField(help_text='Model etiketi (ör. backend.debt)', max_length=50, verbose_name='Model')),
+                ('object_id', models.BigIntegerField(verbose_name='Kayıt ID')),
+                ('deleted_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Silinme Tarihi')),
+            ],
+            options={
+                'verbose_name': 'Silinme İzi',
+                'verbose_name_plural': 'Silinme İzleri',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='customer',
+            index=models.Index(fields=['updated_at'], name='backend_cus_updated_9de408_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='customerbalance',
+            index=models.Index(fields=['updated_at'], name='backend_cus_updated_e66127_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='debt',
+            index=models.Index(fields=['updated_at'], name='backend_deb_updated_3f6406_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='deletiontombstone',
+            index=models.Index(fields=['deleted_at'], name='backend_del_deleted_9fdd17_idx'),
+        ),
+    ]
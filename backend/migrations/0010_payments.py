@@ -0,0 +1,35 @@
+# Generated by Django 4.2.15 on 2026-10-18 07:35
+
+from decimal import Decimal
+from django.conf import settings
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('backend', '0009_sync_tombstones'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Payment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('amount', models.DecimalField(decimal_places=2, help_text='Tahsil edilen tutar', max_digits=14, validators=[django.core.validators.MinValueValidator(Decimal('0.01'))], verbose_name='Tutar')),
+                ('notes', models.TextField(blank=True, help_text='Ödeme hakkında ek notlar', null=True, verbose_name='Notlar')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Ödeme Tarihi')),
+                ('customer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='payments', to='backend.customer', verbose_name='Müşteri')),
+                ('paid_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='recorded_payments', to=settings.AUTH_USER_MODEL, verbose_name='Kaydeden')),
+            ],
+            options={
+                'verbose_name': 'Ödeme',
+                'verbose_name_plural': 'Ödemeler',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['customer', 'created_at'], name='backend_pay_custome_af868c_idx')],
+            },
+        ),
+    ]
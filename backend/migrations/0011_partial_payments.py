@@ -0,0 +1,42 @@
+# Generated by Django 4.2.15 on 2026-10-18 07:37
+
+from decimal import Decimal
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_paid_amounts(apps, schema_editor):
+    """Ödenmiş kayıtlarda ödenen tutar, tutarın tamamıdır"""
+    Debt = apps.get_model('backend', 'Debt')
+    Debt.objects.filter(is_paid=True).update(paid_amount=models.F('amount'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0010_payments'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='debt',
+            name='paid_amount',
+            field=models.DecimalField(decimal_places=2, default=Decimal('0.00'), help_text='Kısmi ödemelerle kapatılan tutar (ödendiyse tutarın tamamı)', max_digits=12, verbose_name='Ödenen Tutar'),
+        ),
+        migrations.RunPython(backfill_paid_amounts, migrations.RunPython.noop),
+        migrations.CreateModel(
+            name='PaymentAllocation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('amount', models.DecimalField(decimal_places=2, help_text='Bu borca uygulanan tutar', max_digits=12, validators=[django.core.validators.MinValueValidator(Decimal('0.01'))], verbose_name='Tutar')),
+                ('debt', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='allocations', to='backend.debt', verbose_name='Borç')),
+                ('payment', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='allocations', to='backend.payment', verbose_name='Ödeme')),
+            ],
+            options={
+                'verbose_name': 'Ödeme Dağılımı',
+                'verbose_name_plural': 'Ödeme Dağılımları',
+                'indexes': [models.Index(fields=['debt'], name='backend_pay_debt_id_f5a856_idx')],
+            },
+        ),
+    ]
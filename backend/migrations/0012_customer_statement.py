@@ -0,0 +1,140 @@
+# Generated by Django 4.2.15 on 2026-10-18 07:42
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+from decimal import Decimal
+
+from django.db.models import Sum
+
+BACKFILL_CHUNK_SIZE = 200
+ZERO = Decimal('0.00')
+
+# Ekstre kuralları bu migration yazıldığı andaki haliyle kopyalanmıştır
+# (backend.core.utils.statement); uygulama kodu sonradan değişse de
+# migration aynı sonucu üretir.
+_KIND_ORDER = {'DEBT': 0, 'CREDIT': 0, 'PAYMENT': 1, 'ADJUSTMENT': 2}
+
+
+def _signed(debt_type, value):
+    return -value if debt_type == 'CREDIT' else value
+
+
+def _history_events(debt_rows, payment_rows, allocated):
+    events = []
+    for debt_id, customer_id, debt_type, amount, paid_amount, created_at, paid_at, updated_at, description in debt_rows:
+        events.append({
+            'customer_id': customer_id,
+            'kind': debt_type,
+            'amount': _signed(debt_type, amount),
+            'debt_id': debt_id,
+            'payment_id': None,
+            'description': (description or '')[:255],
+            'created_at': created_at,
+        })
+        unallocated = (paid_amount or ZERO) - allocated.get(debt_id, ZERO)
+        if unallocated:
+            events.append({
+                'customer_id': customer_id,
+                'kind': 'PAYMENT' if unallocated > ZERO else 'ADJUSTMENT',
+                'amount': -_signed(debt_type, unallocated),
+                'debt_id': debt_id,
+                'payment_id': None,
+                'description': '',
+                'created_at': max(paid_at or updated_at, created_at),
+            })
+
+    for payment_id, customer_id, created_at, notes, amount in payment_rows:
+        if not amount:
+            continue
+        events.append({
+            'customer_id': customer_id,
+            'kind': 'PAYMENT',
+            'amount': -amount,
+            'debt_id': None,
+            'payment_id': payment_id,
+            'description': (notes or '')[:255],
+            'created_at': created_at,
+        })
+
+    events.sort(key=lambda e: (e['customer_id'], e['created_at'], _KIND_ORDER[e['kind']]))
+    return events
+
+
+def _load_history(Debt, Payment, PaymentAllocation, customer_ids):
+    debt_rows = Debt.objects.filter(customer_id__in=customer_ids).values_list(
+        'id', 'customer_id', 'debt_type', 'amount', 'paid_amount',
+        'created_at', 'paid_at', 'updated_at', 'description',
+    )
+    allocations = PaymentAllocation.objects.filter(debt__customer_id__in=customer_ids).order_by()
+    allocated = dict(
+        allocations.values('debt_id').annotate(total=Sum('amount')).values_list('debt_id', 'total')
+    )
+    payment_totals = dict(
+        allocations.values('payment_id').annotate(total=Sum('amount')).values_list('payment_id', 'total')
+    )
+    payment_rows = [
+        row + (payment_totals.get(row[0], ZERO),)
+        for row in Payment.objects.filter(customer_id__in=customer_ids).values_list(
+            'id', 'customer_id', 'created_at', 'notes'
+        )
+    ]
+    return _history_events(debt_rows, payment_rows, allocated)
+
+
+def _with_running_balance(events):
+    balances = {}
+    for event in events:
+        balance = balances.get(event['customer_id'], ZERO) + event['amount']
+        balances[event['customer_id']] = balance
+        yield dict(event, balance_after=balance)
+
+
+def backfill_ledger(apps, schema_editor):
+    """Mevcut borç ve ödemelerden müşteri ekstrelerini oluştur"""
+    Customer = apps.get_model('backend', 'Customer')
+    Debt = apps.get_model('backend', 'Debt')
+    Payment = apps.get_model('backend', 'Payment')
+    PaymentAllocation = apps.get_model('backend', 'PaymentAllocation')
+    LedgerEntry = apps.get_model('backend', 'LedgerEntry')
+
+    customer_ids = list(Customer.objects.order_by('id').values_list('id', flat=True))
+    for start in range(0, len(customer_ids), BACKFILL_CHUNK_SIZE):
+        chunk = customer_ids[start:start + BACKFILL_CHUNK_SIZE]
+        events = _load_history(Debt, Payment, PaymentAllocation, chunk)
+        LedgerEntry.objects.bulk_create(
+            [LedgerEntry(**event) for event in _with_running_balance(events)],
+            batch_size=500,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0011_partial_payments'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LedgerEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('DEBT', 'Borç'), ('CREDIT', 'Alacak'), ('PAYMENT', 'Ödeme'), ('ADJUSTMENT', 'Düzeltme')], help_text='Hareket türü', max_length=10, verbose_name='Tür')),
+                ('amount', models.DecimalField(decimal_places=2, help_text='Bakiyeye etkisi (borç artı, ödeme/alacak eksi)', max_digits=14, verbose_name='Tutar')),
+                ('balance_after', models.DecimalField(decimal_places=2, help_text='Bu hareketten sonraki bakiye', max_digits=14, verbose_name='Bakiye')),
+                ('description', models.CharField(blank=True, default='', max_length=255, verbose_name='Açıklama')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Tarih')),
+                ('customer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ledger_entries', to='backend.customer', verbose_name='Müşteri')),
+                ('debt', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='ledger_entries', to='backend.debt', verbose_name='Borç')),
+                ('payment', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='ledger_entries', to='backend.payment', verbose_name='Ödeme')),
+            ],
+            options={
+                'verbose_name': 'Ekstre Satırı',
+                'verbose_name_plural': 'Ekstre Satırları',
+                'ordering': ['customer', 'created_at', 'id'],
+                'indexes': [models.Index(fields=['customer', 'created_at', 'id'], name='backend_led_custome_9a63c0_idx')],
+            },
+        ),
+        migrations.RunPython(backfill_ledger, migrations.RunPython.noop),
+    ]
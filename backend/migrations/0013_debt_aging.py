@@ -0,0 +1,52 @@
+# Generated by Django 4.2.15 on 2026-10-18 07:59
+
+from decimal import Decimal
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0012_customer_statement'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AgingSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('as_of', models.DateField(verbose_name='Tarih')),
+                ('bucket_0_30', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=14, verbose_name='0-30 gün')),
+                ('bucket_31_60', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=14, verbose_name='31-60 gün')),
+                ('bucket_61_90', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=14, verbose_name='61-90 gün')),
+                ('bucket_90_plus', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=14, verbose_name='90+ gün')),
+                ('total', models.DecimalField(decimal_places=2, default=Decimal('0.00'), help_text='Vadesi geçmiş kalan tutar', max_digits=14, verbose_name='Toplam')),
+                ('debt_count', models.PositiveIntegerField(default=0, verbose_name='Borç Sayısı')),
+                ('oldest_due_date', models.DateField(blank=True, null=True, verbose_name='En Eski Vade')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Oluşturulma Tarihi')),
+            ],
+            options={
+                'verbose_name': 'Yaşlandırma Görüntüsü',
+                'verbose_name_plural': 'Yaşlandırma Görüntüleri',
+                'ordering': ['-as_of', '-total'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='debt',
+            index=models.Index(fields=['is_paid', 'due_date'], name='backend_deb_is_paid_137901_idx'),
+        ),
+        migrations.AddField(
+            model_name='agingsnapshot',
+            name='customer',
+            field=models.ForeignKey(blank=True, help_text='Boş ise genel toplam satırıdır', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='aging_snapshots', to='backend.customer', verbose_name='Müşteri'),
+        ),
+        migrations.AddIndex(
+            model_name='agingsnapshot',
+            index=models.Index(fields=['as_of', '-total'], name='backend_agi_as_of_c88101_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='agingsnapshot',
+            constraint=models.UniqueConstraint(fields=('as_of', 'customer'), name='unique_aging_snapshot_customer'),
+        ),
+    ]
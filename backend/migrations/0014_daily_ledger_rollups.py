@@ -0,0 +1,97 @@
+# Generated by Django 4.2.15 on 2026-10-18 08:06
+
+from decimal import Decimal
+from django.db import migrations, models
+from django.utils import timezone
+
+ZERO = Decimal('0.00')
+
+# Özet kuralları bu migration yazıldığı andaki haliyle kopyalanmıştır
+# (backend.core.utils.rollup); uygulama kodu sonradan değişse de migration
+# aynı sonucu üretir. Tablo ilk kez doldurulduğu için akışlar tüm kayıtlar
+# üzerinden Python'da toplanır.
+
+
+def _local_day(value):
+    return timezone.localtime(value).date()
+
+
+def _add_flow(flows, day, debt_type, count=0, created=ZERO, paid=ZERO):
+    row = flows.setdefault((day, debt_type), [0, ZERO, ZERO])
+    row[0] += count
+    row[1] += created
+    row[2] += paid
+
+
+def backfill_rollups(apps, schema_editor):
+    """Mevcut borç ve ödemelerden günlük özetleri oluştur"""
+    Debt = apps.get_model('backend', 'Debt')
+    PaymentAllocation = apps.get_model('backend', 'PaymentAllocation')
+    DailyLedgerRollup = apps.get_model('backend', 'DailyLedgerRollup')
+
+    flows = {}
+    allocated = {}
+    allocations = PaymentAllocation.objects.values_list('debt_id', 'debt__debt_type', 'payment__created_at', 'amount')
+    for debt_id, debt_type, paid_at, amount in allocations.iterator():
+        # Dağılımlar ödemenin tarihine yazılır
+        _add_flow(flows, _local_day(paid_at), debt_type, paid=amount)
+        allocated[debt_id] = allocated.get(debt_id, ZERO) + amount
+
+    debts = Debt.objects.values_list('id', 'debt_type', 'amount', 'paid_amount', 'created_at', 'paid_at', 'updated_at')
+    for debt_id, debt_type, amount, paid_amount, created_at, paid_at, updated_at in debts.iterator():
+        _add_flow(flows, _local_day(created_at), debt_type, 1, amount)
+        # Dağılımla açıklanmayan ödenen kısım borcun ödeme tarihine yazılır
+        unallocated = (paid_amount or ZERO) - allocated.get(debt_id, ZERO)
+        if unallocated:
+            paid_on = max(paid_at or updated_at or created_at, created_at)
+            _add_flow(flows, _local_day(paid_on), debt_type, paid=unallocated)
+
+    rows = []
+    balances = {}
+    for (day, debt_type), (count, created, paid) in sorted(flows.items(), key=lambda item: (item[0][1], item[0][0])):
+        if not (count or created or paid):
+            continue
+        balance = balances.get(debt_type, ZERO) + created - paid
+        balances[debt_type] = balance
+        rows.append(DailyLedgerRollup(
+            day=day,
+            debt_type=debt_type,
+            created_count=count,
+            created_amount=created,
+            paid_amount=paid,
+            outstanding_amount=balance,
+        ))
+    DailyLedgerRollup.objects.bulk_create(rows, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0013_debt_aging'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyLedgerRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(verbose_name='Gün')),
+                ('debt_type', models.CharField(choices=[('DEBT', 'Borç'), ('CREDIT', 'Alacak')], max_length=10, verbose_name='Tür')),
+                ('created_count', models.IntegerField(default=0, verbose_name='Açılan Kayıt')),
+                ('created_amount', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=14, verbose_name='Açılan Tutar')),
+                ('paid_amount', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=14, verbose_name='Ödenen Tutar')),
+                ('outstanding_amount', models.DecimalField(decimal_places=2, default=Decimal('0.00'), help_text='Gün sonundaki açık tutar', max_digits=14, verbose_name='Açık Tutar')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Güncellenme Tarihi')),
+            ],
+            options={
+                'verbose_name': 'Günlük Defter Özeti',
+                'verbose_name_plural': 'Günlük Defter Özetleri',
+                'ordering': ['debt_type', 'day'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='dailyledgerrollup',
+            constraint=models.UniqueConstraint(fields=('debt_type', 'day'), name='unique_daily_rollup_type_day'),
+        ),
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
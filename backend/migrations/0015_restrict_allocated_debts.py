@@ -0,0 +1,19 @@
+# Generated by Django 4.2.15 on 2026-10-18 08:15
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0014_daily_ledger_rollups'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='paymentallocation',
+            name='debt',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.RESTRICT, related_name='allocations', to='backend.debt', verbose_name='Borç'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.15 on 2026-10-18 08:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0015_restrict_allocated_debts'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='customersearchterm',
+            index=models.Index(fields=['term'], name='customer_search_term_prefix', opclasses=['varchar_pattern_ops']),
+        ),
+    ]
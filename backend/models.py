@@ -5,7 +5,29 @@ Backend app models are defined in core.models
 # Import models from core.models to make them available to Django
 from backend.core.models.customer import Customer
 from backend.core.models.debt import Debt
+from backend.core.models.payment import Payment, PaymentAllocation
 from backend.core.models.gallery import GalleryImage
 from backend.core.models.contact import ContactMessage
+from backend.core.models.balance import CustomerBalance
+from backend.core.models.search import CustomerSearchTerm
+from backend.core.models.job import BackgroundJob
+from backend.core.models.tombstone import DeletionTombstone
+from backend.core.models.statement import LedgerEntry
+from backend.core.models.aging import AgingSnapshot
+from backend.core.models.rollup import DailyLedgerRollup
 
-__all__ = ['Customer', 'Debt', 'GalleryImage', 'ContactMessage']
+__all__ = [
+    'Customer',
+    'Debt',
+    'Payment',
+    'PaymentAllocation',
+    'GalleryImage',
+    'ContactMessage',
+    'CustomerBalance',
+    'CustomerSearchTerm',
+    'BackgroundJob',
+    'DeletionTombstone',
+    'LedgerEntry',
+    'AgingSnapshot',
+    'DailyLedgerRollup',
+]
@@ -0,0 +1,82 @@
+"""
+Customer admin changelist tests.
+"""
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from backend.core.models import Customer, Debt
+
+
+class CustomerAdminChangelistTests(TestCase):
+    """Müşteri listesi bakiye kolonları ve açık borç filtresi"""
+    
+    def setUp(self):
+        self.admin = User.objects.create_superuser('admin', 'admin@example.com', 'x')
+        self.client.force_login(self.admin)
+        self.url = reverse('admin:backend_customer_changelist')
+        self.created = 0
+    
+    def _add_customer(self, outstanding, paid=Decimal('0.00')):
+        self.created += 1
+        customer = Customer.objects.create(
+            first_name=f'Müşteri{self.created}', last_name='Test', phone=f'0532000{self.created:04d}'
+        )
+        if outstanding:
+            Debt.objects.create(customer=customer, amount=outstanding)
+        if paid:
+            Debt.objects.create(customer=customer, amount=paid, is_paid=True)
+        return customer
+    
+    def _changelist_ids(self, params=None):
+        response = self.client.get(self.url, params or {})
+        self.assertEqual(response.status_code, 200)
+        return {customer.id for customer in response.context['cl'].result_list}
+    
+    def _count_changelist_queries(self):
+        # Oturum cache'i ısınsın; yalnızca liste sorguları sayılsın
+        self.client.get(self.url)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['cl'].result_list), self.created)
+        return len(context.captured_queries)
+    
+    def test_changelist_query_count_is_constant(self):
+        for _ in range(2):
+            self._add_customer(Decimal('100.00'), paid=Decimal('50.00'))
+        small = self._count_changelist_queries()
+        for _ in range(10):
+            self._add_customer(Decimal('100.00'), paid=Decimal('50.00'))
+        self.assertEqual(self._count_changelist_queries(), small)
+    
+    def test_balance_columns(self):
+        self._add_customer(Decimal('120.00'), paid=Decimal('30.00'))
+        response = self.client.get(self.url)
+        customer = response.context['cl'].result_list[0]
+        self.assertEqual(customer.outstanding_debt_value, Decimal('120.00'))
+        self.assertEqual(customer.paid_total_value, Decimal('30.00'))
+    
+    def test_outstanding_debt_filter_threshold(self):
+        """?borc_ustu= eşiğin üzerinde açık borcu olanları seçer"""
+        no_debt = self._add_customer(Decimal('0.00'), paid=Decimal('900.00'))
+        small = self._add_customer(Decimal('300.00'))
+        at_threshold = self._add_customer(Decimal('500.00'))
+        large = self._add_customer(Decimal('800.00'))
+        huge = self._add_customer(Decimal('1500.00'))
+        
+        self.assertEqual(self._changelist_ids({'borc_ustu': '0'}), {small.id, at_threshold.id, large.id, huge.id})
+        self.assertEqual(self._changelist_ids({'borc_ustu': '500'}), {large.id, huge.id})
+        self.assertEqual(self._changelist_ids({'borc_ustu': '750'}), {large.id, huge.id})
+        self.assertEqual(self._changelist_ids({'borc_ustu': '1000'}), {huge.id})
+        self.assertEqual(len(self._changelist_ids()), 5)
+        self.assertIn(no_debt.id, self._changelist_ids())
+    
+    def test_outstanding_debt_filter_ignores_invalid_threshold(self):
+        self._add_customer(Decimal('0.00'))
+        self._add_customer(Decimal('300.00'))
+        self.assertEqual(len(self._changelist_ids({'borc_ustu': 'abc'})), 2)
@@ -0,0 +1,300 @@
+"""
+Derived ledger tables (balances, statements, daily rollups) versus Debt writes.
+"""
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.db.models.signals import post_save
+from django.test import TestCase
+from django.utils import timezone
+
+from backend.application.dtos import DebtDTO
+from backend.core.models import Customer, CustomerBalance, DailyLedgerRollup, Debt, LedgerEntry
+from backend.core.signals import rollup, statement
+from backend.core.utils.rollup import first_day
+from backend.infrastructure.repositories import DebtRepository
+
+
+class LedgerConsistencyMixin:
+    """Artımlı tutulan tabloları kayıtlardan yeniden hesaplanan değerlerle karşılaştır"""
+    
+    def rollup_rows(self):
+        return list(DailyLedgerRollup.objects.order_by('debt_type', 'day').values_list(
+            'day', 'debt_type', 'created_count', 'created_amount', 'paid_amount', 'outstanding_amount'
+        ))
+    
+    def assertLedgerConsistent(self):
+        call_command('rebuild_balances', '--check', stdout=StringIO())
+        call_command('rebuild_ledger', '--check', stdout=StringIO())
+        incremental = self.rollup_rows()
+        day = first_day(Debt)
+        if day is not None:
+            DailyLedgerRollup.rebuild(day, timezone.localdate())
+        self.assertEqual(incremental, self.rollup_rows())
+
+
+class DebtStateTests(LedgerConsistencyMixin, TestCase):
+    """Önceki borç durumu handler'lardan bağımsız olarak ilerletilir"""
+    
+    def setUp(self):
+        self.customer = Customer.objects.create(first_name='Ali', last_name='Yılmaz', phone='05321234567')
+        self.repository = DebtRepository()
+    
+    def _dto(self, debt, **changes):
+        values = {
+            'customer_id': debt.customer_id,
+            'debt_type': debt.debt_type,
+            'amount': debt.amount,
+            'description': debt.description,
+            'is_paid': debt.is_paid,
+            'due_date': debt.due_date,
+        }
+        values.update(changes)
+        return DebtDTO(**values)
+    
+    def test_state_advances_after_save(self):
+        debt = Debt.objects.create(customer=self.customer, amount=Decimal('100.00'))
+        self.assertEqual(debt._balance_state, debt.balance_state())
+        debt.amount = Decimal('80.00')
+        debt.save()
+        self.assertEqual(debt._balance_state, debt.balance_state())
+        # Aynı örnek tekrar kaydedilince fark ikinci kez uygulanmaz
+        debt.amount = Decimal('70.00')
+        debt.save()
+        self.assertLedgerConsistent()
+    
+    def test_handlers_do_not_depend_on_connection_order(self):
+        """Ekstre ve özet handler'ları bakiye handler'ından sonra bağlansa da doğru çalışır"""
+        for handler in (statement.append_statement_on_debt_save, rollup.update_rollup_on_debt_save):
+            post_save.disconnect(handler, sender=Debt)
+            post_save.connect(handler, sender=Debt)
+        
+        debt = Debt.objects.create(customer=self.customer, amount=Decimal('100.00'))
+        self.repository.update(debt.id, self._dto(debt, amount=Decimal('120.00')))
+        self.repository.mark_as_paid(debt.id)
+        self.repository.mark_as_unpaid(debt.id)
+        self.assertLedgerConsistent()
+        self.assertEqual(CustomerBalance.objects.get(customer=self.customer).outstanding_debt, Decimal('120.00'))
+
+
+class StatementImportTests(LedgerConsistencyMixin, TestCase):
+    """Geçmiş tarihli içe aktarma ekstreyi yeniden yazmaz"""
+    
+    def setUp(self):
+        self.customer = Customer.objects.create(first_name='Ali', last_name='Yılmaz', phone='05321234567')
+        self.repository = DebtRepository()
+        self.today = timezone.localdate()
+    
+    def _statement(self):
+        return list(LedgerEntry.objects.filter(customer=self.customer).order_by('created_at', 'id').values_list(
+            'id', 'amount', 'balance_after'
+        ))
+    
+    def test_back_dated_rows_are_inserted_and_later_rows_shifted(self):
+        Debt.objects.create(customer=self.customer, amount=Decimal('100.00'))
+        Debt.objects.create(customer=self.customer, amount=Decimal('30.00'), debt_type=Debt.DebtType.CREDIT)
+        before = self._statement()
+        self.assertEqual([row[2] for row in before], [Decimal('100.00'), Decimal('70.00')])
+        
+        self.repository.bulk_create([
+            DebtDTO(customer_id=self.customer.id, amount=Decimal('50.00'), created_at=self.today - timedelta(days=10)),
+            DebtDTO(
+                customer_id=self.customer.id,
+                amount=Decimal('20.00'),
+                is_paid=True,
+                created_at=self.today - timedelta(days=5),
+                paid_at=self.today - timedelta(days=3),
+            ),
+        ])
+        
+        after = self._statement()
+        # Mevcut satırlar silinmedi; yalnızca bakiyeleri kaydı
+        self.assertEqual([row[0] for row in after[-2:]], [row[0] for row in before])
+        self.assertEqual([(row[1], row[2]) for row in after], [
+            (Decimal('50.00'), Decimal('50.00')),
+            (Decimal('20.00'), Decimal('70.00')),
+            (Decimal('-20.00'), Decimal('50.00')),
+            (Decimal('100.00'), Decimal('150.00')),
+            (Decimal('-30.00'), Decimal('120.00')),
+        ])
+        self.assertLedgerConsistent()
+        
+        # Yeniden yazılan ekstre aynı bakiyeleri üretir
+        LedgerEntry.rebuild([self.customer.id])
+        self.assertEqual([row[2] for row in self._statement()], [row[2] for row in after])
+    
+    def test_import_between_same_batch_rows(self):
+        self.repository.bulk_create([
+            DebtDTO(customer_id=self.customer.id, amount=Decimal('10.00'), created_at=self.today - timedelta(days=2)),
+            DebtDTO(customer_id=self.customer.id, amount=Decimal('5.00'), created_at=self.today - timedelta(days=4)),
+        ])
+        self.repository.bulk_create([
+            DebtDTO(customer_id=self.customer.id, amount=Decimal('1.00'), created_at=self.today - timedelta(days=3)),
+        ])
+        self.assertEqual([row[2] for row in self._statement()], [Decimal('5.00'), Decimal('6.00'), Decimal('16.00')])
+        self.assertLedgerConsistent()
+
+
+class BalanceMaintenanceTests(LedgerConsistencyMixin, TestCase):
+    """Tekil ve toplu borç yazımlarında bakiye, ekstre ve günlük özet"""
+    
+    def setUp(self):
+        self.customer = Customer.objects.create(first_name='Ali', last_name='Yılmaz', phone='05321234567')
+        self.other = Customer.objects.create(first_name='Veli', last_name='Kaya', phone='05337654321')
+        self.repository = DebtRepository()
+    
+    def assertBalance(self, customer, outstanding_debt, outstanding_credit, paid_total):
+        balance = CustomerBalance.objects.get(customer=customer)
+        self.assertEqual(
+            (balance.outstanding_debt, balance.outstanding_credit, balance.paid_total),
+            (Decimal(outstanding_debt), Decimal(outstanding_credit), Decimal(paid_total)),
+        )
+    
+    def last_statement_balance(self, customer):
+        return LedgerEntry.last_balance(customer.id)
+    
+    def test_create_and_update(self):
+        debt = Debt.objects.create(customer=self.customer, amount=Decimal('100.00'))
+        Debt.objects.create(customer=self.customer, amount=Decimal('30.00'), debt_type=Debt.DebtType.CREDIT)
+        self.assertBalance(self.customer, '100.00', '30.00', '0.00')
+        self.assertEqual(self.last_statement_balance(self.customer), Decimal('70.00'))
+        
+        self.repository.update(debt.id, DebtDTO(customer_id=self.customer.id, amount=Decimal('80.00')))
+        self.assertBalance(self.customer, '80.00', '30.00', '0.00')
+        
+        # Tür değişikliği: borç alacağa döner
+        self.repository.update(debt.id, DebtDTO(
+            customer_id=self.customer.id, amount=Decimal('80.00'), debt_type=Debt.DebtType.CREDIT
+        ))
+        self.assertBalance(self.customer, '0.00', '110.00', '0.00')
+        self.assertEqual(self.last_statement_balance(self.customer), Decimal('-110.00'))
+        self.assertLedgerConsistent()
+    
+    def test_mark_paid_and_unpaid(self):
+        debt = Debt.objects.create(customer=self.customer, amount=Decimal('100.00'))
+        self.repository.mark_as_paid(debt.id)
+        self.assertBalance(self.customer, '0.00', '0.00', '100.00')
+        self.assertEqual(self.last_statement_balance(self.customer), Decimal('0.00'))
+        
+        self.repository.mark_as_unpaid(debt.id)
+        self.assertBalance(self.customer, '100.00', '0.00', '0.00')
+        self.assertLedgerConsistent()
+    
+    def test_move_to_another_customer(self):
+        debt = Debt.objects.create(customer=self.customer, amount=Decimal('100.00'))
+        debt.customer = self.other
+        debt.save()
+        self.assertBalance(self.customer, '0.00', '0.00', '0.00')
+        self.assertBalance(self.other, '100.00', '0.00', '0.00')
+        self.assertEqual(self.last_statement_balance(self.customer), Decimal('0.00'))
+        self.assertEqual(self.last_statement_balance(self.other), Decimal('100.00'))
+        self.assertLedgerConsistent()
+    
+    def test_delete(self):
+        debt = Debt.objects.create(customer=self.customer, amount=Decimal('100.00'))
+        Debt.objects.create(customer=self.customer, amount=Decimal('20.00'), is_paid=True)
+        self.assertTrue(self.repository.delete(debt.id))
+        self.assertBalance(self.customer, '0.00', '0.00', '20.00')
+        self.assertEqual(self.last_statement_balance(self.customer), Decimal('0.00'))
+        # Silme ekstreye ters kayıt olarak eklenir
+        self.assertEqual(
+            LedgerEntry.objects.filter(customer=self.customer, kind=LedgerEntry.Kind.ADJUSTMENT).count(), 1
+        )
+        self.assertLedgerConsistent()
+    
+    def test_bulk_mark_paid_and_unpaid(self):
+        for amount in ('10.00', '20.00', '30.00'):
+            Debt.objects.create(customer=self.customer, amount=Decimal(amount))
+        Debt.objects.create(customer=self.other, amount=Decimal('5.00'), debt_type=Debt.DebtType.CREDIT)
+        
+        result = self.repository.bulk_mark_as_paid(customer_id=self.customer.id)
+        self.assertEqual(result.updated, 3)
+        self.assertBalance(self.customer, '0.00', '0.00', '60.00')
+        self.assertBalance(self.other, '0.00', '5.00', '0.00')
+        self.assertLedgerConsistent()
+        
+        result = self.repository.bulk_mark_as_unpaid(customer_id=self.customer.id)
+        self.assertEqual(result.updated, 3)
+        self.assertBalance(self.customer, '60.00', '0.00', '0.00')
+        self.assertLedgerConsistent()
+    
+    def test_bulk_import(self):
+        today = timezone.localdate()
+        created = self.repository.bulk_create([
+            DebtDTO(customer_id=self.customer.id, amount=Decimal('40.00')),
+            DebtDTO(customer_id=self.customer.id, amount=Decimal('15.00'), is_paid=True),
+            DebtDTO(
+                customer_id=self.other.id,
+                amount=Decimal('25.00'),
+                debt_type=Debt.DebtType.CREDIT,
+                created_at=today - timedelta(days=40),
+            ),
+        ])
+        self.assertEqual(created, 3)
+        self.assertBalance(self.customer, '40.00', '0.00', '15.00')
+        self.assertBalance(self.other, '0.00', '25.00', '0.00')
+        self.assertLedgerConsistent()
+    
+    def test_customer_delete_cascades(self):
+        Debt.objects.create(customer=self.customer, amount=Decimal('100.00'))
+        Debt.objects.create(customer=self.other, amount=Decimal('50.00'))
+        self.customer.delete()
+        self.assertFalse(CustomerBalance.objects.filter(customer_id=self.customer.id).exists())
+        self.assertBalance(self.other, '50.00', '0.00', '0.00')
+        self.assertLedgerConsistent()
+
+
+class RollupTests(LedgerConsistencyMixin, TestCase):
+    """Günlük özetin artımlı değişiklikleri yeniden hesaplama ile aynı olmalı"""
+    
+    def setUp(self):
+        self.customer = Customer.objects.create(first_name='Ali', last_name='Yılmaz', phone='05321234567')
+        self.repository = DebtRepository()
+        self.today = timezone.localdate()
+    
+    def _backdate(self, debt, days):
+        moment = timezone.now() - timedelta(days=days)
+        Debt.objects.filter(pk=debt.pk).update(created_at=moment)
+        DailyLedgerRollup.rebuild(self.today - timedelta(days=days), self.today)
+        return Debt.objects.get(pk=debt.pk)
+    
+    def test_today_flows(self):
+        debt = Debt.objects.create(customer=self.customer, amount=Decimal('100.00'))
+        Debt.objects.create(customer=self.customer, amount=Decimal('30.00'), debt_type=Debt.DebtType.CREDIT)
+        self.repository.mark_as_paid(debt.id)
+        
+        row = DailyLedgerRollup.objects.get(day=self.today, debt_type=Debt.DebtType.DEBT)
+        self.assertEqual(
+            (row.created_count, row.created_amount, row.paid_amount, row.outstanding_amount),
+            (1, Decimal('100.00'), Decimal('100.00'), Decimal('0.00')),
+        )
+        self.assertLedgerConsistent()
+    
+    def test_correction_of_old_debt_shifts_later_days(self):
+        debt = self._backdate(Debt.objects.create(customer=self.customer, amount=Decimal('100.00')), 5)
+        Debt.objects.create(customer=self.customer, amount=Decimal('10.00'))
+        
+        self.repository.update(debt.id, DebtDTO(customer_id=self.customer.id, amount=Decimal('70.00')))
+        old_row = DailyLedgerRollup.objects.get(day=self.today - timedelta(days=5), debt_type=Debt.DebtType.DEBT)
+        self.assertEqual(old_row.created_amount, Decimal('70.00'))
+        today_row = DailyLedgerRollup.objects.get(day=self.today, debt_type=Debt.DebtType.DEBT)
+        self.assertEqual(today_row.outstanding_amount, Decimal('80.00'))
+        self.assertLedgerConsistent()
+        
+        self.repository.mark_as_paid(debt.id)
+        self.assertLedgerConsistent()
+        self.repository.mark_as_unpaid(debt.id)
+        self.assertLedgerConsistent()
+    
+    def test_delete_same_day_removes_row(self):
+        debt = Debt.objects.create(customer=self.customer, amount=Decimal('100.00'))
+        self.repository.delete(debt.id)
+        self.assertFalse(DailyLedgerRollup.objects.exists())
+    
+    def test_delete_old_debt(self):
+        debt = self._backdate(Debt.objects.create(customer=self.customer, amount=Decimal('100.00')), 3)
+        Debt.objects.create(customer=self.customer, amount=Decimal('10.00'))
+        self.repository.delete(debt.id)
+        self.assertLedgerConsistent()
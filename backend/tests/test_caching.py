@@ -0,0 +1,97 @@
+"""
+Response cache versioning and conditional request tests.
+"""
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from backend.core.models import Customer, Debt
+
+
+class ResponseCacheTests(TestCase):
+    """Liste yanıtı sürümlü anahtarla saklanır, yazım sürümü değiştirir"""
+    
+    def setUp(self):
+        caches['responses'].clear()
+        self.customer = Customer.objects.create(first_name='Ali', last_name='Yılmaz', phone='05321234567')
+        admin = User.objects.create_superuser('admin', 'admin@example.com', 'x')
+        self.api = APIClient()
+        self.api.force_authenticate(admin)
+    
+    def test_etag_and_not_modified(self):
+        first = self.api.get('/api/customers/')
+        self.assertEqual(first.status_code, 200)
+        etag = first['ETag']
+        
+        again = self.api.get('/api/customers/')
+        self.assertEqual(again['ETag'], etag)
+        self.assertEqual(again.content, first.content)
+        
+        not_modified = self.api.get('/api/customers/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified['ETag'], etag)
+        
+        # Farklı query parametresi ayrı bir kayıttır
+        self.assertEqual(self.api.get('/api/customers/', {'search': 'yok'}, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+    
+    def test_write_bumps_version(self):
+        etag = self.api.get('/api/customers/')['ETag']
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            Debt.objects.create(customer=self.customer, amount=Decimal('100.00'))
+        
+        response = self.api.get('/api/customers/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertIn('100.00', response.content.decode())
+
+
+class ConditionalDetailTests(TestCase):
+    """Detay yanıtı updated_at değerlerinden türeyen zayıf ETag taşır"""
+    
+    def setUp(self):
+        caches['responses'].clear()
+        self.customer = Customer.objects.create(first_name='Ali', last_name='Yılmaz', phone='05321234567')
+        admin = User.objects.create_superuser('admin', 'admin@example.com', 'x')
+        self.api = APIClient()
+        self.api.force_authenticate(admin)
+        self.url = f'/api/customers/{self.customer.id}/'
+    
+    def test_etag_and_last_modified(self):
+        response = self.api.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['ETag'].startswith('W/"'))
+        self.assertIn('Last-Modified', response)
+        
+        not_modified = self.api.get(self.url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified['ETag'], response['ETag'])
+        
+        since = self.api.get(self.url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(since.status_code, 304)
+    
+    def test_update_changes_etag(self):
+        etag = self.api.get(self.url)['ETag']
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            self.customer.first_name = 'Ahmet'
+            self.customer.save()
+        
+        response = self.api.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.json()['first_name'], 'Ahmet')
+    
+    def test_debt_write_changes_etag(self):
+        etag = self.api.get(self.url)['ETag']
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            Debt.objects.create(customer=self.customer, amount=Decimal('50.00'))
+        
+        self.assertEqual(self.api.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+    
+    def test_missing_customer(self):
+        self.assertEqual(self.api.get('/api/customers/999999/').status_code, 404)
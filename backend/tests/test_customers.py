@@ -0,0 +1,129 @@
+"""
+Customer phone normalization, uniqueness and list query tests.
+"""
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from backend.core.models import Customer, Debt
+from backend.infrastructure.repositories import CustomerRepository
+
+
+class CustomerPhoneTests(TestCase):
+    """Yinelenen eski numaralar ve farklı yazılmış yinelenen numaralar"""
+    
+    def setUp(self):
+        self.owner = Customer.objects.create(first_name='Ali', last_name='Yılmaz', phone='05321234567')
+        # backfill_phones'un bıraktığı durum: yinelenen eski kayıtta phone_e164 boş
+        Customer.objects.bulk_create([
+            Customer(first_name='Ali', last_name='Eski', phone='0532 123 45 67', phone_e164=None),
+        ])
+        self.legacy = Customer.objects.get(phone='0532 123 45 67')
+        self.admin = User.objects.create_superuser('admin', 'admin@example.com', 'x')
+        self.api = APIClient()
+        self.api.force_authenticate(self.admin)
+    
+    def test_legacy_duplicate_can_be_saved(self):
+        """Telefonu değişmeyen yinelenen kayıt güncellenebilir ve pasife alınabilir"""
+        response = self.api.patch(f'/api/customers/{self.legacy.id}/', {'notes': 'not'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        
+        self.assertTrue(CustomerRepository().delete(self.legacy.id))
+        self.legacy.refresh_from_db()
+        self.assertFalse(self.legacy.is_active)
+        self.assertIsNone(self.legacy.phone_e164)
+    
+    def test_phone_change_recomputes_normalized_columns(self):
+        """Telefon değişince normalize kolonlar yeniden yazılır"""
+        self.legacy.phone = '0533 765 43 21'
+        self.legacy.save()
+        self.legacy.refresh_from_db()
+        self.assertEqual(self.legacy.phone_e164, '+905337654321')
+        self.assertEqual(self.legacy.phone_reversed, '123456733509')
+    
+    def test_api_rejects_differently_formatted_duplicate(self):
+        """Farklı yazılmış yinelenen numara 400 döner"""
+        response = self.api.post('/api/customers/', {
+            'first_name': 'Veli',
+            'last_name': 'Kaya',
+            'phone': '+90 532 123 45 67',
+        }, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('phone', response.json())
+        
+        other = Customer.objects.create(first_name='Veli', last_name='Kaya', phone='05551112233')
+        response = self.api.patch(f'/api/customers/{other.id}/', {'phone': '532 123 4567'}, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('phone', response.json())
+    
+    def test_admin_rejects_differently_formatted_duplicate(self):
+        """Admin ekleme formunda yinelenen numara form hatası verir"""
+        self.client.force_login(self.admin)
+        response = self.client.post(reverse('admin:backend_customer_add'), {
+            'first_name': 'Veli',
+            'last_name': 'Kaya',
+            'phone': '+90 532 123 45 67',
+            'is_active': 'on',
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('phone', response.context['adminform'].form.errors)
+        self.assertEqual(Customer.objects.filter(first_name='Veli').count(), 0)
+
+
+class CustomerListQueryTests(TestCase):
+    """Müşteri listesinin sorgu sayısı müşteri sayısıyla artmaz"""
+    
+    def setUp(self):
+        self.admin = User.objects.create_superuser('admin', 'admin@example.com', 'x')
+        self.api = APIClient()
+        self.api.force_authenticate(self.admin)
+        self.created = 0
+    
+    def _add_customers(self, count):
+        """Her müşteriye bir ödenmemiş, bir ödenmiş borç ve bir alacak ekle"""
+        for _ in range(count):
+            self.created += 1
+            customer = Customer.objects.create(
+                first_name=f'Müşteri{self.created}', last_name='Test', phone=f'0532000{self.created:04d}'
+            )
+            Debt.objects.create(customer=customer, amount=Decimal('100.00'))
+            Debt.objects.create(customer=customer, amount=Decimal('40.00'), is_paid=True)
+            Debt.objects.create(customer=customer, amount=Decimal('15.00'), debt_type=Debt.DebtType.CREDIT)
+    
+    def _count_list_queries(self):
+        caches['responses'].clear()
+        with CaptureQueriesContext(connection) as context:
+            response = self.api.get('/api/customers/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['results']), self.created)
+        return len(context.captured_queries)
+    
+    def _count_get_all_queries(self):
+        with CaptureQueriesContext(connection) as context:
+            customers = CustomerRepository().get_all()
+        self.assertEqual(len(customers), self.created)
+        return len(context.captured_queries)
+    
+    def test_api_list_query_count_is_constant(self):
+        self._add_customers(2)
+        small = self._count_list_queries()
+        self._add_customers(10)
+        self.assertEqual(self._count_list_queries(), small)
+    
+    def test_repository_get_all_query_count_is_constant(self):
+        self._add_customers(2)
+        self.assertEqual(self._count_get_all_queries(), 1)
+        self._add_customers(10)
+        self.assertEqual(self._count_get_all_queries(), 1)
+    
+    def test_list_balances(self):
+        """Bakiyeler join'den doğru okunur"""
+        self._add_customers(1)
+        customer = CustomerRepository().get_all()[0]
+        self.assertEqual(customer.total_debt, Decimal('100.00'))
@@ -0,0 +1,44 @@
+"""
+Ledger export tests.
+"""
+import csv
+import io
+import zipfile
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from backend.core.models import Customer, Debt
+
+
+class LedgerExportTests(TestCase):
+    """Müşteri girdisi metinler formül olarak dışa aktarılmaz"""
+    
+    def setUp(self):
+        customer = Customer.objects.create(
+            first_name='=HYPERLINK("http://example.com","x")', last_name='@SUM(A1)', phone='05321234567'
+        )
+        Debt.objects.create(customer=customer, amount=Decimal('10.50'), description='-2+3')
+        self.admin = User.objects.create_superuser('admin', 'admin@example.com', 'x')
+        self.api = APIClient()
+        self.api.force_authenticate(self.admin)
+    
+    def test_csv_cells_are_escaped(self):
+        response = self.api.get('/api/debts/export/', {'file_type': 'csv'})
+        self.assertEqual(response.status_code, 200)
+        content = b''.join(response.streaming_content).decode('utf-8-sig')
+        header, row = list(csv.reader(io.StringIO(content)))
+        self.assertEqual(row[header.index('Ad')], '\'=HYPERLINK("http://example.com","x")')
+        self.assertEqual(row[header.index('Soyad')], "'@SUM(A1)")
+        self.assertEqual(row[header.index('Açıklama')], "'-2+3")
+        self.assertEqual(row[header.index('Tutar')], '10.50')
+    
+    def test_xlsx_writes_text_cells(self):
+        response = self.api.get('/api/debts/export/', {'file_type': 'xlsx'})
+        self.assertEqual(response.status_code, 200)
+        with zipfile.ZipFile(io.BytesIO(b''.join(response.streaming_content))) as archive:
+            sheet = archive.read('xl/worksheets/sheet1.xml').decode('utf-8')
+        self.assertNotIn('<f>', sheet)
+        self.assertIn('=HYPERLINK', sheet)
@@ -0,0 +1,73 @@
+"""
+Gallery API response tests.
+"""
+import io
+import shutil
+import tempfile
+
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from PIL import Image
+from rest_framework.test import APIClient
+
+from backend.core.models import GalleryImage
+
+
+class GalleryProcessingErrorTests(TestCase):
+    """İşleme hatası yalnızca admin yanıtlarında görünür"""
+    
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        override = override_settings(MEDIA_ROOT=media_root)
+        override.enable()
+        self.addCleanup(override.disable)
+        caches['responses'].clear()
+        
+        buffer = io.BytesIO()
+        Image.new('RGB', (32, 32), 'blue').save(buffer, 'PNG')
+        self.image = GalleryImage.objects.create(
+            title='Jant',
+            image=SimpleUploadedFile('jant.png', buffer.getvalue(), content_type='image/png'),
+        )
+        GalleryImage.objects.filter(pk=self.image.pk).update(
+            processing_status=GalleryImage.ProcessingStatus.FAILED,
+            processing_error='OSError: /srv/media/gallery/jant.png okunamadı',
+        )
+        self.admin = User.objects.create_superuser('admin', 'admin@example.com', 'x')
+    
+    def test_public_responses_hide_processing_error(self):
+        public = APIClient()
+        detail = public.get(f'/api/gallery/{self.image.pk}/')
+        self.assertEqual(detail.status_code, 200)
+        self.assertNotIn('processing_error', detail.json())
+        self.assertEqual(detail.json()['processing_status'], 'FAILED')
+        
+        listing = public.get('/api/gallery/')
+        self.assertEqual(listing.status_code, 200)
+        self.assertNotIn('processing_error', listing.json()['results'][0])
+    
+    def test_admin_update_response_shows_processing_error(self):
+        api = APIClient()
+        api.force_authenticate(self.admin)
+        response = api.patch(f'/api/gallery/{self.image.pk}/', {'order': 3}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('okunamadı', response.json()['processing_error'])
+    
+    def test_shared_cache_entry_has_no_processing_error(self):
+        """Admin'in doldurduğu paylaşılan cache girdisi herkese aynı (hatasız) yanıtı verir"""
+        api = APIClient()
+        api.force_authenticate(self.admin)
+        first = api.get(f'/api/gallery/{self.image.pk}/')
+        self.assertNotIn('processing_error', first.json())
+        
+        public = APIClient()
+        cached = public.get(f'/api/gallery/{self.image.pk}/')
+        self.assertEqual(cached['ETag'], first['ETag'])
+        self.assertEqual(cached.content, first.content)
+        self.assertNotIn(b'processing_error', cached.content)
+        
+        revalidated = public.get(f'/api/gallery/{self.image.pk}/', HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(revalidated.status_code, 304)
@@ -0,0 +1,148 @@
+"""
+Background job queue and gallery processing tests.
+"""
+import io
+import shutil
+import tempfile
+from datetime import timedelta
+from unittest import mock
+
+from django.conf import settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from PIL import Image
+
+from backend.core.jobs import enqueue, register, run_next_job
+from backend.core.jobs.gallery import process_gallery_image
+from backend.core.models import BackgroundJob, GalleryImage
+
+FAILING_TASK = 'tests.always_fails'
+OK_TASK = 'tests.ok'
+
+given_up = []
+
+
+@register(FAILING_TASK, on_give_up=lambda payload, error: given_up.append(payload))
+def _always_fails(payload):
+    raise RuntimeError('bozuk')
+
+
+@register(OK_TASK)
+def _ok(payload):
+    pass
+
+
+class JobQueueTests(TestCase):
+    """İş alma, yeniden deneme ve takılı kalan işler"""
+    
+    def setUp(self):
+        given_up.clear()
+        self.stale_after = settings.BACKGROUND_JOBS_STALE_AFTER
+    
+    def _make_stale(self, job, attempts):
+        BackgroundJob.objects.filter(pk=job.pk).update(
+            status=BackgroundJob.Status.RUNNING,
+            locked_at=timezone.now() - self.stale_after - timedelta(minutes=1),
+            attempts=attempts,
+        )
+    
+    def test_claim_marks_running_once(self):
+        job = enqueue(OK_TASK, {})
+        claimed = BackgroundJob.claim_next(self.stale_after)
+        self.assertEqual(claimed.pk, job.pk)
+        self.assertEqual(claimed.status, BackgroundJob.Status.RUNNING)
+        self.assertEqual(claimed.attempts, 1)
+        self.assertIsNone(BackgroundJob.claim_next(self.stale_after))
+    
+    def test_success_marks_done(self):
+        job = enqueue(OK_TASK, {})
+        run_next_job()
+        job.refresh_from_db()
+        self.assertEqual(job.status, BackgroundJob.Status.DONE)
+    
+    def test_failure_retries_with_delay_then_gives_up(self):
+        job = enqueue(FAILING_TASK, {'n': 1}, max_attempts=2)
+        with self.assertLogs('backend.core.jobs.registry', 'WARNING'):
+            run_next_job()
+        job.refresh_from_db()
+        self.assertEqual(job.status, BackgroundJob.Status.PENDING)
+        self.assertGreater(job.run_after, timezone.now())
+        self.assertIn('bozuk', job.last_error)
+        # Gecikme dolmadan alınmaz
+        self.assertIsNone(BackgroundJob.claim_next(self.stale_after))
+        
+        BackgroundJob.objects.filter(pk=job.pk).update(run_after=timezone.now())
+        with self.assertLogs('backend.core.jobs.registry', 'WARNING'):
+            run_next_job()
+        job.refresh_from_db()
+        self.assertEqual(job.status, BackgroundJob.Status.FAILED)
+        self.assertEqual(given_up, [{'n': 1}])
+    
+    def test_stale_job_is_reclaimed(self):
+        job = enqueue(OK_TASK, {})
+        self._make_stale(job, attempts=1)
+        claimed = BackgroundJob.claim_next(self.stale_after)
+        self.assertEqual(claimed.pk, job.pk)
+        self.assertEqual(claimed.attempts, 2)
+    
+    def test_recent_running_job_is_not_reclaimed(self):
+        job = enqueue(OK_TASK, {})
+        BackgroundJob.claim_next(self.stale_after)
+        self.assertIsNone(BackgroundJob.claim_next(self.stale_after))
+        job.refresh_from_db()
+        self.assertEqual(job.attempts, 1)
+    
+    def test_stale_job_without_attempts_left_fails(self):
+        """Worker'ı öldüren iş sonsuza kadar yeniden alınmaz"""
+        job = enqueue(FAILING_TASK, {'n': 2}, max_attempts=3)
+        self._make_stale(job, attempts=3)
+        self.assertIsNone(BackgroundJob.claim_next(self.stale_after))
+        
+        with self.assertLogs('backend.core.jobs.registry', 'WARNING'):
+            self.assertIsNone(run_next_job())
+        job.refresh_from_db()
+        self.assertEqual(job.status, BackgroundJob.Status.FAILED)
+        self.assertEqual(job.attempts, 3)
+        self.assertIsNotNone(job.finished_at)
+        self.assertEqual(given_up, [{'n': 2}])
+
+
+class GalleryProcessingTests(TestCase):
+    """Yeniden kodlanan orijinalin dosya yönetimi"""
+    
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        override = override_settings(MEDIA_ROOT=self.media_root)
+        override.enable()
+        self.addCleanup(override.disable)
+        
+        buffer = io.BytesIO()
+        Image.new('RGB', (64, 48), 'red').save(buffer, 'PNG')
+        self.image = GalleryImage.objects.create(
+            title='Lastik',
+            image=SimpleUploadedFile('lastik.png', buffer.getvalue(), content_type='image/png'),
+        )
+        self.original_name = self.image.image.name
+    
+    def test_original_kept_when_variants_fail(self):
+        with mock.patch.object(GalleryImage, 'generate_variants', side_effect=OSError('disk dolu')):
+            with self.assertRaises(OSError):
+                process_gallery_image({'image_id': self.image.pk})
+        
+        self.image.refresh_from_db()
+        self.assertEqual(self.image.image.name, self.original_name)
+        self.assertTrue(self.image.image.storage.exists(self.original_name))
+        self.assertEqual(self.image.processing_error, 'disk dolu')
+        self.assertEqual(self.image.image.storage.listdir('gallery')[1], [self.original_name.split('/')[-1]])
+    
+    def test_old_file_deleted_after_save(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            process_gallery_image({'image_id': self.image.pk})
+        
+        self.image.refresh_from_db()
+        self.assertEqual(self.image.processing_status, GalleryImage.ProcessingStatus.READY)
+        self.assertNotEqual(self.image.image.name, self.original_name)
+        self.assertTrue(self.image.image.storage.exists(self.image.image.name))
+        self.assertFalse(self.image.image.storage.exists(self.original_name))
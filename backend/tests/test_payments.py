@@ -0,0 +1,160 @@
+"""
+Partial payment and allocation consistency tests.
+"""
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from backend.application.dtos import PaymentDTO
+from backend.application.exceptions import DebtHasPaymentsError, PaymentAllocationError
+from backend.core.models import Customer, CustomerBalance, Debt, PaymentAllocation
+from backend.infrastructure.repositories import DebtRepository, PaymentRepository
+
+
+class PaymentAllocationTests(TestCase):
+    """Dağıtılmış ödemeler borç yazımlarında kaybolmamalı"""
+    
+    def setUp(self):
+        self.customer = Customer.objects.create(first_name='Ali', last_name='Yılmaz', phone='05321234567')
+        self.debt = Debt.objects.create(customer=self.customer, amount=Decimal('100.00'))
+        self.payments = PaymentRepository()
+        self.debts = DebtRepository()
+        admin = User.objects.create_superuser('admin', 'admin@example.com', 'x')
+        self.client = APIClient()
+        self.client.force_authenticate(admin)
+    
+    def pay(self, amount):
+        return self.payments.create(PaymentDTO(customer_id=self.customer.id, amount=Decimal(amount)))
+    
+    def allocated(self):
+        return sorted(PaymentAllocation.objects.filter(debt=self.debt).values_list('amount', flat=True))
+    
+    def assertBalance(self, outstanding, paid_total):
+        balance = CustomerBalance.objects.get(customer=self.customer)
+        self.assertEqual(balance.outstanding_debt, Decimal(outstanding))
+        self.assertEqual(balance.paid_total, Decimal(paid_total))
+        expected = CustomerBalance.recompute(self.customer.id)
+        self.assertEqual(expected.paid_total, Decimal(paid_total))
+    
+    def test_mark_unpaid_keeps_allocated_part(self):
+        """Kısmi ödemeden sonra ödenmedi işaretleme dağıtılan tutarı korur"""
+        self.pay('40.00')
+        self.assertTrue(self.debts.mark_as_unpaid(self.debt.id))
+        
+        self.debt.refresh_from_db()
+        self.assertEqual(self.debt.paid_amount, Decimal('40.00'))
+        self.assertBalance('60.00', '40.00')
+        
+        with self.assertRaises(PaymentAllocationError):
+            self.pay('100.00')
+        self.pay('60.00')
+        
+        self.debt.refresh_from_db()
+        self.assertTrue(self.debt.is_paid)
+        self.assertEqual(self.allocated(), [Decimal('40.00'), Decimal('60.00')])
+        self.assertBalance('0.00', '100.00')
+    
+    def test_mark_unpaid_after_manual_payment_reverts_manual_part(self):
+        """Elle ödendi işaretlenen kısım geri alınır, dağıtılan kısım kalır"""
+        self.pay('40.00')
+        self.debts.mark_as_paid(self.debt.id)
+        self.debts.mark_as_unpaid(self.debt.id)
+        
+        self.debt.refresh_from_db()
+        self.assertFalse(self.debt.is_paid)
+        self.assertEqual(self.debt.paid_amount, Decimal('40.00'))
+        self.assertBalance('60.00', '40.00')
+    
+    def test_mark_unpaid_rejected_when_closed_by_payments(self):
+        """Ödemelerle tamamen kapanmış borç ödenmedi yapılamaz"""
+        self.pay('100.00')
+        
+        with self.assertRaises(DebtHasPaymentsError):
+            self.debts.mark_as_unpaid(self.debt.id)
+        response = self.client.post(f'/api/debts/{self.debt.id}/mark_unpaid/')
+        self.assertEqual(response.status_code, 400)
+        
+        self.debt.refresh_from_db()
+        self.assertTrue(self.debt.is_paid)
+        self.assertBalance('0.00', '100.00')
+    
+    def test_amount_below_paid_rejected(self):
+        """Tutar ödenen tutarın altına indirilemez"""
+        self.pay('40.00')
+        
+        response = self.client.patch(f'/api/debts/{self.debt.id}/', {'amount': '30.00'}, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('amount', response.json())
+        
+        response = self.client.patch(f'/api/debts/{self.debt.id}/', {'amount': '40.00'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['remaining_amount'], '0.00')
+    
+    def test_delete_with_allocations_rejected(self):
+        """Ödeme dağıtılmış borç silinemez; tahsilat kaybolmaz"""
+        self.pay('40.00')
+        
+        response = self.client.delete(f'/api/debts/{self.debt.id}/')
+        self.assertEqual(response.status_code, 400)
+        self.assertTrue(Debt.objects.filter(id=self.debt.id).exists())
+        self.assertEqual(self.allocated(), [Decimal('40.00')])
+        self.assertBalance('60.00', '40.00')
+    
+    def test_delete_without_allocations(self):
+        """Ödemesi olmayan borç silinebilir"""
+        response = self.client.delete(f'/api/debts/{self.debt.id}/')
+        self.assertEqual(response.status_code, 204)
+        self.assertBalance('0.00', '0.00')
+    
+    def test_customer_delete_cascades_payments(self):
+        """Müşteri silinirken ödemeler ve dağıtımları da silinir"""
+        self.pay('40.00')
+        self.customer.delete()
+        self.assertFalse(Debt.objects.exists())
+        self.assertFalse(PaymentAllocation.objects.exists())
+
+
+class BulkMarkUnpaidTests(TestCase):
+    """Toplu ödenmedi işaretleme dağıtılmış ödemeleri korur"""
+    
+    def setUp(self):
+        self.customer = Customer.objects.create(first_name='Ayşe', last_name='Demir', phone='05329876543')
+        self.partial = Debt.objects.create(customer=self.customer, amount=Decimal('100.00'))
+        self.closed = Debt.objects.create(customer=self.customer, amount=Decimal('50.00'))
+        self.manual = Debt.objects.create(customer=self.customer, amount=Decimal('30.00'))
+        payments = PaymentRepository()
+        payments.create(PaymentDTO(customer_id=self.customer.id, debt_id=self.partial.id, amount=Decimal('40.00')))
+        payments.create(PaymentDTO(customer_id=self.customer.id, debt_id=self.closed.id, amount=Decimal('50.00')))
+        self.debts = DebtRepository()
+        self.debts.bulk_mark_as_paid(customer_id=self.customer.id)
+    
+    def test_bulk_unpaid_reverts_only_manual_part(self):
+        """Dağıtılan kısım ödenmiş kalır, ödemelerle kapanan borç atlanır"""
+        result = self.debts.bulk_mark_as_unpaid(customer_id=self.customer.id)
+        
+        self.assertEqual(result.updated, 2)
+        self.assertEqual(result.skipped_ids, [self.closed.id])
+        paid = dict(Debt.objects.values_list('id', 'paid_amount'))
+        self.assertEqual(paid[self.partial.id], Decimal('40.00'))
+        self.assertEqual(paid[self.manual.id], Decimal('0.00'))
+        self.assertEqual(paid[self.closed.id], Decimal('50.00'))
+        self.assertTrue(Debt.objects.get(id=self.closed.id).is_paid)
+        
+        balance = CustomerBalance.objects.get(customer=self.customer)
+        expected = CustomerBalance.recompute(self.customer.id)
+        self.assertEqual(balance.outstanding_debt, Decimal('90.00'))
+        self.assertEqual(balance.paid_total, Decimal('90.00'))
+        self.assertEqual(expected.paid_total, Decimal('90.00'))
+        call_command('rebuild_ledger', '--check', stdout=StringIO())
+        
+        # Sonraki ödeme yalnızca açık kalan tutara dağıtılır
+        with self.assertRaises(PaymentAllocationError):
+            PaymentRepository().create(PaymentDTO(customer_id=self.customer.id, amount=Decimal('100.00')))
+        PaymentRepository().create(PaymentDTO(customer_id=self.customer.id, amount=Decimal('90.00')))
+        allocated = PaymentAllocation.totals([self.partial.id, self.manual.id])
+        self.assertEqual(allocated[self.partial.id], Decimal('100.00'))
+        self.assertEqual(allocated[self.manual.id], Decimal('30.00'))
@@ -0,0 +1,120 @@
+"""
+Aging and timeseries report tests.
+"""
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from backend.core.models import AgingSnapshot, Customer, Debt
+from backend.core.utils.aging import bucket_for
+from backend.infrastructure.repositories import DebtRepository
+
+
+class AgingReportSourceTests(TestCase):
+    """Bugünün raporu canlı, geçmiş günler görüntüden"""
+    
+    def setUp(self):
+        caches['responses'].clear()
+        self.today = timezone.localdate()
+        self.customer = Customer.objects.create(first_name='Ali', last_name='Yılmaz', phone='05321234567')
+        self.debt = Debt.objects.create(
+            customer=self.customer, amount=Decimal('100.00'), due_date=self.today - timedelta(days=10)
+        )
+        admin = User.objects.create_superuser('admin', 'admin@example.com', 'x')
+        self.api = APIClient()
+        self.api.force_authenticate(admin)
+    
+    def _aging(self, **params):
+        return self.api.get('/api/reports/aging/', params)
+    
+    def test_today_ignores_snapshot_written_before_payment(self):
+        AgingSnapshot.materialize(self.today)
+        DebtRepository().mark_as_paid(self.debt.id)
+        
+        response = self._aging()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['source'], 'live')
+        self.assertEqual(Decimal(response.json()['total']), Decimal('0.00'))
+        self.assertEqual(response.json()['customers'], [])
+    
+    def test_past_day_reads_snapshot(self):
+        yesterday = self.today - timedelta(days=1)
+        AgingSnapshot.materialize(yesterday)
+        DebtRepository().mark_as_paid(self.debt.id)
+        
+        response = self._aging(date=yesterday.isoformat())
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['source'], 'snapshot')
+        self.assertEqual(Decimal(response.json()['total']), Decimal('100.00'))
+        
+        self.assertEqual(self._aging(date=(self.today - timedelta(days=2)).isoformat()).status_code, 404)
+        self.assertEqual(self._aging(date=yesterday.isoformat(), live='true').status_code, 404)
+
+
+class AgingBucketBoundaryTests(TestCase):
+    """Dilim sınırları: 30/31, 60/61, 90/91. gün"""
+    
+    BOUNDARIES = (
+        (1, '0_30'),
+        (30, '0_30'),
+        (31, '31_60'),
+        (60, '31_60'),
+        (61, '61_90'),
+        (90, '61_90'),
+        (91, '90_plus'),
+    )
+    
+    def setUp(self):
+        caches['responses'].clear()
+        self.today = timezone.localdate()
+        self.customer = Customer.objects.create(first_name='Ali', last_name='Yılmaz', phone='05321234567')
+        for days, _ in self.BOUNDARIES:
+            Debt.objects.create(
+                customer=self.customer, amount=Decimal(days), due_date=self.today - timedelta(days=days)
+            )
+        # Vadesi bugün olan ve ödenmiş borçlar rapora girmez
+        Debt.objects.create(customer=self.customer, amount=Decimal('1000.00'), due_date=self.today)
+        Debt.objects.create(
+            customer=self.customer, amount=Decimal('1000.00'), due_date=self.today - timedelta(days=5), is_paid=True
+        )
+        admin = User.objects.create_superuser('admin', 'admin@example.com', 'x')
+        self.api = APIClient()
+        self.api.force_authenticate(admin)
+    
+    def test_bucket_for(self):
+        for days, key in self.BOUNDARIES:
+            with self.subTest(days=days):
+                self.assertEqual(bucket_for(days), key)
+    
+    def test_overdue_endpoint(self):
+        response = self.api.get('/api/debts/overdue/', {'limit': 50})
+        self.assertEqual(response.status_code, 200)
+        rows = {row['days_overdue']: row['aging_bucket'] for row in response.json()['results']}
+        self.assertEqual(rows, dict(self.BOUNDARIES))
+        
+        response = self.api.get('/api/debts/overdue/', {'min_days': 61})
+        self.assertEqual(sorted(row['days_overdue'] for row in response.json()['results']), [61, 90, 91])
+        self.assertEqual(self.api.get('/api/debts/overdue/', {'min_days': 0}).status_code, 400)
+    
+    def test_aging_report_totals(self):
+        expected = {'0_30': Decimal('31'), '31_60': Decimal('91'), '61_90': Decimal('151'), '90_plus': Decimal('91')}
+        
+        live = self.api.get('/api/reports/aging/').json()
+        self.assertEqual({key: Decimal(value) for key, value in live['buckets'].items()}, expected)
+        self.assertEqual(Decimal(live['total']), Decimal('364'))
+        self.assertEqual(live['debt_count'], 7)
+        
+        # Dünkü görüntüde her borç bir gün daha genç; 1 günlük borç henüz vadesinde
+        yesterday = self.today - timedelta(days=1)
+        AgingSnapshot.materialize(yesterday)
+        snapshot = self.api.get('/api/reports/aging/', {'date': yesterday.isoformat()}).json()
+        self.assertEqual(snapshot['source'], 'snapshot')
+        self.assertEqual(
+            {key: Decimal(value) for key, value in snapshot['buckets'].items()},
+            {'0_30': Decimal('61'), '31_60': Decimal('121'), '61_90': Decimal('181'), '90_plus': Decimal('0')},
+        )
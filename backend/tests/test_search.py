@@ -0,0 +1,56 @@
+"""
+Customer search prefix matching tests.
+"""
+from django.test import SimpleTestCase, TestCase
+
+from backend.core.models import Customer
+from backend.core.utils.text import prefix_q, prefix_upper_bound
+from backend.infrastructure.repositories import CustomerRepository
+
+
+class PrefixQueryTests(SimpleTestCase):
+    """Önek koşulunun veritabanına göre üretilmesi"""
+    
+    def test_upper_bound_increments_last_character(self):
+        self.assertEqual(prefix_upper_bound('ali'), 'alj')
+        self.assertEqual(prefix_upper_bound('4321'), '4322')
+        self.assertEqual(prefix_upper_bound('ali.'), 'ali/')
+    
+    def test_postgresql_uses_startswith(self):
+        """Yerel collation'da aralık değil LIKE 'önek%' kullanılır"""
+        q = prefix_q('term', 'ali.', vendor='postgresql')
+        self.assertEqual(q.children, [('term__startswith', 'ali.')])
+    
+    def test_sqlite_uses_binary_range(self):
+        q = prefix_q('term', 'ali', vendor='sqlite')
+        self.assertEqual(sorted(q.children), [('term__gte', 'ali'), ('term__lt', 'alj')])
+
+
+class CustomerSearchPrefixTests(TestCase):
+    """Arama index'inde önek eşleşmesi"""
+    
+    def setUp(self):
+        self.ali = Customer.objects.create(
+            first_name='Ali', last_name='Yılmaz', phone='05321234567', email='ali.veli@example.com'
+        )
+        self.alim = Customer.objects.create(first_name='Alim', last_name='Kaya', phone='05337654321')
+        self.alper = Customer.objects.create(first_name='Alper', last_name='Demir', phone='05441112233')
+        self.repository = CustomerRepository()
+    
+    def _ids(self, query):
+        return [dto.id for dto in self.repository.search(query)]
+    
+    def test_prefix_matches_only_words_with_prefix(self):
+        self.assertEqual(set(self._ids('ali')), {self.ali.id, self.alim.id})
+        self.assertEqual(self._ids('alp'), [self.alper.id])
+    
+    def test_exact_word_ranks_first(self):
+        self.assertEqual(self._ids('ali')[0], self.ali.id)
+    
+    def test_prefix_with_punctuation(self):
+        """Noktalama içeren önek yalnızca o öneki taşıyan terimlerle eşleşir"""
+        self.assertEqual(self._ids('ali.v'), [self.ali.id])
+    
+    def test_phone_suffix(self):
+        found = self.repository.find_by_phone_suffix('4567')
+        self.assertEqual([dto.id for dto in found], [self.ali.id])
@@ -0,0 +1,95 @@
+"""
+Delta sync endpoint tests.
+"""
+import base64
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from backend.core.models import Customer, CustomerBalance, Debt, DeletionTombstone
+
+
+class SyncTests(TestCase):
+    """Token akışı, değişen kayıtlar ve silme kayıtları"""
+    
+    def setUp(self):
+        self.customer = Customer.objects.create(first_name='Ali', last_name='Yılmaz', phone='05321234567')
+        self.other = Customer.objects.create(first_name='Veli', last_name='Kaya', phone='05337654321')
+        self.debt = Debt.objects.create(customer=self.customer, amount=Decimal('100.00'))
+        self.other_debt = Debt.objects.create(customer=self.other, amount=Decimal('20.00'))
+        admin = User.objects.create_superuser('admin', 'admin@example.com', 'x')
+        self.api = APIClient()
+        self.api.force_authenticate(admin)
+        
+        self.token = self._sync().json()['token']
+        # Mevcut kayıtlar token'dan önce yazılmış sayılır
+        earlier = timezone.now() - timedelta(hours=1)
+        Customer.objects.update(updated_at=earlier)
+        CustomerBalance.objects.update(updated_at=earlier)
+        Debt.objects.update(updated_at=earlier)
+    
+    def _sync(self, token=None):
+        return self.api.get('/api/sync/', {'since': token} if token else {})
+    
+    def test_initial_call_returns_only_token(self):
+        data = self._sync().json()
+        self.assertTrue(data['token'])
+        self.assertFalse(data['reset'])
+        self.assertEqual(data['customers'], [])
+        self.assertEqual(data['debts'], [])
+    
+    def test_no_changes(self):
+        data = self._sync(self.token).json()
+        self.assertEqual((data['customers'], data['debts']), ([], []))
+        self.assertEqual((data['deleted_customer_ids'], data['deleted_debt_ids']), ([], []))
+    
+    def test_changed_records(self):
+        self.debt.amount = Decimal('80.00')
+        self.debt.save()
+        
+        data = self._sync(self.token).json()
+        self.assertEqual([debt['id'] for debt in data['debts']], [self.debt.id])
+        # Bakiye değiştiği için müşteri de gelir; diğer müşteri gelmez
+        self.assertEqual([customer['id'] for customer in data['customers']], [self.customer.id])
+    
+    def test_deleted_debt(self):
+        debt_id = self.debt.id
+        self.debt.delete()
+        
+        data = self._sync(self.token).json()
+        self.assertEqual(data['deleted_debt_ids'], [debt_id])
+        self.assertEqual(data['deleted_customer_ids'], [])
+        self.assertEqual(data['debts'], [])
+    
+    def test_deleted_customer(self):
+        customer_id, debt_id = self.other.id, self.other_debt.id
+        self.other.delete()
+        
+        data = self._sync(self.token).json()
+        self.assertEqual(data['deleted_customer_ids'], [customer_id])
+        # Cascade ile silinen borçlar da listelenir
+        self.assertEqual(data['deleted_debt_ids'], [debt_id])
+        self.assertNotIn(customer_id, [customer['id'] for customer in data['customers']])
+    
+    def test_old_tombstones_are_not_returned(self):
+        self.debt.delete()
+        DeletionTombstone.objects.update(deleted_at=timezone.now() - timedelta(hours=1))
+        self.assertEqual(self._sync(self.token).json()['deleted_debt_ids'], [])
+    
+    def test_invalid_token(self):
+        response = self._sync('bozuk-token')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('since', response.json())
+    
+    def test_expired_token_requests_reset(self):
+        moment = (timezone.now() - timedelta(days=31)).isoformat()
+        token = base64.urlsafe_b64encode(('{"t":"%s"}' % moment).encode()).decode().rstrip('=')
+        
+        data = self._sync(token).json()
+        self.assertTrue(data['reset'])
+        self.assertEqual(data['customers'], [])
+        self.assertNotEqual(data['token'], token)
@@ -0,0 +1,100 @@
+"""
+Per-request latency with and without database connection reuse.
+
+Django'nun istek döngüsü taklit edilir: her "istek" request_started ile
+başlar, küçük bir müşteri sorgusu çalıştırır ve request_finished ile biter.
+request_finished, ömrü dolan bağlantıları kapatır; CONN_MAX_AGE=0 iken bu
+her istekte yeni bir bağlantı (TCP + kimlik doğrulama) demektir.
+
+Kullanım (proje kök dizininden):
+    DB_ENGINE=postgresql DB_HOST=127.0.0.1 DB_PASSWORD=... \\
+        python benchmarks/db_connection_reuse.py --requests 500
+
+Yerel deneme için PostgreSQL konteyneri:
+    docker run --rm -d -p 5432:5432 -e POSTGRES_USER=kardeslastik_user \\
+        -e POSTGRES_PASSWORD=secret -e POSTGRES_DB=kardeslastik_db postgres:16
+    python manage.py migrate
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'KardesLastik.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.core.signals import request_finished, request_started  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.db.backends.signals import connection_created  # noqa: E402
+
+from backend.core.models import Customer  # noqa: E402
+
+
+def run(requests, conn_max_age):
+    """Verilen CONN_MAX_AGE ile istek döngüsünü çalıştır; süreleri (ms) ve açılan bağlantı sayısını döndür"""
+    connection.close()
+    connection.settings_dict['CONN_MAX_AGE'] = conn_max_age
+    
+    opened = []
+    
+    def count_connection(sender, **kwargs):
+        opened.append(1)
+    
+    connection_created.connect(count_connection)
+    timings = []
+    try:
+        for _ in range(requests):
+            started = time.perf_counter()
+            request_started.send(sender=None)
+            list(Customer.objects.order_by('-created_at').values_list('id', 'phone')[:20])
+            request_finished.send(sender=None)
+            timings.append((time.perf_counter() - started) * 1000)
+    finally:
+        connection_created.disconnect(count_connection)
+        connection.close()
+    return timings, len(opened)
+
+
+def percentile(values, pct):
+    """Basit yüzdelik (sıralı listede en yakın sıra)"""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--requests', type=int, default=300, help='Her mod için istek sayısı')
+    parser.add_argument('--conn-max-age', type=int, default=60, help='Yeniden kullanım modunda CONN_MAX_AGE')
+    parser.add_argument('--warmup', type=int, default=20, help='Ölçülmeyen ısınma isteği sayısı')
+    args = parser.parse_args()
+    
+    settings_dict = connection.settings_dict
+    print(f"Veritabanı: {settings_dict['ENGINE']} {settings_dict.get('HOST') or ''} {settings_dict['NAME']}")
+    print(f'{args.requests} istek / mod\n')
+    
+    run(args.warmup, args.conn_max_age)
+    
+    header = f"{'mod':<34}{'bağlantı':>10}{'ort ms':>10}{'p50 ms':>10}{'p95 ms':>10}"
+    print(header)
+    print('-' * len(header))
+    for label, conn_max_age in (
+        ('yeni bağlantı (CONN_MAX_AGE=0)', 0),
+        (f'yeniden kullanım ({args.conn_max_age} sn)', args.conn_max_age),
+    ):
+        timings, opened = run(args.requests, conn_max_age)
+        print(
+            f'{label:<34}{opened:>10}'
+            f'{statistics.mean(timings):>10.2f}'
+            f'{percentile(timings, 50):>10.2f}'
+            f'{percentile(timings, 95):>10.2f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
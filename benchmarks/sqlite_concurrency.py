@@ -0,0 +1,192 @@
+"""
+Concurrent write/read throughput on SQLite: Django defaults vs performance mode.
+
+Her mod için geçici bir veritabanı oluşturulur ve migrate edilir. Ardından
+gunicorn worker'larını taklit eden süreçler aynı dosyaya eşzamanlı olarak
+borç ve ödeme yazar (bakiye ve ekstre güncellemeleri dahil) ve müşteri
+listesi ile ekstre okur.
+"database is locked" hataları ayrıca sayılır.
+
+Kullanım (proje kök dizininden):
+    CACHE_BACKEND=locmem python benchmarks/sqlite_concurrency.py --writers 3 --readers 3 --seconds 10
+
+CACHE_BACKEND=locmem, önbellek sürüm yazımlarını dosya sistemi yerine
+bellekte tutarak ölçümü veritabanına odaklar.
+"""
+import argparse
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODES = (
+    ('django varsayılan', '0'),
+    ('performans modu', '1'),
+)
+
+
+def _environment(db_path, performance):
+    """Alt süreçlerin kullanacağı DB_* ortamı"""
+    env = dict(os.environ)
+    env.update({
+        'DJANGO_SETTINGS_MODULE': 'KardesLastik.settings',
+        'DB_ENGINE': 'sqlite',
+        'DB_NAME': db_path,
+        'DB_SQLITE_PERFORMANCE': performance,
+    })
+    return env
+
+
+def _setup(env):
+    """Django'yu verilen ortamla başlat (spawn edilen süreçte)"""
+    os.environ.update(env)
+    sys.path.insert(0, ROOT)
+    import django
+    django.setup()
+
+
+def writer(env, customer_ids, start, deadline, results):
+    """
+    Süre dolana kadar borç kaydı ve ödeme yaz
+    
+    Ödeme transaction'ı önce okur (müşteri ve açık borçlar) sonra yazar;
+    DEFERRED modda bu kilit yükseltmesi eşzamanlı yazarlarla çakışır.
+    """
+    _setup(env)
+    from decimal import Decimal
+    from django.db import OperationalError, transaction
+    from backend.application.dtos.payment_dto import PaymentDTO
+    from backend.application.exceptions import PaymentAllocationError
+    from backend.core.models import Debt
+    from backend.infrastructure.repositories import PaymentRepository
+    
+    repository = PaymentRepository()
+    ok = errors = 0
+    i = 0
+    time.sleep(max(0, start - time.time()))
+    while time.time() < deadline:
+        customer_id = customer_ids[i % len(customer_ids)]
+        i += 1
+        try:
+            with transaction.atomic():
+                Debt.objects.create(customer_id=customer_id, amount=10, description='benchmark')
+            ok += 1
+        except OperationalError:
+            errors += 1
+        try:
+            repository.create(PaymentDTO(customer_id=customer_id, amount=Decimal('5.00')))
+            ok += 1
+        except (OperationalError, PaymentAllocationError):
+            # Borç yazımı kilit hatası aldıysa ödenecek açık borç kalmamış olabilir
+            errors += 1
+    results.put(('write', ok, errors))
+
+
+def reader(env, customer_ids, start, deadline, results):
+    """Süre dolana kadar müşteri listesi ve ekstre oku"""
+    _setup(env)
+    from django.db import OperationalError
+    from backend.core.models import Customer, LedgerEntry
+    
+    ok = errors = 0
+    i = 0
+    time.sleep(max(0, start - time.time()))
+    while time.time() < deadline:
+        customer_id = customer_ids[i % len(customer_ids)]
+        i += 1
+        try:
+            list(Customer.objects.select_related('balance').order_by('-created_at')[:50])
+            list(LedgerEntry.objects.filter(customer_id=customer_id).order_by('-created_at', '-id')[:50])
+            ok += 1
+        except OperationalError:
+            errors += 1
+    results.put(('read', ok, errors))
+
+
+def prepare(env, customers):
+    """Veritabanını migrate et ve müşterileri oluştur; müşteri id'lerini döndür"""
+    subprocess.run(
+        [sys.executable, 'manage.py', 'migrate', '-v0'],
+        cwd=ROOT,
+        env=env,
+        check=True,
+    )
+    script = (
+        'from backend.core.models import Customer\n'
+        f'for i in range({customers}):\n'
+        "    Customer.objects.create(first_name='Bench', last_name=str(i), phone='0555%07d' % i)\n"
+        "print(','.join(str(pk) for pk in Customer.objects.values_list('id', flat=True)))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, 'manage.py', 'shell', '-c', script],
+        cwd=ROOT,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return [int(pk) for pk in output.strip().split(',')]
+
+
+def run_mode(label, performance, args):
+    """Tek modu çalıştır ve sonuç satırını döndür"""
+    with tempfile.TemporaryDirectory() as tmp:
+        env = _environment(os.path.join(tmp, 'bench.sqlite3'), performance)
+        customer_ids = prepare(env, args.customers)
+        
+        ctx = multiprocessing.get_context('spawn')
+        results = ctx.Queue()
+        # Süreçler Django'yu başlatırken beklenir; ölçüm hepsi için aynı anda başlar
+        start = time.time() + args.startup
+        deadline = start + args.seconds
+        processes = [
+            ctx.Process(target=writer, args=(env, customer_ids, start, deadline, results))
+            for _ in range(args.writers)
+        ] + [
+            ctx.Process(target=reader, args=(env, customer_ids, start, deadline, results))
+            for _ in range(args.readers)
+        ]
+        for process in processes:
+            process.start()
+        
+        totals = {'write': [0, 0], 'read': [0, 0]}
+        for _ in processes:
+            kind, ok, errors = results.get()
+            totals[kind][0] += ok
+            totals[kind][1] += errors
+        for process in processes:
+            process.join()
+    
+    return (
+        label,
+        totals['write'][0] / args.seconds,
+        totals['write'][1],
+        totals['read'][0] / args.seconds,
+        totals['read'][1],
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--writers', type=int, default=3, help='Yazan süreç sayısı')
+    parser.add_argument('--readers', type=int, default=3, help='Okuyan süreç sayısı')
+    parser.add_argument('--seconds', type=float, default=10, help='Ölçüm süresi (sn)')
+    parser.add_argument('--customers', type=int, default=50, help='Oluşturulacak müşteri sayısı')
+    parser.add_argument('--startup', type=float, default=3, help='Süreç başlangıcı için eklenen süre (sn)')
+    args = parser.parse_args()
+    
+    print(f'{args.writers} yazar, {args.readers} okuyucu, {args.seconds:g} sn\n')
+    header = f"{'mod':<20}{'yazma/sn':>12}{'kilit hatası':>14}{'okuma/sn':>12}{'okuma hatası':>14}"
+    print(header)
+    print('-' * len(header))
+    for label, performance in MODES:
+        label, writes, write_errors, reads, read_errors = run_mode(label, performance, args)
+        print(f'{label:<20}{writes:>12.1f}{write_errors:>14}{reads:>12.1f}{read_errors:>14}')
+
+
+if __name__ == '__main__':
+    main()
@@ -24,6 +24,12 @@ export const API_ENDPOINTS = {
   CONTACT_ITEM: (id: number) => `/contact/${id}/`,
   CONTACT_MARK_AS_READ: (id: number) => `/contact/${id}/mark_as_read/`,
   
+  // Dashboard endpoints
+  DASHBOARD_STATS: '/dashboard/stats/',
+  
+  // Delta sync endpoint
+  SYNC: '/sync/',
+  
   // Auth endpoints (Django admin)
   ADMIN_LOGIN: '/admin/login/',
 };
@@ -5,6 +5,9 @@ import type { GalleryImage } from '../services/galleryService';
 import { showError } from '../utils/swal';
 import PageTitle from '../components/PageTitle';
 
+// Grid kolonlarına göre (xs=12, sm=6, md=4, lg=3) tarayıcının seçeceği resim genişliği
+const GALLERY_IMAGE_SIZES = '(min-width: 992px) 25vw, (min-width: 768px) 33vw, (min-width: 576px) 50vw, 100vw';
+
 const GalleryPage = () => {
   const [images, setImages] = useState<GalleryImage[]>([]);
   const [loading, setLoading] = useState(true);
@@ -54,15 +57,32 @@ const GalleryPage = () => {
           {images.map((image) => (
             <Col key={image.id} xs={12} sm={6} md={4} lg={3}>
               <Card className="h-100 shadow-sm">
-                <Card.Img
-                  variant="top"
-                  src={image.image_url}
-                  alt={image.title}
-                  style={{ height: '200px', objectFit: 'cover' }}
-                  onError={(e) => {
-                    (e.target as HTMLImageElement).src = 'https://via.placeholder.com/300x200?text=Resim+Yüklenemedi';
-                  }}
-                />
+                <picture>
+                  {image.sources?.map((source) => (
+                    <source key={source.type} type={source.type} srcSet={source.srcset} sizes={GALLERY_IMAGE_SIZES} />
+                  ))}
+                  <Card.Img
+                    variant="top"
+                    src={image.image_url}
+                    srcSet={image.srcset || undefined}
+                    sizes={GALLERY_IMAGE_SIZES}
+                    width={image.width || undefined}
+                    height={image.height || undefined}
+                    loading="lazy"
+                    decoding="async"
+                    alt={image.title}
+                    style={{
+                      height: '200px',
+                      objectFit: 'cover',
+                      // Bulanık önizleme, resim inene kadar arka planda görünür
+                      backgroundImage: image.placeholder ? `url(${image.placeholder})` : undefined,
+                      backgroundSize: 'cover',
+                    }}
+                    onError={(e) => {
+                      (e.target as HTMLImageElement).src = 'https://via.placeholder.com/300x200?text=Resim+Yüklenemedi';
+                    }}
+                  />
+                </picture>
                 <Card.Body>
                   <Card.Title>{image.title}</Card.Title>
                   {image.description && (
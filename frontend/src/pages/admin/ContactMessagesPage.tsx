@@ -1,4 +1,4 @@
-import { useEffect, useState } from 'react';
+import { useEffect, useRef, useState } from 'react';
 import {
   Container,
   Row,
@@ -16,6 +16,7 @@ import {
   deleteContactMessage,
 } from '../../services/contactService';
 import type { ContactMessage } from '../../services/contactService';
+import { subscribeLedger } from '../../services/realtime';
 import { showSuccess, showError, showDeleteConfirm } from '../../utils/swal';
 
 const ContactMessagesPage = () => {
@@ -29,9 +30,15 @@ const ContactMessagesPage = () => {
     loadMessages();
   }, [filterRead]);
 
-  const loadMessages = async () => {
+  // Yeni mesajlar WebSocket olayıyla gelir; güncel filtre ref üzerinden okunur
+  const loadMessagesRef = useRef<((silent?: boolean) => Promise<void>) | null>(null);
+  useEffect(() => {
+    return subscribeLedger(() => loadMessagesRef.current?.(true), ['contactmessage']);
+  }, []);
+
+  const loadMessages = async (silent = false) => {
     try {
-      setLoading(true);
+      if (!silent) setLoading(true);
       const contactMessages = await getContactMessages(filterRead);
       setMessages(contactMessages);
     } catch (err: any) {
@@ -42,6 +49,8 @@ const ContactMessagesPage = () => {
     }
   };
 
+  loadMessagesRef.current = loadMessages;
+
   const handleViewMessage = (message: ContactMessage) => {
     setSelectedMessage(message);
     setShowModal(true);
@@ -2,6 +2,7 @@ import { useEffect, useState } from 'react';
 import { Row, Col, Card, Spinner } from 'react-bootstrap';
 import api from '../../services/api';
 import { API_ENDPOINTS } from '../../config/api';
+import { subscribeLedger } from '../../services/realtime';
 import { showError } from '../../utils/swal';
 
 interface DashboardStats {
@@ -19,41 +20,25 @@ const DashboardPage = () => {
 
   useEffect(() => {
     fetchDashboardStats();
+    // Müşteri/borç değişince istatistikler arka planda yenilenir
+    return subscribeLedger(() => fetchDashboardStats(true), ['customer', 'debt']);
   }, []);
 
-  const fetchDashboardStats = async () => {
+  const fetchDashboardStats = async (silent = false) => {
     try {
-      setLoading(true);
+      if (!silent) setLoading(true);
       
-      // Fetch customers
-      const customersResponse = await api.get(API_ENDPOINTS.CUSTOMERS);
-      const customers = customersResponse.data.results || [];
-      
-      // Fetch debts
-      const debtsResponse = await api.get(API_ENDPOINTS.DEBTS);
-      const debts = debtsResponse.data.results || [];
-
-      // Calculate stats
-      const totalCustomers = customers.length;
-      const activeCustomers = customers.filter((c: any) => c.is_active).length;
-      const totalDebts = debts.length;
-      const unpaidDebts = debts.filter((d: any) => !d.is_paid).length;
-      
-      const totalDebtAmount = debts
-        .filter((d: any) => !d.is_paid && d.debt_type === 'DEBT')
-        .reduce((sum: number, d: any) => sum + parseFloat(d.amount || 0), 0);
-      
-      const totalPaidAmount = debts
-        .filter((d: any) => d.is_paid)
-        .reduce((sum: number, d: any) => sum + parseFloat(d.amount || 0), 0);
+      // Sunucu tarafında hesaplanan özet istatistikler
+      const response = await api.get(API_ENDPOINTS.DASHBOARD_STATS);
+      const data = response.data;
 
       setStats({
-        totalCustomers,
-        activeCustomers,
-        totalDebts,
-        unpaidDebts,
-        totalDebtAmount,
-        totalPaidAmount,
+        totalCustomers: data.total_customers,
+        activeCustomers: data.active_customers,
+        totalDebts: data.total_debts,
+        unpaidDebts: data.unpaid_debts,
+        totalDebtAmount: parseFloat(data.total_debt_amount || 0),
+        totalPaidAmount: parseFloat(data.total_paid_amount || 0),
       });
     } catch (err: any) {
       await showError('İstatistikler yüklenirken bir hata oluştu.');
@@ -1,4 +1,4 @@
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useRef } from 'react';
 import {
   Row,
   Col,
@@ -11,8 +11,9 @@ import {
   InputGroup,
   Spinner,
 } from 'react-bootstrap';
-import api from '../../services/api';
+import api, { fetchAllPages } from '../../services/api';
 import { API_ENDPOINTS } from '../../config/api';
+import { subscribeLedger } from '../../services/realtime';
 import { showSuccess, showError, showDeleteConfirm } from '../../utils/swal';
 
 interface Customer {
@@ -22,6 +23,7 @@ interface Customer {
   full_name: string;
   phone: string;
   email?: string;
+  is_active?: boolean;
 }
 
 interface Debt {
@@ -36,8 +38,23 @@ interface Debt {
   created_at: string;
 }
 
+interface SyncResponse {
+  token: string;
+  reset: boolean;
+  customers: Customer[];
+  debts: Debt[];
+  deleted_customer_ids: number[];
+  deleted_debt_ids: number[];
+}
+
+// Liste sırası backend ile aynı: en yeni önce (-created_at, id)
+const compareDebts = (a: Debt, b: Debt) =>
+  b.created_at.localeCompare(a.created_at) || a.id - b.id;
+
 const DebtsPage = () => {
   const [debts, setDebts] = useState<Debt[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [customers, setCustomers] = useState<Customer[]>([]);
   const [loading, setLoading] = useState(true);
   const [showModal, setShowModal] = useState(false);
@@ -45,6 +62,8 @@ const DebtsPage = () => {
   const [editingDebt, setEditingDebt] = useState<Debt | null>(null);
   const [searchTerm, setSearchTerm] = useState('');
   const [filterPaid, setFilterPaid] = useState<boolean | null>(null);
+  // Son tam yükleme/senkronizasyondan bu yana değişiklikleri almak için token
+  const syncToken = useRef<string | null>(null);
 
   // Form state
   const [formData, setFormData] = useState({
@@ -65,19 +84,92 @@ const DebtsPage = () => {
   });
 
   useEffect(() => {
-    fetchDebts();
-    fetchCustomers();
+    fetchAll();
   }, [filterPaid]);
 
+  // Başka oturumlardaki değişiklikler WebSocket olayıyla gelir; abonelik
+  // sayfa boyunca açık kalır, güncel filtre/cursor ref üzerinden okunur
+  const syncChangesRef = useRef<(() => Promise<void>) | null>(null);
+  useEffect(() => {
+    return subscribeLedger(() => syncChangesRef.current?.(), ['debt', 'customer']);
+  }, []);
+
+  const fetchAll = async () => {
+    // Token tam yüklemeden önce alınır; yükleme sırasında yapılan
+    // değişiklikler bir sonraki senkronizasyonda gelir
+    try {
+      const response = await api.get<SyncResponse>(API_ENDPOINTS.SYNC);
+      syncToken.current = response.data.token;
+    } catch (err: any) {
+      syncToken.current = null;
+      console.error('Senkronizasyon token alınamadı:', err);
+    }
+    await Promise.all([fetchDebts(), fetchCustomers()]);
+  };
+
+  const syncChanges = async () => {
+    if (!syncToken.current) {
+      await fetchAll();
+      return;
+    }
+    try {
+      const response = await api.get<SyncResponse>(API_ENDPOINTS.SYNC, {
+        params: { since: syncToken.current },
+      });
+      const changes = response.data;
+      if (changes.reset) {
+        await fetchAll();
+        return;
+      }
+      syncToken.current = changes.token;
+      applyChanges(changes);
+    } catch (err: any) {
+      console.error('Senkronizasyon başarısız, liste yeniden yükleniyor:', err);
+      await fetchAll();
+    }
+  };
+
+  syncChangesRef.current = syncChanges;
+
+  const applyChanges = (changes: SyncResponse) => {
+    const deletedDebts = new Set(changes.deleted_debt_ids);
+    setDebts((prev) => {
+      const byId = new Map(prev.map((debt) => [debt.id, debt]));
+      // Henüz yüklenmemiş sayfalara düşen kayıtlar eklenmez; "Daha fazla" ile gelir
+      const oldest = prev.length > 0 ? prev[prev.length - 1] : null;
+      for (const debt of changes.debts) {
+        const matches = filterPaid === null || debt.is_paid === filterPaid;
+        if (!matches) {
+          byId.delete(debt.id);
+        } else if (byId.has(debt.id) || !nextCursor || !oldest || compareDebts(debt, oldest) < 0) {
+          byId.set(debt.id, debt);
+        }
+      }
+      deletedDebts.forEach((id) => byId.delete(id));
+      return Array.from(byId.values()).sort(compareDebts);
+    });
+
+    const deletedCustomers = new Set(changes.deleted_customer_ids);
+    setCustomers((prev) => {
+      const byId = new Map(prev.map((customer) => [customer.id, customer]));
+      for (const customer of changes.customers) {
+        if (customer.is_active === false) {
+          byId.delete(customer.id);
+        } else {
+          byId.set(customer.id, customer);
+        }
+      }
+      deletedCustomers.forEach((id) => byId.delete(id));
+      return Array.from(byId.values());
+    });
+  };
+
   const fetchDebts = async () => {
     try {
       setLoading(true);
-      let url = API_ENDPOINTS.DEBTS;
-      if (filterPaid !== null) {
-        url += `?is_paid=${filterPaid}`;
-      }
-      const response = await api.get(url);
+      const response = await api.get(API_ENDPOINTS.DEBTS, { params: debtParams() });
       setDebts(response.data.results || []);
+      setNextCursor(response.data.next);
     } catch (err: any) {
       await showError('Borçlar yüklenirken bir hata oluştu.');
       console.error(err);
@@ -86,10 +178,35 @@ const DebtsPage = () => {
     }
   };
 
+  const debtParams = () => {
+    const params: Record<string, any> = {};
+    if (filterPaid !== null) {
+      params.is_paid = filterPaid;
+    }
+    return params;
+  };
+
+  const fetchMoreDebts = async () => {
+    if (!nextCursor) return;
+    try {
+      setLoadingMore(true);
+      const response = await api.get(API_ENDPOINTS.DEBTS, {
+        params: { ...debtParams(), cursor: nextCursor },
+      });
+      setDebts((prev) => [...prev, ...(response.data.results || [])]);
+      setNextCursor(response.data.next);
+    } catch (err: any) {
+      await showError('Borçlar yüklenirken bir hata oluştu.');
+      console.error(err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const fetchCustomers = async () => {
     try {
-      const response = await api.get(API_ENDPOINTS.CUSTOMERS + '?is_active=true');
-      setCustomers(response.data.results || []);
+      const results = await fetchAllPages<Customer>(API_ENDPOINTS.CUSTOMERS, { is_active: true });
+      setCustomers(results);
     } catch (err: any) {
       console.error('Müşteriler yüklenirken hata:', err);
     }
@@ -147,7 +264,7 @@ const DebtsPage = () => {
 
       handleCloseModal();
       await showSuccess(editingDebt ? 'Borç kaydı güncellendi.' : 'Borç kaydı eklendi.');
-      fetchDebts();
+      syncChanges();
     } catch (err: any) {
       await showError(err.response?.data?.error || 'İşlem başarısız oldu.');
       console.error(err);
@@ -158,7 +275,7 @@ const DebtsPage = () => {
     e.preventDefault();
     try {
       await api.post(API_ENDPOINTS.CUSTOMERS, customerFormData);
-      await fetchCustomers();
+      await syncChanges();
       await showSuccess('Müşteri başarıyla eklendi.');
       setShowCustomerModal(false);
       setCustomerFormData({
@@ -178,7 +295,7 @@ const DebtsPage = () => {
     try {
       await api.post(API_ENDPOINTS.DEBT_MARK_PAID(debtId));
       await showSuccess('Borç ödendi olarak işaretlendi.');
-      fetchDebts();
+      syncChanges();
     } catch (err: any) {
       await showError('İşlem başarısız oldu.');
       console.error(err);
@@ -189,7 +306,7 @@ const DebtsPage = () => {
     try {
       await api.post(API_ENDPOINTS.DEBT_MARK_UNPAID(debtId));
       await showSuccess('Borç ödenmedi olarak işaretlendi.');
-      fetchDebts();
+      syncChanges();
     } catch (err: any) {
       await showError('İşlem başarısız oldu.');
       console.error(err);
@@ -206,7 +323,7 @@ const DebtsPage = () => {
     try {
       await api.delete(API_ENDPOINTS.DEBT(debtId));
       await showSuccess('Borç kaydı başarıyla silindi.');
-      fetchDebts();
+      syncChanges();
     } catch (err: any) {
       await showError('Silme işlemi başarısız oldu.');
       console.error(err);
@@ -374,6 +491,13 @@ const DebtsPage = () => {
               )}
             </tbody>
           </Table>
+          {nextCursor && (
+            <div className="text-center">
+              <Button variant="outline-secondary" onClick={fetchMoreDebts} disabled={loadingMore}>
+                {loadingMore ? 'Yükleniyor...' : 'Daha fazla yükle'}
+              </Button>
+            </div>
+          )}
         </Card.Body>
       </Card>
 
@@ -22,6 +22,12 @@ import type {
 } from '../../services/galleryService';
 import { showSuccess, showError, showDeleteConfirm } from '../../utils/swal';
 
+const PROCESSING_STATUS_LABELS: Record<string, string> = {
+  PENDING: 'İşlenmeyi bekliyor',
+  PROCESSING: 'İşleniyor',
+  FAILED: 'İşleme hatası',
+};
+
 const GalleryPage = () => {
   const [images, setImages] = useState<GalleryImage[]>([]);
   const [loading, setLoading] = useState(true);
@@ -194,9 +200,19 @@ const GalleryPage = () => {
                 <Card.Body>
                   <Card.Title className="h6">{image.title}</Card.Title>
                   <div className="d-flex justify-content-between align-items-center mb-2">
-                    <Badge bg={image.is_active ? 'success' : 'secondary'}>
-                      {image.is_active ? 'Aktif' : 'Pasif'}
-                    </Badge>
+                    <div className="d-flex gap-1">
+                      <Badge bg={image.is_active ? 'success' : 'secondary'}>
+                        {image.is_active ? 'Aktif' : 'Pasif'}
+                      </Badge>
+                      {image.processing_status && image.processing_status !== 'READY' && (
+                        <Badge
+                          bg={image.processing_status === 'FAILED' ? 'danger' : 'warning'}
+                          title={image.processing_error || undefined}
+                        >
+                          {PROCESSING_STATUS_LABELS[image.processing_status]}
+                        </Badge>
+                      )}
+                    </div>
                     <span className="text-muted small">Sıra: {image.order}</span>
                   </div>
                   <div className="d-grid gap-2">
@@ -1,7 +1,7 @@
 /**
  * API Service - Axios instance with interceptors
  */
-import axios from 'axios';
+import axios, { AxiosInstance } from 'axios';
 import { API_BASE_URL } from '../config/api';
 
 // Create axios instance
@@ -44,5 +44,36 @@ api.interceptors.response.use(
   }
 );
 
+/**
+ * Cursor sayfalı liste yanıtı
+ */
+export interface PaginatedResponse<T> {
+  results: T[];
+  next: string | null;
+}
+
+/**
+ * Cursor sayfalı bir listenin tüm sayfalarını sırayla getir.
+ * Sadece küçük listeler (seçim kutuları, galeri) için kullanılmalı.
+ */
+export const fetchAllPages = async <T>(
+  url: string,
+  params: Record<string, any> = {},
+  client: AxiosInstance = api
+): Promise<T[]> => {
+  const items: T[] = [];
+  let cursor: string | null = null;
+
+  do {
+    const response: { data: PaginatedResponse<T> } = await client.get<PaginatedResponse<T>>(url, {
+      params: { ...params, limit: 200, ...(cursor ? { cursor } : {}) },
+    });
+    items.push(...response.data.results);
+    cursor = response.data.next;
+  } while (cursor);
+
+  return items;
+};
+
 export default api;
 
@@ -1,7 +1,7 @@
 /**
  * Contact Service - API calls for contact messages
  */
-import api from './api';
+import api, { fetchAllPages, PaginatedResponse } from './api';
 import axios from 'axios';
 import { API_ENDPOINTS } from '../config/api';
 
@@ -15,10 +15,7 @@ export interface ContactMessage {
   created_at: string;
 }
 
-export interface ContactMessageListResponse {
-  count: number;
-  results: ContactMessage[];
-}
+export type ContactMessageListResponse = PaginatedResponse<ContactMessage>;
 
 export interface CreateContactMessageData {
   name: string;
@@ -48,8 +45,7 @@ export const getContactMessages = async (isRead?: boolean): Promise<ContactMessa
     params.is_read = isRead;
   }
   
-  const response = await api.get<ContactMessageListResponse>(API_ENDPOINTS.CONTACT, { params });
-  return response.data.results;
+  return fetchAllPages<ContactMessage>(API_ENDPOINTS.CONTACT, params);
 };
 
 /**
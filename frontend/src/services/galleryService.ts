@@ -1,15 +1,27 @@
 /**
  * Gallery Service - API calls for gallery images
  */
-import api from './api';
+import api, { fetchAllPages, PaginatedResponse } from './api';
 import axios from 'axios';
 import { API_ENDPOINTS } from '../config/api';
 
+export interface GalleryImageSource {
+  type: string;
+  srcset: string;
+}
+
 export interface GalleryImage {
   id: number;
   title: string;
   description?: string;
   image_url: string;
+  srcset?: string | null;
+  sources?: GalleryImageSource[];
+  placeholder?: string | null;
+  width?: number | null;
+  height?: number | null;
+  processing_status?: 'PENDING' | 'PROCESSING' | 'READY' | 'FAILED';
+  processing_error?: string | null;
   is_active: boolean;
   order: number;
   created_at: string;
@@ -17,10 +29,7 @@ export interface GalleryImage {
   created_by_id?: number;
 }
 
-export interface GalleryImageListResponse {
-  count: number;
-  results: GalleryImage[];
-}
+export type GalleryImageListResponse = PaginatedResponse<GalleryImage>;
 
 export interface CreateGalleryImageData {
   title: string;
@@ -47,11 +56,11 @@ export const getGalleryImages = async (isActive?: boolean): Promise<GalleryImage
   }
   
   // Public endpoint için token göndermeden istek yap
-  const response = await axios.get<GalleryImageListResponse>(
+  return fetchAllPages<GalleryImage>(
     `${import.meta.env.VITE_API_BASE_URL || '/api'}${API_ENDPOINTS.GALLERY}`,
-    { params }
+    params,
+    axios
   );
-  return response.data.results;
 };
 
 /**
@@ -0,0 +1,89 @@
+/**
+ * Realtime Service - Admin WebSocket bağlantısı (/ws/ledger/)
+ *
+ * Sunucu yalnızca "hangi kayıt değişti" olaylarını gönderir; sayfalar
+ * değişen kayıtları /api/sync/ ile ya da kendi listelerini yenileyerek alır.
+ */
+import { API_BASE_URL } from '../config/api';
+
+export type LedgerEntity = 'customer' | 'debt' | 'contactmessage';
+
+export interface LedgerEvent {
+  type: 'change';
+  entity: LedgerEntity;
+  action: 'created' | 'updated' | 'deleted' | 'bulk';
+  ids: number[];
+  customer_ids: number[];
+  truncated: boolean;
+}
+
+// Sunucunun yetkisiz bağlantıları kapattığı kod
+const CLOSE_UNAUTHORIZED = 4401;
+const MAX_RETRY_DELAY = 30000;
+// Toplu işlemlerde art arda gelen olaylar tek bir güncellemede birleştirilir
+const BATCH_WINDOW = 250;
+
+const ledgerSocketUrl = (token: string): string => {
+  // API_BASE_URL göreli (/api) ya da mutlak (https://alan.com/api) olabilir
+  const base = new URL(API_BASE_URL, window.location.origin);
+  const protocol = base.protocol === 'https:' ? 'wss:' : 'ws:';
+  return `${protocol}//${base.host}/ws/ledger/?token=${encodeURIComponent(token)}`;
+};
+
+/**
+ * Değişiklik olaylarına abone ol; kısa aralıkla gelen olaylar tek çağrıda
+ * toplanır. Bağlantı koparsa artan gecikmeyle yeniden bağlanır.
+ * Dönen fonksiyon aboneliği kapatır.
+ */
+export const subscribeLedger = (
+  onEvents: (events: LedgerEvent[]) => void,
+  entities?: LedgerEntity[]
+): (() => void) => {
+  let socket: WebSocket | null = null;
+  let retryDelay = 1000;
+  let retryTimer: number | undefined;
+  let batchTimer: number | undefined;
+  let pending: LedgerEvent[] = [];
+  let closed = false;
+
+  const flush = () => {
+    batchTimer = undefined;
+    const events = pending;
+    pending = [];
+    if (!closed && events.length > 0) onEvents(events);
+  };
+
+  const connect = () => {
+    const token = localStorage.getItem('access_token');
+    if (!token || closed) return;
+
+    socket = new WebSocket(ledgerSocketUrl(token));
+    socket.onopen = () => {
+      retryDelay = 1000;
+    };
+    socket.onmessage = (message) => {
+      const event = JSON.parse(message.data) as LedgerEvent;
+      if (event.type !== 'change') return;
+      if (entities && !entities.includes(event.entity)) return;
+      pending.push(event);
+      if (batchTimer === undefined) {
+        batchTimer = window.setTimeout(flush, BATCH_WINDOW);
+      }
+    };
+    socket.onclose = (event) => {
+      // Token geçersizse yeniden denemek anlamsız; API istekleri girişe yönlendirir
+      if (closed || event.code === CLOSE_UNAUTHORIZED) return;
+      retryTimer = window.setTimeout(connect, retryDelay);
+      retryDelay = Math.min(retryDelay * 2, MAX_RETRY_DELAY);
+    };
+  };
+
+  connect();
+
+  return () => {
+    closed = true;
+    window.clearTimeout(retryTimer);
+    window.clearTimeout(batchTimer);
+    socket?.close();
+  };
+};